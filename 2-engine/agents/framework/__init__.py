@@ -6,20 +6,21 @@ This package provides:
 - BaseAgent: Abstract base class for all agents
 - AgentLoader: Dynamic agent loading from Python and YAML
 - SkillManager: Skill registration and execution
-- TaskSchema: Task validation schemas
+- Task / TaskRegistry: Task records and their registry
 """
 
-from .base_agent import BaseAgent, AgentConfig, AgentState
+from .base_agent import BaseAgent, AgentConfig, AgentStatus
 from .agent_loader import AgentLoader
 from .skill_manager import SkillManager
-from .task_schema import TaskSchema, TaskValidationError
+from .task_schema import Task, TaskRegistry, TaskState
 
 __all__ = [
     "BaseAgent",
     "AgentConfig",
-    "AgentState",
+    "AgentStatus",
     "AgentLoader",
     "SkillManager",
-    "TaskSchema",
-    "TaskValidationError",
+    "Task",
+    "TaskRegistry",
+    "TaskState",
 ]
@@ -3,15 +3,30 @@ Agent Loader for Blackbox 5
 
 This module provides dynamic agent loading and registration functionality.
 Discovers agents from configured paths and manages the agent registry.
+
+Discovery results are kept in an on-disk manifest (file path, mtime, size
+and content hash -> agent classes found in Python files, parsed YAML agent
+definitions). A warm start only stats the agent files: unchanged files are
+taken from the manifest without importing or parsing anything, and changed
+files are re-checked by hash before being re-read. Files that fail to import
+or parse are left out of the manifest, so every scan tries them again. Agent
+classes are imported and instantiated on first use through get_agent, not up
+front.
 """
 
 import asyncio
+import hashlib
 import importlib
 import importlib.util
 import inspect
+import json
 import logging
+import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 from .base_agent import BaseAgent, AgentConfig, AgentTask, AgentResult
 
@@ -24,6 +39,85 @@ from interface.client.ClaudeCodeAgentMixin import ClaudeCodeAgentMixin
 
 logger = logging.getLogger(__name__)
 
+MANIFEST_VERSION = 1
+MANIFEST_ROOT = Path.home() / ".claude" / "agents" / ".cache"
+
+
+def _file_digest(path: Path) -> str:
+    """SHA-1 of a file's contents."""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _parse_agent_yaml(yaml_file: Path) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Read and parse one YAML agent definition.
+
+    Runs in a worker thread; uses the libyaml loader when PyYAML has it.
+
+    Returns:
+        (content hash, parsed document) - document is None for YAML files
+        that are not agent definitions
+    """
+    import yaml
+
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(yaml_file, 'rb') as f:
+        raw = f.read()
+    data = yaml.load(raw, Loader=loader)
+    if not isinstance(data, dict) or 'agent' not in data:
+        data = None
+    return hashlib.sha1(raw).hexdigest(), data
+
+
+@dataclass
+class AgentEntry:
+    """A discovered agent that may not be imported or instantiated yet."""
+    name: str
+    kind: str  # "python" or "yaml"
+    source: Path
+    data: Optional[Dict[str, Any]] = None  # parsed YAML definition
+
+
+@dataclass
+class ManifestFile:
+    """Manifest record for one agent definition file."""
+    mtime_ns: int
+    size: int
+    sha1: str
+    kind: str
+    agents: List[Dict[str, Any]] = field(default_factory=list)
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+
+class AgentRegistry(Mapping):
+    """
+    Read-only name -> agent mapping returned by AgentLoader.load_all.
+
+    Iterating, len() and `in` only use discovered names; looking an agent up
+    imports and instantiates it on first access.
+    """
+
+    def __init__(self, loader: 'AgentLoader'):
+        self._loader = loader
+
+    def __getitem__(self, name: str) -> BaseAgent:
+        agent = self._loader.get_agent(name)
+        if agent is None:
+            raise KeyError(name)
+        return agent
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._loader._entries))
+
+    def __len__(self) -> int:
+        return len(self._loader._entries)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._loader._entries
+
 
 class AgentLoader:
     """
@@ -33,172 +127,354 @@ class AgentLoader:
     Supports both Python modules and YAML-based agent definitions.
     """
 
-    def __init__(self, agents_path: Optional[Path] = None):
+    def __init__(
+        self,
+        agents_path: Optional[Path] = None,
+        manifest_path: Optional[Path] = None,
+        use_manifest: bool = True,
+        yaml_workers: int = 8
+    ):
         """
         Initialize the agent loader.
 
         Args:
             agents_path: Path to directory containing agent definitions
+            manifest_path: Discovery manifest file (default: one per agents_path
+                under ~/.claude/agents/.cache)
+            use_manifest: Read and write the discovery manifest
+            yaml_workers: Threads used to read and parse YAML files on a cold start
         """
-        # Default to the agents directory (parent of this core module)
+        # Default to the agents directory (parent of this framework module)
         if agents_path is None:
-            # Path is: 2-engine/01-core/agents/core/agent_loader.py
-            # We want: 2-engine/01-core/agents/
+            # Path is: 2-engine/agents/framework/agent_loader.py
+            # We want: 2-engine/agents/
             agents_path = Path(__file__).parent.parent
-        self.agents_path = agents_path
+        self.agents_path = Path(agents_path)
+        if manifest_path is None:
+            key = hashlib.sha1(str(self.agents_path.resolve()).encode()).hexdigest()[:16]
+            manifest_path = MANIFEST_ROOT / f"manifest-{key}.json"
+        self.manifest_path = Path(manifest_path)
+        self.use_manifest = use_manifest
+        self.yaml_workers = yaml_workers
+
+        self._entries: Dict[str, AgentEntry] = {}
+        self._manifest: Dict[str, ManifestFile] = {}
+        self._manifest_loaded = False
+        self._modules: Dict[Path, Any] = {}
         self._loaded_agents: Dict[str, Type[BaseAgent]] = {}
         self._agent_instances: Dict[str, BaseAgent] = {}
+        self._registry = AgentRegistry(self)
+        self._stats = {
+            "files_scanned": 0,
+            "files_cached": 0,
+            "files_rehashed": 0,
+            "modules_imported": 0,
+            "yaml_parsed": 0,
+            "agents_instantiated": 0,
+            "discovery_seconds": 0.0,
+        }
 
         logger.info(f"AgentLoader initialized with path: {self.agents_path}")
 
-    async def load_all(self) -> Dict[str, BaseAgent]:
+    async def load_all(self) -> AgentRegistry:
         """
-        Load all available agents from the configured path.
+        Discover all available agents from the configured path.
 
         Searches for agent definitions in:
         1. Python modules with BaseAgent subclasses
         2. YAML agent definition files
 
+        Files unchanged since the manifest was written are not imported or
+        parsed. Agents are instantiated when first looked up.
+
         Returns:
-            Dictionary mapping agent names to agent instances
+            Mapping of agent names to agent instances (created on access)
         """
         logger.info("Loading all agents...")
+        loop = asyncio.get_running_loop()
+        start = loop.time()
 
-        # Load Python agents
-        await self._load_python_agents()
+        if self.use_manifest and not self._manifest_loaded:
+            self._read_manifest()
+        self._manifest_loaded = True
 
-        # Load YAML agents
-        await self._load_yaml_agents()
-
-        # Instantiate all loaded agent classes
-        for name, agent_class in self._loaded_agents.items():
-            if name not in self._agent_instances:
-                try:
-                    # Get config from agent class
-                    if hasattr(agent_class, 'get_default_config'):
-                        config = agent_class.get_default_config()
-                    else:
-                        # Create default config
-                        config = AgentConfig(
-                            name=name,
-                            full_name=agent_class.__name__,
-                            role=agent_class.__name__.replace('Agent', ''),
-                            category='general',
-                            description=f"Auto-generated config for {agent_class.__name__}"
-                        )
-
-                    instance = agent_class(config)
-                    self._agent_instances[name] = instance
-                    logger.info(f"Instantiated agent: {name}")
-
-                except Exception as e:
-                    logger.error(f"Failed to instantiate agent {name}: {e}")
-
-        logger.info(f"Loaded {len(self._agent_instances)} agents")
-
-        return self._agent_instances
-
-    async def _load_python_agents(self) -> None:
-        """Load agents from Python modules."""
         if not self.agents_path.exists():
             logger.warning(f"Agents path does not exist: {self.agents_path}")
-            return
+            self._entries = {}
+            return self._registry
+
+        python_files, yaml_files = self._scan()
+        manifest: Dict[str, ManifestFile] = {}
+        changed = False
+        stale_python: List[Tuple[Path, str, os.stat_result]] = []
+        stale_yaml: List[Tuple[Path, str, os.stat_result]] = []
+
+        for kind, files, stale in (("python", python_files, stale_python),
+                                   ("yaml", yaml_files, stale_yaml)):
+            for path in files:
+                rel = path.relative_to(self.agents_path).as_posix()
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                self._stats["files_scanned"] += 1
+                cached = self._manifest.get(rel)
+                if cached is not None and cached.kind == kind:
+                    if cached.matches(stat):
+                        manifest[rel] = cached
+                        self._stats["files_cached"] += 1
+                        continue
+                    # Touched but maybe not changed: compare contents before re-reading
+                    self._stats["files_rehashed"] += 1
+                    if _file_digest(path) == cached.sha1:
+                        cached.mtime_ns, cached.size = stat.st_mtime_ns, stat.st_size
+                        manifest[rel] = cached
+                        self._stats["files_cached"] += 1
+                        changed = True
+                        continue
+                stale.append((path, rel, stat))
+                changed = True
+                # Changed since its classes were loaded: drop them so they are re-read
+                self._modules.pop(path, None)
+                for agent in (cached.agents if cached is not None else []):
+                    self._loaded_agents.pop(agent["name"], None)
+
+        for path, rel, stat in stale_python:
+            classes = self._load_agent_from_file(path)
+            if classes is None:
+                continue  # Import failed; not recorded, so retried next scan
+            manifest[rel] = ManifestFile(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                sha1=_file_digest(path),
+                kind="python",
+                agents=[{"name": name} for name in classes]
+            )
+
+        if stale_yaml:
+            manifest.update(await self._parse_yaml_files(stale_yaml))
+
+        changed = changed or manifest.keys() != self._manifest.keys()
+        self._manifest = manifest
+        self._entries = self._build_entries(python_files, yaml_files)
+        if changed and self.use_manifest:
+            self._write_manifest()
+
+        self._stats["discovery_seconds"] = loop.time() - start
+        logger.info(
+            f"Discovered {len(self._entries)} agents "
+            f"({self._stats['files_cached']} of {self._stats['files_scanned']} files from manifest)"
+        )
 
-        # Find all Python files
-        python_files = list(self.agents_path.rglob("*.py"))
+        return self._registry
 
-        for py_file in python_files:
+    def _scan(self) -> Tuple[List[Path], List[Path]]:
+        """List candidate Python and YAML agent files, in a stable order."""
+        python_files = sorted(
+            py_file for py_file in self.agents_path.rglob("*.py")
             # Skip __init__ and test files
-            if py_file.name.startswith("__") or "test" in py_file.name.lower():
+            if not py_file.name.startswith("__") and "test" not in py_file.name.lower()
+        )
+        yaml_files = sorted(
+            yaml_file
+            for yaml_file in list(self.agents_path.rglob("*.yaml")) + list(self.agents_path.rglob("*.yml"))
+            # Skip non-agent YAML files (look for agent or specialist in filename)
+            if "agent" in yaml_file.name.lower() or "specialist" in yaml_file.name.lower()
+        )
+        return python_files, yaml_files
+
+    def _build_entries(self, python_files: List[Path], yaml_files: List[Path]) -> Dict[str, AgentEntry]:
+        """Agent entries from the manifest; later files win name clashes."""
+        entries: Dict[str, AgentEntry] = {}
+        for path in python_files + yaml_files:
+            record = self._manifest.get(path.relative_to(self.agents_path).as_posix())
+            if record is None:
                 continue
-
-            try:
-                await self._load_agent_from_file(py_file)
-            except Exception as e:
-                logger.debug(f"Failed to load agents from {py_file}: {e}")
-
-    async def _load_agent_from_file(self, file_path: Path) -> None:
+            for agent in record.agents:
+                entries[agent["name"]] = AgentEntry(
+                    name=agent["name"],
+                    kind=record.kind,
+                    source=path,
+                    data=agent.get("data")
+                )
+        return entries
+
+    async def _parse_yaml_files(
+        self,
+        stale: List[Tuple[Path, str, os.stat_result]]
+    ) -> Dict[str, ManifestFile]:
+        """Read and parse YAML agent definitions concurrently."""
+        if importlib.util.find_spec("yaml") is None:
+            logger.warning("PyYAML not installed, skipping YAML agents")
+            return {}
+
+        loop = asyncio.get_running_loop()
+        records: Dict[str, ManifestFile] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.yaml_workers, len(stale)))) as pool:
+            results = await asyncio.gather(
+                *(loop.run_in_executor(pool, _parse_agent_yaml, path) for path, _, _ in stale),
+                return_exceptions=True
+            )
+
+        for (path, rel, stat), result in zip(stale, results):
+            if isinstance(result, Exception):
+                logger.debug(f"Failed to load agent from {path}: {result}")
+                continue
+            digest, data = result
+            self._stats["yaml_parsed"] += 1
+            agents = []
+            if data is not None:
+                agents.append({"name": self._yaml_agent_id(path, data), "data": data})
+            records[rel] = ManifestFile(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                sha1=digest,
+                kind="yaml",
+                agents=agents
+            )
+        return records
+
+    def _read_manifest(self) -> None:
+        """Load the discovery manifest, ignoring a missing or outdated one."""
+        try:
+            with open(self.manifest_path, 'r') as f:
+                raw = json.load(f)
+            if raw.get("version") != MANIFEST_VERSION:
+                return
+            self._manifest = {
+                rel: ManifestFile(**record) for rel, record in raw.get("files", {}).items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable agent manifest {self.manifest_path}: {e}")
+            self._manifest = {}
+
+    def _write_manifest(self) -> None:
+        """Atomically replace the discovery manifest."""
+        payload = {
+            "version": MANIFEST_VERSION,
+            "agents_path": str(self.agents_path.resolve()),
+            "files": {
+                rel: {
+                    "mtime_ns": record.mtime_ns,
+                    "size": record.size,
+                    "sha1": record.sha1,
+                    "kind": record.kind,
+                    "agents": record.agents,
+                }
+                for rel, record in self._manifest.items()
+            },
+        }
+        tmp_path = self.manifest_path.with_name(f"{self.manifest_path.name}.{os.getpid()}.tmp")
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(payload, f, default=str)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            logger.warning(f"Could not write agent manifest {self.manifest_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _load_agent_from_file(self, file_path: Path) -> Optional[Dict[str, Type[BaseAgent]]]:
         """
         Load agent classes from a Python file.
 
         Args:
             file_path: Path to Python file
+
+        Returns:
+            Agent classes found in the module, by attribute name, or None if
+            the module could not be imported
         """
+        module = self._import_module(file_path)
+        if module is None:
+            return None
+
+        # Find BaseAgent subclasses
+        classes = {}
+        for name, obj in inspect.getmembers(module):
+            if (inspect.isclass(obj) and
+                issubclass(obj, BaseAgent) and
+                obj is not BaseAgent and
+                not obj.__name__.startswith('_')):
+
+                logger.info(f"Found agent class: {name} in {file_path}")
+                classes[name] = obj
+        return classes
+
+    def _import_module(self, file_path: Path) -> Optional[Any]:
+        """Execute a Python agent file as a module (once per loader)."""
+        if file_path in self._modules:
+            return self._modules[file_path]
+
         # Create module spec
         module_name = file_path.stem
         spec = importlib.util.spec_from_file_location(module_name, file_path)
 
         if spec is None or spec.loader is None:
             logger.debug(f"Could not create spec for {file_path}")
-            return
+            return None
 
         # Load module
         module = importlib.util.module_from_spec(spec)
-        sys_modules = sys.modules  # type: ignore
-        sys_modules[module_name] = module
+        sys.modules[module_name] = module
+        self._stats["modules_imported"] += 1
 
         try:
             spec.loader.exec_module(module)
         except Exception as e:
             logger.debug(f"Failed to load module {module_name}: {e}")
-            return
-
-        # Find BaseAgent subclasses
-        for name, obj in inspect.getmembers(module):
-            if (inspect.isclass(obj) and
-                issubclass(obj, BaseAgent) and
-                obj is not BaseAgent and
-                not obj.__name__.startswith('_')):
-
-                logger.info(f"Found agent class: {name} in {file_path}")
-                self._loaded_agents[name] = obj
-
-    async def _load_yaml_agents(self) -> None:
-        """
-        Load agents from YAML definition files.
-
-        YAML agents are converted to Python classes dynamically.
-        """
-        yaml_files = list(self.agents_path.rglob("*.yaml")) + list(self.agents_path.rglob("*.yml"))
-
-        for yaml_file in yaml_files:
-            # Skip non-agent YAML files (look for agent or specialist in filename)
-            if "agent" not in yaml_file.name.lower() and "specialist" not in yaml_file.name.lower():
-                continue
-
-            try:
-                await self._load_agent_from_yaml(yaml_file)
-            except Exception as e:
-                logger.debug(f"Failed to load agent from {yaml_file}: {e}")
+            return None
+
+        self._modules[file_path] = module
+        return module
+
+    def _get_agent_class(self, name: str) -> Optional[Type[BaseAgent]]:
+        """Import or build the class for a discovered agent."""
+        if name in self._loaded_agents:
+            return self._loaded_agents[name]
+
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+
+        if entry.kind == "yaml":
+            agent_class = self._build_yaml_agent(entry.name, entry.data, entry.source)
+        else:
+            module = self._import_module(entry.source)
+            agent_class = getattr(module, name, None) if module is not None else None
+            if not (inspect.isclass(agent_class) and issubclass(agent_class, BaseAgent)):
+                logger.error(f"Agent class {name} no longer found in {entry.source}")
+                return None
+
+        self._loaded_agents[name] = agent_class
+        return agent_class
+
+    @staticmethod
+    def _yaml_agent_id(yaml_file: Path, data: Dict[str, Any]) -> str:
+        """Agent name for a YAML definition."""
+        metadata = data['agent'].get('metadata', {})
+        # Create agent name from metadata
+        agent_id = metadata.get('id', '').replace('/', '_').replace('.md', '')
+        return agent_id or yaml_file.stem
 
-    async def _load_agent_from_yaml(self, yaml_file: Path) -> None:
+    def _build_yaml_agent(self, agent_id: str, data: Dict[str, Any], yaml_file: Path) -> Type[BaseAgent]:
         """
-        Load an agent from a YAML definition file.
+        Build an agent class from a parsed YAML definition.
 
         Args:
+            agent_id: Agent name
+            data: Parsed YAML document
             yaml_file: Path to YAML file
-        """
-        try:
-            import yaml
-        except ImportError:
-            logger.warning("PyYAML not installed, skipping YAML agents")
-            return
-
-        with open(yaml_file, 'r') as f:
-            data = yaml.safe_load(f)
-
-        if not data or 'agent' not in data:
-            return
 
+        Returns:
+            Agent class backed by Claude Code CLI
+        """
         agent_data = data['agent']
         metadata = agent_data.get('metadata', {})
         persona = agent_data.get('persona', {})
 
-        # Create agent name from metadata
-        agent_id = metadata.get('id', '').replace('/', '_').replace('.md', '')
-        if not agent_id:
-            agent_id = yaml_file.stem
-
         # Extract capabilities from YAML (can be list of strings or list of dicts with 'name')
         raw_caps = agent_data.get('capabilities', [])
         capabilities = []
@@ -381,12 +657,13 @@ class AgentLoader:
         # Set class name
         YamlAgent.__name__ = metadata.get('title', agent_id).replace(' ', '')
 
-        self._loaded_agents[agent_id] = YamlAgent
         logger.info(f"Loaded YAML agent: {agent_id}")
+        return YamlAgent
 
     def get_agent(self, name: str) -> Optional[BaseAgent]:
         """
-        Get an agent instance by name.
+        Get an agent instance by name, importing and instantiating it on
+        first use.
 
         Args:
             name: Agent name
@@ -394,16 +671,45 @@ class AgentLoader:
         Returns:
             Agent instance or None if not found
         """
-        return self._agent_instances.get(name)
+        if name in self._agent_instances:
+            return self._agent_instances[name]
+
+        try:
+            agent_class = self._get_agent_class(name)
+            if agent_class is None:
+                return None
+
+            # Get config from agent class
+            if hasattr(agent_class, 'get_default_config'):
+                config = agent_class.get_default_config()
+            else:
+                # Create default config
+                config = AgentConfig(
+                    name=name,
+                    full_name=agent_class.__name__,
+                    role=agent_class.__name__.replace('Agent', ''),
+                    category='general',
+                    description=f"Auto-generated config for {agent_class.__name__}"
+                )
+
+            instance = agent_class(config)
+        except Exception as e:
+            logger.error(f"Failed to instantiate agent {name}: {e}")
+            return None
+
+        self._agent_instances[name] = instance
+        self._stats["agents_instantiated"] += 1
+        logger.info(f"Instantiated agent: {name}")
+        return instance
 
     def list_agents(self) -> List[str]:
         """
-        List all loaded agent names.
+        List all discovered agent names.
 
         Returns:
             List of agent names
         """
-        return list(self._agent_instances.keys())
+        return list(self._entries.keys())
 
     def get_agent_info(self, name: str) -> Optional[Dict[str, any]]:
         """
@@ -420,6 +726,16 @@ class AgentLoader:
             return agent.get_capabilities()
         return None
 
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get discovery statistics (cumulative over load_all calls).
+
+        Returns:
+            Dictionary with scanned / manifest-hit / re-read file counts,
+            modules imported, agents instantiated and last discovery time
+        """
+        return dict(self._stats, agents_discovered=len(self._entries))
+
     async def reload_agent(self, name: str) -> Optional[BaseAgent]:
         """
         Reload a specific agent.
@@ -430,15 +746,15 @@ class AgentLoader:
         Returns:
             Reloaded agent instance or None if not found
         """
-        # Remove old instance
-        if name in self._agent_instances:
-            del self._agent_instances[name]
-
-        # Reload all agents
+        # Remove old instance and class, and force its file to be re-read
+        self._agent_instances.pop(name, None)
+        self._loaded_agents.pop(name, None)
+        entry = self._entries.get(name)
+        if entry is not None:
+            self._modules.pop(entry.source, None)
+            self._manifest.pop(entry.source.relative_to(self.agents_path).as_posix(), None)
+
+        # Rediscover agents
         await self.load_all()
 
         return self.get_agent(name)
-
-
-# Import sys for module loading
-import sys
@@ -0,0 +1,288 @@
+"""
+Persistent Skill Catalogue for Blackbox 5
+
+SkillManager used to walk the skills trees and re-parse every JSON, Python
+and SKILL.md skill on every start. This module keeps the parsed skills in
+SQLite, one row set per source file together with the file's mtime and size,
+plus tag -> skill and agent -> skill tables. A start only walks and stats the
+trees; files that are new or whose mtime/size changed are handed back to be
+re-parsed, and files that disappeared are dropped.
+
+Records are plain dicts so the catalogue does not depend on the skill
+classes; SkillManager converts them to Skill / AgentSkill.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from helpers.core.sqlite_utils import immediate_transaction
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    root TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS files_root ON files (root);
+
+CREATE TABLE IF NOT EXISTS skills (
+    path TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    tier INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    content TEXT,
+    PRIMARY KEY (path, position)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS skill_tags (
+    tag TEXT NOT NULL,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (tag, name, path)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS skill_tags_path ON skill_tags (path);
+
+CREATE TABLE IF NOT EXISTS agent_skills (
+    agent TEXT NOT NULL,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (agent, name, path)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS agent_skills_path ON agent_skills (path);
+"""
+
+
+@dataclass
+class CatalogChanges:
+    """Files found by a catalogue scan, grouped by what has to happen to them."""
+    stale: List[Tuple[str, str, os.stat_result]] = field(default_factory=list)  # (path, kind, stat)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.stale or self.removed)
+
+
+def walk_files(root: Path, classify: Callable[[str], Optional[str]]) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """
+    Single pass over a tree, skipping hidden directories.
+
+    Args:
+        root: Directory to walk
+        classify: Maps a file name to its kind, or None to skip the file
+
+    Yields:
+        (absolute path, kind, stat result) for each classified file
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            logger.debug(f"Cannot scan {directory}: {e}")
+            continue
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.') and entry.name != '__pycache__':
+                            stack.append(entry.path)
+                        continue
+                    kind = classify(entry.name)
+                    if kind is not None and entry.is_file():
+                        yield entry.path, kind, entry.stat()
+                except OSError as e:
+                    logger.debug(f"Cannot stat {entry.path}: {e}")
+
+
+class SkillCatalog:
+    """
+    SQLite-backed catalogue of parsed skills, keyed by source file.
+
+    Example:
+        ```python
+        catalog = SkillCatalog(Path('~/.claude/skills/.cache/catalog.db').expanduser())
+        changes = catalog.scan(skills_root, classify)
+        for path, kind, stat in changes.stale:
+            catalog.store(path, skills_root, kind, stat, parse(path, kind))
+        catalog.remove(changes.removed)
+        records = catalog.records()
+        ```
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Open (or create) the catalogue.
+
+        Args:
+            db_path: SQLite file (None = in memory)
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        if db_path is not None:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(db_path) if db_path is not None else ':memory:',
+            check_same_thread=False,
+            isolation_level=None,  # Explicit transactions only
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def scan(self, root: Path, classify: Callable[[str], Optional[str]]) -> CatalogChanges:
+        """
+        Compare a skills tree against the catalogue.
+
+        Args:
+            root: Skills directory
+            classify: Maps a file name to its kind, or None to skip the file
+
+        Returns:
+            New or modified files (to re-parse) and files no longer present
+        """
+        root_key = str(root)
+        with self._lock:
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self._conn.execute(
+                    "SELECT path, mtime_ns, size FROM files WHERE root = ?", (root_key,)
+                )
+            }
+
+        changes = CatalogChanges()
+        if Path(root).exists():
+            for path, kind, stat in walk_files(root, classify):
+                existing = known.pop(path, None)
+                if existing == (stat.st_mtime_ns, stat.st_size):
+                    changes.unchanged += 1
+                else:
+                    changes.stale.append((path, kind, stat))
+        changes.removed = list(known)
+        return changes
+
+    def store(
+        self,
+        path: str,
+        root: Path,
+        kind: str,
+        stat: os.stat_result,
+        records: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Replace the skills recorded for one file.
+
+        Args:
+            path: Source file
+            root: Skills directory the file was found under
+            kind: File kind ('json', 'python' or 'markdown')
+            stat: Stat result the records were parsed from
+            records: Skill records with 'tier', 'name', 'data' and optional
+                'content', 'tags' and 'agents'
+        """
+        self.store_many([(path, root, kind, stat, records)])
+
+    def store_many(self, files: List[Tuple[str, Path, str, os.stat_result, List[Dict[str, Any]]]]) -> None:
+        """Replace the skills recorded for several files in one transaction."""
+        with immediate_transaction(self._conn, self._lock) as conn:
+            for path, root, kind, stat, records in files:
+                self._delete(conn, path)
+                conn.execute(
+                    "INSERT INTO files (path, root, kind, mtime_ns, size) VALUES (?, ?, ?, ?, ?)",
+                    (path, str(root), kind, stat.st_mtime_ns, stat.st_size),
+                )
+                conn.executemany(
+                    "INSERT INTO skills (path, position, tier, name, data, content) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (path, position, record['tier'], record['name'],
+                         json.dumps(record['data'], default=str), record.get('content'))
+                        for position, record in enumerate(records)
+                    ],
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO skill_tags (tag, name, path) VALUES (?, ?, ?)",
+                    [(tag, record['name'], path) for record in records for tag in record.get('tags', [])],
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO agent_skills (agent, name, path) VALUES (?, ?, ?)",
+                    [(agent, record['name'], path) for record in records for agent in record.get('agents', [])],
+                )
+
+    def remove(self, paths: List[str]) -> None:
+        """Forget files that no longer exist."""
+        if not paths:
+            return
+        with immediate_transaction(self._conn, self._lock) as conn:
+            for path in paths:
+                self._delete(conn, path)
+
+    def records(self, root: Optional[Path] = None) -> Dict[str, Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Load catalogued skills.
+
+        Args:
+            root: Only files found under this skills directory (None = all)
+
+        Returns:
+            path -> (kind, records in file order); records carry 'tier',
+            'name', 'data' and 'content'
+        """
+        query = (
+            "SELECT f.path, f.kind, s.tier, s.name, s.data, s.content "
+            "FROM files f LEFT JOIN skills s ON s.path = f.path"
+        )
+        with self._lock:
+            if root is None:
+                rows = self._conn.execute(query + " ORDER BY f.path, s.position").fetchall()
+            else:
+                rows = self._conn.execute(
+                    query + " WHERE f.root = ? ORDER BY f.path, s.position", (str(root),)
+                ).fetchall()
+
+        catalogued: Dict[str, Tuple[str, List[Dict[str, Any]]]] = {}
+        for path, kind, tier, name, data, content in rows:
+            _, records = catalogued.setdefault(path, (kind, []))
+            if name is not None:
+                records.append({'tier': tier, 'name': name, 'data': json.loads(data), 'content': content})
+        return catalogued
+
+    def skills_with_tag(self, tag: str) -> List[str]:
+        """Names of catalogued skills carrying a tag."""
+        with self._lock:
+            return [name for (name,) in self._conn.execute(
+                "SELECT DISTINCT name FROM skill_tags WHERE tag = ? ORDER BY name", (tag,)
+            )]
+
+    def skills_for_agent(self, agent: str) -> List[str]:
+        """Names of catalogued skills that declare an agent."""
+        with self._lock:
+            return [name for (name,) in self._conn.execute(
+                "SELECT DISTINCT name FROM agent_skills WHERE agent = ? ORDER BY name", (agent,)
+            )]
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, path: str) -> None:
+        for table in ("files", "skills", "skill_tags", "agent_skills"):
+            conn.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
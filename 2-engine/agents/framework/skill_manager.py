@@ -7,6 +7,9 @@ Skills are reusable capabilities that can be attached to agents.
 Extended with Tier 2 Agent Skills Standard support:
 - Tier 1: Python-based engine skills (existing)
 - Tier 2: Agent Skills Standard (SKILL.md with YAML frontmatter)
+
+Parsed skills are kept in a persistent SkillCatalog, so a start only
+re-parses skill files that are new or changed since the last run.
 """
 
 import asyncio
@@ -14,12 +17,15 @@ import importlib
 import importlib.util
 import json
 import logging
+import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Any, Union
 from enum import Enum
 
+from .skill_catalog import SkillCatalog
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +48,7 @@ class Skill:
     capabilities: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     enabled: bool = True
+    agents: List[str] = field(default_factory=list)  # Agents this skill is declared for
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert skill to dictionary."""
@@ -53,9 +60,24 @@ class Skill:
             "capabilities": self.capabilities,
             "metadata": self.metadata,
             "enabled": self.enabled,
+            "agents": self.agents,
             "tier": 1,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Skill':
+        """Rebuild a skill from to_dict output."""
+        return cls(
+            name=data["name"],
+            description=data["description"],
+            category=data["category"],
+            skill_type=SkillType(data["type"]),
+            capabilities=data.get("capabilities", []),
+            metadata=data.get("metadata", {}),
+            enabled=data.get("enabled", True),
+            agents=data.get("agents", []),
+        )
+
 
 @dataclass
 class AgentSkill:
@@ -74,6 +96,7 @@ class AgentSkill:
     category: str = "general"
     enabled: bool = True
     file_path: Optional[Path] = None
+    agents: List[str] = field(default_factory=list)  # Agents this skill is declared for
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert skill to dictionary."""
@@ -86,10 +109,27 @@ class AgentSkill:
             "version": self.version,
             "category": self.category,
             "enabled": self.enabled,
+            "agents": self.agents,
             "tier": 2,
             "file_path": str(self.file_path) if self.file_path else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AgentSkill':
+        """Rebuild a skill from to_dict output."""
+        return cls(
+            name=data["name"],
+            description=data["description"],
+            tags=data.get("tags", []),
+            content=data.get("content") or "",
+            author=data.get("author"),
+            version=data.get("version"),
+            category=data.get("category", "general"),
+            enabled=data.get("enabled", True),
+            file_path=Path(data["file_path"]) if data.get("file_path") else None,
+            agents=data.get("agents", []),
+        )
+
     @classmethod
     def from_markdown(cls, path: Path) -> 'AgentSkill':
         """
@@ -126,7 +166,7 @@ class AgentSkill:
         # Parse YAML frontmatter
         try:
             import yaml
-            frontmatter = yaml.safe_load(frontmatter_str)
+            frontmatter = yaml.load(frontmatter_str, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
         except ImportError:
             # Fallback: simple key-value parsing
             frontmatter = {}
@@ -164,6 +204,7 @@ class AgentSkill:
             category=frontmatter.get('category', 'general'),
             enabled=frontmatter.get('enabled', True),
             file_path=path,
+            agents=_as_list(frontmatter.get('agents')),
         )
 
     def get_summary(self) -> str:
@@ -183,6 +224,50 @@ class AgentSkill:
 Use `load_skill_full` for complete content."""
 
 
+def _as_list(value: Any) -> List[str]:
+    """Normalize a frontmatter/JSON list field ("a, b", [a, b] or None)."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [v.strip() for v in value.strip('[]').split(',') if v.strip()]
+    return [str(v) for v in value]
+
+
+def _classify_tier1(name: str) -> Optional[str]:
+    """Kind of a Tier 1 skill file, or None if it is not one."""
+    if name.endswith('.json'):
+        return "json"
+    # Skip __init__ and test files
+    if name.endswith('.py') and not name.startswith("__") and "test" not in name.lower():
+        return "python"
+    return None
+
+
+def _classify_tier2(name: str) -> Optional[str]:
+    """Kind of a Tier 2 skill file, or None if it is not one."""
+    return "markdown" if name == "SKILL.md" else None
+
+
+def _catalog_record(skill: Union[Skill, AgentSkill]) -> Dict[str, Any]:
+    """SkillCatalog record for a parsed skill."""
+    data = skill.to_dict()
+    return {
+        "tier": data["tier"],
+        "name": skill.name,
+        "data": data,
+        "content": data.pop("content", None),
+        "tags": skill.tags if isinstance(skill, AgentSkill) else [],
+        "agents": skill.agents,
+    }
+
+
+def _skill_from_record(record: Dict[str, Any]) -> Union[Skill, AgentSkill]:
+    """Rebuild a skill from a SkillCatalog record."""
+    if record["tier"] == 2:
+        return AgentSkill.from_dict(dict(record["data"], content=record["content"]))
+    return Skill.from_dict(record["data"])
+
+
 class SkillManager:
     """
     Skill discovery and management system with two-tier support.
@@ -199,12 +284,21 @@ class SkillManager:
     - Token-efficient on-demand loading
     """
 
-    def __init__(self, skills_path: Optional[Path] = None):
+    def __init__(
+        self,
+        skills_path: Optional[Path] = None,
+        catalog_path: Optional[Path] = None,
+        use_catalog: bool = True
+    ):
         """
         Initialize the skill manager.
 
         Args:
             skills_path: Path to directory containing Tier 1 skill definitions
+            catalog_path: SQLite skill catalogue (default: .cache/catalog.db
+                in the Tier 2 skills directory)
+            use_catalog: Persist the catalogue between runs (False keeps it
+                in memory, so every start re-parses all skills)
         """
         self.skills_path = skills_path or Path.cwd() / ".skills"
 
@@ -218,6 +312,16 @@ class SkillManager:
         self._tier2_skills: Dict[str, AgentSkill] = {}
         self._tier2_tags_index: Dict[str, List[str]] = {}  # tag -> [skill_names]
 
+        # Persistent catalogue and the in-memory indexes rebuilt from it
+        self._catalog_path = catalog_path
+        self._use_catalog = use_catalog
+        self._catalog: Optional[SkillCatalog] = None
+        self._file_skills: Dict[str, List[Union[Skill, AgentSkill]]] = {}  # source file -> skills
+        self._registered_skills: Dict[str, Skill] = {}  # register_skill() additions
+        self._declared_agent_skills: Dict[str, List[str]] = {}  # agent_name -> [skill_names]
+        self._enabled_skills: Optional[List[Union[Skill, AgentSkill]]] = None
+        self._watch_task: Optional[asyncio.Task] = None
+
         # Advanced caching with ContextManager (NEW)
         self._cache_manager: Optional['ContextManager'] = None
         self._cache_enabled = True
@@ -239,21 +343,21 @@ class SkillManager:
         """
         Load all available skills from both Tier 1 and Tier 2 sources.
 
+        Skills come from the catalogue; only new or modified skill files
+        are parsed.
+
         Returns:
             List of all loaded skills (Tier 1 and Tier 2)
         """
         logger.info("Loading all skills (Tier 1 + Tier 2)...")
 
-        # Load Tier 1 skills (existing)
-        if self.skills_path.exists():
-            await self._load_json_skills()
-            await self._load_python_skills()
-            self._organize_skills()
-        else:
+        if not self.skills_path.exists():
             logger.warning(f"Tier 1 skills path does not exist: {self.skills_path}")
+        if not self._tier2_skills_path.exists():
+            logger.info(f"Tier 2 skills path does not exist yet: {self._tier2_skills_path}")
+            logger.info("Create it with: mkdir -p ~/.claude/skills")
 
-        # Load Tier 2 skills (NEW - Agent Skills Standard)
-        await self._load_tier2_skills()
+        await self.refresh()
 
         tier1_count = len(self._skills)
         tier2_count = len(self._tier2_skills)
@@ -261,64 +365,186 @@ class SkillManager:
 
         return list(self._skills.values()) + list(self._tier2_skills.values())
 
-    async def _load_json_skills(self) -> None:
-        """Load skills from JSON definition files."""
-        json_files = list(self.skills_path.rglob("*.json"))
+    async def refresh(self) -> Dict[str, List[str]]:
+        """
+        Bring skills up to date with the skill directories.
 
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
-
-                if 'name' not in data or 'description' not in data:
-                    logger.debug(f"Skipping invalid skill file: {json_file}")
-                    continue
-
-                # Create skill
-                skill_type = SkillType(data.get('type', 'operation'))
-                skill = Skill(
-                    name=data['name'],
-                    description=data['description'],
-                    category=data.get('category', 'general'),
-                    skill_type=skill_type,
-                    capabilities=data.get('capabilities', []),
-                    metadata=data.get('metadata', {}),
-                    enabled=data.get('enabled', True)
-                )
+        Walks both trees once; only files that are new or whose mtime/size
+        changed are parsed, and skills from deleted files are dropped.
 
-                self._skills[skill.name] = skill
-                logger.debug(f"Loaded JSON skill: {skill.name}")
+        Returns:
+            Names of 'added', 'updated' and 'removed' skills
+        """
+        catalog = self._get_catalog()
+        first_load = not self._file_skills
+        changed: Dict[str, List[Union[Skill, AgentSkill]]] = {}
+        removed: List[str] = []
+
+        for root, classify in ((self.skills_path, _classify_tier1),
+                               (self._tier2_skills_path, _classify_tier2)):
+            changes = catalog.scan(root, classify)
+            parsed = []
+            for path, kind, stat in changes.stale:
+                skills = self._parse_skill_file(Path(path), kind)
+                changed[path] = skills
+                parsed.append((path, root, kind, stat, [_catalog_record(skill) for skill in skills]))
+            if parsed:
+                catalog.store_many(parsed)
+            catalog.remove(changes.removed)
+            removed.extend(changes.removed)
+
+            if first_load and changes.unchanged:
+                for path, (kind, records) in catalog.records(root=root).items():
+                    if path not in changed:
+                        self._file_skills[path] = [_skill_from_record(record) for record in records]
+
+        if not (changed or removed or first_load):
+            return {"added": [], "updated": [], "removed": []}
+
+        before = {
+            name: path for path, skills in self._file_skills.items() for name in (s.name for s in skills)
+        }
+        for path in removed:
+            self._file_skills.pop(path, None)
+        self._file_skills.update(changed)
+        self._rebuild_indexes()
+
+        after = {name for skills in self._file_skills.values() for name in (s.name for s in skills)}
+        changed_names = {skill.name for skills in changed.values() for skill in skills}
+        summary = {
+            "added": sorted(changed_names - set(before)),
+            "updated": sorted(changed_names & set(before)),
+            "removed": sorted(set(before) - after),
+        }
+        if not first_load:
+            logger.info(
+                f"Skills reloaded: {len(summary['added'])} added, {len(summary['updated'])} updated, "
+                f"{len(summary['removed'])} removed"
+            )
+        return summary
 
+    async def watch(self, interval: float = 1.0, on_change=None) -> None:
+        """
+        Poll the skill directories and hot-reload changed skills until cancelled.
+
+        Args:
+            interval: Seconds between scans
+            on_change: Optional callable (or coroutine function) given the
+                refresh summary whenever skills changed
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                summary = await self.refresh()
             except Exception as e:
-                logger.debug(f"Failed to load skill from {json_file}: {e}")
+                logger.warning(f"Skill reload failed: {e}")
+                continue
+            if on_change and any(summary.values()):
+                result = on_change(summary)
+                if asyncio.iscoroutine(result):
+                    await result
 
-    async def _load_python_skills(self) -> None:
-        """Load skills from Python modules."""
-        python_files = list(self.skills_path.rglob("*.py"))
+    def start_watching(self, interval: float = 1.0, on_change=None) -> asyncio.Task:
+        """
+        Start hot-reloading skills in the background.
 
-        for py_file in python_files:
-            # Skip __init__ and test files
-            if py_file.name.startswith("__") or "test" in py_file.name.lower():
-                continue
+        Args:
+            interval: Seconds between scans
+            on_change: Optional callback, see watch()
+
+        Returns:
+            The watch task
+        """
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self.watch(interval, on_change))
+        return self._watch_task
 
+    async def stop_watching(self) -> None:
+        """Stop the background watch task, if any."""
+        task, self._watch_task = self._watch_task, None
+        if task is not None:
+            task.cancel()
             try:
-                await self._load_skill_from_file(py_file)
-            except Exception as e:
-                logger.debug(f"Failed to load skills from {py_file}: {e}")
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _get_catalog(self) -> SkillCatalog:
+        """Open the skill catalogue on first use."""
+        if self._catalog is None:
+            catalog_path = self._catalog_path
+            if catalog_path is None and self._use_catalog and self._tier2_skills_path.exists():
+                catalog_path = self._tier2_skills_path / ".cache" / "catalog.db"
+            if not self._use_catalog:
+                catalog_path = None
+            try:
+                self._catalog = SkillCatalog(catalog_path)
+            except sqlite3.Error as e:
+                logger.warning(f"Skill catalogue {catalog_path} unavailable, using memory: {e}")
+                self._catalog = SkillCatalog(None)
+        return self._catalog
+
+    def _parse_skill_file(self, path: Path, kind: str) -> List[Union[Skill, AgentSkill]]:
+        """Parse one skill file of the given kind ('json', 'python' or 'markdown')."""
+        if kind == "json":
+            return self._parse_json_skill(path)
+        if kind == "python":
+            return self._parse_python_skills(path)
 
-    async def _load_skill_from_file(self, file_path: Path) -> None:
+        try:
+            skill = AgentSkill.from_markdown(path)
+            logger.debug(f"Loaded Tier 2 skill: {skill.name} from {path}")
+            return [skill]
+        except Exception as e:
+            logger.warning(f"Failed to load Tier 2 skill from {path}: {e}")
+            return []
+
+    def _parse_json_skill(self, json_file: Path) -> List[Skill]:
+        """Parse a skill from a JSON definition file."""
+        try:
+            with open(json_file, 'r') as f:
+                data = json.load(f)
+
+            if 'name' not in data or 'description' not in data:
+                logger.debug(f"Skipping invalid skill file: {json_file}")
+                return []
+
+            # Create skill
+            skill_type = SkillType(data.get('type', 'operation'))
+            skill = Skill(
+                name=data['name'],
+                description=data['description'],
+                category=data.get('category', 'general'),
+                skill_type=skill_type,
+                capabilities=data.get('capabilities', []),
+                metadata=data.get('metadata', {}),
+                enabled=data.get('enabled', True),
+                agents=_as_list(data.get('agents'))
+            )
+
+            logger.debug(f"Loaded JSON skill: {skill.name}")
+            return [skill]
+
+        except Exception as e:
+            logger.debug(f"Failed to load skill from {json_file}: {e}")
+            return []
+
+    def _parse_python_skills(self, file_path: Path) -> List[Skill]:
         """
         Load skills from a Python file.
 
         Args:
             file_path: Path to Python file
+
+        Returns:
+            Skills defined in the module
         """
         # Create module spec
         module_name = f"skill_{file_path.stem}"
         spec = importlib.util.spec_from_file_location(module_name, file_path)
 
         if spec is None or spec.loader is None:
-            return
+            return []
 
         # Load module
         module = importlib.util.module_from_spec(spec)
@@ -331,9 +557,10 @@ class SkillManager:
             spec.loader.exec_module(module)
         except Exception as e:
             logger.debug(f"Failed to load skill module {module_name}: {e}")
-            return
+            return []
 
         # Find skill definitions
+        skills = []
         for name, obj in vars(module).items():
             if name.startswith('_') or not inspect.isclass(obj):
                 continue
@@ -349,52 +576,41 @@ class SkillManager:
                         skill_type=SkillType(skill_info.get('type', 'operation')),
                         capabilities=skill_info.get('capabilities', []),
                         metadata=skill_info,
+                        agents=_as_list(skill_info.get('agents')),
                     )
-                    self._skills[skill.name] = skill
+                    skills.append(skill)
                     logger.debug(f"Loaded Python skill: {skill.name}")
                 except Exception as e:
                     logger.debug(f"Failed to create skill from {name}: {e}")
-
-    async def _load_tier2_skills(self) -> None:
-        """
-        Load Tier 2 skills from Agent Skills Standard directory.
-
-        Scans ~/.claude/skills/ for SKILL.md files with YAML frontmatter.
-        """
-        if not self._tier2_skills_path.exists():
-            logger.info(f"Tier 2 skills path does not exist yet: {self._tier2_skills_path}")
-            logger.info("Create it with: mkdir -p ~/.claude/skills")
-            return
-
-        logger.info(f"Loading Tier 2 skills from: {self._tier2_skills_path}")
-
-        # Find all SKILL.md files
-        skill_files = list(self._tier2_skills_path.rglob("SKILL.md"))
-
-        for skill_file in skill_files:
-            try:
-                skill = AgentSkill.from_markdown(skill_file)
-
-                # Check if skill is enabled
-                if not skill.enabled:
-                    logger.debug(f"Skipping disabled skill: {skill.name}")
-                    continue
-
-                self._tier2_skills[skill.name] = skill
-
-                # Index by tags
-                for tag in skill.tags:
-                    if tag not in self._tier2_tags_index:
-                        self._tier2_tags_index[tag] = []
-                    if skill.name not in self._tier2_tags_index[tag]:
-                        self._tier2_tags_index[tag].append(skill.name)
-
-                logger.debug(f"Loaded Tier 2 skill: {skill.name} from {skill_file}")
-
-            except Exception as e:
-                logger.warning(f"Failed to load Tier 2 skill from {skill_file}: {e}")
-
-        logger.info(f"Loaded {len(self._tier2_skills)} Tier 2 skills")
+        return skills
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild name, category, tag and agent indexes from the parsed files."""
+        self._skills = {}
+        self._tier2_skills = {}
+        for path in sorted(self._file_skills):
+            for skill in self._file_skills[path]:
+                if isinstance(skill, AgentSkill):
+                    # Disabled Tier 2 skills stay catalogued but are not served
+                    if skill.enabled:
+                        self._tier2_skills[skill.name] = skill
+                else:
+                    self._skills[skill.name] = skill
+        self._skills.update(self._registered_skills)
+        self._organize_skills()
+
+        tags_index: Dict[str, Dict[str, None]] = {}
+        for skill in self._tier2_skills.values():
+            for tag in skill.tags:
+                tags_index.setdefault(tag, {})[skill.name] = None
+        self._tier2_tags_index = {tag: list(names) for tag, names in tags_index.items()}
+
+        declared: Dict[str, Dict[str, None]] = {}
+        for skill in list(self._skills.values()) + list(self._tier2_skills.values()):
+            for agent_name in skill.agents:
+                declared.setdefault(agent_name, {})[skill.name] = None
+        self._declared_agent_skills = {agent: list(names) for agent, names in declared.items()}
+        self._enabled_skills = None
 
     def _organize_skills(self) -> None:
         """Organize skills by category."""
@@ -529,9 +745,12 @@ class SkillManager:
         Returns:
             List of skills (Tier 1 and Tier 2) available to the agent
         """
-        # Check if agent has specific skills mapped
-        if agent_name in self._agent_skill_map:
-            skill_names = self._agent_skill_map[agent_name]
+        # Check if agent has specific skills mapped (at runtime or declared by the skills)
+        if agent_name in self._agent_skill_map or agent_name in self._declared_agent_skills:
+            skill_names = self._agent_skill_map.get(agent_name, []) + [
+                name for name in self._declared_agent_skills.get(agent_name, [])
+                if name not in self._agent_skill_map.get(agent_name, [])
+            ]
             skills = []
             for name in skill_names:
                 # Check Tier 2 first
@@ -543,9 +762,11 @@ class SkillManager:
             return skills
 
         # Return all enabled skills from both tiers by default
-        tier1_skills = [s for s in self._skills.values() if s.enabled]
-        tier2_skills = [s for s in self._tier2_skills.values() if s.enabled]
-        return tier1_skills + tier2_skills
+        if self._enabled_skills is None:
+            tier1_skills = [s for s in self._skills.values() if s.enabled]
+            tier2_skills = [s for s in self._tier2_skills.values() if s.enabled]
+            self._enabled_skills = tier1_skills + tier2_skills
+        return list(self._enabled_skills)
 
     def map_skill_to_agent(self, skill_name: str, agent_name: str) -> bool:
         """
@@ -579,6 +800,8 @@ class SkillManager:
             skill: Skill to register
         """
         self._skills[skill.name] = skill
+        self._registered_skills[skill.name] = skill
+        self._enabled_skills = None
 
         if skill.category not in self._skills_by_category:
             self._skills_by_category[skill.category] = []
@@ -603,6 +826,8 @@ class SkillManager:
             category = skill.category
 
             del self._skills[name]
+            self._registered_skills.pop(name, None)
+            self._enabled_skills = None
 
             if category in self._skills_by_category:
                 self._skills_by_category[category].remove(name)
@@ -25,6 +25,7 @@ source "${SCRIPT_DIR}/../../lib/paths.sh"
 
 # Event logging
 EVENTS_FILE="$(get_project_path)/.autonomous/agents/communications/events.yaml"
+LOG_EVENT="$(get_bin_root)/bb5-log-event"
 LOG_DIR="$(get_engine_path)/.autonomous/logs"
 LOG_FILE="${LOG_DIR}/github-auto-push.log"
 
@@ -58,23 +59,16 @@ log_event() {
     local timestamp
     timestamp=$(date '+%Y-%m-%dT%H:%M:%S%z')
 
-    # Create event entry
-    local event_entry
-    event_entry=$(cat <<EOF
-
-- timestamp: "$timestamp"
-  type: "$type"
-  agent_type: "github-auto-push"
-  agent_id: "${BB5_AGENT_ID:-unknown}"
-  parent_task: "${BB5_TASK_ID:-}"
-  source: "hook"
-  message: "$message"
-EOF
-)
-
-    # Append to events.yaml if it exists and is writable
+    # Append to the event journal (mirrored into events.yaml) if events.yaml is there
     if [ -f "$EVENTS_FILE" ] && [ -w "$EVENTS_FILE" ]; then
-        echo "$event_entry" >> "$EVENTS_FILE"
+        "$LOG_EVENT" --events-file "$EVENTS_FILE" \
+            timestamp="$timestamp" \
+            type="$type" \
+            agent_type=github-auto-push \
+            agent_id="${BB5_AGENT_ID:-unknown}" \
+            parent_task="${BB5_TASK_ID:-}" \
+            source=hook \
+            message="$message" || true
     fi
 }
 
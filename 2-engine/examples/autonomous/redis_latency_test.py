@@ -2,79 +2,155 @@
 """
 Redis latency test for autonomous agent coordination.
 
-Tests the actual latency of Redis pub/sub in your environment.
-Run this to verify Redis performance before deploying the system.
+Tests the actual latency and throughput of the RedisEventBus in your
+environment. Run this to verify Redis performance before deploying the
+system.
+
+Each configuration publishes N events from one bus and measures, on a
+second bus subscribed to them:
+- Throughput (events/s from first publish to last delivery)
+- End-to-end latency (publish -> subscriber handler) p50/p99/max
+
+Configurations:
+- pubsub:           one PUBLISH round trip per event
+- pubsub-batched:   publishes coalesced into pipelines
+- streams-batched:  XADD pipelines + XREADGROUP consumer group
+
+Usage:
+    python examples/autonomous/redis_latency_test.py
+    python examples/autonomous/redis_latency_test.py --events 20000 --host redis.local
+    python examples/autonomous/redis_latency_test.py --fake   # in-process fakeredis
 """
 
+import argparse
+import asyncio
+import statistics
 import sys
+import time
 from pathlib import Path
 
-# Add core/autonomous to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "2-engine" / "core" / "autonomous"))
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from redis.coordinator import RedisLatencyTest
+from workflows.engine.state.event_bus import Event, EventBusConfig, RedisEventBus
 
 
-def main():
-    """Run Redis latency tests"""
-    print("=" * 60)
-    print("Redis Latency Test")
-    print("=" * 60)
-    print()
-    print("Testing Redis pub/sub latency...")
-    print("This will take a few seconds...")
-    print()
+CONFIGURATIONS = {
+    "pubsub": dict(use_streams=False, publish_batch_window=0),
+    "pubsub-batched": dict(use_streams=False, publish_batch_window=0.002),
+    "streams-batched": dict(use_streams=True, publish_batch_window=0.002),
+}
 
-    try:
-        results = RedisLatencyTest.test_latency(
-            host="localhost",
-            port=6379,
-            iterations=100
+
+def make_client_factory(args):
+    """Return a callable creating a Redis client (None = bus default pool)."""
+    if not args.fake:
+        return lambda: None
+
+    import fakeredis
+
+    server = fakeredis.FakeServer()
+    return lambda: fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+
+
+async def run_configuration(name: str, args, client_factory) -> dict:
+    """Publish `args.events` events and measure delivery on a second bus."""
+    options = dict(
+        CONFIGURATIONS[name],
+        use_redis=True,
+        redis_host=args.host,
+        redis_port=args.port,
+        batch_size=args.batch_size,
+        flush_interval=0.01,
+        stream_name=f"bench:{name}:{time.time_ns()}",
+    )
+    publisher = RedisEventBus(EventBusConfig(**options), redis_client=client_factory())
+    consumer = RedisEventBus(EventBusConfig(**options), redis_client=client_factory())
+
+    latencies = []
+    done = asyncio.Event()
+
+    async def on_event(event: Event):
+        latencies.append(time.perf_counter() - event.data["sent"])
+        if len(latencies) >= args.events:
+            done.set()
+
+    await consumer.subscribe("bench.event", on_event)
+    await consumer.start()
+    await asyncio.sleep(0.1)  # Let the listener subscribe / create the group
+
+    start = time.perf_counter()
+    for i in range(args.events):
+        await publisher.publish(
+            Event(type="bench.event", data={"i": i, "sent": time.perf_counter()}, source="bench")
         )
+    await publisher.flush()
 
-        print("Results:")
-        print("-" * 60)
-        print(f"  Min:     {results['min_ms']:.3f} ms")
-        print(f"  Max:     {results['max_ms']:.3f} ms")
-        print(f"  Average: {results['avg_ms']:.3f} ms")
-        print(f"  P50:     {results['p50_ms']:.3f} ms")
-        print(f"  P99:     {results['p99_ms']:.3f} ms")
-        print()
+    try:
+        await asyncio.wait_for(done.wait(), timeout=args.timeout)
+    except asyncio.TimeoutError:
+        pass
+    elapsed = time.perf_counter() - start
 
-        # Evaluate results
-        avg = results['avg_ms']
-
-        if avg < 1:
-            print("  ✓ Excellent! Sub-millisecond latency.")
-            print("    Your Redis setup is ideal for autonomous agents.")
-        elif avg < 10:
-            print("  ✓ Good! Latency is under 10ms.")
-            print("    Your Redis setup will work well for autonomous agents.")
-        elif avg < 50:
-            print("  ⚠ Acceptable. Latency is under 50ms.")
-            print("    Redis performance is adequate but could be improved.")
-        else:
-            print("  ✗ High latency detected.")
-            print("    Consider optimizing your Redis setup.")
+    stats = await publisher.get_statistics()
+    await publisher.stop()
+    await consumer.stop()
 
-        print()
-        print("Comparison:")
-        print("-" * 60)
-        print(f"  Redis pub/sub:     {avg:.3f} ms")
-        print(f"  File watching:     ~100 ms")
-        print(f"  Polling (10s):     ~10000 ms")
-        print()
-        print(f"Speedup vs polling:  {10000/avg:.0f}x faster")
-        print()
+    latencies.sort()
+    ms = [x * 1000 for x in latencies] or [0.0]
+    return {
+        "delivered": len(latencies),
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(ms),
+        "p99_ms": ms[min(len(ms) - 1, int(len(ms) * 0.99))],
+        "max_ms": ms[-1],
+        "avg_batch": stats["redis"]["avg_batch_size"],
+    }
+
+
+async def run(args) -> None:
+    client_factory = make_client_factory(args)
+
+    print("=" * 78)
+    print(f"RedisEventBus benchmark: {args.events} events "
+          f"({'fakeredis' if args.fake else f'{args.host}:{args.port}'})")
+    print("=" * 78)
+    print(f"{'mode':<17}{'delivered':>10}{'events/s':>11}{'p50 ms':>9}"
+          f"{'p99 ms':>9}{'max ms':>9}{'batch':>8}")
+    print("-" * 78)
 
+    for name in args.modes:
+        result = await run_configuration(name, args, client_factory)
+        print(f"{name:<17}{result['delivered']:>10}{result['throughput']:>11.0f}"
+              f"{result['p50_ms']:>9.3f}{result['p99_ms']:>9.3f}{result['max_ms']:>9.3f}"
+              f"{result['avg_batch']:>8.1f}")
+
+    print("-" * 78)
+    print("Comparison: file watching ~100 ms, polling (10s) ~10000 ms")
+
+
+def main():
+    """Run Redis latency tests"""
+    parser = argparse.ArgumentParser(description="RedisEventBus throughput/latency benchmark")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--modes", nargs="+", choices=list(CONFIGURATIONS), default=list(CONFIGURATIONS))
+    parser.add_argument("--fake", action="store_true", help="Use an in-process fakeredis server")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run(args))
     except Exception as e:
         print(f"Error: {e}")
         print()
         print("Make sure Redis is running:")
         print("  brew services start redis")
         print()
-        print("Or install Redis:")
-        print("  brew install redis")
+        print("Or run against an in-process fake:")
+        print("  pip install fakeredis && python examples/autonomous/redis_latency_test.py --fake")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+GLMClient Transport Benchmark
+
+Runs a local stub of the GLM chat completions endpoint and measures, for
+1, 16 and 128 concurrent agents:
+- Throughput (requests/s)
+- Request latency p50/p99
+- TCP connections opened on the server
+
+Transports:
+- legacy:  the previous acreate(), a new connection per request
+           (requests.post without a Session) run in the default thread pool
+- pooled:  acreate() on the shared keep-alive client
+
+The stub runs in its own process over plain HTTP on localhost. Each new
+connection waits --connect-latency before it is served, standing in for
+the TCP and TLS handshake round trips a remote API costs.
+
+Usage:
+    python examples/integrations/glm_client_benchmark.py
+    python examples/integrations/glm_client_benchmark.py --requests 5000 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from interface.client.GLMClient import GLMClient, aclose_shared_http_clients
+
+
+COMPLETION = json.dumps({
+    "choices": [{"message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 12, "completion_tokens": 1, "total_tokens": 13},
+}).encode()
+
+
+class StubServer:
+    """Keep-alive HTTP/1.1 server (separate process) answering POSTs with a fixed completion"""
+
+    def __init__(self, latency: float, connect_latency: float):
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self._connections = multiprocessing.Value("i", 0)
+        self._port = multiprocessing.Value("i", 0)
+        self._ready = multiprocessing.Event()
+
+    @property
+    def connections(self) -> int:
+        return self._connections.value
+
+    def start(self) -> str:
+        multiprocessing.Process(target=self._run, daemon=True).start()
+        self._ready.wait()
+        return f"http://127.0.0.1:{self._port.value}/api/paas/v4/chat/completions"
+
+    def _run(self) -> None:
+        async def serve():
+            server = await asyncio.start_server(self._handle, "127.0.0.1", 0, backlog=1024)
+            self._port.value = server.sockets[0].getsockname()[1]
+            self._ready.set()
+            await server.serve_forever()
+
+        asyncio.run(serve())
+
+    async def _handle(self, reader, writer) -> None:
+        with self._connections.get_lock():
+            self._connections.value += 1
+        await asyncio.sleep(self.connect_latency)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                await reader.readexactly(length)
+                await asyncio.sleep(self.latency)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n\r\n%s" % (len(COMPLETION), COMPLETION)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def legacy_acreate(url: str, payload: dict, headers: dict) -> dict:
+    """The previous acreate(): a fresh connection per request on the default executor"""
+    parts = urlsplit(url)
+    body = json.dumps(payload)
+
+    def post():
+        connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=120)
+        try:
+            connection.request("POST", parts.path, body=body, headers=headers)
+            return json.loads(connection.getresponse().read())
+        finally:
+            connection.close()
+
+    return await asyncio.get_event_loop().run_in_executor(None, post)
+
+
+async def run_agents(agents: int, total: int, call) -> tuple:
+    """`agents` coroutines share `total` requests; returns (elapsed, latencies)"""
+    latencies = []
+    remaining = [total]
+
+    async def agent():
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(agent() for _ in range(agents)))
+    return time.perf_counter() - start, latencies
+
+
+def summarize(elapsed: float, latencies: list) -> str:
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    return f"{len(latencies) / elapsed:>10.0f}{p50:>10.2f}{p99:>10.2f}"
+
+
+async def main_async(args) -> None:
+    server = StubServer(args.latency, args.connect_latency)
+    url = server.start()
+    os.environ.setdefault("GLM_API_KEY", "benchmark-key")
+    messages = [{"role": "user", "content": "Summarise the task queue."}]
+
+    client = GLMClient(
+        base_url=url,
+        enable_prompt_compression=False,
+        enable_token_optimization=False,
+    )
+    payload = {"model": "glm-4.7", "messages": messages, "temperature": 0.7, "top_p": 0.9, "stream": False}
+
+    print("=" * 66)
+    print(f"{'agents':>7}  {'transport':<10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'conns':>9}")
+    print("-" * 66)
+    for agents in args.agents:
+        for name in ("legacy", "pooled"):
+            if name == "legacy":
+                call = lambda: legacy_acreate(url, payload, client._headers)
+            else:
+                call = lambda: client.acreate(messages)
+
+            await run_agents(agents, min(agents, args.requests), call)  # warm-up
+            before = server.connections
+            elapsed, latencies = await run_agents(agents, args.requests, call)
+            print(f"{agents:>7}  {name:<10}{summarize(elapsed, latencies)}"
+                  f"{server.connections - before:>9}")
+        print("-" * 66)
+
+    await aclose_shared_http_clients()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GLMClient transport benchmark")
+    parser.add_argument("--agents", type=int, nargs="+", default=[1, 16, 128])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per configuration")
+    parser.add_argument("--latency", type=float, default=0.005, help="Stub server think time (s)")
+    parser.add_argument("--connect-latency", type=float, default=0.02,
+                        help="Simulated handshake time per new connection (s)")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Agent Loading Benchmark
+
+Times AgentLoader.load_all in fresh interpreters:
+- cold: no discovery manifest, every agent file imported or parsed
+- warm: manifest present, files only stat'ed
+
+and the first get_agent call on a warm loader (import + instantiate one
+agent). Runs against the engine's own agents directory, or a generated
+tree of synthetic agents with --synthetic.
+
+Usage:
+    python examples/orchestration/agent_loading_benchmark.py
+    python examples/orchestration/agent_loading_benchmark.py --synthetic 500 --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ENGINE_ROOT = Path(__file__).parent.parent.parent
+
+PYTHON_AGENT = '''from typing import List
+from agents.framework.base_agent import AgentResult, AgentTask, BaseAgent
+
+
+class {name}(BaseAgent):
+    async def execute(self, task: AgentTask) -> AgentResult:
+        return AgentResult(success=True, output="{name}")
+
+    async def think(self, task: AgentTask) -> List[str]:
+        return ["{name}"]
+'''
+
+YAML_AGENT = '''agent:
+  metadata:
+    id: specialists/synthetic-{i}
+    name: Synthetic {i}
+    title: Synthetic Specialist {i}
+    tags: [synthetic, bench, agent-{i}]
+  persona:
+    role: Synthetic Specialist
+    identity: Generated agent number {i} for the loading benchmark.
+    domain_expertise: [{domains}]
+  capabilities:
+{capabilities}
+'''
+
+
+def make_synthetic(root: Path, count: int) -> None:
+    """Write count YAML agents and count // 4 Python agents under root."""
+    (root / "specialists").mkdir(parents=True)
+    (root / "core").mkdir()
+    for i in range(count):
+        capabilities = "\n".join(f"    - name: skill_{i}_{j}\n      level: expert" for j in range(12))
+        domains = ", ".join(f"domain-{i}-{j}" for j in range(8))
+        (root / "specialists" / f"synthetic-{i}-specialist.yaml").write_text(
+            YAML_AGENT.format(i=i, domains=domains, capabilities=capabilities)
+        )
+    for i in range(count // 4):
+        (root / "core" / f"Synthetic{i}Agent.py").write_text(PYTHON_AGENT.format(name=f"Synthetic{i}Agent"))
+
+
+def child(agents_path: str, manifest_path: str) -> None:
+    """Measure one load_all (and first lookup) in this interpreter."""
+    sys.path.insert(0, str(ENGINE_ROOT))
+    from agents.framework.agent_loader import AgentLoader
+
+    loader = AgentLoader(agents_path=Path(agents_path), manifest_path=Path(manifest_path))
+    start = time.perf_counter()
+    agents = asyncio.run(loader.load_all())
+    load_seconds = time.perf_counter() - start
+
+    names = sorted(agents)
+    start = time.perf_counter()
+    loader.get_agent(names[0]) if names else None
+    first_lookup = time.perf_counter() - start
+
+    print(json.dumps({
+        "load_seconds": load_seconds,
+        "first_lookup_seconds": first_lookup,
+        "agents": len(names),
+        "stats": loader.get_stats(),
+    }))
+
+
+def run_child(agents_path: Path, manifest_path: Path) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", str(agents_path), str(manifest_path)],
+        capture_output=True, text=True, check=True, cwd=ENGINE_ROOT
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold vs warm AgentLoader.load_all")
+    parser.add_argument("--synthetic", type=int, default=0, help="Generate N YAML (+ N/4 Python) agents")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        if args.synthetic:
+            agents_path = tmp / "agents"
+            make_synthetic(agents_path, args.synthetic)
+        else:
+            agents_path = ENGINE_ROOT / "agents"
+        manifest = tmp / "manifest.json"
+
+        cold, warm = [], []
+        for _ in range(args.runs):
+            manifest.unlink(missing_ok=True)
+            cold.append(run_child(agents_path, manifest))
+            warm.append(run_child(agents_path, manifest))
+
+    def median(runs, key):
+        return statistics.median(r[key] for r in runs) * 1000
+
+    print("=" * 60)
+    print(f"agents path: {agents_path if not args.synthetic else f'{args.synthetic} synthetic'}")
+    print(f"agents discovered: {warm[-1]['agents']}, files: {warm[-1]['stats']['files_scanned']}")
+    print("-" * 60)
+    print(f"{'start':<8}{'load_all ms':>14}{'first get_agent ms':>22}{'imports':>10}")
+    for label, runs in (("cold", cold), ("warm", warm)):
+        print(f"{label:<8}{median(runs, 'load_seconds'):>14.1f}"
+              f"{median(runs, 'first_lookup_seconds'):>22.1f}"
+              f"{runs[-1]['stats']['modules_imported']:>10}")
+    print("-" * 60)
+    print(f"warm speedup: {median(cold, 'load_seconds') / median(warm, 'load_seconds'):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
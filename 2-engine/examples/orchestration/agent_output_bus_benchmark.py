@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Agent Output Bus Benchmark
+
+Logging throughput for agent outputs:
+- legacy:     the previous _log_to_database (connect, insert one row,
+              commit, close per output)
+- batched:    AgentOutputBus.receive with the background writer
+- compressed: the same, with raw outputs of 1 KiB or more stored compressed
+
+Handler fan-out, with --handlers handlers that each block for
+--handler-ms milliseconds (e.g. a webhook call):
+- receive:  handlers run one after another
+- areceive: handlers run concurrently
+
+Usage:
+    python examples/orchestration/agent_output_bus_benchmark.py
+    python examples/orchestration/agent_output_bus_benchmark.py --outputs 20000 --handlers 4 --handler-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "interface"))
+
+from AgentOutputBus import SCHEMA, AgentOutputBus, HandlerResult, OutputHandler
+from AgentOutputParser import create_agent_output, parse_agent_output
+
+
+def make_output(i: int) -> str:
+    return create_agent_output(
+        status=("success", "partial", "failed")[i % 3],
+        summary=f"Finished step {i}",
+        deliverables=[f"src/module_{i % 50}.py", f"tests/test_module_{i % 50}.py"],
+        next_steps=["Review the changes", "Run the integration suite"],
+        human_content=f"Implemented step {i}.\n" + "Details of the change. " * 60,
+        agent_name=f"agent-{i % 8}",
+        task_id=f"TASK-{i}"
+    )
+
+
+def legacy_log(db_path: Path, raw_output: str) -> None:
+    """The pre-writer _log_to_database: one connection and commit per output."""
+    parsed = parse_agent_output(raw_output)
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        INSERT INTO agent_outputs
+        (timestamp, agent_name, task_id, status, summary, deliverables, next_steps, metadata, human_content, raw_output)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (
+        time.strftime("%Y-%m-%dT%H:%M:%S"),
+        parsed.metadata.get("agent", "unknown"),
+        parsed.metadata.get("task_id", "unknown"),
+        parsed.status,
+        parsed.summary,
+        json.dumps(parsed.deliverables),
+        json.dumps(parsed.next_steps),
+        json.dumps(parsed.metadata),
+        parsed.human_content,
+        raw_output
+    ))
+    conn.commit()
+    conn.close()
+
+
+class BlockingHandler(OutputHandler):
+    def __init__(self, name: str, seconds: float):
+        super().__init__(name)
+        self.seconds = seconds
+
+    def handle(self, event):
+        time.sleep(self.seconds)
+        return HandlerResult(True, "ok")
+
+
+def run_legacy(tmp: Path, outputs: list) -> float:
+    db_path = tmp / "legacy.db"
+    conn = sqlite3.connect(db_path)  # Default rollback journal, as before
+    conn.executescript(SCHEMA)
+    conn.close()
+
+    start = time.perf_counter()
+    for raw in outputs:
+        legacy_log(db_path, raw)
+    return time.perf_counter() - start
+
+
+def run_bus(tmp: Path, name: str, outputs: list, **kwargs) -> tuple:
+    db_path = tmp / f"{name}.db"
+    bus = AgentOutputBus(db_path=db_path, **kwargs)
+    bus.initialize()
+    start = time.perf_counter()
+    for raw in outputs:
+        bus.receive(raw)
+    bus.log_writer.flush()
+    elapsed = time.perf_counter() - start
+    batches = bus.log_writer.stats["batches"]
+    bus.close()
+    return elapsed, batches, db_path.stat().st_size
+
+
+def run_fanout(tmp: Path, outputs: list, handlers: int, handler_seconds: float) -> tuple:
+    bus = AgentOutputBus(db_path=tmp / "fanout.db")
+    for i in range(handlers):
+        bus.register_handler(BlockingHandler(f"handler-{i}", handler_seconds))
+    bus.initialize()
+
+    start = time.perf_counter()
+    for raw in outputs:
+        bus.receive(raw)
+    sync_elapsed = time.perf_counter() - start
+
+    async def run_async():
+        for raw in outputs:
+            await bus.areceive(raw)
+
+    start = time.perf_counter()
+    asyncio.run(run_async())
+    async_elapsed = time.perf_counter() - start
+    bus.close()
+    return sync_elapsed, async_elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AgentOutputBus logging throughput and handler fan-out")
+    parser.add_argument("--outputs", type=int, default=5000)
+    parser.add_argument("--legacy-outputs", type=int, default=1000)
+    parser.add_argument("--handlers", type=int, default=4)
+    parser.add_argument("--handler-ms", type=float, default=10.0)
+    parser.add_argument("--fanout-outputs", type=int, default=50)
+    args = parser.parse_args()
+
+    outputs = [make_output(i) for i in range(args.outputs)]
+    print("=" * 64)
+    print(f"{'logging':<14}{'outputs':>10}{'outputs/s':>14}{'batches':>10}{'db KiB':>12}")
+    print("-" * 64)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        legacy = outputs[:args.legacy_outputs]
+        elapsed = run_legacy(tmp, legacy)
+        size = (tmp / "legacy.db").stat().st_size
+        print(f"{'legacy':<14}{len(legacy):>10}{len(legacy) / elapsed:>14.0f}{len(legacy):>10}{size / 1024:>12.0f}")
+
+        for name, kwargs in (("batched", {}), ("compressed", {"compress_threshold": 1024})):
+            elapsed, batches, size = run_bus(tmp, name, outputs, **kwargs)
+            print(f"{name:<14}{len(outputs):>10}{len(outputs) / elapsed:>14.0f}{batches:>10}{size / 1024:>12.0f}")
+
+        print("-" * 64)
+        fanout = outputs[:args.fanout_outputs]
+        sync_elapsed, async_elapsed = run_fanout(tmp, fanout, args.handlers, args.handler_ms / 1000)
+        print(f"{args.handlers} handlers x {args.handler_ms:.0f} ms, {len(fanout)} outputs:")
+        print(f"  receive   {sync_elapsed / len(fanout) * 1000:8.1f} ms/output")
+        print(f"  areceive  {async_elapsed / len(fanout) * 1000:8.1f} ms/output")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
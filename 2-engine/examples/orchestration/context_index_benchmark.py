@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Code Context Search Benchmark
+
+Generates a synthetic repository and compares ContextExtractor code search:
+- scan:     the previous full scan (rglob per pattern, read every file,
+            substring match on every line) for each query
+- build:    building the inverted index from scratch
+- reopen:   opening a persisted index and refreshing it (stat walk only)
+- refresh:  incremental refresh after touching a handful of files
+- query:    ranked search_codebase() against the warm index
+
+Usage:
+    python examples/orchestration/context_index_benchmark.py
+    python examples/orchestration/context_index_benchmark.py --files 50000 --scan-queries 2
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from workflows.engine.pipeline.context_extractor import ContextExtractor
+
+
+WORDS = [
+    "agent", "task", "workflow", "state", "event", "router", "memory", "token",
+    "budget", "context", "cache", "session", "queue", "worker", "schedule",
+    "circuit", "breaker", "journal", "commit", "checkpoint", "skill", "vector",
+    "embed", "prompt", "response", "client", "request", "handler", "config",
+    "metric", "monitor", "health", "retry", "timeout", "parse", "render",
+]
+QUERIES = [
+    ["circuit", "breaker"], ["token", "budget"], ["workflow", "checkpoint"],
+    ["AgentRouter"], ["embed", "vector", "cache"], ["health", "monitor"],
+    ["parse_response"], ["session", "timeout"],
+]
+
+
+def generate_repo(root: Path, files: int, seed: int) -> None:
+    """
+    Write `files` Python files in nested packages, plus skipped noise.
+
+    Identifier words follow a Zipf distribution over WORDS plus 5000
+    synthetic words, like real code: a few terms everywhere, most rare.
+    """
+    rng = random.Random(seed)
+    vocabulary = WORDS + [f"w{n}x" for n in range(5000)]
+    rng.shuffle(vocabulary)
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    for i in range(files):
+        package = root / f"pkg{i % 50}" / f"mod{i % 20}"
+        package.mkdir(parents=True, exist_ok=True)
+        lines = []
+        for _ in range(rng.randint(20, 80)):
+            a, b = rng.choices(vocabulary, weights, k=2)
+            lines.append(f"def {a}_{b}_{rng.randint(0, 9)}({b}):")
+            lines.append(f"    return {a.capitalize()}{b.capitalize()}({b})")
+        (package / f"file{i}.py").write_text("\n".join(lines) + "\n")
+
+    noise = root / "node_modules" / "dep"
+    noise.mkdir(parents=True)
+    for i in range(files // 10):
+        (noise / f"dep{i}.js").write_text("function circuit_breaker() {}\n" * 50)
+
+
+def legacy_scan(root: Path, keywords: list) -> int:
+    """The pre-index search: rglob per pattern and scan every line."""
+    patterns = ContextExtractor.DEFAULT_CODE_PATTERNS
+    keywords = [k.lower() for k in keywords]
+    matches = 0
+    for pattern in patterns:
+        for file_path in root.rglob(pattern):
+            if any(skip in str(file_path) for skip in ContextExtractor.SKIP_DIRECTORIES):
+                continue
+            try:
+                content = file_path.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+            for line in content.splitlines():
+                if any(k in line.lower() for k in keywords):
+                    matches += 1
+                    break
+    return matches
+
+
+def touch(paths: list) -> None:
+    for path in paths:
+        with open(path, "a") as f:
+            f.write("def late_circuit_change():\n    pass\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def summarize(samples: list) -> str:
+    samples = sorted(samples)
+    p50 = statistics.median(samples) * 1000
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000
+    return f"{p50:>11.2f}{p99:>11.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ContextExtractor code search benchmark")
+    parser.add_argument("--files", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--scan-queries", type=int, default=3, help="Queries timed with the full scan")
+    parser.add_argument("--touch", type=int, default=20, help="Files modified before the refresh")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "repo"
+        index_path = Path(tmp) / "index" / "code.db"
+        print(f"Generating {args.files} files...")
+        generate_repo(root, args.files, args.seed)
+
+        print("=" * 60)
+        print(f"{'phase':<12}{'runs':>6}{'p50 ms':>11}{'p99 ms':>11}  notes")
+        print("-" * 60)
+
+        scan = [timed(legacy_scan, root, QUERIES[i % len(QUERIES)])[0] for i in range(args.scan_queries)]
+        print(f"{'scan':<12}{len(scan):>6}{summarize(scan)}  per query")
+
+        extractor = ContextExtractor(root, index_path=index_path, index_refresh_interval=3600)
+        build, counts = timed(extractor.refresh_index)
+        print(f"{'build':<12}{1:>6}{summarize([build])}  {counts['added']} files indexed")
+
+        reopened = ContextExtractor(root, index_path=index_path, index_refresh_interval=3600)
+        reopen, counts = timed(reopened.refresh_index)
+        print(f"{'reopen':<12}{1:>6}{summarize([reopen])}  {counts['unchanged']} unchanged")
+
+        touch(sorted(root.rglob("file1*.py"))[:args.touch])
+        refresh, counts = timed(extractor.refresh_index)
+        print(f"{'refresh':<12}{1:>6}{summarize([refresh])}  {counts['updated']} updated")
+
+        queries = []
+        for i in range(args.queries):
+            elapsed, results = timed(
+                lambda q: asyncio.run(extractor.search_codebase(q)), QUERIES[i % len(QUERIES)]
+            )
+            queries.append(elapsed)
+        print(f"{'query':<12}{len(queries):>6}{summarize(queries)}  top {extractor.max_files} files read")
+
+        print("-" * 60)
+        speedup = statistics.median(scan) / statistics.median(queries)
+        print(f"Query speedup over full scan: {speedup:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+DAG Scheduler Benchmark
+
+Runs wide (fan-out) and deep (chain) synthetic workflows through the
+AgentOrchestrator with mock agents and compares wall-clock time against
+the critical-path length (the lower bound for any scheduler).
+
+Usage:
+    python examples/orchestration/dag_scheduler_benchmark.py
+    python examples/orchestration/dag_scheduler_benchmark.py --delay 0.02 --parallelism 32
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from workflows.engine.Orchestrator import AgentOrchestrator, Workflow, WorkflowStep
+from agents.framework.base_agent import BaseAgent, AgentConfig, AgentTask, AgentResult
+
+
+class SleepAgent(BaseAgent):
+    """Mock agent whose latency is read from the task context."""
+
+    def __init__(self, name: str):
+        super().__init__(AgentConfig(
+            name=name,
+            full_name=f"Sleep Agent {name}",
+            role="benchmark",
+            category="testing",
+            description="Sleeps for the task's configured latency",
+        ))
+
+    async def execute(self, task: AgentTask) -> AgentResult:
+        await asyncio.sleep(task.context["latency"])
+        return AgentResult(success=True, output=task.id)
+
+    async def think(self, task: AgentTask) -> list:
+        return []
+
+
+def build_wide(width: int, agents: int, delay: float) -> Workflow:
+    """One root fanning out to `width` independent steps joined by a sink."""
+    steps = [_step("root", 0, delay)]
+    for i in range(width):
+        steps.append(_step(f"w{i}", i % agents, delay, ["root"]))
+    steps.append(_step("sink", 0, delay, [f"w{i}" for i in range(width)]))
+    return Workflow(name=f"wide-{width}", steps=steps)
+
+
+def build_deep(depth: int, lanes: int, agents: int, delay: float) -> Workflow:
+    """`lanes` independent chains of `depth` steps each."""
+    steps = []
+    for lane in range(lanes):
+        for level in range(depth):
+            deps = [f"l{lane}-{level - 1}"] if level else []
+            steps.append(_step(f"l{lane}-{level}", (lane + level) % agents, delay, deps))
+    return Workflow(name=f"deep-{lanes}x{depth}", steps=steps)
+
+
+def build_random(size: int, agents: int, delay: float, seed: int = 7) -> Workflow:
+    """Random layered DAG with jittered latencies."""
+    rng = random.Random(seed)
+    steps = []
+    for i in range(size):
+        deps = rng.sample([s.id for s in steps], k=min(len(steps), rng.randint(0, 3)))
+        steps.append(_step(f"r{i}", i % agents, delay * rng.uniform(0.5, 1.5), deps))
+    rng.shuffle(steps)
+    return Workflow(name=f"random-{size}", steps=steps)
+
+
+def _step(step_id: str, agent: int, latency: float, deps: List[str] = None) -> WorkflowStep:
+    return WorkflowStep(
+        id=step_id,
+        name=step_id,
+        agent_name=f"agent{agent}",
+        task=AgentTask(id=step_id, description=step_id, context={"latency": latency}),
+        depends_on=deps or [],
+    )
+
+
+def critical_path(workflow: Workflow) -> float:
+    """Longest latency-weighted path through the workflow."""
+    steps: Dict[str, WorkflowStep] = {s.id: s for s in workflow.steps}
+    finish: Dict[str, float] = {}
+
+    def visit(step_id: str) -> float:
+        if step_id not in finish:
+            step = steps[step_id]
+            start = max((visit(d) for d in step.depends_on), default=0.0)
+            finish[step_id] = start + step.task.context["latency"]
+        return finish[step_id]
+
+    return max(visit(s) for s in steps)
+
+
+def serial_time(workflow: Workflow) -> float:
+    """Sum of all step latencies (what a one-at-a-time scheduler pays)."""
+    return sum(s.task.context["latency"] for s in workflow.steps)
+
+
+async def run(workflow: Workflow, agents: int, parallelism: int) -> float:
+    orchestrator = AgentOrchestrator(
+        enable_checkpoints=False,
+        max_concurrent_agents=parallelism,
+    )
+    for i in range(agents):
+        await orchestrator.register_agent(SleepAgent(f"agent{i}"))
+
+    start = time.perf_counter()
+    await orchestrator.execute_workflow(workflow)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--delay", type=float, default=0.01, help="Mock agent latency (s)")
+    parser.add_argument("--agents", type=int, default=8, help="Number of mock agents")
+    parser.add_argument("--parallelism", type=int, default=64, help="Global max concurrency")
+    args = parser.parse_args()
+
+    workflows = [
+        build_wide(20, args.agents, args.delay),
+        build_wide(200, args.agents, args.delay),
+        build_deep(20, 1, args.agents, args.delay),
+        build_deep(20, 10, args.agents, args.delay),
+        build_random(300, args.agents, args.delay),
+    ]
+
+    print("=" * 78)
+    print(f"{'workflow':<14}{'steps':>7}{'serial(s)':>12}{'critical(s)':>13}"
+          f"{'wall(s)':>10}{'wall/crit':>11}{'speedup':>10}")
+    print("-" * 78)
+    for workflow in workflows:
+        serial = serial_time(workflow)
+        crit = critical_path(workflow)
+        wall = asyncio.run(run(workflow, args.agents, args.parallelism))
+        print(f"{workflow.name:<14}{len(workflow.steps):>7}{serial:>12.3f}{crit:>13.3f}"
+              f"{wall:>10.3f}{wall / crit:>11.2f}{serial / wall:>9.1f}x")
+    print("=" * 78)
+    print("wall/crit close to 1.0 means the scheduler adds little over the critical path;")
+    print("it rises when --parallelism is below the workflow's width.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Event Journal Benchmark
+
+Measures the latency of logging one event on top of N existing events:
+- legacy:  the previous log_event (read events.yaml, safe_load every event,
+           append one, write every event back)
+- journal: EventJournal.append (one O_APPEND write, segment rotation)
+
+The legacy path is only run up to --legacy-max existing events; its cost
+grows linearly, so larger histories take minutes per event.
+
+Usage:
+    python examples/orchestration/event_journal_benchmark.py
+    python examples/orchestration/event_journal_benchmark.py --sizes 1000 100000 1000000 --legacy-max 10000
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "bin" / "lib"))
+
+from event_journal import EventJournal
+
+
+def make_event(i: int) -> dict:
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "agent": f"executor-{i % 8}",
+        "type": "task_completed",
+        "message": f"Completed task {i}",
+        "task_id": f"TASK-{i}",
+        "data": {"duration_seconds": i % 600, "files_changed": i % 12},
+    }
+
+
+def write_legacy_event(f, evt: dict) -> None:
+    f.write("\n")
+    f.write(f"  - timestamp: \"{evt['timestamp']}\"\n")
+    f.write(f"    agent: {evt['agent']}\n")
+    f.write(f"    type: {evt['type']}\n")
+    f.write(f"    message: \"{evt['message']}\"\n")
+    f.write(f"    task_id: {evt['task_id']}\n")
+    f.write("    data:\n")
+    for key, value in evt["data"].items():
+        f.write(f"      {key}: {value}\n")
+
+
+def legacy_log_event(events_file: Path, event: dict) -> None:
+    """The pre-journal log_event: full read, parse and rewrite."""
+    content = events_file.read_text()
+    events = (yaml.safe_load(content) or {}).get("events") or []
+    events.append(event)
+    with open(events_file, "w") as f:
+        f.write("events:\n")
+        for evt in events:
+            write_legacy_event(f, evt)
+
+
+def median_us(fn, repeat: int) -> float:
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn(i)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="events.yaml rewrite vs append-only journal")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument("--legacy-max", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print(f"{'existing events':>16}{'legacy us/event':>18}{'journal us/event':>18}{'segments':>10}")
+    print("-" * 64)
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            events_file = Path(tmp) / "events.yaml"
+
+            legacy = "-"
+            if size <= args.legacy_max:
+                with open(events_file, "w") as f:
+                    f.write("events:\n")
+                    for i in range(size):
+                        write_legacy_event(f, make_event(i))
+                legacy_us = median_us(lambda i: legacy_log_event(events_file, make_event(size + i)),
+                                      max(3, min(args.repeat, 200_000 // size)))
+                legacy = f"{legacy_us:.0f}"
+
+            journal = EventJournal.for_events_file(events_file)
+            for start in range(0, size, 10000):
+                journal.append_many(make_event(i) for i in range(start, min(size, start + 10000)))
+            journal_us = median_us(lambda i: journal.append(make_event(size + i)), args.repeat)
+            segments = len(journal.segments())
+            journal.close()
+
+        print(f"{size:>16}{legacy:>18}{journal_us:>18.1f}{segments:>10}")
+    print("-" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Skill Catalogue Benchmark
+
+Generates N Tier 2 skills (SKILL.md with frontmatter) and measures
+SkillManager:
+- full parse: no persistent catalogue, every SKILL.md parsed (the old startup)
+- cold:  first start with an empty catalogue (parse + write)
+- warm:  new SkillManager over the populated catalogue (stat only)
+- reload: refresh() after editing a handful of skills
+and the per-call cost of get_skill / search_skills_by_tag /
+get_skills_for_agent.
+
+Usage:
+    python examples/orchestration/skill_catalog_benchmark.py
+    python examples/orchestration/skill_catalog_benchmark.py --skills 5000 --edits 20
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.framework.skill_manager import SkillManager
+
+TAGS = [f"tag-{i}" for i in range(40)]
+AGENTS = ["developer", "architect", "analyst", "tester", "devops"]
+
+SKILL_MD = """---
+name: skill-{i}
+description: Generated skill number {i} for the catalogue benchmark
+tags: [{tags}]
+agents: [{agent}]
+author: bench
+version: 1.0.{i}
+---
+
+# skill-{i}
+
+{body}
+"""
+
+
+def write_skill(root: Path, i: int, rng: random.Random, revision: int = 0) -> None:
+    path = root / f"skill-{i}" / "SKILL.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    body = "\n".join(f"- Step {j}: do the thing (revision {revision})" for j in range(30))
+    path.write_text(SKILL_MD.format(
+        i=i, tags=", ".join(rng.sample(TAGS, 3)), agent=rng.choice(AGENTS), body=body
+    ))
+
+
+def make_manager(root: Path, catalog: Path, use_catalog: bool = True) -> SkillManager:
+    manager = SkillManager(skills_path=root / "tier1", catalog_path=catalog, use_catalog=use_catalog)
+    manager.set_tier2_path(root / "skills")
+    return manager
+
+
+def timed_load(manager: SkillManager) -> float:
+    start = time.perf_counter()
+    asyncio.run(manager.load_all())
+    return time.perf_counter() - start
+
+
+def per_call_us(fn, args, repeat: int = 2000) -> float:
+    start = time.perf_counter()
+    for i in range(repeat):
+        fn(args[i % len(args)])
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SkillManager catalogue startup and lookups")
+    parser.add_argument("--skills", type=int, default=1000)
+    parser.add_argument("--edits", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(args.skills):
+            write_skill(root / "skills", i, rng)
+        catalog = root / "catalog.db"
+
+        full = statistics.median(
+            timed_load(make_manager(root, catalog, use_catalog=False)) for _ in range(args.runs)
+        )
+        cold = timed_load(make_manager(root, catalog))
+        warm_times = []
+        for _ in range(args.runs):
+            manager = make_manager(root, catalog)
+            warm_times.append(timed_load(manager))
+        warm = statistics.median(warm_times)
+
+        for i in rng.sample(range(args.skills), args.edits):
+            write_skill(root / "skills", i, rng, revision=1)
+        start = time.perf_counter()
+        summary = asyncio.run(manager.refresh())
+        reload_seconds = time.perf_counter() - start
+
+        names = [f"skill-{i}" for i in range(args.skills)]
+        get_us = per_call_us(manager.get_skill, names)
+        tag_us = per_call_us(manager.search_skills_by_tag, TAGS)
+        agent_us = per_call_us(manager.get_skills_for_agent, AGENTS)
+
+    print("=" * 60)
+    print(f"{args.skills} Tier 2 skills")
+    print("-" * 60)
+    print(f"full parse (no catalogue): {full * 1000:>9.1f} ms")
+    print(f"cold start (build):        {cold * 1000:>9.1f} ms")
+    print(f"warm start:                {warm * 1000:>9.1f} ms")
+    print(f"reload {args.edits} edited:          {reload_seconds * 1000:>9.1f} ms  ({len(summary['updated'])} updated)")
+    print("-" * 60)
+    print(f"get_skill:            {get_us:>8.2f} us/call")
+    print(f"search_skills_by_tag: {tag_us:>8.2f} us/call  (~{args.skills * 3 // len(TAGS)} hits)")
+    print(f"get_skills_for_agent: {agent_us:>8.2f} us/call  (~{args.skills // len(AGENTS)} hits)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+StateManager Update Latency Benchmark
+
+Compares the cost of recording task transitions with:
+- markdown:  StateManager.update() re-parsing and rewriting STATE.md
+- store:     StateManager.update() against the SQLite store
+- task:      StateManager.update_task() single-row upserts on the store
+
+at 10, 100 and 1000 tasks per workflow.
+
+Usage:
+    python examples/orchestration/state_store_benchmark.py
+    python examples/orchestration/state_store_benchmark.py --sizes 10 100 1000 5000
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from workflows.engine.state.state_manager import StateManager
+
+
+def make_waves(task_count: int, waves: int = 4):
+    """Split `task_count` tasks evenly across `waves` waves."""
+    per_wave = max(1, task_count // waves)
+    return [
+        [
+            {"task_id": f"w{w}_t{i}", "description": f"Task {i} of wave {w}"}
+            for i in range(per_wave)
+        ]
+        for w in range(waves)
+    ]
+
+
+def time_updates(manager: StateManager, waves, iterations: int) -> list:
+    """Time full update() calls that mark one more task complete each time."""
+    current = [dict(task) for task in waves[0]]
+    samples = []
+    for i in range(iterations):
+        task = current[i % len(current)]
+        task["result"] = {"success": True}
+        start = time.perf_counter()
+        manager.update(
+            workflow_id="bench",
+            workflow_name="Benchmark",
+            wave_id=1,
+            total_waves=len(waves),
+            completed_tasks=[],
+            current_wave_tasks=current,
+            pending_waves=waves[1:],
+        )
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def time_task_updates(manager: StateManager, waves, iterations: int) -> list:
+    """Time update_task() calls (single task transition)."""
+    samples = []
+    for i in range(iterations):
+        task = waves[0][i % len(waves[0])]
+        start = time.perf_counter()
+        manager.update_task(task["task_id"], "completed", commit_hash=f"{i:07x}")
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples: list) -> str:
+    samples = sorted(samples)
+    p50 = statistics.median(samples) * 1000
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000
+    return f"{p50:>9.3f}{p99:>9.3f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StateManager update latency benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    print("=" * 62)
+    print(f"{'tasks':>6}  {'mode':<10}{'p50 ms':>9}{'p99 ms':>9}")
+    print("-" * 62)
+
+    for size in args.sizes:
+        waves = make_waves(size)
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+
+            markdown = StateManager(state_path=tmp / "md" / "STATE.md")
+            markdown.initialize("bench", "Benchmark", len(waves), waves)
+            print(f"{size:>6}  {'markdown':<10}{summarize(time_updates(markdown, waves, args.iterations))}")
+
+            store = StateManager(state_path=tmp / "db" / "STATE.md", use_store=True)
+            store.initialize("bench", "Benchmark", len(waves), waves)
+            print(f"{size:>6}  {'store':<10}{summarize(time_updates(store, waves, args.iterations))}")
+            print(f"{size:>6}  {'task':<10}{summarize(time_task_updates(store, waves, args.iterations))}")
+
+            store.render_state()
+        print("-" * 62)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Subagent Pool Benchmark
+
+Runs the same batch of jobs against the stub Claude Code CLI with a
+simulated startup cost, and compares:
+- cold:  ClaudeCodeClient.stream per job (a new CLI process each)
+- pool:  SubagentPool, one job per CLI session, each session started
+         while the slot's previous job runs
+
+Both are capped at the same concurrency. Reports wall time, mean time to
+first reply event per job, and the pool's startup / warm overhead split.
+The pool hides the startup only for jobs that run at least as long as the
+CLI takes to start (--work x 2 events vs --startup).
+
+Usage:
+    python examples/orchestration/subagent_pool_benchmark.py
+    python examples/orchestration/subagent_pool_benchmark.py --jobs 200 --workers 8 --startup 1.5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from interface.client.ClaudeCodeClient import ClaudeCodeClient
+from interface.client.SubagentPool import SubagentPool
+
+STUB_CLI = Path(__file__).parent.parent.parent / "interface" / "client" / "stub_claude_cli.py"
+
+
+async def run_cold(client: ClaudeCodeClient, jobs: int, env: dict) -> tuple:
+    first_events = []
+
+    async def one(i):
+        async with client.stream(f"job {i}", mcp_profile="minimal", env=env) as run:
+            spawned = time.monotonic()  # after the concurrency slot, like a pool job
+            async for event in run:
+                if event.type != "system":
+                    first_events.append(time.monotonic() - spawned)
+                    break
+            async for _ in run:
+                pass
+
+    start = time.monotonic()
+    await asyncio.gather(*(one(i) for i in range(jobs)))
+    return time.monotonic() - start, statistics.mean(first_events)
+
+
+async def run_pool(client: ClaudeCodeClient, jobs: int, workers: int, env: dict) -> tuple:
+    start = time.monotonic()
+    async with SubagentPool(size=workers, client=client, env=env) as pool:
+        results = await asyncio.gather(*(pool.submit(f"job {i}") for i in range(jobs)))
+        stats = pool.get_stats()
+    elapsed = time.monotonic() - start
+    assert all(r.success for r in results)
+    mean_first = statistics.mean(r.metadata["first_event_seconds"] for r in results)
+    return elapsed, mean_first, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm subagent pool vs cold CLI spawns")
+    parser.add_argument("--jobs", type=int, default=48)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--startup", type=float, default=0.5, help="Simulated CLI startup seconds")
+    parser.add_argument("--work", type=float, default=0.5, help="Simulated seconds per reply event")
+    args = parser.parse_args()
+
+    env = {
+        "STUB_CLAUDE_STARTUP": str(args.startup),
+        "STUB_CLAUDE_EVENTS": "2",
+        "STUB_CLAUDE_DELAY": str(args.work),
+    }
+    client = ClaudeCodeClient(claude_path=str(STUB_CLI), max_concurrent=args.workers)
+
+    cold_elapsed, cold_first = asyncio.run(run_cold(client, args.jobs, env))
+    pool_elapsed, pool_first, stats = asyncio.run(run_pool(client, args.jobs, args.workers, env))
+
+    print("=" * 60)
+    print(f"{args.jobs} jobs, {args.workers} concurrent, {args.startup}s CLI startup")
+    print("-" * 60)
+    print(f"{'mode':<8}{'wall s':>10}{'jobs/s':>10}{'first event ms':>18}")
+    print(f"{'cold':<8}{cold_elapsed:>10.2f}{args.jobs / cold_elapsed:>10.1f}{cold_first * 1000:>18.1f}")
+    print(f"{'pool':<8}{pool_elapsed:>10.2f}{args.jobs / pool_elapsed:>10.1f}{pool_first * 1000:>18.1f}")
+    print("-" * 60)
+    print(f"speedup:              {cold_elapsed / pool_elapsed:.1f}x")
+    print(f"worker starts:        {stats['worker_starts']}")
+    print(f"mean startup:         {stats['mean_startup_seconds'] * 1000:.1f} ms")
+    print(f"cold first event:     {stats['mean_cold_first_event_seconds'] * 1000:.1f} ms")
+    print(f"warm first event:     {stats['mean_warm_first_event_seconds'] * 1000:.1f} ms")
+    print(f"mean queue wait:      {stats['mean_queue_wait_seconds'] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    if os.name != "posix":
+        sys.exit("This benchmark needs a POSIX system")
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Token Counting Benchmark
+
+Measures TokenOptimizer.optimize() overhead in an agent loop: the
+conversation grows by one message per turn and optimize() runs on every
+turn, for several history lengths.
+
+- before:  regex heuristic over every string on every call, full recount
+           of the history, O(n^2) message trimming
+- after:   shared TokenCounter (memoized counts) and incremental history
+           counting
+
+Token counts use the heuristic in both modes, so only overhead differs.
+
+Usage:
+    python examples/orchestration/token_counting_benchmark.py
+    python examples/orchestration/token_counting_benchmark.py --history 500 5000 20000
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from helpers.core.token_counter import configure_token_counter
+from interface.client import TokenOptimizer as token_optimizer
+
+
+WORDS = ("agent task workflow state event router memory token budget context "
+         "cache session queue worker schedule deploy review plan test").split()
+CODE = "def handle_{0}(event):\n    if event.kind == '{0}':\n        return route(event)\n"
+
+
+def make_message(rng: random.Random, i: int) -> dict:
+    if rng.random() < 0.3:
+        content = "".join(CODE.format(rng.choice(WORDS)) for _ in range(rng.randint(3, 30)))
+    else:
+        content = " ".join(rng.choice(WORDS) for _ in range(rng.randint(30, 400)))
+    return {"role": "user" if i % 2 == 0 else "assistant", "content": content}
+
+
+# Previous implementation, kept for comparison ---------------------------------
+
+def legacy_estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    char_count = len(text)
+    is_code = bool(re.search(r'^\s*(def|class|function|if|for|while)\b', text, re.M))
+    chinese_chars = len(re.findall(r'[一-鿿]', text))
+    if chinese_chars > char_count * 0.3:
+        return int(chinese_chars / 1.5 + (char_count - chinese_chars) / 4)
+    elif is_code:
+        return int(char_count / 3.5)
+    return int(char_count / 4)
+
+
+def legacy_estimate_messages_tokens(messages) -> int:
+    return sum(legacy_estimate_tokens(m.get('content', '')) for m in messages)
+
+
+def legacy_trim_messages_by_tokens(messages, max_tokens, keep_system=True):
+    if not messages:
+        return []
+    system_msgs = [m for m in messages if m.get('role') == 'system'] if keep_system else []
+    other_msgs = [m for m in messages if m.get('role') != 'system']
+    system_tokens = sum(legacy_estimate_tokens(m.get('content', '')) for m in system_msgs)
+    remaining_budget = max_tokens - system_tokens
+    if remaining_budget <= 0:
+        return system_msgs[:1]
+    result_msgs = list(system_msgs)
+    current_tokens = system_tokens
+    for msg in reversed(other_msgs):
+        msg_tokens = legacy_estimate_tokens(msg.get('content', ''))
+        if current_tokens + msg_tokens <= remaining_budget:
+            result_msgs.insert(len(system_msgs), msg)
+            current_tokens += msg_tokens
+        else:
+            break
+    return result_msgs
+
+
+@contextmanager
+def legacy_mode(optimizer):
+    saved = {name: getattr(token_optimizer, name) for name in
+             ("estimate_tokens", "estimate_messages_tokens", "trim_messages_by_tokens")}
+    history_tokens = optimizer._history_tokens
+    token_optimizer.estimate_tokens = legacy_estimate_tokens
+    token_optimizer.estimate_messages_tokens = legacy_estimate_messages_tokens
+    token_optimizer.trim_messages_by_tokens = legacy_trim_messages_by_tokens
+    optimizer._history_tokens = SimpleNamespace(count=legacy_estimate_messages_tokens)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(token_optimizer, name, value)
+        optimizer._history_tokens = history_tokens
+
+
+# -----------------------------------------------------------------------------
+
+def run_turns(history_len: int, turns: int, legacy: bool, seed: int) -> list:
+    """Time optimize() for `turns` turns on top of a `history_len` history."""
+    rng = random.Random(seed)
+    history = [make_message(rng, i) for i in range(history_len)]
+    system_prompt = " ".join(rng.choice(WORDS) for _ in range(1500))
+    persona = " ".join(rng.choice(WORDS) for _ in range(600))
+    code_context = "".join(CODE.format(rng.choice(WORDS)) for _ in range(400))
+
+    configure_token_counter()
+    optimizer = token_optimizer.TokenOptimizer(
+        cache_manager=token_optimizer.CachedPromptManager(),
+        enable_consolidation=False,
+    )
+    samples = []
+    with legacy_mode(optimizer) if legacy else _nothing():
+        for turn in range(turns):
+            history.append(make_message(rng, history_len + turn))
+            start = time.perf_counter()
+            optimizer.optimize(
+                system_prompt=system_prompt,
+                agent_persona=persona,
+                conversation_history=history,
+                code_context=code_context,
+                user_query="Implement the retry policy for the router",
+                task_type="implement",
+            )
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+@contextmanager
+def _nothing():
+    yield
+
+
+def summarize(samples: list) -> str:
+    samples = sorted(samples[1:] or samples)  # first turn warms the caches
+    p50 = statistics.median(samples) * 1000
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000
+    return f"{p50:>10.3f}{p99:>10.3f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TokenOptimizer.optimize() overhead benchmark")
+    parser.add_argument("--history", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    token_optimizer.logger.disabled = True
+
+    print("=" * 56)
+    print(f"{'history':>8}  {'mode':<8}{'p50 ms':>10}{'p99 ms':>10}{'speedup':>12}")
+    print("-" * 56)
+    for history_len in args.history:
+        before = run_turns(history_len, args.turns, legacy=True, seed=args.seed)
+        after = run_turns(history_len, args.turns, legacy=False, seed=args.seed)
+        print(f"{history_len:>8}  {'before':<8}{summarize(before)}")
+        speedup = statistics.median(before[1:]) / statistics.median(after[1:])
+        print(f"{history_len:>8}  {'after':<8}{summarize(after)}{speedup:>11.1f}x")
+        print("-" * 56)
+
+
+if __name__ == "__main__":
+    main()
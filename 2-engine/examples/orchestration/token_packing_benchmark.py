@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Token Packing Benchmark
+
+Compresses TaskContext fixtures to 8k and 32k budgets and compares
+TokenCompressor's hybrid strategy:
+- before:  relevance, extractive, code-summary and dedup passes in
+           sequence, re-estimating the whole context between passes
+- after:   one-pass ContextPacker (auto, dp and greedy methods)
+
+Reports compression time, budget utilization (compressed / target tokens),
+contexts over target and the mean quality score.
+
+Fixtures are TaskContext.to_dict() JSON files. Without --fixtures the
+benchmark generates synthetic contexts; --record DIR writes them out so
+later runs can replay the same set.
+
+Usage:
+    python examples/orchestration/token_packing_benchmark.py
+    python examples/orchestration/token_packing_benchmark.py --record /tmp/task_contexts
+    python examples/orchestration/token_packing_benchmark.py --fixtures /tmp/task_contexts
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from helpers.core.token_counter import configure_token_counter
+from workflows.engine.pipeline import token_compressor
+from workflows.engine.pipeline.context_extractor import (
+    ConversationContext,
+    DocSection,
+    FileContext,
+    TaskContext,
+)
+from workflows.engine.pipeline.token_compressor import CompressionStrategy, TokenCompressor
+
+
+WORDS = ("agent task workflow state event router memory token budget context "
+         "cache session queue worker schedule retry timeout checkpoint").split()
+CODE = ("def handle_{0}(event):\n"
+        "    \"\"\"Route {0} events.\"\"\"\n"
+        "    if event.kind == '{0}':\n"
+        "        return route(event)\n")
+
+
+def sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 25))).capitalize() + "."
+
+
+def make_context(rng: random.Random, i: int) -> TaskContext:
+    """A synthetic extraction result of realistic shape and size."""
+    keywords = rng.sample(WORDS, 3)
+    files = [
+        FileContext(
+            file_path=f"src/{rng.choice(WORDS)}/{rng.choice(WORDS)}_{n}.py",
+            language=rng.choice(["python", "python", "javascript", "markdown"]),
+            relevant_lines="".join(
+                CODE.format(rng.choice(WORDS)) for _ in range(rng.randint(2, 60))
+            ).split("\n"),
+            summary=sentence(rng),
+            size_bytes=rng.randint(200, 150000)
+        )
+        for n in range(rng.randint(20, 120))
+    ]
+    docs = [
+        DocSection(
+            section_path=f"docs/{rng.choice(WORDS)}.md",
+            title=" ".join(rng.sample(WORDS, 2)).title(),
+            content=" ".join(sentence(rng) for _ in range(rng.randint(3, 60))),
+            relevance_score=round(rng.random(), 2)
+        )
+        for _ in range(rng.randint(5, 40))
+    ]
+    messages = [
+        {"role": "user" if n % 2 == 0 else "assistant",
+         "content": " ".join(sentence(rng) for _ in range(rng.randint(1, 12)))}
+        for n in range(rng.randint(0, 30))
+    ]
+    return TaskContext(
+        task_id=f"task-{i}",
+        task_description=" ".join(sentence(rng) for _ in range(3)),
+        relevant_files=files,
+        relevant_docs=docs,
+        conversation_context=ConversationContext(
+            summary=sentence(rng),
+            relevant_messages=messages,
+            participant_count=2,
+            message_count=len(messages)
+        ),
+        total_tokens=0,
+        extraction_time=0.0,
+        sources_searched=len(files) + len(docs),
+        keywords=keywords
+    )
+
+
+def load_fixtures(directory: Path) -> list:
+    return [
+        TaskContext.from_dict(json.loads(path.read_text()))
+        for path in sorted(directory.glob("*.json"))
+    ]
+
+
+def sequential_hybrid(compressor: TokenCompressor, context, keywords):
+    """Previous hybrid strategy: each pass in turn until under target."""
+    for strategy in compressor.strategies:
+        if compressor.estimator.estimate_task_context(context) <= compressor.target_tokens:
+            break
+        context = compressor._apply_single_strategy(context, keywords, strategy)
+    return context
+
+
+def run(contexts: list, max_tokens: int, mode: str) -> dict:
+    packing = mode if mode in ("dp", "greedy") else "auto"
+    compressor = TokenCompressor(max_tokens=max_tokens, packing=packing)
+    if mode == "before":
+        compressor._apply_hybrid_strategy = (
+            lambda context, keywords: sequential_hybrid(compressor, context, keywords)
+        )
+
+    times, utilization, quality, over = [], [], [], 0
+    for context in contexts:
+        configure_token_counter()  # cold counts, as for a fresh extraction
+        start = time.perf_counter()
+        metrics = compressor.compress(context, strategy=CompressionStrategy.HYBRID).metrics
+        times.append(time.perf_counter() - start)
+        utilization.append(metrics.budget_utilization)
+        quality.append(metrics.quality_score)
+        over += metrics.compressed_tokens > compressor.target_tokens
+    return {
+        "ms": statistics.median(times) * 1000,
+        "util": statistics.mean(utilization),
+        "min_util": min(utilization),
+        "over": over,
+        "quality": statistics.mean(quality),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TokenCompressor packing benchmark")
+    parser.add_argument("--fixtures", type=Path, help="Directory of TaskContext JSON dumps")
+    parser.add_argument("--record", type=Path, help="Write the generated contexts here")
+    parser.add_argument("--contexts", type=int, default=40)
+    parser.add_argument("--budgets", type=int, nargs="+", default=[8000, 32000])
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    token_compressor.logger.disabled = True
+
+    if args.fixtures:
+        contexts = load_fixtures(args.fixtures)
+    else:
+        rng = random.Random(args.seed)
+        contexts = [make_context(rng, i) for i in range(args.contexts)]
+        if args.record:
+            args.record.mkdir(parents=True, exist_ok=True)
+            for context in contexts:
+                (args.record / f"{context.task_id}.json").write_text(json.dumps(context.to_dict()))
+    print(f"{len(contexts)} task contexts")
+
+    print("=" * 72)
+    print(f"{'budget':>7}  {'mode':<8}{'p50 ms':>9}{'util':>9}{'min util':>10}{'over':>7}{'quality':>10}{'speedup':>10}")
+    print("-" * 72)
+    for budget in args.budgets:
+        baseline = None
+        for mode in ("before", "auto", "dp", "greedy"):
+            r = run(contexts, budget, mode)
+            baseline = baseline or r["ms"]
+            speedup = f"{baseline / r['ms']:.1f}x" if mode != "before" else ""
+            print(f"{budget:>7}  {mode:<8}{r['ms']:>9.2f}{r['util']:>9.1%}{r['min_util']:>10.1%}"
+                  f"{r['over']:>7}{r['quality']:>10.2f}{speedup:>10}")
+        print("-" * 72)
+
+
+if __name__ == "__main__":
+    main()
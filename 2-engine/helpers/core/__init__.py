@@ -1,10 +1,26 @@
 """
 Core tool infrastructure.
 
-Provides the base classes and registry for all tools.
+Provides the base classes and registry for all tools, plus the shared
+token counting service.
 """
 
 from .base import BaseTool
 from .registry import ToolRegistry
+from .sqlite_utils import immediate_transaction
+from .token_counter import (
+    MessageTokenCounter,
+    TokenCounter,
+    configure_token_counter,
+    get_token_counter,
+)
 
-__all__ = ['BaseTool', 'ToolRegistry']
+__all__ = [
+    'BaseTool',
+    'ToolRegistry',
+    'TokenCounter',
+    'MessageTokenCounter',
+    'get_token_counter',
+    'configure_token_counter',
+    'immediate_transaction',
+]
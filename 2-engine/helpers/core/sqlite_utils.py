@@ -0,0 +1,42 @@
+"""
+Shared SQLite helpers.
+
+The engine's SQLite stores (workflow state, code index, skill catalogue)
+each share one connection between the threads of a process behind a lock,
+and rely on SQLite's file locking (WAL mode) to serialize other processes.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Union
+
+
+@contextmanager
+def immediate_transaction(
+    conn: sqlite3.Connection,
+    lock: Union[threading.Lock, threading.RLock]
+) -> Iterator[sqlite3.Connection]:
+    """
+    Run one IMMEDIATE transaction on a shared connection under its lock.
+
+    BEGIN IMMEDIATE takes SQLite's write lock up front, so a transaction
+    never fails half way on a lock upgrade against another process. The
+    connection must be in autocommit mode (isolation_level=None).
+
+    Args:
+        conn: Connection shared by the calling threads
+        lock: Lock guarding the connection
+
+    Yields:
+        The connection, inside the transaction; it is committed on exit
+        and rolled back if the block raises
+    """
+    with lock:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
@@ -0,0 +1,373 @@
+"""
+Black Box 5 Engine - Token Counting
+
+One token counting service shared by the prompt optimizer
+(interface/client/TokenOptimizer.py) and the context compressor
+(workflows/engine/pipeline/token_compressor.py).
+
+- Exact counts from a local tokenizer file, loaded offline:
+  - tokenizer.json (Hugging Face format, needs the `tokenizers` package)
+  - *.tiktoken BPE rank files (built-in byte-pair merge)
+- A character heuristic when no tokenizer is configured
+- Counts memoized by content hash in an LRU
+- MessageTokenCounter for conversations that grow one message at a time
+
+The tokenizer file is read from BB5_TOKENIZER_PATH, or set explicitly:
+
+    configure_token_counter(vocab_path=Path("models/glm-4/tokenizer.json"))
+    get_token_counter().count("def main(): ...")
+"""
+
+import base64
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Texts up to this length are cache keys themselves; longer ones are hashed
+INLINE_KEY_CHARS = 256
+
+
+class Tokenizer:
+    """
+    Base class for tokenizers.
+
+    Subclasses set `name` and implement count().
+    """
+
+    name = "tokenizer"
+    exact = True
+
+    def count(self, text: str, language: Optional[str] = None) -> int:
+        """Number of tokens in text (language is a hint for estimators)"""
+        raise NotImplementedError
+
+
+class HeuristicTokenizer(Tokenizer):
+    """
+    Character-based estimate, used when no tokenizer file is available.
+
+    Without a language hint it approximates GLM 4.7 (similar to GPT models):
+    - English: ~4 chars per token
+    - Code: ~3.5 chars per token
+    - Chinese: ~1.5 chars per token
+    With a hint it applies the per-language ratio from TOKENS_PER_CHAR.
+
+    Counts may be off by ~20%.
+    """
+
+    name = "heuristic"
+    exact = False
+
+    # Approximate tokens per character for different languages
+    TOKENS_PER_CHAR = {
+        'python': 0.3,  # Code is more token-dense
+        'javascript': 0.3,
+        'typescript': 0.3,
+        'java': 0.25,
+        'cpp': 0.25,
+        'markdown': 0.5,  # Text is less dense
+        'yaml': 0.4,
+        'json': 0.35,
+        'default': 0.4
+    }
+
+    CODE_PATTERN = re.compile(r'^\s*(def|class|function|if|for|while)\b', re.M)
+    CHINESE_PATTERN = re.compile(r'[\u4e00-\u9fff]')
+
+    def count(self, text: str, language: Optional[str] = None) -> int:
+        if not text:
+            return 0
+
+        char_count = len(text)
+        if language is not None:
+            ratio = self.TOKENS_PER_CHAR.get(language, self.TOKENS_PER_CHAR['default'])
+            return int(char_count * ratio)
+
+        # ASCII text has no Chinese characters; skip the scan
+        chinese_chars = 0 if text.isascii() else len(self.CHINESE_PATTERN.findall(text))
+        if chinese_chars > char_count * 0.3:
+            # Mostly Chinese
+            return int(chinese_chars / 1.5 + (char_count - chinese_chars) / 4)
+        elif self.CODE_PATTERN.search(text):
+            # Code is more token-efficient
+            return int(char_count / 3.5)
+        else:
+            # English text
+            return int(char_count / 4)
+
+
+class HuggingFaceTokenizer(Tokenizer):
+    """Exact counts from a tokenizer.json (pip install tokenizers)"""
+
+    def __init__(self, path: Path):
+        from tokenizers import Tokenizer as HFTokenizer
+
+        self._tokenizer = HFTokenizer.from_file(str(path))
+        self.name = f"hf:{Path(path).parent.name or Path(path).name}"
+
+    def count(self, text: str, language: Optional[str] = None) -> int:
+        return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+class BPETokenizer(Tokenizer):
+    """
+    Exact counts from a tiktoken-format rank file (base64 token, rank per line).
+
+    Text is split into pieces with the cl100k pre-tokenizer pattern (exact
+    with the `regex` package, a close stdlib approximation otherwise) and
+    each distinct piece is merged once, then memoized.
+    """
+
+    # cl100k_base pre-tokenizer; needs the `regex` package for \p classes
+    PATTERN = (
+        r"""(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\p{L}\p{N}]?\p{L}+|\p{N}{1,3}|"""
+        r""" ?[^\s\p{L}\p{N}]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"""
+    )
+    FALLBACK_PATTERN = (
+        r"""(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\w]?[^\W\d_]+|\d{1,3}|"""
+        r""" ?[^\s\w]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"""
+    )
+
+    def __init__(self, path: Path, piece_cache_size: int = 65536):
+        self.ranks: Dict[bytes, int] = {}
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    token, rank = line.split()
+                    self.ranks[base64.b64decode(token)] = int(rank)
+        self.name = f"bpe:{Path(path).stem}"
+
+        try:
+            import regex
+            self._pattern = regex.compile(self.PATTERN)
+        except ImportError:
+            self._pattern = re.compile(self.FALLBACK_PATTERN)
+        self._piece_tokens = lru_cache(maxsize=piece_cache_size)(self._merge)
+
+    def count(self, text: str, language: Optional[str] = None) -> int:
+        return sum(self._piece_tokens(piece) for piece in self._pattern.findall(text))
+
+    def _merge(self, piece: str) -> int:
+        """Byte-pair merge one piece; returns its token count"""
+        data = piece.encode('utf-8')
+        if data in self.ranks:
+            return 1
+        parts = [data[i:i + 1] for i in range(len(data))]
+        ranks = self.ranks
+        while len(parts) > 1:
+            best_rank, best = None, -1
+            for i in range(len(parts) - 1):
+                rank = ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank, best = rank, i
+            if best < 0:
+                break
+            parts[best:best + 2] = [parts[best] + parts[best + 1]]
+        return len(parts)
+
+
+def load_tokenizer(path: Path) -> Tokenizer:
+    """Load a tokenizer file: tokenizer.json (Hugging Face) or a tiktoken rank file"""
+    path = Path(path)
+    if path.suffix == '.json':
+        return HuggingFaceTokenizer(path)
+    return BPETokenizer(path)
+
+
+class TokenCounter:
+    """
+    Token counting service with an LRU of counts keyed by content hash.
+
+    Uses the exact tokenizer when one is configured, the heuristic
+    otherwise (or if the tokenizer fails on a text). Thread-safe.
+    """
+
+    def __init__(self, tokenizer: Optional[Tokenizer] = None, cache_size: int = 65536):
+        """
+        Initialize token counter.
+
+        Args:
+            tokenizer: Exact tokenizer (None = heuristic only)
+            cache_size: Counts memoized (0 disables the cache)
+        """
+        self.tokenizer = tokenizer
+        self.fallback = HeuristicTokenizer()
+        self.cache_size = cache_size
+
+        self._cache: 'OrderedDict[Tuple[Optional[str], Any], int]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'fallbacks': 0}
+
+    @property
+    def exact(self) -> bool:
+        """True if counts come from a real tokenizer"""
+        return self.tokenizer is not None
+
+    def count(self, text: str, language: Optional[str] = None) -> int:
+        """
+        Count tokens in text.
+
+        Args:
+            text: Text to count
+            language: Language hint for the heuristic (ignored by exact tokenizers)
+
+        Returns:
+            Token count
+        """
+        if not text:
+            return 0
+        if not self.cache_size:
+            return self._count(text, language)
+
+        # The heuristic depends on the language hint; exact counts do not
+        key = (None if self.tokenizer else language,
+               text if len(text) <= INLINE_KEY_CHARS
+               else hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest())
+        with self._lock:
+            tokens = self._cache.get(key)
+            if tokens is not None:
+                self._cache.move_to_end(key)
+                self._stats['hits'] += 1
+                return tokens
+
+        tokens = self._count(text, language)
+        with self._lock:
+            self._stats['misses'] += 1
+            self._cache[key] = tokens
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def count_messages(self, messages: List[Dict[str, str]]) -> int:
+        """Total tokens in the content of a list of messages"""
+        return sum(self.count(m.get('content', '')) for m in messages)
+
+    def _count(self, text: str, language: Optional[str]) -> int:
+        if self.tokenizer is not None:
+            try:
+                return self.tokenizer.count(text, language)
+            except Exception as e:
+                with self._lock:
+                    self._stats['fallbacks'] += 1
+                logger.warning(f"Tokenizer {self.tokenizer.name} failed, using heuristic: {e}")
+        return self.fallback.count(text, language)
+
+    def clear(self) -> None:
+        """Drop all memoized counts"""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get token counter statistics."""
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'tokenizer': self.tokenizer.name if self.tokenizer else self.fallback.name,
+                'exact': self.exact,
+                'entries': len(self._cache),
+                'hit_rate': self._stats['hits'] / lookups if lookups > 0 else 0,
+            }
+
+
+class MessageTokenCounter:
+    """
+    Running token total for a conversation.
+
+    count(messages) reuses the counts of the longest prefix shared with
+    the previous call, so appending a message only counts the new one.
+
+    Usage:
+        tally = MessageTokenCounter()
+        tally.count(history)        # counts every message
+        history.append(reply)
+        tally.count(history)        # counts only `reply`
+    """
+
+    def __init__(self, counter: Optional[TokenCounter] = None):
+        self.counter = counter
+        self._contents: List[str] = []
+        self._totals: List[int] = [0]  # _totals[i] = tokens in the first i messages
+        self._lock = threading.RLock()
+
+    @property
+    def total(self) -> int:
+        return self._totals[-1]
+
+    def count(self, messages: List[Dict[str, str]]) -> int:
+        """Total tokens in messages, counting only what changed since the last call"""
+        with self._lock:
+            contents = self._contents
+            shared = 0
+            limit = min(len(messages), len(contents))
+            while shared < limit:
+                content = messages[shared].get('content', '')
+                if content is not contents[shared] and content != contents[shared]:
+                    break
+                shared += 1
+
+            del contents[shared:]
+            del self._totals[shared + 1:]
+            for message in messages[shared:]:
+                self.append(message)
+            return self.total
+
+    def append(self, message: Dict[str, str]) -> int:
+        """Add one message; returns the new total"""
+        content = message.get('content', '')
+        tokens = (self.counter or get_token_counter()).count(content)
+        with self._lock:
+            self._contents.append(content)
+            self._totals.append(self._totals[-1] + tokens)
+            return self.total
+
+
+# Global token counter instance
+_global_counter: Optional[TokenCounter] = None
+_counter_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """Get global token counter (loads BB5_TOKENIZER_PATH on first use)."""
+    global _global_counter
+    with _counter_lock:
+        if _global_counter is None:
+            tokenizer = None
+            path = os.getenv('BB5_TOKENIZER_PATH')
+            if path:
+                try:
+                    tokenizer = load_tokenizer(Path(path))
+                except Exception as e:
+                    logger.warning(f"Could not load tokenizer {path}, using heuristic: {e}")
+            _global_counter = TokenCounter(tokenizer)
+        return _global_counter
+
+
+def configure_token_counter(
+    tokenizer: Optional[Tokenizer] = None,
+    vocab_path: Optional[Path] = None,
+    cache_size: int = 65536
+) -> TokenCounter:
+    """
+    Replace the global token counter.
+
+    Args:
+        tokenizer: Exact tokenizer instance
+        vocab_path: Tokenizer file to load instead (see load_tokenizer)
+        cache_size: Counts memoized (0 disables the cache)
+    """
+    global _global_counter
+    if tokenizer is None and vocab_path is not None:
+        tokenizer = load_tokenizer(vocab_path)
+    counter = TokenCounter(tokenizer, cache_size=cache_size)
+    with _counter_lock:
+        _global_counter = counter
+    return counter
@@ -12,7 +12,9 @@ import sys
 from pathlib import Path
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "bin" / "lib"))
 from paths import PathResolver, get_path_resolver
+from event_journal import EventJournal
 
 resolver = get_path_resolver()
 PROJECT_DIR = resolver.get_project_path()
@@ -235,19 +237,11 @@ def send_to_dashboard(alert: Dict[str, Any]) -> bool:
             'metadata': alert.get('metadata', {}),
         }
 
-        # Load existing events
-        events = []
-        if events_file.exists():
-            with open(events_file, 'r') as f:
-                data = yaml.safe_load(f)
-                events = data if isinstance(data, list) else []
-
-        # Prepend new event
-        events.insert(0, event)
-
-        # Save
-        with open(events_file, 'w') as f:
-            yaml.safe_dump(events, f, default_flow_style=False)
+        # Append to the event journal, mirrored into events.yaml
+        journal = EventJournal.for_events_file(events_file)
+        journal.seed_from_events_file()
+        journal.record(event)
+        journal.close()
 
         logger.info(f"Alert sent to dashboard: {alert['id']}")
         return True
@@ -2,8 +2,11 @@
 """
 Event Logger - Unified Agent Communication Module
 
-Provides event logging to events.yaml for Python agents.
-Matches the format used by bash agents for unified communication.
+Provides event logging for Python agents. Events are appended to the
+journal next to events.yaml (events.journal/, see bin/lib/event_journal.py)
+and mirrored into events.yaml with one append instead of rewriting the whole
+file, like the bash agents do through bin/bb5-log-event;
+export_events_yaml() rebuilds events.yaml from the journal.
 
 Usage:
     from event_logger import log_event, log_start, log_complete, log_error
@@ -14,19 +17,24 @@ Usage:
         message="Analysis started",
         run_dir="/path/to/run"
     )
+
+    # Rebuild events.yaml from the journal
+    python event_logger.py --export
 """
 
-import os
 import sys
-import yaml
-import fcntl
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-# Add unified_config to path for path resolution
+# Add unified_config and the shared event journal (bin/lib) to path
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "bin" / "lib"))
 from unified_config import get_path_resolver
+from event_journal import EventJournal
+
+# Open journals by events file; history in events.yaml is imported on first use
+_journals: Dict[Path, EventJournal] = {}
 
 
 def _get_events_file_path() -> Path:
@@ -59,8 +67,6 @@ def _ensure_events_file_exists(events_file: Path) -> None:
 #
 # This is an APPEND-ONLY log. Never delete or modify existing entries.
 
-version: "1.0"
-
 # =============================================================================
 # EVENT STRUCTURE
 # =============================================================================
@@ -93,31 +99,24 @@ version: "1.0"
 # in_progress      - Agent is working on task
 
 # =============================================================================
-# EVENT LOG (append only)
+# EVENT LOG (append only, one list item per event below)
 # =============================================================================
 
-events: []
 """
         with open(events_file, 'w') as f:
             f.write(header)
 
 
-def _lock_file(f) -> None:
-    """Acquire an exclusive lock on the file for thread-safe writes."""
-    try:
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-    except (ImportError, AttributeError):
-        # fcntl not available on Windows, skip locking
-        pass
-
-
-def _unlock_file(f) -> None:
-    """Release the lock on the file."""
-    try:
-        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-    except (ImportError, AttributeError):
-        # fcntl not available on Windows, skip unlocking
-        pass
+def _get_journal(events_file: Path) -> EventJournal:
+    """Get the journal for an events file, importing its existing events once."""
+    journal = _journals.get(events_file)
+    if journal is None:
+        journal = EventJournal.for_events_file(events_file)
+        imported = journal.seed_from_events_file()
+        if imported:
+            print(f"Imported {imported} events from {events_file} into {journal.directory}", file=sys.stderr)
+        _journals[events_file] = journal
+    return journal
 
 
 def log_event(
@@ -166,64 +165,8 @@ def log_event(
         if data:
             event["data"] = data
 
-        # Read existing events
-        with open(events_file, 'r') as f:
-            _lock_file(f)
-            content = f.read()
-            _unlock_file(f)
-
-        # Parse YAML to find events list
-        events = []
-        try:
-            yaml_content = yaml.safe_load(content) or {}
-            if isinstance(yaml_content, dict):
-                raw_events = yaml_content.get('events', [])
-                if isinstance(raw_events, list):
-                    events = raw_events
-                elif raw_events is None:
-                    events = []
-        except yaml.YAMLError:
-            events = []
-
-        # Append new event
-        events.append(event)
-
-        # Write back with proper YAML structure
-        # We need to preserve the header comments, so we reconstruct carefully
-        with open(events_file, 'w') as f:
-            _lock_file(f)
-
-            # Write header (everything before "events:")
-            header_end = content.find("events:")
-            if header_end >= 0:
-                f.write(content[:header_end])
-                f.write("events:\n")
-            else:
-                f.write("events:\n")
-
-            # Write all events
-            for evt in events:
-                f.write("\n")
-                f.write(f"  - timestamp: \"{evt['timestamp']}\"\n")
-                f.write(f"    agent: {evt['agent']}\n")
-                f.write(f"    type: {evt['type']}\n")
-
-                if 'message' in evt:
-                    # Escape quotes in message
-                    msg = evt['message'].replace('"', '\\"')
-                    f.write(f"    message: \"{msg}\"\n")
-
-                if 'run_dir' in evt:
-                    f.write(f"    run_dir: {evt['run_dir']}\n")
-
-                if 'task_id' in evt:
-                    f.write(f"    task_id: {evt['task_id']}\n")
-
-                if 'data' in evt and evt['data']:
-                    f.write("    data:\n")
-                    _write_yaml_data(f, evt['data'], indent_level=3)
-
-            _unlock_file(f)
+        # One O_APPEND write to the journal, one append to events.yaml
+        _get_journal(events_file).record(event)
 
         return True
 
@@ -232,37 +175,23 @@ def log_event(
         return False
 
 
-def _write_yaml_data(f, data: Any, indent_level: int = 0) -> None:
-    """Write data as YAML with proper indentation."""
-    indent = "  " * indent_level
-
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if isinstance(value, dict):
-                f.write(f"{indent}{key}:\n")
-                _write_yaml_data(f, value, indent_level + 1)
-            elif isinstance(value, list):
-                f.write(f"{indent}{key}:\n")
-                for item in value:
-                    if isinstance(item, dict):
-                        f.write(f"{indent}-\n")
-                        _write_yaml_data(f, item, indent_level + 1)
-                    else:
-                        f.write(f"{indent}- {item}\n")
-            else:
-                # Escape quotes in string values
-                if isinstance(value, str):
-                    value = value.replace('"', '\\"')
-                    f.write(f"{indent}{key}: \"{value}\"\n")
-                else:
-                    f.write(f"{indent}{key}: {value}\n")
-    elif isinstance(data, list):
-        for item in data:
-            if isinstance(item, dict):
-                f.write(f"{indent}-\n")
-                _write_yaml_data(f, item, indent_level + 1)
-            else:
-                f.write(f"{indent}- {item}\n")
+def export_events_yaml(events_file: Optional[Path] = None) -> Path:
+    """
+    Rebuild events.yaml from the event journal.
+
+    Keeps the file's comment header and writes every journaled event as a
+    list item. The file is replaced atomically, so readers never see a
+    partial export.
+
+    Args:
+        events_file: events.yaml to render (default: the active one)
+
+    Returns:
+        Path of the rendered file
+    """
+    events_file = Path(events_file) if events_file else _get_events_file_path()
+    _ensure_events_file_exists(events_file)
+    return _get_journal(events_file).export_events_file()
 
 
 def log_start(agent: str, message: str = "Agent started", run_dir: Optional[str] = None, task_id: Optional[str] = None) -> bool:
@@ -307,6 +236,10 @@ def log_in_progress(agent: str, message: str = "Agent in progress", run_dir: Opt
 
 
 if __name__ == "__main__":
+    if "--export" in sys.argv[1:]:
+        print(f"Rendered {export_events_yaml()}")
+        sys.exit(0)
+
     # Test the module
     print("Testing event_logger module...")
 
@@ -320,4 +253,4 @@ if __name__ == "__main__":
     success = log_error("test-agent", "Test error event", error_details="Something went wrong")
     print(f"Error event logged: {success}")
 
-    print("Test complete. Check events.yaml for logged events.")
+    print(f"Test complete. Check {export_events_yaml()} for logged events.")
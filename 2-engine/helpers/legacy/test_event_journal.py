@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Event Journal
+
+Tests the append-only event log and the events.yaml compatibility export.
+Run with: python3 -m unittest test_event_journal -v
+"""
+
+import json
+import multiprocessing
+import shutil
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import yaml
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "bin" / "lib"))
+LOG_EVENT_CLI = Path(__file__).resolve().parents[3] / "bin" / "bb5-log-event"
+
+import event_logger
+from event_journal import EventJournal
+
+
+def _append_events(directory: str, writer: int, count: int) -> None:
+    journal = EventJournal(Path(directory), max_segment_bytes=4096, index_stride=512)
+    for i in range(count):
+        journal.append({"agent": f"writer-{writer}", "type": "tick", "n": i})
+    journal.close()
+
+
+class TestEventJournal(unittest.TestCase):
+    """Test cases for EventJournal."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.events_file = self.temp_dir / "events.yaml"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_append_rotates_by_size(self):
+        """Test that segments rotate by size and events read back in order."""
+        journal = EventJournal.for_events_file(self.events_file, max_segment_bytes=1024)
+        for i in range(100):
+            journal.append({"timestamp": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}", "type": "tick", "n": i})
+
+        self.assertEqual(journal.directory, self.temp_dir / "events.journal")
+        segments = journal.segments()
+        self.assertGreater(len(segments), 3)
+        self.assertTrue(all(s.path.stat().st_size <= 1024 + 100 for s in segments))
+        self.assertEqual([e["n"] for e in journal.iter_events()], list(range(100)))
+
+        reopened = EventJournal.for_events_file(self.events_file, max_segment_bytes=1024)
+        reopened.append({"type": "tock"})
+        self.assertEqual(len(reopened.segments()), len(segments))
+        last = list(reopened.iter_events())[-1]
+        self.assertEqual(last["type"], "tock")
+        self.assertIn("timestamp", last)
+
+    def test_append_rotates_by_age(self):
+        """Test that a segment written to for too long is rotated."""
+        journal = EventJournal.for_events_file(self.events_file, max_segment_age=0.05)
+        journal.append({"type": "first"})
+        time.sleep(0.1)
+        journal.append({"type": "second"})
+        self.assertEqual([s.number for s in journal.segments()], [1, 2])
+
+    def test_sparse_index_points_at_records(self):
+        """Test that index entries are record offsets with their timestamps."""
+        journal = EventJournal.for_events_file(self.events_file, index_stride=256)
+        journal.append_many(
+            {"timestamp": f"2026-01-01T00:00:{i:02d}", "type": "tick", "n": i} for i in range(50)
+        )
+
+        [segment] = journal.segments()
+        index = journal.read_index(segment)
+        self.assertEqual(index[0].offset, 0)
+        self.assertGreater(len(index), 5)
+        self.assertLess(len(index), 50)
+        for entry in index:
+            first = next(journal.read_segment(segment, entry.offset))
+            self.assertEqual(first["timestamp"], entry.timestamp)
+
+    def test_import_runs_once_and_torn_tail_is_skipped(self):
+        """Test history import and recovery from a partial final record."""
+        journal = EventJournal.for_events_file(self.events_file)
+        self.assertEqual(journal.import_events([{"type": "old", "n": 1}, {"type": "old", "n": 2}]), 2)
+        self.assertEqual(journal.import_events([{"type": "old", "n": 3}]), 0)
+
+        [segment] = journal.segments()
+        with open(segment.path, "a") as f:
+            f.write('{"type": "torn"')
+        self.assertEqual([e["n"] for e in journal.iter_events()], [1, 2])
+
+    def test_concurrent_writers(self):
+        """Test that processes appending at once never interleave records."""
+        directory = self.temp_dir / "events.journal"
+        processes = [
+            multiprocessing.Process(target=_append_events, args=(str(directory), writer, 200))
+            for writer in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        journal = EventJournal(directory)
+        events = list(journal.iter_events())
+        self.assertEqual(len(events), 800)
+        for writer in range(4):
+            mine = [e["n"] for e in events if e["agent"] == f"writer-{writer}"]
+            self.assertEqual(mine, list(range(200)))
+        for segment in journal.segments():
+            for entry in journal.read_index(segment):
+                with open(segment.path, "rb") as f:
+                    f.seek(entry.offset)
+                    self.assertEqual(json.loads(f.readline())["timestamp"], entry.timestamp)
+
+
+class TestEventLoggerJournal(unittest.TestCase):
+    """Test cases for event_logger on top of the journal."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.events_file = self.temp_dir / "events.yaml"
+        self._original_path = event_logger._get_events_file_path
+        event_logger._get_events_file_path = lambda: self.events_file
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        event_logger._get_events_file_path = self._original_path
+        journal = event_logger._journals.pop(self.events_file, None)
+        if journal is not None:
+            journal.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_log_event_appends_and_export_renders_yaml(self):
+        """Test that history is kept, events are mirrored and export is lossless."""
+        event_logger._ensure_events_file_exists(self.events_file)
+        header = self.events_file.read_text()
+        self.events_file.write_text(
+            header + 'events:\n\n  - timestamp: "2026-01-01T00:00:00"\n    agent: planner\n    type: start\n'
+        )
+
+        self.assertTrue(event_logger.log_start("executor", 'Started "task"', task_id="TASK-1"))
+        self.assertTrue(event_logger.log_complete("executor", data={"files": ["a.py"], "ok": True}))
+        content = self.events_file.read_text()
+        self.assertTrue(content.startswith(header))
+        mirrored = yaml.safe_load(content)
+        self.assertEqual([e["agent"] for e in mirrored], ["planner", "executor", "executor"])
+
+        event_logger.export_events_yaml()
+        content = self.events_file.read_text()
+        self.assertTrue(content.startswith(header))
+        events = yaml.safe_load(content)
+        self.assertEqual(events, mirrored)
+        self.assertEqual(events[1]["message"], 'Started "task"')
+        self.assertEqual(events[1]["task_id"], "TASK-1")
+        self.assertEqual(events[2]["data"], {"files": ["a.py"], "ok": True})
+
+    def test_shell_writer_events_reach_the_journal(self):
+        """Test that bb5-log-event and log_event share one journal and mirror."""
+        self.events_file.write_text("- timestamp: '2026-01-01T00:00:00'\n  type: old\n")
+        self.assertTrue(event_logger.log_start("executor", task_id="TASK-1"))
+        subprocess.run(
+            [sys.executable, str(LOG_EVENT_CLI), "--events-file", str(self.events_file),
+             "type=task_complete", "task_id=TASK-1", "source=bb5-complete",
+             "data.file_count:=2", 'data.files:=["a.py", "b.py"]'],
+            check=True
+        )
+
+        journal = EventJournal.for_events_file(self.events_file)
+        journaled = list(journal.iter_events())
+        self.assertEqual([e["type"] for e in journaled], ["old", "start", "task_complete"])
+        self.assertEqual(journaled[2]["data"], {"file_count": 2, "files": ["a.py", "b.py"]})
+        self.assertEqual(
+            [e["type"] for e in yaml.safe_load(self.events_file.read_text())],
+            ["old", "start", "task_complete"]
+        )
+
+        event_logger.export_events_yaml()
+        self.assertEqual(yaml.safe_load(self.events_file.read_text()), journaled)
+
+        result = subprocess.run(
+            [sys.executable, str(LOG_EVENT_CLI), "--events-file", str(self.events_file), "no-equals-sign"],
+            capture_output=True
+        )
+        self.assertEqual(result.returncode, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,16 +15,29 @@ Usage:
 
     # Send to bus (auto-routes to Kanban, Scheduler, DB)
     bus.receive(agent_output)
+
+    # Or from async code, running handlers concurrently
+    await bus.areceive(agent_output)
+
+Outputs are logged to SQLite by a background writer that batches inserts
+into transactions over one persistent WAL-mode connection; queries flush
+pending rows first, and close() (or collecting the bus, or interpreter exit)
+flushes the rest. areceive() never blocks the event loop on a full queue.
 """
 
+import asyncio
+import atexit
 import logging
 import json
 import sqlite3
 import sys
 import threading
+import time
+import weakref
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -107,6 +120,293 @@ class OutputHandler:
         """
         raise NotImplementedError(f"{self.name}.handle() not implemented")
 
+    async def ahandle(self, event: OutputEvent) -> HandlerResult:
+        """
+        Handle an agent output event from async code.
+
+        Runs handle() in a worker thread; handlers with native async I/O
+        can override this.
+        """
+        return await asyncio.to_thread(self.handle, event)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS agent_outputs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    agent_name TEXT NOT NULL,
+    task_id TEXT,
+    status TEXT NOT NULL,
+    summary TEXT,
+    deliverables TEXT,
+    next_steps TEXT,
+    metadata TEXT,
+    human_content TEXT,
+    raw_output TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_agent_outputs_timestamp
+ON agent_outputs(timestamp DESC);
+
+CREATE INDEX IF NOT EXISTS idx_agent_outputs_status
+ON agent_outputs(status);
+
+CREATE INDEX IF NOT EXISTS idx_agent_outputs_agent_time
+ON agent_outputs(agent_name, timestamp);
+
+CREATE INDEX IF NOT EXISTS idx_agent_outputs_agent_status
+ON agent_outputs(agent_name, status);
+
+CREATE INDEX IF NOT EXISTS idx_agent_outputs_task_time
+ON agent_outputs(task_id, timestamp);
+
+-- Covered by the (agent_name, ...) indexes above
+DROP INDEX IF EXISTS idx_agent_outputs_agent;
+"""
+
+INSERT_OUTPUT = """
+    INSERT INTO agent_outputs
+    (timestamp, agent_name, task_id, status, summary, deliverables, next_steps, metadata, human_content, raw_output)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# Writers with a running thread, closed by one exit hook (weak, so the set
+# itself never keeps a writer alive)
+_running_writers: "weakref.WeakSet[OutputLogWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_running_writers() -> None:
+    for writer in list(_running_writers):
+        writer.close()
+
+
+class OutputLogWriter:
+    """
+    Background writer for the agent_outputs table.
+
+    Rows are queued by add() and inserted by a writer thread, one
+    transaction per batch: a batch is written once batch_size rows are
+    queued or the oldest queued row is flush_interval seconds old. The
+    connection is opened once, in WAL mode with synchronous=NORMAL, and
+    shared with readers under a lock.
+
+    raw_output values of at least compress_threshold bytes are stored as
+    zlib-compressed BLOBs; decode_raw_output() reverses this.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        batch_size: int = 100,
+        flush_interval: float = 0.25,
+        max_pending: int = 10000,
+        compress_threshold: Optional[int] = None
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            db_path: SQLite database path
+            batch_size: Rows per transaction that trigger a write
+            flush_interval: Maximum seconds a row waits before being written
+            max_pending: Queued rows at which add() blocks (or, with block=False,
+                refuses the row) until the writer catches up
+            compress_threshold: Compress raw_output of at least this many bytes (None = never)
+        """
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_pending = max(self.batch_size, max_pending)
+        self.compress_threshold = compress_threshold
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.RLock()
+
+        self._cond = threading.Condition()
+        self._pending: List[tuple] = []
+        self._first_pending_at = 0.0
+        self._queued = 0  # Rows ever queued
+        self._done = 0  # Rows written or dropped after an error
+        self._flush_waiters = 0
+        self._closing = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.stats = {"written": 0, "failed": 0, "batches": 0, "compressed": 0}
+
+    # =========================================================================
+    # CONNECTION
+    # =========================================================================
+
+    def open(self) -> None:
+        """Open the connection and create the schema."""
+        with self._db_lock:
+            if self._conn is not None:
+                return
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            conn.executescript(SCHEMA)
+            conn.commit()
+            self._conn = conn
+
+    def query(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Run a query on the shared connection, after flushing queued rows."""
+        self.flush()
+        self.open()
+        with self._db_lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def execute_write(self, sql: str, params: tuple = ()) -> int:
+        """Run and commit a statement on the shared connection; returns its rowcount."""
+        self.flush()
+        self.open()
+        with self._db_lock:
+            with self._conn:
+                return self._conn.execute(sql, params).rowcount
+
+    # =========================================================================
+    # WRITING
+    # =========================================================================
+
+    def add(self, event: "OutputEvent", block: bool = True) -> bool:
+        """
+        Queue an event for insertion.
+
+        Args:
+            event: Output to log
+            block: Wait while max_pending rows are queued; otherwise return False
+
+        Returns:
+            False if the queue was full and block is False
+        """
+        row, compressed = self._row(event)
+        with self._cond:
+            if self._closing:
+                raise RuntimeError("OutputLogWriter is closed")
+            self._start()
+            while len(self._pending) >= self.max_pending:
+                if not block:
+                    return False
+                self._cond.wait()
+            if not self._pending:
+                self._first_pending_at = time.monotonic()
+            self._pending.append(row)
+            self._queued += 1
+            self.stats["compressed"] += compressed
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every row queued so far is written.
+
+        Returns:
+            False if the timeout expired first
+        """
+        with self._cond:
+            target = self._queued
+            if self._done >= target:
+                return True
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(lambda: self._done >= target, timeout)
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self) -> None:
+        """Write queued rows, stop the writer thread and close the connection."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        _running_writers.discard(self)
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @property
+    def pending(self) -> int:
+        """Rows queued but not yet written."""
+        with self._cond:
+            return self._queued - self._done
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="agent-output-writer", daemon=True)
+            self._thread.start()
+            _running_writers.add(self)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closing)
+                if not self._pending:
+                    return  # Closing with nothing left to write
+
+                # Let the batch fill up unless someone is waiting on it
+                while (len(self._pending) < self.batch_size
+                       and not self._flush_waiters and not self._closing):
+                    remaining = self._first_pending_at + self.flush_interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch, self._pending = self._pending, []
+                self._cond.notify_all()  # Wake producers blocked on max_pending
+
+            written = self._write(batch)
+            with self._cond:
+                self._done += len(batch)
+                self.stats["written" if written else "failed"] += len(batch)
+                self.stats["batches"] += written
+                self._cond.notify_all()
+
+    def _write(self, batch: List[tuple]) -> bool:
+        try:
+            self.open()
+            with self._db_lock:
+                with self._conn:
+                    self._conn.executemany(INSERT_OUTPUT, batch)
+            return True
+        except Exception as e:
+            logger.error(f"Database logging failed for {len(batch)} outputs: {e}")
+            return False
+
+    def _row(self, event: "OutputEvent") -> Tuple[tuple, bool]:
+        raw_output: Any = event.raw_output
+        compressed = (self.compress_threshold is not None and bool(raw_output)
+                      and len(raw_output) >= self.compress_threshold)
+        if compressed:
+            raw_output = zlib.compress(raw_output.encode("utf-8"))
+        return (
+            event.timestamp.isoformat(),
+            event.agent_name,
+            event.task_id,
+            event.status.value,
+            event.summary,
+            json.dumps(event.deliverables),
+            json.dumps(event.next_steps),
+            json.dumps(event.metadata),
+            event.human_content,
+            raw_output
+        ), compressed
+
+
+def decode_raw_output(value: Any) -> Optional[str]:
+    """raw_output as stored by OutputLogWriter, decompressed if it was compressed."""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
 
 class AgentOutputBus:
     """
@@ -119,17 +419,34 @@ class AgentOutputBus:
     4. Aggregates results
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        batch_size: int = 100,
+        flush_interval: float = 0.25,
+        compress_threshold: Optional[int] = None
+    ):
         """
         Initialize the Agent Output Bus.
 
         Args:
             db_path: Path to SQLite database for logging (optional)
+            batch_size: Logged outputs per database transaction
+            flush_interval: Maximum seconds an output waits before being logged
+            compress_threshold: Compress raw outputs of at least this many bytes (None = never)
         """
         self.db_path = db_path or Path.cwd() / "agent_outputs.db"
         self._handlers: List[OutputHandler] = []
         self._lock = threading.RLock()
         self._initialized = False
+        self.log_writer = OutputLogWriter(
+            self.db_path,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            compress_threshold=compress_threshold
+        )
+        # Closes the writer when the bus is closed, collected or the interpreter exits
+        self._close_writer = weakref.finalize(self, self.log_writer.close)
 
         logger.info(f"AgentOutputBus created (db: {self.db_path})")
 
@@ -154,40 +471,13 @@ class AgentOutputBus:
             self._handlers.append(handler)
             logger.info(f"Registered handler: {handler.name}")
 
+    def close(self) -> None:
+        """Log pending outputs and close the database connection."""
+        self._close_writer()
+
     def _init_database(self) -> None:
         """Initialize SQLite database for logging."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS agent_outputs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                agent_name TEXT NOT NULL,
-                task_id TEXT,
-                status TEXT NOT NULL,
-                summary TEXT,
-                deliverables TEXT,
-                next_steps TEXT,
-                metadata TEXT,
-                human_content TEXT,
-                raw_output TEXT
-            )
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_agent_outputs_timestamp
-            ON agent_outputs(timestamp DESC)
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_agent_outputs_agent
-            ON agent_outputs(agent_name)
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_agent_outputs_status
-            ON agent_outputs(status)
-        """)
-        conn.commit()
-        conn.close()
+        self.log_writer.open()
 
         logger.info(f"Database initialized at {self.db_path}")
 
@@ -203,6 +493,69 @@ class AgentOutputBus:
         Returns:
             Dictionary with processing results
         """
+        event = self._accept(raw_output)
+        if not isinstance(event, OutputEvent):
+            return event
+
+        # Route to handlers
+        handler_results = []
+        for handler in self._handlers:
+            try:
+                result = handler.handle(event)
+            except Exception as e:
+                result = e
+            handler_results.append(self._handler_result(handler, result))
+
+        return self._summary(event, handler_results)
+
+    async def areceive(self, raw_output: str) -> Dict[str, Any]:
+        """
+        Receive and process an agent output from async code.
+
+        Same as receive(), except that handlers run concurrently (see
+        OutputHandler.ahandle); results keep the registration order.
+
+        Args:
+            raw_output: Raw string output from agent
+
+        Returns:
+            Dictionary with processing results
+        """
+        event = self._parse(raw_output)
+        if not isinstance(event, OutputEvent):
+            return event
+        try:
+            await self._alog_to_database(event)
+        except Exception as e:
+            logger.error(f"Database logging failed: {e}")
+
+        handlers = list(self._handlers)
+        results = await asyncio.gather(
+            *(handler.ahandle(event) for handler in handlers),
+            return_exceptions=True
+        )
+        handler_results = [
+            self._handler_result(handler, result) for handler, result in zip(handlers, results)
+        ]
+
+        return self._summary(event, handler_results)
+
+    def _accept(self, raw_output: str):
+        """Parse an output and queue it for logging; returns the event or an error result."""
+        event = self._parse(raw_output)
+        if not isinstance(event, OutputEvent):
+            return event
+
+        # Log to database
+        try:
+            self._log_to_database(event)
+        except Exception as e:
+            logger.error(f"Database logging failed: {e}")
+
+        return event
+
+    def _parse(self, raw_output: str):
+        """Parse an output; returns the event or an error result."""
         if not self._initialized:
             logger.warning("AgentOutputBus not initialized, initializing now")
             self.initialize()
@@ -231,39 +584,32 @@ class AgentOutputBus:
                 "handlers": []
             }
 
-        # Log to database
-        try:
-            self._log_to_database(event)
-        except Exception as e:
-            logger.error(f"Database logging failed: {e}")
+        return event
 
-        # Route to handlers
-        handler_results = []
-        for handler in self._handlers:
-            try:
-                result = handler.handle(event)
-                handler_results.append({
-                    "handler": handler.name,
-                    "success": result.success,
-                    "message": result.message,
-                    "data": result.data
-                })
-
-                # Log handler result
-                if result.success:
-                    logger.info(f"✓ Handler {handler.name}: {result.message}")
-                else:
-                    logger.warning(f"✗ Handler {handler.name}: {result.message}")
+    def _handler_result(self, handler: OutputHandler, result: Any) -> Dict[str, Any]:
+        """Result entry for one handler; result is a HandlerResult or the exception it raised."""
+        if isinstance(result, BaseException):
+            logger.error(f"Handler {handler.name} crashed: {result}")
+            return {
+                "handler": handler.name,
+                "success": False,
+                "error": str(result)
+            }
+
+        # Log handler result
+        if result.success:
+            logger.info(f"✓ Handler {handler.name}: {result.message}")
+        else:
+            logger.warning(f"✗ Handler {handler.name}: {result.message}")
 
-            except Exception as e:
-                logger.error(f"Handler {handler.name} crashed: {e}")
-                handler_results.append({
-                    "handler": handler.name,
-                    "success": False,
-                    "error": str(e)
-                })
-
-        # Return summary
+        return {
+            "handler": handler.name,
+            "success": result.success,
+            "message": result.message,
+            "data": result.data
+        }
+
+    def _summary(self, event: OutputEvent, handler_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         return {
             "success": True,
             "event": {
@@ -278,50 +624,54 @@ class AgentOutputBus:
         }
 
     def _log_to_database(self, event: OutputEvent) -> None:
-        """Log event to database for analytics."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("""
-            INSERT INTO agent_outputs
-            (timestamp, agent_name, task_id, status, summary, deliverables, next_steps, metadata, human_content, raw_output)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            event.timestamp.isoformat(),
-            event.agent_name,
-            event.task_id,
-            event.status.value,
-            event.summary,
-            json.dumps(event.deliverables),
-            json.dumps(event.next_steps),
-            json.dumps(event.metadata),
-            event.human_content,
-            event.raw_output
-        ))
-        conn.commit()
-        conn.close()
-
-    def get_recent_outputs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Queue event for the background database writer."""
+        self.log_writer.add(event)
+
+    async def _alog_to_database(self, event: OutputEvent) -> None:
+        """Queue event without blocking the loop; waits in a thread only while the queue is full."""
+        if not self.log_writer.add(event, block=False):
+            await asyncio.to_thread(self.log_writer.add, event)
+
+    def get_recent_outputs(
+        self,
+        limit: int = 50,
+        agent_name: Optional[str] = None,
+        task_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get recent agent outputs from database.
 
         Args:
             limit: Maximum number of outputs to return
+            agent_name: Only outputs of this agent (optional)
+            task_id: Only outputs for this task (optional)
 
         Returns:
             List of recent outputs
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
-        cursor = conn.execute("""
+        conditions = []
+        params: List[Any] = []
+        if agent_name:
+            conditions.append("agent_name = ?")
+            params.append(agent_name)
+        if task_id:
+            conditions.append("task_id = ?")
+            params.append(task_id)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        rows = self.log_writer.query(f"""
             SELECT * FROM agent_outputs
+            {where}
             ORDER BY timestamp DESC
             LIMIT ?
-        """, (limit,))
+        """, (*params, limit))
 
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [dict(row) for row in rows]
+        outputs = []
+        for row in rows:
+            output = dict(row)
+            output["raw_output"] = decode_raw_output(output["raw_output"])
+            outputs.append(output)
+        return outputs
 
     def get_agent_stats(self, agent_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -333,11 +683,8 @@ class AgentOutputBus:
         Returns:
             Statistics dictionary
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
         if agent_name:
-            cursor = conn.execute("""
+            rows = self.log_writer.query("""
                 SELECT
                     COUNT(*) as total,
                     SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as success_count,
@@ -347,7 +694,7 @@ class AgentOutputBus:
                 WHERE agent_name = ?
             """, (agent_name,))
         else:
-            cursor = conn.execute("""
+            rows = self.log_writer.query("""
                 SELECT
                     COUNT(*) as total,
                     SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as success_count,
@@ -356,8 +703,7 @@ class AgentOutputBus:
                 FROM agent_outputs
             """)
 
-        stats = cursor.fetchone()
-        conn.close()
+        stats = rows[0] if rows else None
 
         if not stats or stats[0] == 0:
             return {"total": 0, "success_rate": 0}
@@ -372,10 +718,7 @@ class AgentOutputBus:
 
     def get_recent_deliverables(self, limit: int = 20) -> List[str]:
         """Get list of recent deliverables."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
-        cursor = conn.execute("""
+        rows = self.log_writer.query("""
             SELECT deliverables FROM agent_outputs
             WHERE deliverables IS NOT NULL AND deliverables != '[]'
             ORDER BY timestamp DESC
@@ -383,14 +726,13 @@ class AgentOutputBus:
         """, (limit,))
 
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             try:
                 deliverables = json.loads(row[0])
                 results.extend(deliverables)
             except (json.JSONDecodeError, TypeError, KeyError):
                 continue
 
-        conn.close()
         return results[:limit]
 
     def clear_old_logs(self, days_to_keep: int = 30) -> int:
@@ -403,16 +745,11 @@ class AgentOutputBus:
         Returns:
             Number of rows deleted
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("""
+        deleted = self.log_writer.execute_write("""
             DELETE FROM agent_outputs
             WHERE timestamp < datetime('now', '-' || ? || ' days')
         """, (days_to_keep,))
 
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
-
         logger.info(f"Cleared {deleted} old log entries (kept {days_to_keep} days)")
         return deleted
 
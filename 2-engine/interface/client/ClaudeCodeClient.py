@@ -9,14 +9,22 @@ Usage:
 
     client = ClaudeCodeClient()
     result = client.execute("Write a hello world function in Python")
+
+    # Stream stream-json events as the CLI emits them
+    async with client.stream("Fix the failing test", timeout=600) as run:
+        async for event in run:
+            print(event.type, event.text)
 """
 
 import asyncio
 import json
 import logging
+import signal
 import subprocess
+import threading
+import weakref
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 import os
@@ -25,6 +33,16 @@ import tempfile
 logger = logging.getLogger(__name__)
 
 
+class ClaudeCodeError(Exception):
+    """Base exception for Claude Code client errors"""
+    pass
+
+
+class ClaudeCodeTimeoutError(ClaudeCodeError, asyncio.TimeoutError):
+    """Raised when a streamed CLI run exceeds its timeout (the process group is killed)"""
+    pass
+
+
 @dataclass
 class ClaudeCodeRequest:
     """Request configuration for Claude Code execution."""
@@ -47,6 +65,277 @@ class ClaudeCodeResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class ClaudeCodeEvent:
+    """
+    One line of CLI output.
+
+    stream-json lines become events of their own `type` (system, assistant,
+    user, result, ...); anything else is a `text` event.
+    """
+    type: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    raw: str = ""
+
+    @classmethod
+    def parse(cls, line: str) -> 'ClaudeCodeEvent':
+        """Parse one output line"""
+        try:
+            data = json.loads(line)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            return cls(type="text", data={"text": line}, raw=line)
+        return cls(type=str(data.get("type", "unknown")), data=data, raw=line)
+
+    @property
+    def text(self) -> str:
+        """Text carried by the event (plain line, assistant text blocks or final result)"""
+        if self.type == "text":
+            return self.data.get("text", "")
+        if self.type == "result":
+            return self.data.get("result") or ""
+        if self.type == "assistant":
+            return "".join(
+                block.get("text", "") for block in self._content()
+                if block.get("type") == "text"
+            )
+        return ""
+
+    def tool_uses(self) -> List[Dict[str, Any]]:
+        """tool_use blocks of an assistant event"""
+        if self.type != "assistant":
+            return []
+        return [block for block in self._content() if block.get("type") == "tool_use"]
+
+    def _content(self) -> List[Dict[str, Any]]:
+        message = self.data.get("message")
+        content = message.get("content", []) if isinstance(message, dict) else []
+        return [block for block in content if isinstance(block, dict)] if isinstance(content, list) else []
+
+
+class ClaudeCodeStream:
+    """
+    A Claude Code CLI run, iterated one output event at a time.
+
+    The process starts on first iteration (or on `async with`) via
+    asyncio.create_subprocess_exec, so no executor thread is held while it
+    runs. stdout is read line by line and each line is parsed as it
+    arrives; only stderr is buffered (capped at `stderr_limit` bytes).
+
+    The CLI runs in its own process group. A timeout, cancellation of the
+    consuming task, cancel(), or leaving the iteration early kills the
+    whole group, including tools the CLI spawned.
+
+    Usage:
+        async with client.stream("Fix the failing test") as run:
+            async for event in run:
+                handle(event)
+        print(run.returncode, run.stderr)
+    """
+
+    def __init__(
+        self,
+        cmd: List[str],
+        prompt: str,
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = 300,
+        kill_grace: float = 2.0,
+        slot_provider: Optional[Callable[[], Optional[asyncio.Semaphore]]] = None,
+        line_limit: int = 16 * 1024 * 1024,
+        stderr_limit: int = 1024 * 1024
+    ):
+        """
+        Args:
+            cmd: CLI command line
+            prompt: Prompt written to the CLI's stdin
+            cwd: Working directory
+            env: Full process environment (None = inherit)
+            timeout: Seconds until the process group is killed (None = no limit)
+            kill_grace: Seconds between SIGTERM and SIGKILL when stopping
+            slot_provider: Returns the semaphore held while the process runs
+                (the client's per-loop concurrency cap)
+            line_limit: Longest stdout line accepted, in bytes
+            stderr_limit: stderr bytes kept
+        """
+        self.cmd = cmd
+        self.prompt = prompt
+        self.cwd = cwd
+        self.env = env
+        self.timeout = timeout
+        self.kill_grace = kill_grace
+        self.line_limit = line_limit
+        self.stderr_limit = stderr_limit
+
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.returncode: Optional[int] = None
+        self.timed_out = False
+        self.cancelled = False
+        self.events_read = 0
+        self.started_at: Optional[datetime] = None
+
+        self._slot_provider = slot_provider
+        self._slot: Optional[asyncio.Semaphore] = None
+        self._holding_slot = False
+        self._deadline: Optional[float] = None
+        self._stderr = bytearray()
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def stderr(self) -> str:
+        return self._stderr.decode("utf-8", "replace")
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process else None
+
+    async def start(self) -> None:
+        """Start the CLI process (no-op if already started)"""
+        if self.process is not None or self._closed:
+            return
+
+        self._slot = self._slot_provider() if self._slot_provider else None
+        if self._slot is not None:
+            await self._slot.acquire()
+            self._holding_slot = True
+
+        loop = asyncio.get_running_loop()
+        self.started_at = datetime.now()
+        if self.timeout is not None:
+            self._deadline = loop.time() + self.timeout
+
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                *self.cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.cwd) if self.cwd else None,
+                env=self.env,
+                limit=self.line_limit,
+                start_new_session=os.name == "posix"
+            )
+        except BaseException:
+            self._closed = True
+            self._release_slot()
+            raise
+
+        self._stderr_task = loop.create_task(self._drain_stderr())
+        logger.debug(f"Started Claude CLI pid={self.process.pid}")
+
+        try:
+            if self.prompt:
+                self.process.stdin.write(self.prompt.encode("utf-8"))
+                await self.process.stdin.drain()
+            self.process.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            # The CLI exited without reading its prompt; stdout/returncode tell why
+            pass
+
+    def __aiter__(self) -> 'ClaudeCodeStream':
+        return self
+
+    async def __anext__(self) -> ClaudeCodeEvent:
+        await self.start()
+        if self._closed:
+            raise StopAsyncIteration
+
+        while True:
+            try:
+                line = await asyncio.wait_for(self.process.stdout.readline(), self._remaining())
+                if not line:
+                    self.returncode = await asyncio.wait_for(self.process.wait(), self._remaining())
+            except asyncio.TimeoutError:
+                self.timed_out = True
+                await self.aclose()
+                raise ClaudeCodeTimeoutError(f"Claude Code CLI timed out after {self.timeout} seconds")
+            except asyncio.CancelledError:
+                self.cancel()
+                raise
+            except BaseException:
+                await self.aclose()
+                raise
+
+            if not line:
+                await self.aclose()
+                raise StopAsyncIteration
+
+            text = line.decode("utf-8", "replace").rstrip("\r\n")
+            if text.strip():
+                self.events_read += 1
+                return ClaudeCodeEvent.parse(text)
+
+    async def __aenter__(self) -> 'ClaudeCodeStream':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            self.cancel()
+        await self.aclose()
+
+    def cancel(self) -> None:
+        """Kill the process group now (SIGKILL); safe to call from any callback"""
+        if self.process is not None and self.process.returncode is None:
+            self.cancelled = True
+            self._signal(signal.SIGKILL if hasattr(signal, "SIGKILL") else signal.SIGTERM)
+        self._release_slot()
+
+    async def aclose(self) -> None:
+        """Stop the process group if still running (SIGTERM, then SIGKILL) and reap it"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self.process is not None:
+                if self.process.returncode is None:
+                    self._signal(signal.SIGTERM)
+                    try:
+                        await asyncio.wait_for(self.process.wait(), self.kill_grace)
+                    except asyncio.TimeoutError:
+                        self._signal(signal.SIGKILL if hasattr(signal, "SIGKILL") else signal.SIGTERM)
+                        await self.process.wait()
+                if self.returncode is None:
+                    self.returncode = self.process.returncode
+                if self._stderr_task is not None:
+                    try:
+                        await asyncio.wait_for(self._stderr_task, self.kill_grace)
+                    except asyncio.TimeoutError:
+                        self._stderr_task.cancel()
+        finally:
+            self._release_slot()
+
+    def _signal(self, sig: int) -> None:
+        try:
+            if os.name == "posix":
+                os.killpg(self.process.pid, sig)
+            else:
+                self.process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _remaining(self) -> Optional[float]:
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - asyncio.get_running_loop().time())
+
+    def _release_slot(self) -> None:
+        if self._holding_slot:
+            self._holding_slot = False
+            self._slot.release()
+
+    async def _drain_stderr(self) -> None:
+        while True:
+            chunk = await self.process.stderr.read(65536)
+            if not chunk:
+                return
+            room = self.stderr_limit - len(self._stderr)
+            if room > 0:
+                self._stderr += chunk[:room]
+
+
 class ClaudeCodeClient:
     """
     Client for executing tasks via Claude Code CLI.
@@ -89,10 +378,14 @@ class ClaudeCodeClient:
         }
     }
 
+    # Flags that make the CLI print one JSON event per line
+    STREAM_JSON_ARGS = ["-p", "--output-format", "stream-json", "--verbose"]
+
     def __init__(
         self,
         claude_path: Optional[str] = None,
-        profiles_dir: Optional[Path] = None
+        profiles_dir: Optional[Path] = None,
+        max_concurrent: Optional[int] = None
     ):
         """
         Initialize Claude Code client.
@@ -100,9 +393,16 @@ class ClaudeCodeClient:
         Args:
             claude_path: Path to Claude Code CLI binary (default: auto-detect)
             profiles_dir: Directory containing MCP profiles (default: ~/.claude-profiles/)
+            max_concurrent: CLI processes run at once per event loop (None = no cap)
         """
         self.claude_path = claude_path or self._find_claude_cli()
         self.profiles_dir = Path(profiles_dir or Path.home() / ".claude-profiles")
+        self.max_concurrent = max_concurrent
+
+        self._slots_lock = threading.Lock()
+        self._loop_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
 
         logger.debug(f"ClaudeCodeClient initialized: claude={self.claude_path}, profiles={self.profiles_dir}")
 
@@ -317,6 +617,57 @@ class ClaudeCodeClient:
                 metadata={"mcp_profile": mcp_profile}
             )
 
+    def stream(
+        self,
+        prompt: str,
+        mcp_profile: Optional[str] = None,
+        context: Optional[str] = None,
+        timeout: Optional[float] = 300,
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None,
+        kill_grace: float = 2.0
+    ) -> ClaudeCodeStream:
+        """
+        Run a task via Claude Code CLI, streaming its stream-json events.
+
+        Args:
+            prompt: Task description/prompt
+            mcp_profile: MCP profile to use (default: auto-detect)
+            context: Optional context file path (PRD, spec, etc.)
+            timeout: Seconds until the process group is killed (None = no limit)
+            cwd: Working directory (default: current directory)
+            env: Additional environment variables
+            kill_grace: Seconds between SIGTERM and SIGKILL when stopping
+
+        Returns:
+            ClaudeCodeStream (async iterator of ClaudeCodeEvent)
+        """
+        if mcp_profile is None:
+            mcp_profile = self.detect_mcp_profile(prompt)
+
+        request = ClaudeCodeRequest(
+            prompt=prompt,
+            mcp_profile=mcp_profile,
+            context=context,
+            timeout=timeout,
+            cwd=cwd or Path.cwd(),
+            env=env or {}
+        )
+
+        cmd = [self.claude_path, *self.STREAM_JSON_ARGS]
+        if request.context:
+            cmd.extend(["--context", request.context])
+
+        return ClaudeCodeStream(
+            cmd,
+            request.prompt,
+            cwd=request.cwd,
+            env=self._build_claude_command(request),
+            timeout=request.timeout,
+            kill_grace=kill_grace,
+            slot_provider=self._async_slot
+        )
+
     async def execute_async(
         self,
         prompt: str,
@@ -329,6 +680,10 @@ class ClaudeCodeClient:
         """
         Execute a task via Claude Code CLI (asynchronous).
 
+        Runs the CLI as an asyncio subprocess and folds its streamed events
+        into a ClaudeCodeResult; no thread is held while it runs. Cancelling
+        the awaiting task kills the CLI's process group.
+
         Args:
             prompt: Task description/prompt
             mcp_profile: MCP profile to use (default: auto-detect)
@@ -340,13 +695,113 @@ class ClaudeCodeClient:
         Returns:
             ClaudeCodeResult with execution output
         """
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.execute(prompt, mcp_profile, context, timeout, cwd, env)
+        if mcp_profile is None:
+            mcp_profile = self.detect_mcp_profile(prompt)
+
+        start_time = datetime.now()
+        run = self.stream(prompt, mcp_profile, context, timeout, cwd, env)
+        cwd = run.cwd
+        logger.info(f"Executing task with profile '{mcp_profile}': {prompt[:100]}...")
+
+        texts: List[str] = []
+        written: List[str] = []
+        final: Optional[ClaudeCodeEvent] = None
+        session_id = None
+
+        try:
+            async with run:
+                async for event in run:
+                    if event.type == "result":
+                        final = event
+                    elif event.text:
+                        texts.append(event.text)
+                    for tool in event.tool_uses():
+                        if tool.get("name") == "Write":
+                            path = tool.get("input", {}).get("file_path")
+                            if path:
+                                written.append(path)
+                    session_id = event.data.get("session_id", session_id)
+
+        except ClaudeCodeTimeoutError:
+            duration = (datetime.now() - start_time).total_seconds()
+            logger.error(f"Task timed out after {duration:.2f}s")
+
+            return ClaudeCodeResult(
+                success=False,
+                output="",
+                error=f"Task timed out after {timeout} seconds",
+                duration_seconds=duration,
+                metadata={"mcp_profile": mcp_profile, "events": run.events_read}
+            )
+
+        except Exception as e:
+            duration = (datetime.now() - start_time).total_seconds()
+            logger.error(f"Task execution failed: {e}")
+
+            return ClaudeCodeResult(
+                success=False,
+                output="",
+                error=str(e),
+                duration_seconds=duration,
+                metadata={"mcp_profile": mcp_profile}
+            )
+
+        duration = (datetime.now() - start_time).total_seconds()
+        output = final.text if final is not None and final.text else "\n".join(texts)
+        is_error = bool(final.data.get("is_error")) if final is not None else False
+
+        metadata = {
+            "mcp_profile": mcp_profile,
+            "returncode": run.returncode,
+            "cwd": str(cwd),
+            "events": run.events_read
+        }
+        if session_id:
+            metadata["session_id"] = session_id
+        if final is not None:
+            for key in ("usage", "total_cost_usd", "num_turns"):
+                if key in final.data:
+                    metadata[key] = final.data[key]
+
+        if run.returncode == 0 and not is_error:
+            files_created = written + [
+                path for path in self._extract_files_created(output, cwd) if path not in written
+            ]
+            logger.info(f"Task completed successfully in {duration:.2f}s")
+
+            return ClaudeCodeResult(
+                success=True,
+                output=output,
+                duration_seconds=duration,
+                files_created=files_created,
+                metadata=metadata
+            )
+
+        error_msg = run.stderr or output or "Unknown error"
+        logger.error(f"Task failed: {error_msg}")
+
+        return ClaudeCodeResult(
+            success=False,
+            output="",
+            error=error_msg,
+            duration_seconds=duration,
+            metadata=metadata
         )
 
+    def _async_slot(self) -> Optional[asyncio.Semaphore]:
+        """Concurrency slot for the running event loop (None = uncapped)"""
+        if self.max_concurrent is None:
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        with self._slots_lock:
+            semaphore = self._loop_slots.get(loop)
+            if semaphore is None:
+                semaphore = self._loop_slots[loop] = asyncio.Semaphore(self.max_concurrent)
+            return semaphore
+
     def _extract_files_created(self, output: str, cwd: Path) -> List[str]:
         """
         Extract list of created files from Claude output.
@@ -6,18 +6,41 @@ as a drop-in replacement for Anthropic's Claude API in BlackBox5.
 
 GLM (General Language Model) is developed by Zhipu AI and provides
 similar capabilities to Claude for agent orchestration.
+
+Transport:
+- One pooled keep-alive httpx client per process (sync) and per event
+  loop (async), HTTP/2 when the `h2` package is installed
+- Per-host concurrency cap and token-bucket rate limit shared by every
+  GLMClient with the same limits
+- Retries with full-jitter exponential backoff that honour Retry-After
 """
 
 import os
 import json
+import time
+import random
 import asyncio
-from typing import Dict, List, Optional, Any, AsyncGenerator, Union
-from dataclasses import dataclass
+import threading
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Any, AsyncGenerator, Iterator, Tuple, Union
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from urllib.parse import urlsplit
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Statuses worth retrying; other 4xx responses fail immediately
+RETRY_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+# Connection pool shared by every client in the process. Keep it small:
+# httpcore scans every connection for every queued request, so requests
+# beyond the host limiter's max_concurrency wait on the cheap semaphore
+POOL_MAX_CONNECTIONS = 64
+POOL_KEEPALIVE_EXPIRY = 60.0
+
 
 @dataclass
 class GLMMessage:
@@ -45,6 +68,211 @@ class GLMAPIError(GLMClientError):
     pass
 
 
+# ============================================================================
+# Transport
+# ============================================================================
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry timing for failed requests.
+
+    Backoff uses full jitter: a uniform delay in [0, base_delay * 2**attempt],
+    capped at max_delay, so concurrent agents do not retry in lockstep.
+    A Retry-After header from the server replaces the backoff.
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    max_retry_after: float = 120.0
+
+    def __post_init__(self):
+        if self.max_attempts <= 0:
+            raise ValueError(f"max_attempts must be at least 1, got {self.max_attempts}")
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before attempt number `attempt + 1`"""
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostLimiter:
+    """
+    Concurrency cap and token-bucket rate limit for one API host.
+
+    reserve() takes a token and returns how long the caller must wait
+    before sending, so the same bucket serves threads and event loops.
+    Concurrency is capped per thread pool (sync) and per event loop (async).
+    """
+
+    def __init__(self, max_concurrency: int, rate: Optional[float] = None, burst: Optional[int] = None):
+        """
+        Args:
+            max_concurrency: Requests in flight at once
+            rate: Requests per second (None = unlimited)
+            burst: Requests allowed back to back (defaults to max(1, rate))
+        """
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.burst = burst or max(1, int(rate or 1))
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._thread_slots = threading.BoundedSemaphore(max_concurrency)
+        self._loop_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def reserve(self) -> float:
+        """Take a token; returns the seconds to wait before sending"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            if self.rate:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self.rate)
+            return wait
+
+    def block_for(self, seconds: float) -> None:
+        """Hold back every new request to this host (server asked us to wait)"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    @contextmanager
+    def thread_slot(self) -> Iterator[None]:
+        """Hold one concurrency slot from a thread"""
+        with self._thread_slots:
+            yield
+
+    @asynccontextmanager
+    async def async_slot(self):
+        """Hold one concurrency slot from the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._loop_slots.get(loop)
+            if semaphore is None:
+                semaphore = self._loop_slots[loop] = asyncio.Semaphore(self.max_concurrency)
+        async with semaphore:
+            yield
+
+
+_shared_lock = threading.Lock()
+_sync_http_clients: Dict[bool, Any] = {}
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[bool, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_host_limiters: Dict[Tuple, HostLimiter] = {}
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise GLMClientError(
+            "The 'httpx' library is required for GLMClient. "
+            "Install it with: pip install httpx"
+        )
+    return httpx
+
+
+def http2_available() -> bool:
+    """True if the h2 package is installed, so httpx can negotiate HTTP/2"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _pool_limits(httpx):
+    return httpx.Limits(
+        max_connections=POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=POOL_MAX_CONNECTIONS,
+        keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+    )
+
+
+def get_shared_http_client(http2: bool = True):
+    """Process-wide pooled httpx.Client (thread-safe)"""
+    httpx = _import_httpx()
+    http2 = http2 and http2_available()
+    with _shared_lock:
+        client = _sync_http_clients.get(http2)
+        if client is None or client.is_closed:
+            client = _sync_http_clients[http2] = httpx.Client(http2=http2, limits=_pool_limits(httpx))
+        return client
+
+
+def get_shared_async_http_client(http2: bool = True):
+    """Pooled httpx.AsyncClient for the running event loop"""
+    httpx = _import_httpx()
+    http2 = http2 and http2_available()
+    loop = asyncio.get_running_loop()
+    with _shared_lock:
+        clients = _async_http_clients.setdefault(loop, {})
+        client = clients.get(http2)
+        if client is None or client.is_closed:
+            client = clients[http2] = httpx.AsyncClient(http2=http2, limits=_pool_limits(httpx))
+        return client
+
+
+def get_host_limiter(url: str, max_concurrency: int, rate: Optional[float] = None,
+                     burst: Optional[int] = None) -> HostLimiter:
+    """Limiter shared by every client talking to the same host with the same limits"""
+    key = (urlsplit(url).netloc, max_concurrency, rate, burst)
+    with _shared_lock:
+        limiter = _host_limiters.get(key)
+        if limiter is None:
+            limiter = _host_limiters[key] = HostLimiter(max_concurrency, rate, burst)
+        return limiter
+
+
+def close_shared_http_clients() -> None:
+    """Close the pooled sync clients (async clients close via aclose_shared_http_clients)"""
+    with _shared_lock:
+        clients = list(_sync_http_clients.values())
+        _sync_http_clients.clear()
+    for client in clients:
+        client.close()
+
+
+async def aclose_shared_http_clients() -> None:
+    """Close the pooled async clients of the running event loop"""
+    with _shared_lock:
+        clients = list(_async_http_clients.pop(asyncio.get_running_loop(), {}).values())
+    for client in clients:
+        await client.aclose()
+
+
+def _token_optimizer_module():
+    """TokenOptimizer, imported within the client package or as a sibling module"""
+    if __package__:
+        from . import TokenOptimizer
+    else:
+        import TokenOptimizer
+    return TokenOptimizer
+
+
 class GLMClient:
     """
     GLM API Client compatible with BlackBox5 agent system.
@@ -85,6 +313,12 @@ class GLMClient:
         enable_prompt_compression: bool = True,
         compression_config: Optional[Dict[str, Any]] = None,
         enable_token_optimization: bool = True,
+        max_concurrency: int = 32,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        http2: bool = True,
+        response_cache: Union[bool, Any, None] = None,
     ):
         """
         Initialize GLM client.
@@ -93,9 +327,17 @@ class GLMClient:
             api_key: GLM API key (defaults to GLM_API_KEY env var)
             base_url: API base URL
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retries for failed requests
+            max_retries: Maximum number of attempts for failed requests
             enable_prompt_compression: Enable LLMLingua prompt compression
             compression_config: Optional configuration for LLMLingua
+            max_concurrency: Requests in flight per host
+            rate_limit: Requests per second per host (None = unlimited)
+            rate_burst: Requests allowed back to back under rate_limit
+            retry_policy: Backoff settings (defaults to max_retries attempts)
+            http2: Use HTTP/2 when the h2 package is installed
+            response_cache: Cache deterministic (temperature 0) responses and
+                coalesce identical in-flight requests. True uses the global
+                ResponseCache from TokenOptimizer; or pass a ResponseCache.
         """
         self.api_key = api_key or os.getenv("GLM_API_KEY")
         if not self.api_key:
@@ -110,34 +352,40 @@ class GLMClient:
         self.enable_prompt_compression = enable_prompt_compression
         self.compression_config = compression_config or {}
         self.enable_token_optimization = enable_token_optimization
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=max_retries)
+        self.http2 = http2
+        self.limiter = get_host_limiter(base_url, max_concurrency, rate_limit, rate_burst)
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        self.stats = {"requests": 0, "retries": 0, "throttled": 0}
+        self._stats_lock = threading.Lock()
+
+        self.response_cache = None
+        if response_cache is True:
+            self.response_cache = _token_optimizer_module().get_global_response_cache()
+        elif response_cache:
+            self.response_cache = response_cache
 
         # Initialize token optimizer
         self.token_optimizer = None
         if enable_token_optimization:
             try:
-                from TokenOptimizer import TokenOptimizer
-                self.token_optimizer = TokenOptimizer()
+                self.token_optimizer = _token_optimizer_module().TokenOptimizer()
                 logger.info("GLM Client: Token optimization enabled")
             except ImportError:
                 logger.warning("TokenOptimizer not available, optimization disabled")
                 self.enable_token_optimization = False
 
-        # Try to import requests, provide helpful error if not available
-        try:
-            import requests
-            self.requests = requests
-        except ImportError:
-            raise GLMClientError(
-                "The 'requests' library is required for GLMClient. "
-                "Install it with: pip install requests"
-            )
+        # Fail early with a helpful error if httpx is missing
+        self.httpx = _import_httpx()
 
         # Initialize LLMLingua compressor if enabled
         self.compressor = None
         if self.enable_prompt_compression:
             try:
                 import sys
-                from pathlib import Path
 
                 # Add parent directory to path to import LLMLinguaCompressor
                 # Assuming GLMClient is in 2-engine/01-core/client/
@@ -160,6 +408,11 @@ class GLMClient:
 
         logger.info(f"GLM Client initialized with model: {self.base_url}")
 
+    def _count(self, stat: str) -> None:
+        """Increment a request statistic (shared by threads and the event loop)"""
+        with self._stats_lock:
+            self.stats[stat] += 1
+
     def _validate_model(self, model: str) -> str:
         """Validate and return model name"""
         model = model.lower()
@@ -203,6 +456,9 @@ class GLMClient:
         """
         Create a chat completion.
 
+        With a response_cache, deterministic requests (temperature 0) are
+        served from the cache and identical concurrent requests share one call.
+
         Args:
             messages: List of message dictionaries with 'role' and 'content'
             model: Model name (default: glm-4.7)
@@ -220,6 +476,62 @@ class GLMClient:
         Raises:
             GLMAPIError: If the API request fails
         """
+        model, payload = self._prepare_payload(
+            messages, model, max_tokens, temperature, top_p, stream, instruction, question, kwargs
+        )
+        cacheable = self.response_cache.key_for(payload, self.base_url) if self.response_cache else None
+        if cacheable is None:
+            return self._send(model, payload)
+
+        key, request_bytes = cacheable
+        value = self.response_cache.get_or_compute(
+            key, lambda: asdict(self._send(model, payload)), request_bytes
+        )
+        return GLMResponse(**value)
+
+    def _send(self, model: str, payload: Dict[str, Any]) -> GLMResponse:
+        """POST the payload with rate limiting and retries"""
+        client = get_shared_http_client(self.http2)
+
+        for attempt in range(self.retry_policy.max_attempts):
+            logger.debug(
+                f"Sending request to GLM API (attempt {attempt + 1}): "
+                f"{len(payload['messages'])} messages"
+            )
+            wait = self.limiter.reserve()
+            if wait:
+                time.sleep(wait)
+
+            try:
+                with self.limiter.thread_slot():
+                    self._count("requests")
+                    response = client.post(
+                        self.base_url,
+                        json=payload,
+                        headers=self._headers,
+                        timeout=self.timeout
+                    )
+            except self.httpx.TransportError as e:
+                time.sleep(self._failure_delay(attempt, f"GLM API request error: {e}"))
+                continue
+
+            if response.is_success:
+                return self._parse_response(response, model)
+            time.sleep(self._failure_delay(attempt, *self._status_error(response)))
+
+    def _prepare_payload(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: Optional[int],
+        temperature: float,
+        top_p: float,
+        stream: bool,
+        instruction: Optional[str],
+        question: Optional[str],
+        extra: Dict[str, Any],
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Validate the model, compress the prompt and build the request body"""
         model = self._validate_model(model)
         formatted_messages = self._format_messages(messages)
 
@@ -252,75 +564,66 @@ class GLMClient:
             payload["max_tokens"] = max_tokens
 
         # Add any additional parameters
-        payload.update(kwargs)
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        for attempt in range(self.max_retries):
-            try:
-                logger.debug(
-                    f"Sending request to GLM API (attempt {attempt + 1}): "
-                    f"{len(messages)} messages"
-                )
-
-                response = self.requests.post(
-                    self.base_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=self.timeout
-                )
-
-                response.raise_for_status()
-                data = response.json()
-
-                # Extract response content
-                content = data["choices"][0]["message"]["content"]
-                usage = data.get("usage", {})
-                finish_reason = data["choices"][0].get("finish_reason", "stop")
-
-                logger.debug(
-                    f"GLM response received: {len(content)} chars, "
-                    f"tokens: {usage.get('total_tokens', 'N/A')}"
-                )
+        payload.update(extra)
+        return model, payload
 
-                return GLMResponse(
-                    content=content,
-                    model=model,
-                    usage={
-                        "prompt_tokens": usage.get("prompt_tokens", 0),
-                        "completion_tokens": usage.get("completion_tokens", 0),
-                        "total_tokens": usage.get("total_tokens", 0),
-                    },
-                    finish_reason=finish_reason
-                )
-
-            except self.requests.exceptions.HTTPError as e:
-                error_detail = e.response.text if e.response else str(e)
-                logger.error(f"GLM API HTTP error: {error_detail}")
-
-                if attempt == self.max_retries - 1:
-                    raise GLMAPIError(
-                        f"GLM API request failed after {self.max_retries} attempts: {error_detail}"
-                    )
-
-                # Exponential backoff
-                import time
-                time.sleep(2 ** attempt)
-
-            except self.requests.exceptions.RequestException as e:
-                logger.error(f"GLM API request error: {e}")
+    def _parse_response(self, response, model: str) -> GLMResponse:
+        """Build a GLMResponse from a successful HTTP response"""
+        try:
+            data = response.json()
+
+            # Extract response content
+            content = data["choices"][0]["message"]["content"]
+            usage = data.get("usage", {})
+            finish_reason = data["choices"][0].get("finish_reason", "stop")
+        except (KeyError, IndexError, ValueError) as e:
+            raise GLMAPIError(f"Failed to parse GLM API response: {e}")
+
+        logger.debug(
+            f"GLM response received: {len(content)} chars, "
+            f"tokens: {usage.get('total_tokens', 'N/A')}"
+        )
 
-                if attempt == self.max_retries - 1:
-                    raise GLMAPIError(f"GLM API request failed: {e}")
+        return GLMResponse(
+            content=content,
+            model=model,
+            usage={
+                "prompt_tokens": usage.get("prompt_tokens", 0),
+                "completion_tokens": usage.get("completion_tokens", 0),
+                "total_tokens": usage.get("total_tokens", 0),
+            },
+            finish_reason=finish_reason
+        )
 
-                import time
-                time.sleep(2 ** attempt)
+    def _status_error(self, response) -> Tuple[str, Optional[float]]:
+        """
+        Describe a failed response; raises at once if it is not retryable.
 
-            except (KeyError, IndexError, json.JSONDecodeError) as e:
-                raise GLMAPIError(f"Failed to parse GLM API response: {e}")
+        Returns:
+            (error message, Retry-After seconds or None)
+        """
+        error = f"GLM API HTTP {response.status_code}: {response.text}"
+        if response.status_code not in RETRY_STATUS_CODES:
+            logger.error(error)
+            raise GLMAPIError(f"GLM API request failed: {error}")
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code == 429:
+            self._count("throttled")
+            if retry_after is not None:
+                # Every client sharing this host backs off, not just this request
+                self.limiter.block_for(min(retry_after, self.retry_policy.max_retry_after))
+        return error, retry_after
+
+    def _failure_delay(self, attempt: int, error: str, retry_after: Optional[float] = None) -> float:
+        """Log a failed attempt; returns the backoff, or raises after the last attempt"""
+        logger.error(error)
+        if attempt >= self.retry_policy.max_attempts - 1:
+            raise GLMAPIError(
+                f"GLM API request failed after {self.retry_policy.max_attempts} attempts: {error}"
+            )
+        self._count("retries")
+        return self.retry_policy.delay(attempt, retry_after)
 
     def create_optimized(
         self,
@@ -419,26 +722,55 @@ class GLMClient:
         temperature: float = 0.7,
         top_p: float = 0.9,
         stream: bool = False,
+        instruction: Optional[str] = None,
+        question: Optional[str] = None,
         **kwargs
     ) -> GLMResponse:
         """
         Async version of create().
 
-        Uses asyncio to run the synchronous request in a thread pool.
+        Sends the request on the event loop's pooled connection, waiting for
+        a concurrency slot and the host rate limit without blocking a thread.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.create(
-                messages=messages,
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                top_p=top_p,
-                stream=stream,
-                **kwargs
-            )
+        model, payload = self._prepare_payload(
+            messages, model, max_tokens, temperature, top_p, stream, instruction, question, kwargs
         )
+        cacheable = self.response_cache.key_for(payload, self.base_url) if self.response_cache else None
+        if cacheable is None:
+            return await self._asend(model, payload)
+
+        async def send() -> Dict[str, Any]:
+            return asdict(await self._asend(model, payload))
+
+        key, request_bytes = cacheable
+        value = await self.response_cache.aget_or_compute(key, send, request_bytes)
+        return GLMResponse(**value)
+
+    async def _asend(self, model: str, payload: Dict[str, Any]) -> GLMResponse:
+        """POST the payload on the event loop with rate limiting and retries"""
+        client = get_shared_async_http_client(self.http2)
+
+        for attempt in range(self.retry_policy.max_attempts):
+            wait = self.limiter.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+
+            try:
+                async with self.limiter.async_slot():
+                    self._count("requests")
+                    response = await client.post(
+                        self.base_url,
+                        json=payload,
+                        headers=self._headers,
+                        timeout=self.timeout
+                    )
+            except self.httpx.TransportError as e:
+                await asyncio.sleep(self._failure_delay(attempt, f"GLM API request error: {e}"))
+                continue
+
+            if response.is_success:
+                return self._parse_response(response, model)
+            await asyncio.sleep(self._failure_delay(attempt, *self._status_error(response)))
 
     async def acreate_stream(
         self,
@@ -481,21 +813,16 @@ class GLMClient:
 
         payload.update(kwargs)
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        try:
-            import httpx
-        except ImportError:
-            raise GLMClientError(
-                "The 'httpx' library is required for streaming. "
-                "Install it with: pip install httpx"
-            )
+        wait = self.limiter.reserve()
+        if wait:
+            await asyncio.sleep(wait)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            async with client.stream("POST", self.base_url, json=payload, headers=headers) as response:
+        client = get_shared_async_http_client(self.http2)
+        async with self.limiter.async_slot():
+            self._count("requests")
+            async with client.stream(
+                "POST", self.base_url, json=payload, headers=self._headers, timeout=self.timeout
+            ) as response:
                 response.raise_for_status()
 
                 async for line in response.aiter_lines():
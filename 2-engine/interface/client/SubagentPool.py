@@ -0,0 +1,638 @@
+"""
+Subagent Pool - Warm Claude Code CLI workers
+
+Spawning a `claude` process per task pays the CLI's startup (MCP servers,
+config, auth) on every call. SubagentPool keeps `size` CLI processes
+already running in stream-json input mode and hands each job, as a user
+message, to one of them. While a job runs and more jobs are queued, the
+process that will take the next job in its slot is spawned, so queued
+jobs find a started process instead of paying the cold start.
+
+- One job per CLI session by default: a job never sees an earlier job's
+  conversation. `max_jobs_per_worker` > 1 opts into sharing a session
+  between that many consecutive jobs
+- Priority job queue (lower number runs first) with per-job timeouts
+- Admission control: `size` workers is the concurrency ceiling, and at
+  most `max_queue` jobs wait; beyond that submit() raises PoolSaturatedError
+- Worker health: a worker that exits, times out or is cancelled mid-job
+  is killed (whole process group) and replaced. A worker that fails to
+  spawn is retried with backoff; if it still cannot start, the job fails
+  and the slot retries on its next job
+- get_stats() reports cold vs warm first-event latency, startup and queue
+  wait, to quantify the savings
+
+Usage:
+    from interface.client.SubagentPool import SubagentPool
+
+    async with SubagentPool(size=4) as pool:
+        results = await asyncio.gather(*(
+            pool.submit(prompt, priority=1, timeout=300) for prompt in prompts
+        ))
+        print(pool.get_stats())
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import signal
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from interface.client.ClaudeCodeClient import (
+    ClaudeCodeClient,
+    ClaudeCodeError,
+    ClaudeCodeEvent,
+    ClaudeCodeRequest,
+    ClaudeCodeResult,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PoolSaturatedError(ClaudeCodeError):
+    """Raised when the job queue is full (admission control)"""
+    pass
+
+
+class PoolClosedError(ClaudeCodeError):
+    """Raised when submitting to a pool that is shut down"""
+    pass
+
+
+class WorkerSpawnError(ClaudeCodeError):
+    """Raised when a worker's CLI process cannot be started"""
+    pass
+
+
+@dataclass
+class SubagentJob:
+    """A queued prompt and the future its result resolves."""
+    prompt: str
+    priority: int
+    timeout: Optional[float]
+    future: asyncio.Future
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+class SubagentWorker:
+    """
+    One long-lived Claude Code CLI process.
+
+    Jobs are written to stdin as stream-json user messages; a job is done
+    when the CLI emits its `result` event.
+    """
+
+    def __init__(
+        self,
+        worker_id: int,
+        cmd: List[str],
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None,
+        kill_grace: float = 2.0,
+        line_limit: int = 16 * 1024 * 1024
+    ):
+        self.worker_id = worker_id
+        self.cmd = cmd
+        self.cwd = cwd
+        self.env = env
+        self.kill_grace = kill_grace
+        self.line_limit = line_limit
+
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.jobs_done = 0
+        self.starts = 0
+        self.prespawned = False  # started ahead of the job it will run
+        self.spawned_at: Optional[float] = None
+        self.ready_at: Optional[float] = None  # first output seen after spawn
+        self._stderr_tail = bytearray()
+        self._stderr_task: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    @property
+    def stderr(self) -> str:
+        return self._stderr_tail.decode("utf-8", "replace")
+
+    async def start(self) -> None:
+        """Spawn the CLI process"""
+        self.spawned_at = time.monotonic()
+        self.ready_at = None
+        self.process = await asyncio.create_subprocess_exec(
+            *self.cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.cwd) if self.cwd else None,
+            env=self.env,
+            limit=self.line_limit,
+            start_new_session=os.name == "posix"
+        )
+        self.jobs_done = 0
+        self.starts += 1
+        self._stderr_tail.clear()
+        self._stderr_task = asyncio.get_running_loop().create_task(self._drain_stderr())
+        logger.debug(f"Subagent worker {self.worker_id} started pid={self.process.pid}")
+
+    async def send(self, prompt: str) -> None:
+        """Hand one prompt to the CLI"""
+        message = {
+            "type": "user",
+            "message": {"role": "user", "content": [{"type": "text", "text": prompt}]}
+        }
+        self.process.stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+        await self.process.stdin.drain()
+
+    async def read_event(self) -> Optional[ClaudeCodeEvent]:
+        """Next output event (None when the CLI exited)"""
+        while True:
+            line = await self.process.stdout.readline()
+            if not line:
+                return None
+            if self.ready_at is None:
+                self.ready_at = time.monotonic()
+            text = line.decode("utf-8", "replace").rstrip("\r\n")
+            if text.strip():
+                return ClaudeCodeEvent.parse(text)
+
+    async def stop(self) -> None:
+        """Close stdin, then SIGTERM and SIGKILL the process group if it lingers"""
+        if self.process is None:
+            return
+        if self.process.returncode is None:
+            try:
+                self.process.stdin.close()
+                await asyncio.wait_for(self.process.wait(), self.kill_grace)
+            except (asyncio.TimeoutError, BrokenPipeError, ConnectionResetError):
+                self.kill(signal.SIGTERM)
+                try:
+                    await asyncio.wait_for(self.process.wait(), self.kill_grace)
+                except asyncio.TimeoutError:
+                    self.kill()
+                    await self.process.wait()
+        if self._stderr_task is not None:
+            try:
+                await asyncio.wait_for(self._stderr_task, self.kill_grace)
+            except asyncio.TimeoutError:
+                pass
+
+    def kill(self, sig: Optional[int] = None) -> None:
+        """Signal the worker's process group (default SIGKILL)"""
+        if self.process is None or self.process.returncode is not None:
+            return
+        sig = sig if sig is not None else getattr(signal, "SIGKILL", signal.SIGTERM)
+        try:
+            if os.name == "posix":
+                os.killpg(self.process.pid, sig)
+            else:
+                self.process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    async def _drain_stderr(self) -> None:
+        while True:
+            chunk = await self.process.stderr.read(65536)
+            if not chunk:
+                return
+            # Keep the tail; it explains crashes
+            self._stderr_tail += chunk
+            del self._stderr_tail[:-65536]
+
+
+class SubagentPool:
+    """
+    Pool of warm Claude Code CLI workers with a priority job queue.
+
+    Asyncio-native: create and use it from one event loop. Each of the
+    `size` slots holds a running worker, plus its successor while the
+    worker runs its last job and more jobs are queued, so up to 2 * size
+    CLI processes exist at once. Workers spawn on start() (or on first
+    submit) and, once retired, are replaced when their slot takes its
+    next job; shutdown() stops them.
+    """
+
+    # Flags for a persistent CLI session: jobs in and events out as JSON lines
+    WORKER_ARGS = [
+        "-p",
+        "--input-format", "stream-json",
+        "--output-format", "stream-json",
+        "--verbose"
+    ]
+
+    def __init__(
+        self,
+        size: int = 4,
+        client: Optional[ClaudeCodeClient] = None,
+        mcp_profile: str = "minimal",
+        extra_args: Optional[List[str]] = None,
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None,
+        max_queue: int = 1000,
+        default_timeout: Optional[float] = 300,
+        max_jobs_per_worker: Optional[int] = 1,
+        kill_grace: float = 2.0,
+        spawn_retries: int = 2,
+        spawn_backoff: float = 0.5
+    ):
+        """
+        Initialize subagent pool.
+
+        Args:
+            size: Long-lived workers; also the ceiling on concurrent jobs
+            client: ClaudeCodeClient supplying the CLI path and profile env
+            mcp_profile: MCP profile the workers run with
+            extra_args: Further CLI flags (e.g. ["--allowed-tools", "Read,Grep"])
+            cwd: Working directory of the workers
+            env: Additional environment variables
+            max_queue: Jobs allowed to wait; more raise PoolSaturatedError
+            default_timeout: Per-job timeout in seconds when submit() gives none
+            max_jobs_per_worker: Jobs per CLI session before the worker is replaced;
+                more than 1 (or None = never replace) lets jobs share a session
+                and see the previous jobs' conversation
+            kill_grace: Seconds between SIGTERM and SIGKILL when stopping a worker
+            spawn_retries: Further attempts to start a worker before its job fails
+            spawn_backoff: Seconds before the first retry; doubles on each retry
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if max_jobs_per_worker is not None and max_jobs_per_worker < 1:
+            raise ValueError("max_jobs_per_worker must be at least 1 (or None)")
+        if spawn_retries < 0:
+            raise ValueError("spawn_retries must be non-negative")
+
+        self.size = size
+        self.client = client or ClaudeCodeClient()
+        self.mcp_profile = mcp_profile
+        self.cwd = Path(cwd or Path.cwd())
+        self.max_queue = max_queue
+        self.default_timeout = default_timeout
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.kill_grace = kill_grace
+        self.spawn_retries = spawn_retries
+        self.spawn_backoff = spawn_backoff
+
+        request = ClaudeCodeRequest(prompt="", mcp_profile=mcp_profile, cwd=self.cwd, env=env or {})
+        self._env = self.client._build_claude_command(request)
+        self._cmd = [self.client.claude_path, *self.WORKER_ARGS, *(extra_args or [])]
+
+        self._workers: List[SubagentWorker] = []  # current worker per slot
+        self._spares: List[Optional[asyncio.Task]] = []  # successor being spawned per slot
+        self._retiring: Set[asyncio.Task] = set()  # finished workers exiting
+        self._tasks: List[asyncio.Task] = []
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._seq = itertools.count()
+        self._started = False
+        self._closed = False
+        self._running = 0
+
+        self._stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'rejected': 0,
+            'timeouts': 0,
+            'cancelled': 0,
+            'crashes': 0,
+            'restarts': 0,
+            'recycled': 0,
+            'worker_starts': 0,
+            'spawn_failures': 0,
+            'cold_jobs': 0,
+            'warm_jobs': 0,
+        }
+        self._timings = {
+            'startup_seconds': 0.0,       # spawn -> first CLI output
+            'cold_first_event': 0.0,      # send -> first reply event, first job on a worker
+            'warm_first_event': 0.0,      # send -> first reply event, later jobs
+            'queue_wait': 0.0,
+        }
+
+    async def start(self) -> 'SubagentPool':
+        """Spawn the workers (no-op if already started)"""
+        if self._closed:
+            raise PoolClosedError("Subagent pool is shut down")
+        if self._started:
+            return self
+        self._started = True
+        self._queue = asyncio.PriorityQueue()
+
+        self._workers = [self._new_worker(slot) for slot in range(self.size)]
+        self._spares = [None] * self.size
+        started = await asyncio.gather(*(self._start_worker(w) for w in self._workers),
+                                       return_exceptions=True)
+        for slot, outcome in enumerate(started):
+            if isinstance(outcome, Exception):
+                # The slot retries when it takes its first job
+                self._stats['spawn_failures'] += 1
+                logger.error(f"Subagent worker {slot} failed to start: {outcome}")
+        self._tasks = [asyncio.create_task(self._worker_loop(slot)) for slot in range(self.size)]
+
+        logger.info(f"Subagent pool started: {self.size} workers ({self.client.claude_path})")
+        return self
+
+    async def submit(
+        self,
+        prompt: str,
+        priority: int = 0,
+        timeout: Optional[float] = None
+    ) -> ClaudeCodeResult:
+        """
+        Run a prompt on the next free worker.
+
+        Args:
+            prompt: Task prompt
+            priority: Lower runs first; equal priorities run in submit order
+            timeout: Seconds for this job once it starts (default: default_timeout)
+
+        Returns:
+            ClaudeCodeResult (failures and timeouts are reported, not raised)
+
+        Raises:
+            PoolSaturatedError: max_queue jobs are already waiting
+            PoolClosedError: the pool is shut down
+        """
+        if self._closed:
+            raise PoolClosedError("Subagent pool is shut down")
+        await self.start()
+
+        if self._queue.qsize() >= self.max_queue:
+            self._stats['rejected'] += 1
+            raise PoolSaturatedError(
+                f"Subagent pool queue is full ({self.max_queue} jobs waiting)"
+            )
+
+        job = SubagentJob(
+            prompt=prompt,
+            priority=priority,
+            timeout=timeout if timeout is not None else self.default_timeout,
+            future=asyncio.get_running_loop().create_future()
+        )
+        self._stats['submitted'] += 1
+        self._queue.put_nowait((priority, next(self._seq), job))
+        return await job.future
+
+    async def shutdown(self) -> None:
+        """Fail queued jobs, stop the workers and wait for them to exit"""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._started:
+            return
+
+        while not self._queue.empty():
+            _, _, job = self._queue.get_nowait()
+            if not job.future.done():
+                job.future.set_exception(PoolClosedError("Subagent pool shut down"))
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        spares = await asyncio.gather(*(s for s in self._spares if s is not None), return_exceptions=True)
+        workers = self._workers + [w for w in spares if isinstance(w, SubagentWorker)]
+        await asyncio.gather(*(w.stop() for w in workers), *self._retiring, return_exceptions=True)
+        logger.info(f"Subagent pool stopped: {self.get_stats()}")
+
+    async def __aenter__(self) -> 'SubagentPool':
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.shutdown()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics, including cold vs warm per-job overhead."""
+        cold = self._stats['cold_jobs']
+        warm = self._stats['warm_jobs']
+        finished = self._stats['completed'] + self._stats['failed']
+        return {
+            **self._stats,
+            'workers': self.size,
+            'alive': sum(1 for w in self._workers if w.alive),
+            'running': self._running,
+            'queued': self._queue.qsize() if self._queue else 0,
+            'mean_startup_seconds': self._timings['startup_seconds'] / cold if cold else 0.0,
+            'mean_cold_first_event_seconds': self._timings['cold_first_event'] / cold if cold else 0.0,
+            'mean_warm_first_event_seconds': self._timings['warm_first_event'] / warm if warm else 0.0,
+            'mean_queue_wait_seconds': self._timings['queue_wait'] / finished if finished else 0.0,
+        }
+
+    def _new_worker(self, slot: int) -> SubagentWorker:
+        return SubagentWorker(slot, self._cmd, cwd=self.cwd, env=self._env, kill_grace=self.kill_grace)
+
+    async def _start_worker(self, worker: SubagentWorker) -> SubagentWorker:
+        await worker.start()
+        self._stats['worker_starts'] += 1
+        return worker
+
+    def _prespawn(self, slot: int) -> None:
+        """Start the slot's next worker in the background"""
+        if self._spares[slot] is None:
+            spare = self._new_worker(slot)
+            spare.prespawned = True
+            self._spares[slot] = asyncio.create_task(self._start_worker(spare))
+
+    async def _replace_worker(self, slot: int, failed: bool = True) -> None:
+        """
+        Retire the slot's worker.
+
+        A failed worker is killed; one that finished its jobs gets its
+        stdin closed and exits in the background. Its successor is the
+        pre-spawned worker if there is one, otherwise a process started
+        when the slot takes its next job (see _ensure_worker).
+        """
+        old = self._workers[slot]
+        if failed:
+            old.kill()
+            await old.stop()
+            self._stats['restarts'] += 1
+        else:
+            retiring = asyncio.create_task(old.stop())
+            self._retiring.add(retiring)
+            retiring.add_done_callback(self._retiring.discard)
+            self._stats['recycled'] += 1
+
+        self._workers[slot] = self._new_worker(slot)
+
+    async def _ensure_worker(self, slot: int) -> SubagentWorker:
+        """
+        The slot's running worker, starting its successor if needed.
+
+        Uses the pre-spawned worker if there is one. Spawn failures are
+        retried `spawn_retries` times with exponential backoff before
+        raising WorkerSpawnError.
+        """
+        worker = self._workers[slot]
+        if worker.alive:
+            return worker
+
+        spare, self._spares[slot] = self._spares[slot], None
+        for attempt in range(self.spawn_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.spawn_backoff * 2 ** (attempt - 1))
+            try:
+                worker = await spare if spare is not None else await self._start_worker(self._new_worker(slot))
+            except Exception as e:
+                spare = None
+                error = e
+                self._stats['spawn_failures'] += 1
+                logger.warning(f"Subagent worker {slot} failed to start (attempt {attempt + 1}): {e}")
+                continue
+            self._workers[slot] = worker
+            return worker
+
+        raise WorkerSpawnError(f"Could not start Claude Code CLI worker {slot}: {error}") from error
+
+    def _backlogged(self) -> bool:
+        """Whether more jobs are waiting than there are idle workers"""
+        return self._queue.qsize() > self.size - self._running
+
+    def _session_full(self, worker: SubagentWorker, upcoming: int = 0) -> bool:
+        """Whether the worker has run (with `upcoming` more jobs) its last job"""
+        return bool(self.max_jobs_per_worker) and worker.jobs_done + upcoming >= self.max_jobs_per_worker
+
+    async def _worker_loop(self, slot: int) -> None:
+        while True:
+            _, _, job = await self._queue.get()
+            if job.future.done():
+                continue  # cancelled while queued
+
+            self._running += 1
+            worker = self._workers[slot]
+            try:
+                worker = await self._ensure_worker(slot)
+                if self._session_full(worker, upcoming=1) and self._backlogged():
+                    self._prespawn(slot)  # Warm up the next job's worker meanwhile
+                result = await self._run_job(worker, job)
+            except asyncio.CancelledError:
+                if not job.future.done():
+                    job.future.set_exception(PoolClosedError("Subagent pool shut down"))
+                raise
+            except Exception as e:
+                logger.error(f"Subagent worker {slot} failed: {e}")
+                result = self._failure(job, worker, str(e), time.monotonic())
+                if not isinstance(e, WorkerSpawnError):
+                    await self._replace_worker(slot)
+            finally:
+                self._running -= 1
+
+            if result is not None and not job.future.done():
+                job.future.set_result(result)
+            if result is not None:
+                self._stats['completed' if result.success else 'failed'] += 1
+
+            worker = self._workers[slot]
+            if worker.alive and self._session_full(worker):
+                await self._replace_worker(slot, failed=False)
+
+    async def _run_job(self, worker: SubagentWorker, job: SubagentJob) -> Optional[ClaudeCodeResult]:
+        """Run one job; returns None if its caller cancelled it"""
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        self._timings['queue_wait'] += started - job.submitted_at
+        deadline = started + job.timeout if job.timeout is not None else None
+        cold = worker.jobs_done == 0 and not worker.prespawned
+
+        await worker.send(job.prompt)
+
+        texts: List[str] = []
+        written: List[str] = []
+        first_event: Optional[float] = None
+        final: Optional[ClaudeCodeEvent] = None
+
+        while final is None:
+            read = loop.create_task(worker.read_event())
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, _ = await asyncio.wait({read, job.future}, timeout=remaining,
+                                         return_when=asyncio.FIRST_COMPLETED)
+
+            if read not in done:
+                read.cancel()
+                if job.future.done():
+                    # Caller gave up; the CLI is mid-turn, so replace the worker
+                    self._stats['cancelled'] += 1
+                    await self._replace_worker(worker.worker_id)
+                    return None
+                self._stats['timeouts'] += 1
+                logger.warning(f"Subagent job timed out after {job.timeout}s on worker {worker.worker_id}")
+                await self._replace_worker(worker.worker_id)
+                return self._failure(job, worker, f"Task timed out after {job.timeout} seconds", started)
+
+            event = read.result()
+            if event is None:
+                self._stats['crashes'] += 1
+                await worker.stop()
+                error = worker.stderr.strip() or f"CLI exited with code {worker.process.returncode}"
+                logger.error(f"Subagent worker {worker.worker_id} exited mid-job: {error[:200]}")
+                await self._replace_worker(worker.worker_id)
+                return self._failure(job, worker, error, started)
+
+            if event.type == "system":
+                continue  # session init, may predate this job
+
+            if first_event is None:
+                first_event = time.monotonic()
+                if cold:
+                    self._stats['cold_jobs'] += 1
+                    self._timings['cold_first_event'] += first_event - started
+                    self._timings['startup_seconds'] += worker.ready_at - worker.spawned_at
+                else:
+                    self._stats['warm_jobs'] += 1
+                    self._timings['warm_first_event'] += first_event - started
+
+            if event.type == "result":
+                final = event
+            elif event.text:
+                texts.append(event.text)
+            for tool in event.tool_uses():
+                if tool.get("name") == "Write":
+                    path = tool.get("input", {}).get("file_path")
+                    if path:
+                        written.append(path)
+
+        worker.jobs_done += 1
+        duration = time.monotonic() - started
+        output = final.text or "\n".join(texts)
+        metadata = {
+            "mcp_profile": self.mcp_profile,
+            "worker": worker.worker_id,
+            "cold_start": cold,
+            "queue_wait_seconds": started - job.submitted_at,
+            "first_event_seconds": first_event - started,
+        }
+        for key in ("session_id", "usage", "total_cost_usd", "num_turns"):
+            if key in final.data:
+                metadata[key] = final.data[key]
+
+        if final.data.get("is_error"):
+            return ClaudeCodeResult(
+                success=False,
+                output="",
+                error=output or "Unknown error",
+                duration_seconds=duration,
+                metadata=metadata
+            )
+        return ClaudeCodeResult(
+            success=True,
+            output=output,
+            duration_seconds=duration,
+            files_created=written,
+            metadata=metadata
+        )
+
+    def _failure(self, job: SubagentJob, worker: SubagentWorker, error: str, started: float) -> ClaudeCodeResult:
+        return ClaudeCodeResult(
+            success=False,
+            output="",
+            error=error,
+            duration_seconds=time.monotonic() - started,
+            metadata={
+                "mcp_profile": self.mcp_profile,
+                "worker": worker.worker_id,
+                "queue_wait_seconds": started - job.submitted_at,
+            }
+        )
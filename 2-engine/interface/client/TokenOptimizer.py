@@ -11,65 +11,55 @@ Strategy:
 2. Token-aware conversation trimming (cap history by budget)
 3. Dynamic token budget allocation (per task type)
 4. Semantic code context retrieval (don't send full files)
+5. Response caching with request coalescing for identical deterministic prompts
 
 Based on analysis of real production token usage patterns.
 """
 
+import asyncio
+import concurrent.futures
 import hashlib
 import logging
+import sqlite3
 import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Callable
+from typing import Awaitable, Dict, List, Optional, Tuple, Any, Callable
 import json
-import re
+import sys
+
+try:
+    from helpers.core.token_counter import MessageTokenCounter, get_token_counter
+except ImportError:
+    # Imported as a top-level module (e.g. next to GLMClient): put the
+    # engine root on the path
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+    from helpers.core.token_counter import MessageTokenCounter, get_token_counter
 
 logger = logging.getLogger(__name__)
 
 
 # =============================================================================
-# TOKEN COUNTING (Approximation for GLM 4.7)
+# TOKEN COUNTING (shared service, exact with a local tokenizer file)
 # =============================================================================
 
 def estimate_tokens(text: str) -> int:
     """
-    Estimate token count for text.
-
-    GLM 4.7 tokenization is similar to GPT models:
-    - English: ~4 chars per token
-    - Code: ~3-4 chars per token (more efficient)
-    - Chinese: ~1.5 chars per token
+    Count tokens for text.
 
-    This is a heuristic approximation - actual counts may vary by ~20%.
+    Exact when a tokenizer file is configured (BB5_TOKENIZER_PATH), otherwise
+    the GLM 4.7 heuristic (~4 chars per English token, ~3.5 for code, ~1.5
+    per Chinese character), accurate to ~20%. Counts are memoized.
     """
-    if not text:
-        return 0
-
-    # Count characters
-    char_count = len(text)
-
-    # Detect if code (has indentation, brackets, etc)
-    is_code = bool(re.search(r'^\s*(def|class|function|if|for|while)\b', text, re.M))
-
-    # Chinese character detection
-    chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', text))
-
-    # Estimate tokens
-    if chinese_chars > char_count * 0.3:
-        # Mostly Chinese
-        return int(chinese_chars / 1.5 + (char_count - chinese_chars) / 4)
-    elif is_code:
-        # Code is more token-efficient
-        return int(char_count / 3.5)
-    else:
-        # English text
-        return int(char_count / 4)
+    return get_token_counter().count(text)
 
 
 def estimate_messages_tokens(messages: List[Dict[str, str]]) -> int:
     """Estimate total tokens for a list of messages."""
-    return sum(estimate_tokens(m.get('content', '')) for m in messages)
+    return get_token_counter().count_messages(messages)
 
 
 # =============================================================================
@@ -314,6 +304,378 @@ def get_global_cache() -> CachedPromptManager:
         return _global_cache_manager
 
 
+# =============================================================================
+# LLM RESPONSE CACHE
+# =============================================================================
+
+@dataclass
+class CachedResponse:
+    """A cached LLM response (JSON-serializable dict) with its sizes."""
+    value: Dict[str, Any]
+    expires_at: float
+    request_bytes: int
+    response_bytes: int
+
+
+RESPONSE_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    request_bytes INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+"""
+
+
+def is_deterministic_request(payload: Dict[str, Any]) -> bool:
+    """
+    True if the request should produce the same completion every time.
+
+    Only greedy decoding (temperature 0 or do_sample false) is cacheable;
+    streamed requests never are.
+    """
+    if payload.get('stream'):
+        return False
+    return payload.get('temperature') == 0 or payload.get('do_sample') is False
+
+
+def response_cache_key(payload: Dict[str, Any], endpoint: str = "") -> Tuple[str, int]:
+    """
+    Canonical hash of a request (endpoint, model, messages, sampling params).
+
+    Args:
+        payload: Request body
+        endpoint: URL the request is sent to, so identical payloads sent to
+            different APIs or deployments get different keys
+
+    Returns:
+        (sha256 hex digest, canonical request size in bytes)
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode()
+    digest = hashlib.sha256(endpoint.encode() + b"\n" + canonical).hexdigest()
+    return digest, len(canonical)
+
+
+class ResponseCache:
+    """
+    Cache of LLM responses for identical deterministic requests.
+
+    Two tiers:
+    - Memory: LRU bounded by max_entries, entries expire after ttl_seconds
+    - Disk (optional): SQLite at db_path, same TTL, survives restarts
+
+    get_or_compute()/aget_or_compute() are single-flight: concurrent
+    callers with the same key share one in-flight call, from threads and
+    event loops alike. Failed calls are not cached.
+
+    Usage:
+        cache = ResponseCache(ttl_seconds=600, db_path=Path("responses.db"))
+        cacheable = cache.key_for(payload, endpoint=url)
+        if cacheable:
+            key, size = cacheable
+            value = cache.get_or_compute(key, lambda: call_api(payload), request_bytes=size)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 600,
+        db_path: Optional[Path] = None,
+        max_disk_entries: int = 100_000
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            max_entries: Responses kept in memory
+            ttl_seconds: Seconds before a cached response expires
+            db_path: Optional SQLite file for the disk tier
+            max_disk_entries: Responses kept on disk before the oldest are evicted
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_entries = max_disk_entries
+
+        self._memory: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._waiters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0, 'disk_hits': 0, 'misses': 0, 'coalesced': 0,
+            'stores': 0, 'evictions': 0, 'expired': 0,
+            'bytes_saved': 0, 'tokens_saved': 0,
+        }
+
+        self._db = None
+        self._disk_entries = 0
+        if db_path is not None:
+            db_path = Path(db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(
+                str(db_path),
+                check_same_thread=False,
+                isolation_level=None,  # Explicit transactions only
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(RESPONSE_CACHE_SCHEMA)
+            self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            self._disk_entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def key_for(self, payload: Dict[str, Any], endpoint: str = "") -> Optional[Tuple[str, int]]:
+        """(key, request_bytes) for a cacheable request to endpoint, None otherwise."""
+        if not is_deterministic_request(payload):
+            return None
+        return response_cache_key(payload, endpoint)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached response for key, or None (counts a hit or miss)."""
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            return entry.value
+
+    def put(self, key: str, value: Dict[str, Any], request_bytes: int = 0) -> CachedResponse:
+        """Store a response in both tiers."""
+        encoded = json.dumps(value, separators=(',', ':'))
+        entry = CachedResponse(
+            value=value,
+            expires_at=time.time() + self.ttl_seconds,
+            request_bytes=request_bytes,
+            response_bytes=len(encoded.encode()),
+        )
+        with self._lock:
+            self._remember(key, entry)
+            self._stats['stores'] += 1
+            if self._db is not None:
+                inserted = self._db.execute(
+                    "INSERT OR IGNORE INTO responses (key, value, request_bytes, expires_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, encoded, request_bytes, entry.expires_at),
+                ).rowcount
+                if inserted:
+                    self._disk_entries += 1
+                    if self._disk_entries > self.max_disk_entries:
+                        self._evict_disk()
+                else:
+                    self._db.execute(
+                        "UPDATE responses SET value = ?, request_bytes = ?, expires_at = ? WHERE key = ?",
+                        (encoded, request_bytes, entry.expires_at, key),
+                    )
+        return entry
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Dict[str, Any]],
+        request_bytes: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Return the cached response, or call compute() once for all concurrent callers.
+
+        Args:
+            key: Request key from response_cache_key()
+            compute: Makes the request; returns a JSON-serializable dict
+            request_bytes: Request size, counted in bytes_saved on hits
+        """
+        future, leader = self._claim(key)
+        if not leader:
+            return future.result()
+        return self._lead(key, future, request_bytes, compute)
+
+    async def aget_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+        request_bytes: int = 0
+    ) -> Dict[str, Any]:
+        """Async get_or_compute(): compute is a coroutine function."""
+        future, leader = self._claim(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            value = await compute()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, entry=self.put(key, value, request_bytes))
+        return value
+
+    def _lead(self, key, future, request_bytes, compute) -> Dict[str, Any]:
+        try:
+            value = compute()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, entry=self.put(key, value, request_bytes))
+        return value
+
+    def _claim(self, key: str) -> Tuple[concurrent.futures.Future, bool]:
+        """
+        Resolve key from the cache or an in-flight call.
+
+        Returns:
+            (future, True) if the caller must compute and resolve the future,
+            (future, False) if the future is (or will be) resolved by another caller
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                future = concurrent.futures.Future()
+                future.set_result(entry.value)
+                return future, False
+
+            future = self._inflight.get(key)
+            if future is not None:
+                self._stats['coalesced'] += 1
+                self._waiters[key] = self._waiters.get(key, 0) + 1
+                return future, False
+
+            self._stats['misses'] += 1
+            future = self._inflight[key] = concurrent.futures.Future()
+            return future, True
+
+    def _finish(self, key, future, entry=None, error=None) -> None:
+        """Release the in-flight call and wake the coalesced callers."""
+        with self._lock:
+            self._inflight.pop(key, None)
+            waiters = self._waiters.pop(key, 0)
+            if entry is not None:
+                for _ in range(waiters):
+                    self._record_savings(entry)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(entry.value)
+
+    def _lookup(self, key: str) -> Optional[CachedResponse]:
+        """Find a live entry in memory, then on disk (lock held)."""
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            if entry.expires_at > now:
+                self._memory.move_to_end(key)
+                self._record_hit(entry, 'hits')
+                return entry
+            del self._memory[key]
+            self._stats['expired'] += 1
+
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT value, request_bytes, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[2] <= now:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._disk_entries -= 1
+            self._stats['expired'] += 1
+            return None
+
+        entry = CachedResponse(
+            value=json.loads(row[0]), expires_at=row[2],
+            request_bytes=row[1], response_bytes=len(row[0].encode()),
+        )
+        self._remember(key, entry)
+        self._record_hit(entry, 'disk_hits')
+        return entry
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        """Insert into the memory tier, evicting least recently used (lock held)."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def _record_hit(self, entry: CachedResponse, counter: str) -> None:
+        self._stats[counter] += 1
+        self._record_savings(entry)
+
+    def _record_savings(self, entry: CachedResponse) -> None:
+        self._stats['bytes_saved'] += entry.request_bytes + entry.response_bytes
+        usage = entry.value.get('usage') or {}
+        self._stats['tokens_saved'] += usage.get('total_tokens', 0)
+
+    def _evict_disk(self) -> None:
+        """Drop expired rows, then the oldest down to 90% of capacity (lock held)."""
+        db = self._db
+        db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        count = db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        excess = count - int(self.max_disk_entries * 0.9)
+        if excess > 0:
+            db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY expires_at LIMIT ?)",
+                (excess,),
+            )
+            self._stats['evictions'] += excess
+            count -= excess
+        self._disk_entries = count
+
+    def clear(self) -> None:
+        """Remove every cached response from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._disk_entries = 0
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get response cache statistics."""
+        with self._lock:
+            served = self._stats['hits'] + self._stats['disk_hits'] + self._stats['coalesced']
+            total = served + self._stats['misses']
+            return {
+                **self._stats,
+                'hit_rate': served / total if total > 0 else 0,
+                'memory_entries': len(self._memory),
+                'disk_entries': self._disk_entries,
+                'inflight': len(self._inflight),
+            }
+
+
+# Global response cache instance (memory only until configured)
+_global_response_cache: Optional[ResponseCache] = None
+
+
+def get_global_response_cache() -> ResponseCache:
+    """Get global response cache instance."""
+    global _global_response_cache
+    with _cache_lock:
+        if _global_response_cache is None:
+            _global_response_cache = ResponseCache()
+        return _global_response_cache
+
+
+def configure_response_cache(**kwargs) -> ResponseCache:
+    """
+    Replace the global response cache (e.g. to add a disk tier).
+
+    Args:
+        **kwargs: ResponseCache arguments (max_entries, ttl_seconds, db_path, ...)
+    """
+    global _global_response_cache
+    cache = ResponseCache(**kwargs)
+    with _cache_lock:
+        previous, _global_response_cache = _global_response_cache, cache
+    if previous is not None:
+        previous.close()
+    return cache
+
+
 # =============================================================================
 # TOKEN BUDGET ALLOCATION
 # =============================================================================
@@ -502,23 +864,21 @@ def trim_messages_by_tokens(
         return system_msgs[:1]  # Return just first system message
 
     # Add non-system messages from most recent until budget exceeded
-    result_msgs = list(system_msgs)
+    kept = []
     current_tokens = system_tokens
 
     for msg in reversed(other_msgs):
         msg_tokens = estimate_tokens(msg.get('content', ''))
 
         if current_tokens + msg_tokens <= remaining_budget:
-            result_msgs.insert(len(system_msgs), msg)
+            kept.append(msg)
             current_tokens += msg_tokens
         else:
             break
 
-    # Sort by original order (keep chronological sequence)
-    if len(result_msgs) > len(system_msgs):
-        # Non-system messages were added in reverse, need to fix order
-        non_system = result_msgs[len(system_msgs):]
-        result_msgs = system_msgs + non_system
+    # Restore chronological order (messages were collected newest first)
+    kept.reverse()
+    result_msgs = system_msgs + kept
 
     dropped = len(messages) - len(result_msgs)
     if dropped > 0:
@@ -632,6 +992,10 @@ class TokenOptimizer:
         self.enable_consolidation = enable_consolidation
         self.enable_trimming = enable_trimming
 
+        # Running count of the caller's history: a conversation that grew by
+        # one message since the last optimize() only counts the new message
+        self._history_tokens = MessageTokenCounter()
+
     def optimize(
         self,
         system_prompt: str,
@@ -673,7 +1037,7 @@ class TokenOptimizer:
         # Calculate original tokens
         original_system = estimate_tokens(system_prompt)
         original_persona = estimate_tokens(agent_persona)
-        original_conversation = estimate_messages_tokens(conversation_history)
+        original_conversation = self._history_tokens.count(conversation_history)
         original_code = estimate_tokens(code_context)
         original_query = estimate_tokens(user_query)
         original_total = original_system + original_persona + original_conversation + original_code + original_query
@@ -804,6 +1168,10 @@ def optimize_prompt(
 
 
 def get_optimization_stats() -> Dict[str, Any]:
-    """Get global optimization statistics."""
+    """Get global optimization statistics (prompt cache, response cache, token counter)."""
     cache = get_global_cache()
-    return cache.get_stats()
+    return {
+        **cache.get_stats(),
+        'response_cache': get_global_response_cache().get_stats(),
+        'token_counter': get_token_counter().get_stats(),
+    }
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Stub Claude Code CLI for testing ClaudeCodeClient without the real binary.
+
+Reads the prompt from stdin and, with `--output-format stream-json`, prints
+stream-json events (system init, assistant turns, result); otherwise plain
+text lines. With `--input-format stream-json` it stays up and answers each
+stream-json user message on stdin with one turn, like a warm session.
+
+Behaviour is controlled through the environment:
+
+    STUB_CLAUDE_STARTUP   seconds to sleep before doing anything (cold start)
+    STUB_CLAUDE_EVENTS    assistant events per turn (default 3)
+    STUB_CLAUDE_DELAY     seconds to sleep before each assistant event (default 0)
+    STUB_CLAUDE_EXIT      exit code (default 0)
+    STUB_CLAUDE_WRITE     file path reported in a Write tool_use event
+    STUB_CLAUDE_HANG      if set, start a child that holds stdout, then hang
+    STUB_CLAUDE_PID_FILE  write the hanging child's pid here
+
+A prompt containing "[hang]" or "[crash]" hangs or exits (code 3) in
+that turn.
+
+Usage:
+    client = ClaudeCodeClient(claude_path="interface/client/stub_claude_cli.py")
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+def emit(event: dict) -> None:
+    print(json.dumps(event), flush=True)
+
+
+def hang() -> None:
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(3600)"])
+    pid_file = os.getenv("STUB_CLAUDE_PID_FILE")
+    if pid_file:
+        with open(pid_file, "w") as f:
+            f.write(str(child.pid))
+    time.sleep(3600)
+
+
+def turn(prompt: str, session_id: str, stream_json: bool, number: int) -> None:
+    """Answer one prompt"""
+    events = int(os.getenv("STUB_CLAUDE_EVENTS", "3"))
+    delay = float(os.getenv("STUB_CLAUDE_DELAY", "0"))
+    failed = int(os.getenv("STUB_CLAUDE_EXIT", "0")) != 0
+
+    for i in range(events):
+        time.sleep(delay)
+        text = f"step {i + 1} of {events}"
+        if stream_json:
+            emit({
+                "type": "assistant",
+                "session_id": session_id,
+                "message": {"role": "assistant", "content": [{"type": "text", "text": text}]}
+            })
+        else:
+            print(text, flush=True)
+
+    if "[crash]" in prompt:
+        print("stub crashed", file=sys.stderr, flush=True)
+        sys.exit(3)
+    if os.getenv("STUB_CLAUDE_HANG") or "[hang]" in prompt:
+        hang()
+
+    path = os.getenv("STUB_CLAUDE_WRITE")
+    if path and stream_json:
+        emit({
+            "type": "assistant",
+            "session_id": session_id,
+            "message": {"role": "assistant", "content": [
+                {"type": "tool_use", "name": "Write", "input": {"file_path": path, "content": ""}}
+            ]}
+        })
+
+    result = f"done: {prompt.strip()}"
+    if stream_json:
+        emit({
+            "type": "result",
+            "subtype": "error" if failed else "success",
+            "is_error": failed,
+            "result": result,
+            "session_id": session_id,
+            "num_turns": number,
+            "usage": {"input_tokens": len(prompt.split()), "output_tokens": events}
+        })
+    else:
+        print(result, flush=True)
+
+
+def main() -> int:
+    if "--version" in sys.argv:
+        print("0.0.0 (stub)")
+        return 0
+
+    time.sleep(float(os.getenv("STUB_CLAUDE_STARTUP", "0")))
+    args = " ".join(sys.argv[1:])
+    stream_json = "--output-format stream-json" in args
+    exit_code = int(os.getenv("STUB_CLAUDE_EXIT", "0"))
+    session_id = f"stub-{os.getpid()}"
+
+    if stream_json:
+        emit({"type": "system", "subtype": "init", "session_id": session_id})
+
+    if "--input-format stream-json" in args:
+        # Warm session: one turn per user message until stdin closes
+        for number, line in enumerate(sys.stdin, 1):
+            if not line.strip():
+                continue
+            message = json.loads(line)["message"]
+            prompt = "".join(block.get("text", "") for block in message["content"])
+            turn(prompt, session_id, stream_json, number)
+    else:
+        turn(sys.stdin.read(), session_id, stream_json, 1)
+
+    if exit_code:
+        print("stub failure", file=sys.stderr)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Test streamed Claude Code CLI execution.
+
+Tests that:
+1. stream-json events are parsed and yielded as the CLI prints them
+2. execute_async folds events into a ClaudeCodeResult
+3. A timeout or cancellation kills the CLI's whole process group
+4. Many CLI runs proceed concurrently, bounded by max_concurrent
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add engine root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from interface.client.ClaudeCodeClient import (
+    ClaudeCodeClient,
+    ClaudeCodeEvent,
+    ClaudeCodeTimeoutError,
+)
+
+STUB_CLI = Path(__file__).parent / "stub_claude_cli.py"
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX only")
+
+
+def make_client(**kwargs) -> ClaudeCodeClient:
+    return ClaudeCodeClient(claude_path=str(STUB_CLI), **kwargs)
+
+
+def process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        # Orphans may linger as zombies until init reaps them
+        return Path(f"/proc/{pid}/stat").read_text().split(")")[-1].split()[0] != "Z"
+    except OSError:
+        return True
+
+
+def test_parse_event_lines():
+    event = ClaudeCodeEvent.parse(
+        '{"type": "assistant", "message": {"content": [{"type": "text", "text": "hi"}]}}'
+    )
+    assert event.type == "assistant"
+    assert event.text == "hi"
+
+    plain = ClaudeCodeEvent.parse("not json")
+    assert plain.type == "text"
+    assert plain.text == "not json"
+    assert ClaudeCodeEvent.parse("[1, 2]").type == "text"
+
+
+@pytest.mark.asyncio
+async def test_events_arrive_before_exit():
+    client = make_client()
+    arrivals = []
+    start = time.monotonic()
+    async with client.stream(
+        "hello", mcp_profile="minimal", env={"STUB_CLAUDE_EVENTS": "3", "STUB_CLAUDE_DELAY": "0.2"}
+    ) as run:
+        async for event in run:
+            arrivals.append((event.type, time.monotonic() - start))
+
+    assert [t for t, _ in arrivals] == ["system", "assistant", "assistant", "assistant", "result"]
+    assert arrivals[1][1] < arrivals[-1][1] - 0.3  # first turn seen well before the end
+    assert run.returncode == 0
+    assert run.events_read == 5
+
+
+@pytest.mark.asyncio
+async def test_execute_async_builds_result(tmp_path):
+    client = make_client()
+    result = await client.execute_async(
+        "build it",
+        mcp_profile="minimal",
+        cwd=tmp_path,
+        env={"STUB_CLAUDE_WRITE": str(tmp_path / "app.py")}
+    )
+
+    assert result.success
+    assert result.output == "done: build it"
+    assert result.files_created == [str(tmp_path / "app.py")]
+    assert result.metadata["returncode"] == 0
+    assert result.metadata["num_turns"] == 1
+    assert result.metadata["session_id"].startswith("stub-")
+
+    failed = await client.execute_async("x", mcp_profile="minimal", env={"STUB_CLAUDE_EXIT": "2"})
+    assert not failed.success
+    assert failed.metadata["returncode"] == 2
+    assert "stub failure" in failed.error
+
+
+@pytest.mark.asyncio
+async def test_timeout_kills_process_group(tmp_path):
+    client = make_client()
+    pid_file = tmp_path / "child.pid"
+    run = client.stream(
+        "hang", mcp_profile="minimal", timeout=1.0, kill_grace=0.5,
+        env={"STUB_CLAUDE_HANG": "1", "STUB_CLAUDE_PID_FILE": str(pid_file)}
+    )
+
+    events = []
+    with pytest.raises(ClaudeCodeTimeoutError):
+        async for event in run:
+            events.append(event.type)
+
+    assert "assistant" in events
+    assert run.timed_out
+    assert run.returncode is not None
+    await asyncio.sleep(0.2)
+    assert not process_alive(int(pid_file.read_text()))
+
+    result = await client.execute_async(
+        "hang", mcp_profile="minimal", timeout=1, env={"STUB_CLAUDE_HANG": "1"}
+    )
+    assert not result.success
+    assert result.error == "Task timed out after 1 seconds"
+
+
+@pytest.mark.asyncio
+async def test_cancellation_kills_process_group(tmp_path):
+    client = make_client()
+    pid_file = tmp_path / "child.pid"
+    task = asyncio.create_task(client.execute_async(
+        "hang", mcp_profile="minimal",
+        env={"STUB_CLAUDE_HANG": "1", "STUB_CLAUDE_PID_FILE": str(pid_file)}
+    ))
+    for _ in range(100):
+        if pid_file.exists() and pid_file.read_text():
+            break
+        await asyncio.sleep(0.05)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0.2)
+    assert not process_alive(int(pid_file.read_text()))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_overlap():
+    client = make_client()
+    env = {"STUB_CLAUDE_EVENTS": "2", "STUB_CLAUDE_DELAY": "0.5"}
+    start = time.monotonic()
+    results = await asyncio.gather(*(
+        client.execute_async(f"task {i}", mcp_profile="minimal", env=env) for i in range(24)
+    ))
+    elapsed = time.monotonic() - start
+
+    assert all(r.success for r in results)
+    assert elapsed < 6  # 24 x 1s runs overlap instead of queueing behind an executor
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_caps_running_processes():
+    client = make_client(max_concurrent=2)
+    running = 0
+    peak = 0
+
+    async def run_one(i):
+        nonlocal running, peak
+        async with client.stream(f"task {i}", mcp_profile="minimal",
+                                 env={"STUB_CLAUDE_EVENTS": "1", "STUB_CLAUDE_DELAY": "0.2"}) as run:
+            running += 1
+            peak = max(peak, running)
+            async for _ in run:
+                pass
+            running -= 1
+
+    await asyncio.gather(*(run_one(i) for i in range(6)))
+    assert peak == 2
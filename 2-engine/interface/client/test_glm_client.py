@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Test the GLMClient transport.
+
+Tests that:
+1. Requests reuse pooled keep-alive connections
+2. Retryable statuses are retried, honouring Retry-After
+3. Other client errors fail without retrying
+4. The host limiter enforces its rate and burst
+5. Deterministic requests are cached and coalesced
+6. Retry policies need at least one attempt, and stats count every request
+7. Token optimization loads whether the client is imported from the
+   package or as a sibling module
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from email.utils import formatdate
+from pathlib import Path
+
+import pytest
+
+# Add engine root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from interface.client.GLMClient import (
+    GLMAPIError,
+    GLMClient,
+    HostLimiter,
+    RetryPolicy,
+    aclose_shared_http_clients,
+    parse_retry_after,
+)
+from interface.client.TokenOptimizer import ResponseCache
+
+COMPLETION = json.dumps({
+    "choices": [{"message": {"content": "hello"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4},
+}).encode()
+
+
+class StubAPI:
+    """Keep-alive HTTP/1.1 stub; replies with queued (status, headers) then 200s"""
+
+    def __init__(self, replies=()):
+        self.replies = list(replies)
+        self.connections = 0
+        self.requests = 0
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v4/chat/completions"
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = next(
+                    int(line.split(b":", 1)[1]) for line in head.split(b"\r\n")
+                    if line.lower().startswith(b"content-length:")
+                )
+                await reader.readexactly(length)
+                self.requests += 1
+                status, headers = self.replies.pop(0) if self.replies else (200, {})
+                body = COMPLETION if status == 200 else b'{"error": "nope"}'
+                extra = "".join(f"{k}: {v}\r\n" for k, v in headers.items()).encode()
+                writer.write(
+                    b"HTTP/1.1 %d X\r\nContent-Type: application/json\r\n%sContent-Length: %d\r\n\r\n%s"
+                    % (status, extra, len(body), body)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def make_client(url: str, max_attempts: int = 3, **kwargs) -> GLMClient:
+    return GLMClient(
+        api_key="test-key",
+        base_url=url,
+        enable_prompt_compression=False,
+        enable_token_optimization=False,
+        retry_policy=RetryPolicy(max_attempts=max_attempts, base_delay=0.001),
+        **kwargs,
+    )
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+@pytest.mark.asyncio
+async def test_acreate_reuses_connection():
+    stub = StubAPI()
+    client = make_client(await stub.start())
+
+    responses = await asyncio.gather(*(client.acreate(MESSAGES) for _ in range(5)))
+    for _ in range(5):
+        await client.acreate(MESSAGES)
+
+    assert [r.content for r in responses] == ["hello"] * 5
+    assert responses[0].usage["total_tokens"] == 4
+    assert stub.requests == 10
+    assert stub.connections <= 5
+    await aclose_shared_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_retries_honour_retry_after():
+    stub = StubAPI([(429, {"Retry-After": "0.2"}), (503, {})])
+    client = make_client(await stub.start())
+
+    start = time.perf_counter()
+    response = await client.acreate(MESSAGES)
+
+    assert response.content == "hello"
+    assert time.perf_counter() - start >= 0.2
+    assert stub.requests == 3
+    assert client.stats == {"requests": 3, "retries": 2, "throttled": 1}
+    await aclose_shared_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_sync_create_gives_up_after_max_attempts():
+    stub = StubAPI([(500, {})] * 3)
+    client = make_client(await stub.start())
+
+    with pytest.raises(GLMAPIError, match="after 3 attempts"):
+        await asyncio.to_thread(client.create, MESSAGES)
+    assert stub.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    stub = StubAPI([(400, {})])
+    client = make_client(await stub.start())
+
+    with pytest.raises(GLMAPIError, match="400"):
+        await client.acreate(MESSAGES)
+    assert stub.requests == 1
+    await aclose_shared_http_clients()
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert 8 < parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0, max_retry_after=5.0)
+    assert all(0 <= policy.delay(attempt) <= 4.0 for attempt in range(10))
+    assert policy.delay(0, retry_after=2.5) == 2.5
+    assert policy.delay(0, retry_after=60) == 5.0
+
+
+def test_retry_policy_needs_an_attempt():
+    with pytest.raises(ValueError, match="max_attempts"):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError, match="max_attempts"):
+        GLMClient(api_key="test-key", max_retries=-1, enable_prompt_compression=False,
+                  enable_token_optimization=False)
+
+
+def test_token_optimizer_loads_from_both_entry_points():
+    client = GLMClient(api_key="test-key", enable_prompt_compression=False)
+    assert client.token_optimizer is not None
+
+    script = (
+        "import GLMClient\n"
+        "client = GLMClient.GLMClient(api_key='test-key', enable_prompt_compression=False)\n"
+        "assert client.token_optimizer is not None\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=Path(__file__).parent, check=True)
+
+
+@pytest.mark.asyncio
+async def test_stats_count_concurrent_sync_requests():
+    stub = StubAPI([(503, {})] * 8)
+    client = make_client(await stub.start(), max_attempts=10)
+
+    await asyncio.gather(*(asyncio.to_thread(client.create, MESSAGES) for _ in range(16)))
+
+    assert stub.requests == 24
+    assert client.stats == {"requests": 24, "retries": 8, "throttled": 0}
+
+
+def test_host_limiter_rate_and_burst():
+    limiter = HostLimiter(max_concurrency=4, rate=10, burst=2)
+    waits = [limiter.reserve() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+    limiter.block_for(1.0)
+    assert HostLimiter(1).reserve() == 0.0
+    assert limiter.reserve() >= 0.9
+
+
+@pytest.mark.asyncio
+async def test_response_cache_coalesces_identical_requests():
+    stub = StubAPI()
+    cache = ResponseCache()
+    client = make_client(await stub.start(), response_cache=cache)
+
+    responses = await asyncio.gather(*(client.acreate(MESSAGES, temperature=0) for _ in range(8)))
+    again = await asyncio.to_thread(client.create, MESSAGES, temperature=0)
+    await client.acreate(MESSAGES, temperature=0.7)
+
+    assert {r.content for r in responses} == {again.content} == {"hello"}
+    assert stub.requests == 2  # one shared deterministic call + the sampled one
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"]) == (1, 7, 1)
+    assert stats["tokens_saved"] == 8 * 4
+    await aclose_shared_http_clients()
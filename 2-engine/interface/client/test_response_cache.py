@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test the LLM response cache.
+
+Tests that:
+1. Only deterministic requests get a cache key, which includes the endpoint
+2. The memory tier expires entries and evicts least recently used ones
+3. The SQLite tier survives a restart and counts replaced rows once
+4. Concurrent identical calls share one computation, failures included
+5. Metrics are reported by get_optimization_stats()
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add engine root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from interface.client.TokenOptimizer import (
+    ResponseCache,
+    get_optimization_stats,
+    response_cache_key,
+)
+
+RESPONSE = {"content": "4", "model": "glm-4.7", "usage": {"total_tokens": 10}, "finish_reason": "stop"}
+
+
+def payload(content="2+2?", **params):
+    return {"model": "glm-4.7", "messages": [{"role": "user", "content": content}],
+            "temperature": 0, **params}
+
+
+def test_key_is_canonical_and_deterministic_only():
+    cache = ResponseCache()
+    key, size = cache.key_for(payload())
+
+    assert key == response_cache_key(dict(reversed(list(payload().items()))))[0]
+    assert size > 0
+    assert cache.key_for(payload(top_p=0.5))[0] != key
+    assert cache.key_for(payload(temperature=0.7)) is None
+    assert cache.key_for(payload(stream=True)) is None
+    assert cache.key_for(payload(temperature=0.9, do_sample=False)) is not None
+
+    other_endpoint = "https://api.z.ai/api/paas/v4/chat/completions"
+    assert cache.key_for(payload(), endpoint=other_endpoint)[0] != key
+    assert cache.key_for(payload(), endpoint=other_endpoint) == cache.key_for(payload(), other_endpoint)
+
+
+def test_memory_tier_ttl_and_lru():
+    cache = ResponseCache(max_entries=2, ttl_seconds=0.05)
+    cache.put("a", RESPONSE)
+    cache.put("b", RESPONSE)
+    assert cache.get("a") == RESPONSE  # a is now most recent
+    cache.put("c", RESPONSE)
+
+    assert cache.get("b") is None
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+    stats = cache.get_stats()
+    assert (stats["evictions"], stats["expired"], stats["hits"]) == (1, 1, 1)
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    db_path = tmp_path / "responses.db"
+    cache = ResponseCache(db_path=db_path)
+    cache.put("k", RESPONSE, request_bytes=100)
+    cache.close()
+
+    reopened = ResponseCache(db_path=db_path)
+    assert reopened.get("k") == RESPONSE
+    assert reopened.get("k") == RESPONSE
+
+    stats = reopened.get_stats()
+    assert (stats["disk_hits"], stats["hits"], stats["disk_entries"]) == (1, 1, 1)
+    assert stats["tokens_saved"] == 20
+    assert stats["bytes_saved"] > 200
+    reopened.close()
+
+
+def test_disk_tier_counts_replaced_rows_once(tmp_path):
+    cache = ResponseCache(db_path=tmp_path / "responses.db", max_disk_entries=10)
+    for _ in range(20):
+        cache.put("k", RESPONSE)
+    cache.put("other", RESPONSE)
+
+    assert cache.get_stats()["disk_entries"] == 2
+    assert cache.get_stats()["evictions"] == 0
+    cache.close()
+
+
+def test_disk_tier_evicts_oldest(tmp_path):
+    cache = ResponseCache(max_entries=1, db_path=tmp_path / "responses.db", max_disk_entries=10)
+    for i in range(11):
+        cache.put(f"k{i}", RESPONSE)
+
+    assert cache.get_stats()["disk_entries"] == 9
+    assert cache.get("k0") is None
+    assert cache.get("k10") == RESPONSE
+    cache.close()
+
+
+def test_single_flight_across_threads():
+    cache = ResponseCache()
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return RESPONSE
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    while cache.get_stats()["coalesced"] < 7:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [RESPONSE] * 8
+    assert cache.get_or_compute("k", compute) == RESPONSE
+    assert len(calls) == 1
+
+
+def test_failures_propagate_and_are_not_cached():
+    cache = ResponseCache()
+
+    def fail():
+        raise RuntimeError("api down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute("k", fail)
+    assert cache.get_or_compute("k", lambda: RESPONSE) == RESPONSE
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_optimization_stats_include_response_cache():
+    stats = get_optimization_stats()
+
+    assert "cache_hits" in stats
+    assert {"hits", "misses", "coalesced", "bytes_saved"} <= set(stats["response_cache"])
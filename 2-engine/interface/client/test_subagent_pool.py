@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Test the warm Claude Code subagent pool.
+
+Tests that:
+1. Each job gets its own CLI session, started while the previous job ran
+   if jobs are queued, so only first jobs pay the CLI startup, and idle
+   slots spawn no successor
+2. Queued jobs run in priority order
+3. Timed out, crashed and cancelled jobs get their worker restarted
+4. Admission control rejects jobs past max_queue
+5. Sessions are shared only when max_jobs_per_worker allows it
+6. Workers that fail to spawn fail their jobs and are retried, instead of
+   stalling the pool
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add engine root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from interface.client.ClaudeCodeClient import ClaudeCodeClient
+from interface.client.SubagentPool import PoolSaturatedError, SubagentPool
+
+STUB_CLI = Path(__file__).parent / "stub_claude_cli.py"
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX only")
+
+
+def make_pool(size: int = 2, env=None, cli=STUB_CLI, **kwargs) -> SubagentPool:
+    return SubagentPool(
+        size=size,
+        client=ClaudeCodeClient(claude_path=str(cli)),
+        env={"STUB_CLAUDE_EVENTS": "1", **(env or {})},
+        kill_grace=0.5,
+        **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_jobs_get_fresh_prestarted_sessions():
+    env = {"STUB_CLAUDE_STARTUP": "0.5", "STUB_CLAUDE_DELAY": "0.25", "STUB_CLAUDE_EVENTS": "3"}
+    async with make_pool(2, env=env) as pool:
+        results = await asyncio.gather(*(pool.submit(f"job {i}") for i in range(6)))
+        stats = pool.get_stats()
+
+    assert [r.output for r in results] == [f"done: job {i}" for i in range(6)]
+    assert all(r.success for r in results)
+    assert len({r.metadata["session_id"] for r in results}) == 6
+    assert all(r.metadata["num_turns"] == 1 for r in results)
+    assert stats["recycled"] == 6 and stats["restarts"] == 0
+    assert stats["cold_jobs"] == 2 and stats["warm_jobs"] == 4
+    assert stats["mean_startup_seconds"] >= 0.5
+    assert stats["mean_warm_first_event_seconds"] < 0.5
+    assert sum(r.metadata["cold_start"] for r in results) == 2
+
+
+@pytest.mark.asyncio
+async def test_idle_slots_spawn_no_successor():
+    async with make_pool(5) as pool:
+        results = await asyncio.gather(*(pool.submit(f"job {i}") for i in range(5)))
+        stats = pool.get_stats()
+
+    assert all(r.success for r in results)
+    assert stats["worker_starts"] == 5 and stats["recycled"] == 5
+
+
+@pytest.mark.asyncio
+async def test_priority_order():
+    order = []
+
+    async with make_pool(1) as pool:
+        async def run(prompt, priority):
+            result = await pool.submit(prompt, priority=priority)
+            order.append(result.output)
+
+        blocker = asyncio.create_task(run("blocker", 0))
+        await asyncio.sleep(0.1)
+        jobs = [asyncio.create_task(run(f"p{p}", p)) for p in (5, 1, 3)]
+        await asyncio.gather(blocker, *jobs)
+
+    assert order == ["done: blocker", "done: p1", "done: p3", "done: p5"]
+
+
+@pytest.mark.asyncio
+async def test_timeout_restarts_worker(tmp_path):
+    pid_file = tmp_path / "child.pid"
+    async with make_pool(1, env={"STUB_CLAUDE_PID_FILE": str(pid_file)}) as pool:
+        timed_out = await pool.submit("[hang]", timeout=0.5)
+        after = await pool.submit("next")
+        stats = pool.get_stats()
+
+    assert not timed_out.success
+    assert timed_out.error == "Task timed out after 0.5 seconds"
+    assert after.success
+    assert stats["timeouts"] == 1 and stats["restarts"] == 1
+
+    await asyncio.sleep(0.2)
+    stat = Path(f"/proc/{pid_file.read_text()}/stat")
+    assert not stat.exists() or stat.read_text().split(")")[-1].split()[0] == "Z"
+
+
+@pytest.mark.asyncio
+async def test_crash_restarts_worker():
+    async with make_pool(1) as pool:
+        crashed = await pool.submit("[crash]")
+        after = await pool.submit("next")
+        stats = pool.get_stats()
+
+    assert not crashed.success
+    assert "stub crashed" in crashed.error
+    assert after.success
+    assert stats["crashes"] == 1 and stats["restarts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_restarts_worker():
+    async with make_pool(1) as pool:
+        task = asyncio.create_task(pool.submit("[hang]"))
+        await asyncio.sleep(0.3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        after = await pool.submit("next")
+        stats = pool.get_stats()
+
+    assert after.success
+    assert stats["cancelled"] == 1 and stats["restarts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_admission_control():
+    async with make_pool(1, env={"STUB_CLAUDE_DELAY": "0.3"}, max_queue=1) as pool:
+        running = asyncio.create_task(pool.submit("running"))
+        await asyncio.sleep(0.1)
+        queued = asyncio.create_task(pool.submit("queued"))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(PoolSaturatedError):
+            await pool.submit("rejected")
+
+        assert (await running).success and (await queued).success
+        assert pool.get_stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sessions_shared_up_to_max_jobs():
+    async with make_pool(1, max_jobs_per_worker=2) as pool:
+        results = [await pool.submit(f"job {i}") for i in range(4)]
+        stats = pool.get_stats()
+
+    assert all(r.success for r in results)
+    sessions = [r.metadata["session_id"] for r in results]
+    assert sessions[0] == sessions[1] != sessions[2] == sessions[3]
+    assert [r.metadata["num_turns"] for r in results] == [1, 2, 1, 2]
+    assert stats["recycled"] == 2
+    assert [r.metadata["cold_start"] for r in results] == [True, False, True, False]
+
+
+@pytest.mark.asyncio
+async def test_spawn_failures_fail_jobs_and_retry(tmp_path):
+    cli = tmp_path / "claude"
+    shutil.copy(STUB_CLI, cli)
+
+    async with make_pool(1, cli=cli, spawn_retries=2, spawn_backoff=0.01) as pool:
+        assert (await pool.submit("first")).success
+
+        cli.unlink()
+        failed = await asyncio.wait_for(
+            asyncio.gather(*(pool.submit(f"job {i}") for i in range(2))), timeout=10
+        )
+        assert not any(r.success for r in failed)
+        assert "Could not start Claude Code CLI worker 0" in failed[0].error
+        assert pool.get_stats()["spawn_failures"] == 6
+
+        shutil.copy(STUB_CLI, cli)
+        assert (await pool.submit("after")).success
+
+
+@pytest.mark.asyncio
+async def test_pool_starts_without_cli(tmp_path):
+    async with make_pool(2, cli=tmp_path / "missing", spawn_retries=0) as pool:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(pool.submit(f"job {i}") for i in range(3))), timeout=10
+        )
+        stats = pool.get_stats()
+
+    assert not any(r.success for r in results)
+    assert stats["failed"] == 3 and stats["spawn_failures"] == 5
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test AgentLoader discovery through the on-disk manifest.
+
+Tests that:
+1. A warm start takes agents from the manifest without importing or parsing
+2. Agents are imported and instantiated on first lookup only
+3. Edited files are re-read; touched but unchanged files are only re-hashed
+4. Removed files drop their agents; a corrupt manifest is ignored
+5. Files that fail to import are not recorded and are retried on every scan
+"""
+
+import asyncio
+import os
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.framework.agent_loader import AgentLoader
+
+PYTHON_AGENT = '''
+from pathlib import Path
+from typing import List
+
+from agents.framework.base_agent import AgentResult, AgentTask, BaseAgent
+
+with open({marker!r}, "a") as f:
+    f.write("imported\\n")
+
+
+class {name}(BaseAgent):
+    async def execute(self, task: AgentTask) -> AgentResult:
+        return AgentResult(success=True, output="{name}")
+
+    async def think(self, task: AgentTask) -> List[str]:
+        return []
+'''
+
+YAML_AGENT = '''
+agent:
+  metadata:
+    id: specialists/{name}
+    name: {name}
+    title: {title}
+    tags: [{tag}]
+  persona:
+    role: {title}
+  capabilities:
+    - name: reviewing
+'''
+
+
+@pytest.fixture
+def agents_dir(tmp_path):
+    root = tmp_path / "agents"
+    (root / "core").mkdir(parents=True)
+    (root / "specialists").mkdir()
+    marker = tmp_path / "imports.log"
+    write_python_agent(root / "core" / "ReviewerAgent.py", "ReviewerAgent", marker)
+    (root / "specialists" / "qa-specialist.yaml").write_text(
+        YAML_AGENT.format(name="qa", title="QA Specialist", tag="testing")
+    )
+    (root / "specialists" / "notes.yaml").write_text("not: an agent\n")
+    return root
+
+
+def write_python_agent(path: Path, name: str, marker: Path) -> None:
+    path.write_text(textwrap.dedent(PYTHON_AGENT.format(name=name, marker=str(marker))))
+
+
+def import_count(agents_dir: Path) -> int:
+    marker = agents_dir.parent / "imports.log"
+    return len(marker.read_text().splitlines()) if marker.exists() else 0
+
+
+def make_loader(agents_dir: Path, **kwargs) -> AgentLoader:
+    return AgentLoader(agents_path=agents_dir, manifest_path=agents_dir.parent / "manifest.json", **kwargs)
+
+
+def load(loader: AgentLoader):
+    return asyncio.run(loader.load_all())
+
+
+def test_warm_start_imports_nothing(agents_dir):
+    cold = make_loader(agents_dir)
+    agents = load(cold)
+    assert sorted(agents) == ["ReviewerAgent", "specialists_qa"]
+    assert cold.get_stats()["modules_imported"] == 1
+    assert cold.get_stats()["yaml_parsed"] == 1
+    assert import_count(agents_dir) == 1
+
+    warm = make_loader(agents_dir)
+    agents = load(warm)
+    stats = warm.get_stats()
+    assert sorted(agents) == ["ReviewerAgent", "specialists_qa"]
+    assert stats["files_cached"] == stats["files_scanned"] == 2
+    assert stats["modules_imported"] == 0 and stats["yaml_parsed"] == 0
+    assert import_count(agents_dir) == 1
+
+
+def test_agents_instantiated_on_first_lookup(agents_dir):
+    load(make_loader(agents_dir))
+    loader = make_loader(agents_dir)
+    agents = load(loader)
+
+    assert "specialists_qa" in agents and len(agents) == 2
+    assert loader.get_stats()["agents_instantiated"] == 0
+
+    qa = agents["specialists_qa"]
+    assert qa.config.full_name == "QA Specialist"
+    assert qa.config.capabilities == ["reviewing", "testing"]
+    assert loader.get_stats()["agents_instantiated"] == 1
+    assert import_count(agents_dir) == 1
+
+    reviewer = loader.get_agent("ReviewerAgent")
+    assert type(reviewer).__name__ == "ReviewerAgent"
+    assert loader.get_agent("ReviewerAgent") is reviewer
+    assert import_count(agents_dir) == 2
+    assert loader.get_agent("missing") is None
+    with pytest.raises(KeyError):
+        agents["missing"]
+
+
+def test_changed_files_are_reread(agents_dir):
+    load(make_loader(agents_dir))
+
+    yaml_file = agents_dir / "specialists" / "qa-specialist.yaml"
+    os.utime(yaml_file, ns=(0, 0))
+    py_file = agents_dir / "core" / "ReviewerAgent.py"
+    write_python_agent(py_file, "AuditorAgent", agents_dir.parent / "imports.log")
+
+    loader = make_loader(agents_dir)
+    agents = load(loader)
+    stats = loader.get_stats()
+
+    assert sorted(agents) == ["AuditorAgent", "specialists_qa"]
+    assert stats["files_rehashed"] == 2
+    assert stats["yaml_parsed"] == 0
+    assert stats["modules_imported"] == 1
+
+    again = make_loader(agents_dir)
+    load(again)
+    assert again.get_stats()["files_rehashed"] == 0
+
+
+def test_removed_files_and_corrupt_manifest(agents_dir):
+    load(make_loader(agents_dir))
+    (agents_dir / "core" / "ReviewerAgent.py").unlink()
+    assert list(load(make_loader(agents_dir))) == ["specialists_qa"]
+
+    (agents_dir.parent / "manifest.json").write_text("{not json")
+    loader = make_loader(agents_dir)
+    assert list(load(loader)) == ["specialists_qa"]
+    assert loader.get_stats()["yaml_parsed"] == 1
+
+
+def test_failed_imports_are_retried(agents_dir):
+    broken = agents_dir / "core" / "PlannerAgent.py"
+    broken.write_text("import missing_dependency_for_planner\n")
+
+    cold = make_loader(agents_dir)
+    assert sorted(load(cold)) == ["ReviewerAgent", "specialists_qa"]
+    assert cold.get_stats()["modules_imported"] == 2
+
+    manifest = (agents_dir.parent / "manifest.json").read_text()
+    assert "PlannerAgent.py" not in manifest
+
+    retry = make_loader(agents_dir)
+    load(retry)
+    assert retry.get_stats()["modules_imported"] == 1
+    assert retry.get_stats()["files_cached"] == 2
+
+    write_python_agent(broken, "PlannerAgent", agents_dir.parent / "imports.log")
+    fixed = make_loader(agents_dir)
+    assert sorted(load(fixed)) == ["PlannerAgent", "ReviewerAgent", "specialists_qa"]
+    assert "PlannerAgent.py" in (agents_dir.parent / "manifest.json").read_text()
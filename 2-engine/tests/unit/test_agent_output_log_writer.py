@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Test the batched database writer behind AgentOutputBus.
+
+Tests that:
+1. Outputs are logged in batches and queries see every received output
+2. The writer flushes on its interval and on close
+3. Large raw outputs can be stored compressed and read back as text
+4. Recent outputs can be filtered by agent and task through indexes
+5. areceive runs handlers concurrently and keeps their order
+6. areceive does not block the event loop while the writer queue is full
+7. A bus that is dropped without close() still flushes and stops its writer
+"""
+
+import asyncio
+import gc
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "interface"))
+
+from AgentOutputBus import AgentOutputBus, HandlerResult, OutputHandler
+from AgentOutputParser import create_agent_output
+
+
+def make_output(agent: str = "coder", task_id: str = "TASK-1", status: str = "success",
+                human_content: str = "Done.") -> str:
+    return create_agent_output(
+        status=status,
+        summary=f"{agent} finished {task_id}",
+        deliverables=["a.py"],
+        next_steps=["Review"],
+        human_content=human_content,
+        agent_name=agent,
+        task_id=task_id
+    )
+
+
+def count_rows(db_path: Path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM agent_outputs").fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def make_bus(tmp_path):
+    buses = []
+
+    def factory(**kwargs) -> AgentOutputBus:
+        bus = AgentOutputBus(db_path=tmp_path / "outputs.db", **kwargs)
+        bus.initialize()
+        buses.append(bus)
+        return bus
+
+    yield factory
+    for bus in buses:
+        bus.close()
+
+
+class SleepyHandler(OutputHandler):
+    def __init__(self, name: str, delay: float, fail: bool = False):
+        super().__init__(name)
+        self.delay = delay
+        self.fail = fail
+
+    def handle(self, event):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("handler broke")
+        return HandlerResult(True, f"{self.name} saw {event.task_id}")
+
+
+def test_outputs_are_written_in_batches(make_bus):
+    bus = make_bus(batch_size=100, flush_interval=60)
+    for i in range(250):
+        assert bus.receive(make_output(task_id=f"TASK-{i}"))["success"]
+
+    assert bus.get_agent_stats()["total"] == 250
+    assert bus.log_writer.pending == 0
+    assert bus.log_writer.stats["written"] == 250
+    assert bus.log_writer.stats["batches"] <= 4
+    assert bus.get_recent_outputs(limit=1)[0]["task_id"] == "TASK-249"
+
+
+def test_writer_flushes_on_interval_and_close(make_bus, tmp_path):
+    bus = make_bus(batch_size=1000, flush_interval=0.05)
+    bus.receive(make_output())
+    deadline = time.monotonic() + 5
+    while count_rows(tmp_path / "outputs.db") < 1 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert count_rows(tmp_path / "outputs.db") == 1
+
+    slow = make_bus(batch_size=1000, flush_interval=60)
+    for i in range(10):
+        slow.receive(make_output(task_id=f"TASK-{i}"))
+    slow.close()
+    assert count_rows(tmp_path / "outputs.db") == 11
+
+
+def test_large_raw_outputs_are_compressed(make_bus, tmp_path):
+    bus = make_bus(compress_threshold=512)
+    small = make_output(task_id="TASK-small")
+    large = make_output(task_id="TASK-large", human_content="All the details. " * 200)
+    bus.receive(small)
+    bus.receive(large)
+
+    outputs = {row["task_id"]: row["raw_output"] for row in bus.get_recent_outputs()}
+    assert outputs == {"TASK-small": small, "TASK-large": large}
+    assert bus.log_writer.stats["compressed"] == 1
+
+    conn = sqlite3.connect(tmp_path / "outputs.db")
+    stored = dict(conn.execute("SELECT task_id, typeof(raw_output) FROM agent_outputs").fetchall())
+    conn.close()
+    assert stored == {"TASK-small": "text", "TASK-large": "blob"}
+
+
+def test_recent_outputs_filter_by_agent_and_task(make_bus, tmp_path):
+    bus = make_bus()
+    for agent in ("coder", "tester"):
+        for task_id in ("TASK-1", "TASK-2"):
+            bus.receive(make_output(agent=agent, task_id=task_id))
+    bus.receive(make_output(agent="coder", task_id="TASK-3", status="failed"))
+
+    assert {row["task_id"] for row in bus.get_recent_outputs(agent_name="coder")} == {"TASK-1", "TASK-2", "TASK-3"}
+    assert [row["agent_name"] for row in bus.get_recent_outputs(agent_name="tester", task_id="TASK-2")] == ["tester"]
+    assert bus.get_agent_stats("coder")["failed_count"] == 1
+
+    conn = sqlite3.connect(tmp_path / "outputs.db")
+    plan = " ".join(row[3] for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM agent_outputs WHERE task_id = ? ORDER BY timestamp DESC LIMIT 5",
+        ("TASK-1",)
+    ))
+    conn.close()
+    assert "idx_agent_outputs_task_time" in plan
+
+
+def test_areceive_runs_handlers_concurrently(make_bus):
+    bus = make_bus()
+    for i in range(3):
+        bus.register_handler(SleepyHandler(f"slow-{i}", 0.2))
+    bus.register_handler(SleepyHandler("broken", 0.0, fail=True))
+
+    start = time.perf_counter()
+    result = asyncio.run(bus.areceive(make_output(task_id="TASK-9")))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert [r["handler"] for r in result["handlers"]] == ["slow-0", "slow-1", "slow-2", "broken"]
+    assert [r["success"] for r in result["handlers"]] == [True, True, True, False]
+    assert result["handlers"][0]["message"] == "slow-0 saw TASK-9"
+    assert result["handlers"][3]["error"] == "handler broke"
+    assert bus.get_recent_outputs(limit=1)[0]["task_id"] == "TASK-9"
+
+
+def test_areceive_waits_for_a_full_queue_off_loop(make_bus):
+    bus = make_bus(batch_size=1, flush_interval=0)
+    bus.log_writer.max_pending = 1
+    db_lock = bus.log_writer._db_lock
+
+    async def main():
+        # Stall the writer thread so the queue fills up
+        db_lock.acquire()
+        asyncio.get_running_loop().call_later(0.3, db_lock.release)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        results = [await bus.areceive(make_output(task_id=f"TASK-{i}")) for i in range(4)]
+        ticker.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(main())
+
+    assert all(r["success"] for r in results)
+    assert ticks >= 10
+    assert bus.get_agent_stats()["total"] == 4
+
+
+def test_dropped_bus_closes_its_writer(tmp_path):
+    bus = AgentOutputBus(db_path=tmp_path / "outputs.db", flush_interval=60)
+    bus.initialize()
+    bus.receive(make_output())
+    writer = bus.log_writer
+
+    del bus
+    gc.collect()
+
+    assert not writer._thread.is_alive()
+    assert count_rows(tmp_path / "outputs.db") == 1
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test the health monitor's EventReader over the event journal.
+
+Tests that:
+1. tail() reads the last events backwards across blocks and segments
+2. between() seeks through the sparse index and reads only part of a segment
+3. The task_id regex fast path indexes the same events as decoding every line
+4. The per-task index is saved with its cursor and resumed after a restart
+5. A saved index whose cursor no longer fits the journal is rebuilt
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "bin" / "lib"))
+
+from event_journal import EventJournal
+from health_monitor import event_reader as event_reader_module
+from health_monitor.event_reader import EventReader
+
+START = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def make_events(count: int, first: int = 0):
+    return [
+        {
+            "timestamp": (START + timedelta(seconds=i)).isoformat(),
+            "type": "task_progress",
+            "task_id": f"TASK-{i % 7}",
+            "agent": "executor",
+            "data": {"n": i},
+        }
+        for i in range(first, first + count)
+    ]
+
+
+@pytest.fixture
+def events_file(tmp_path):
+    return tmp_path / "events.yaml"
+
+
+def write_journal(events_file: Path, events, **kwargs) -> EventJournal:
+    options = dict(max_segment_bytes=4096, index_stride=512)
+    options.update(kwargs)
+    journal = EventJournal.for_events_file(events_file, **options)
+    journal.append_many(events)
+    journal.close()
+    return journal
+
+
+def latest_by_task_from_scratch(events_file: Path):
+    reader = EventReader(events_file, persist_index=False)
+    reader.refresh()
+    return {task_id: (e.timestamp, e.data) for task_id, e in reader.latest_by_task().items()}
+
+
+def test_tail_reads_backwards_across_blocks_and_segments(events_file, monkeypatch):
+    monkeypatch.setattr(event_reader_module, "TAIL_BLOCK_BYTES", 300)
+    journal = write_journal(events_file, make_events(400))
+    assert len(journal.segments()) > 5
+
+    reader = EventReader(events_file)
+    assert [e.data["n"] for e in reader.tail(50)] == list(range(350, 400))
+    assert [e.data["n"] for e in reader.tail(1000)] == list(range(400))
+    assert reader.tail(0) == []
+
+    # A record still being written is not returned
+    with open(journal.segments()[-1].path, "ab") as f:
+        f.write(b'{"timestamp":"2026-03-01T13:00:00","type":"tor')
+    assert [e.data["n"] for e in reader.tail(2)] == [398, 399]
+
+
+def test_between_seeks_through_sparse_index(events_file, monkeypatch):
+    write_journal(events_file, make_events(400), max_segment_bytes=64 * 1024)
+    reader = EventReader(events_file)
+    segment = reader.journal.segments()[0]
+    assert len(reader._read_index(segment)) > 10
+
+    reads = []
+    read_lines = EventReader._read_lines
+
+    def recording(path, start, stop):
+        reads.append((start, stop))
+        return read_lines(path, start, stop)
+
+    monkeypatch.setattr(EventReader, "_read_lines", staticmethod(recording))
+    start, end = START + timedelta(seconds=200), START + timedelta(seconds=219)
+    events = reader.between(start, end)
+
+    assert [e.data["n"] for e in events] == list(range(200, 220))
+    [(first, stop)] = reads
+    assert first > 0 and stop is not None
+    assert stop - first < segment.path.stat().st_size / 4
+
+
+def test_between_skips_segments_outside_window(events_file):
+    write_journal(events_file, make_events(400))
+    reader = EventReader(events_file)
+
+    events = reader.between(START + timedelta(seconds=390), START + timedelta(seconds=500))
+    assert [e.data["n"] for e in events] == list(range(390, 400))
+    assert reader.between(START - timedelta(days=1), START - timedelta(hours=1)) == []
+
+
+def test_index_lines_fast_path_matches_full_decode(events_file, monkeypatch):
+    lines = [json.dumps(record, separators=(",", ":")).encode() for record in [
+        {"timestamp": "2026-03-01T12:00:00", "type": "start", "task_id": "TASK-1"},
+        {"timestamp": "2026-03-01T12:00:01", "type": "start", "task_id": 'TASK-"quoted"'},
+        {"timestamp": "2026-03-01T12:00:02", "type": "note", "task_id": None},
+        {"timestamp": "2026-03-01T12:00:03", "type": "progress", "task_id": "TASK-1"},
+        {"timestamp": "2026-03-01T12:00:04", "type": "spawn", "task_id": "TASK-2",
+         "data": {"task_id": "TASK-9"}},
+        {"timestamp": "2026-03-01T12:00:05", "type": "progress", "data": {"task_id": "TASK-3"}},
+        {"timestamp": "2026-03-01T12:00:06", "type": "done", "task_id": 'TASK-"quoted"'},
+    ]]
+    lines.append(b'{"timestamp":"2026-03-01T12:00:07","task_id":"TASK-4",broken')
+
+    fast = EventReader(events_file)
+    decoded = []
+    decode = EventReader._decode
+
+    def counting(line):
+        decoded.append(line)
+        return decode(line)
+
+    monkeypatch.setattr(EventReader, "_decode", staticmethod(counting))
+    fast._index_lines(lines)
+
+    slow = EventReader(events_file)
+    for line in lines:
+        slow._index_record(decode(line))
+
+    summary = lambda reader: {k: (e.event_type, e.timestamp) for k, e in reader.latest_by_task().items()}
+    assert summary(fast) == summary(slow)
+    assert summary(fast) == {
+        "TASK-1": ("progress", datetime(2026, 3, 1, 12, 0, 3)),
+        'TASK-"quoted"': ("done", datetime(2026, 3, 1, 12, 0, 6)),
+        "TASK-2": ("spawn", datetime(2026, 3, 1, 12, 0, 4)),
+    }
+    # One decode per task on the fast path, plus the lines it cannot pick apart
+    assert len(decoded) < len(lines)
+
+
+def test_task_index_resumes_after_restart(events_file):
+    journal = EventJournal.for_events_file(events_file, max_segment_bytes=4096, index_stride=512)
+    journal.append_many(make_events(300))
+
+    first = EventReader(events_file)
+    assert first.refresh() == 300
+    assert first.index_path.exists()
+
+    journal.append_many(make_events(40, first=300))
+    journal.close()
+
+    restarted = EventReader(events_file)
+    assert restarted.refresh() == 40
+    assert restarted.refresh() == 0
+    expected = latest_by_task_from_scratch(events_file)
+    assert {k: (e.timestamp, e.data) for k, e in restarted.latest_by_task().items()} == expected
+
+
+def test_stale_task_index_is_rebuilt(events_file):
+    write_journal(events_file, make_events(100))
+    EventReader(events_file).refresh()
+
+    # The journal is recreated: the saved cursor points past the new segments
+    journal_dir = events_file.with_suffix(".journal")
+    for path in journal_dir.glob("0*"):
+        path.unlink()
+    write_journal(events_file, make_events(10, first=500))
+
+    reader = EventReader(events_file)
+    assert reader.refresh() == 10
+    assert {e.data["n"] for e in reader.latest_by_task().values()} == set(range(503, 510))
+
+    (journal_dir / "latest_by_task.json").write_text("{not json")
+    assert EventReader(events_file).refresh() == 10
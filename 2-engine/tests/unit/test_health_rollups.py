@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Test the health monitor's snapshot storage and the daemon's change detection.
+
+Tests that:
+1. Saving snapshots upserts their minute, hour and day rollups
+2. Rollup averages match averages over the raw snapshots
+3. _backfill_rollups builds the same rollups for snapshots saved before them
+4. SnapshotWriter batches snapshots, and the daemon flushes them on shutdown
+5. _changed_inputs reports only the input files that changed
+"""
+
+import os
+import signal
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "bin" / "lib"))
+
+from health_monitor import config as config_module
+from health_monitor import database
+from health_monitor.daemon import DaemonConfig, MonitoringDaemon
+from health_monitor.models import HealthSnapshot, HealthStatus
+
+
+@pytest.fixture
+def health_config(tmp_path, monkeypatch):
+    monkeypatch.setenv("BB5_HOME", str(tmp_path))
+    monkeypatch.setattr(config_module, "_config", None)
+    config = config_module.get_config()
+    database.init_database()
+    yield config
+    database.close_database()
+
+
+def make_snapshot(timestamp: datetime, score: int, status=HealthStatus.HEALTHY, **counts) -> HealthSnapshot:
+    values = dict(queue_pending=3, queue_in_progress=1, queue_completed=10,
+                  agents_online=2, agents_stale=0, agents_total=2, stuck_tasks=0)
+    values.update(counts)
+    return HealthSnapshot(timestamp=timestamp, health_score=score, status=status, **values)
+
+
+def make_history(count: int, step: timedelta):
+    """Snapshots ending an hour ago, spread over the hour buckets before it."""
+    end = datetime.now().replace(microsecond=0) - timedelta(hours=1)
+    return [
+        make_snapshot(
+            end - step * i,
+            score=40 + (i * 7) % 61,
+            status=HealthStatus.CRITICAL if i % 11 == 0 else HealthStatus.HEALTHY,
+            queue_pending=i % 5,
+            stuck_tasks=i % 3,
+        )
+        for i in range(count)
+    ]
+
+
+def rollup_rows():
+    with database._transaction() as conn:
+        return [tuple(row) for row in conn.execute(
+            "SELECT * FROM snapshot_rollups ORDER BY resolution, bucket"
+        )]
+
+
+def test_save_snapshots_upserts_rollups(health_config):
+    bucket = datetime.fromtimestamp(1_800_000_000 - 1_800_000_000 % 3600)
+    database.save_snapshots([
+        (make_snapshot(bucket + timedelta(seconds=10), 90), {"note": "first"}),
+        (make_snapshot(bucket + timedelta(seconds=20), 50, HealthStatus.WARNING, queue_pending=7), None),
+    ])
+    database.save_snapshot(make_snapshot(bucket + timedelta(minutes=5), 70, queue_pending=None))
+
+    with database._transaction() as conn:
+        rows = {
+            (row['resolution'], row['bucket']): row
+            for row in conn.execute("SELECT * FROM snapshot_rollups")
+        }
+    start = int(bucket.timestamp())
+    assert set(rows) == {('1m', start), ('1m', start + 300), ('1h', start),
+                         ('1d', start - start % 86400)}
+
+    minute = rows[('1m', start)]
+    assert (minute['samples'], minute['health_score_sum']) == (2, 140)
+    assert (minute['health_score_min'], minute['health_score_max']) == (50, 90)
+    assert minute['status_worst'] == database.STATUS_RANK[HealthStatus.WARNING]
+    assert minute['queue_pending_sum'] == 10
+
+    hour = rows[('1h', start)]
+    assert (hour['samples'], hour['health_score_sum'], hour['queue_pending_sum']) == (3, 210, 10)
+    assert rows[('1m', start + 300)]['status_worst'] == database.STATUS_RANK[HealthStatus.HEALTHY]
+
+
+@pytest.mark.parametrize("resolution,step", [
+    ("1m", timedelta(seconds=17)),
+    ("1h", timedelta(minutes=13)),
+    ("1d", timedelta(hours=5)),
+])
+def test_rollup_averages_match_raw_snapshots(health_config, resolution, step):
+    snapshots = make_history(120, step)
+    database.save_snapshots((snapshot, None) for snapshot in snapshots)
+
+    seconds = database.ROLLUP_RESOLUTIONS[resolution]
+    buckets = defaultdict(list)
+    for snapshot in snapshots:
+        timestamp = int(snapshot.timestamp.timestamp())
+        buckets[timestamp - timestamp % seconds].append(snapshot)
+
+    hours = int(step.total_seconds() * 120 / 3600) + 48
+    rolled = database.get_recent_snapshots(hours=hours, resolution=resolution)
+    assert [int(s.timestamp.timestamp()) for s in rolled] == sorted(buckets, reverse=True)
+
+    for rollup in rolled:
+        raw = buckets[int(rollup.timestamp.timestamp())]
+        assert rollup.health_score == round(sum(s.health_score for s in raw) / len(raw))
+        for column in database.SNAPSHOT_COLUMNS:
+            expected = round(sum(getattr(s, column) for s in raw) / len(raw))
+            assert getattr(rollup, column) == expected, column
+        assert rollup.status == max((s.status for s in raw), key=database.STATUS_RANK.get)
+
+
+def test_backfill_builds_the_same_rollups(health_config):
+    snapshots = make_history(90, timedelta(minutes=7))
+    snapshots.append(make_snapshot(datetime.now() - timedelta(hours=2), 65, agents_stale=None))
+    database.save_snapshots((snapshot, None) for snapshot in snapshots)
+    saved = rollup_rows()
+
+    with database._transaction() as conn:
+        conn.execute("DELETE FROM snapshot_rollups")
+    database.init_database()
+    assert rollup_rows() == saved
+
+    # Rollups that already exist are left alone
+    with database._transaction() as conn:
+        conn.execute("DELETE FROM snapshot_rollups WHERE resolution = '1d'")
+    database.init_database()
+    assert len(rollup_rows()) < len(saved)
+
+
+def test_snapshot_writer_batches(health_config):
+    writer = database.SnapshotWriter(batch_size=3, max_delay_seconds=3600)
+    now = datetime.now()
+
+    writer.add(make_snapshot(now - timedelta(seconds=2), 80))
+    writer.add(make_snapshot(now - timedelta(seconds=1), 81))
+    assert writer.pending == 2
+    assert database.get_recent_snapshots(hours=1) == []
+
+    writer.add(make_snapshot(now, 82))
+    assert writer.pending == 0
+    assert [s.health_score for s in database.get_recent_snapshots(hours=1)] == [82, 81, 80]
+
+    writer.add(make_snapshot(now, 83))
+    assert writer.flush() == 1
+    assert writer.flush() == 0
+
+
+def test_daemon_flushes_pending_snapshots_on_shutdown(health_config, monkeypatch):
+    # run() installs process-wide signal handlers
+    monkeypatch.setattr(signal, "signal", lambda signum, handler: None)
+    daemon = MonitoringDaemon(DaemonConfig(check_interval_seconds=0, snapshot_batch_size=10))
+    checks = []
+
+    def check():
+        checks.append(make_snapshot(datetime.now(), 70 + len(checks)))
+        daemon.snapshot_writer.add(checks[-1])
+        if len(checks) == 3:
+            daemon.running = False
+
+    daemon._check_all = check
+    daemon.run()
+
+    assert daemon.snapshot_writer.pending == 0
+    saved = database.get_recent_snapshots(hours=1)
+    assert sorted(s.health_score for s in saved) == [70, 71, 72]
+
+
+def test_changed_inputs_follow_file_signatures(health_config):
+    daemon = MonitoringDaemon(DaemonConfig())
+    health_config.queue_path.parent.mkdir(parents=True, exist_ok=True)
+    health_config.queue_path.write_text("queue: []\n")
+
+    # First check: every input is new, including the missing ones
+    assert daemon._changed_inputs() == {'queue', 'heartbeat', 'metrics'}
+    assert daemon._changed_inputs() == set()
+
+    health_config.queue_path.write_text("queue:\n  - id: TASK-1\n")
+    assert daemon._changed_inputs() == {'queue'}
+
+    stat = health_config.queue_path.stat()
+    os.utime(health_config.queue_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert daemon._changed_inputs() == {'queue'}
+
+    health_config.heartbeat_path.write_text("heartbeats: {}\n")
+    health_config.queue_path.unlink()
+    assert daemon._changed_inputs() == {'queue', 'heartbeat'}
+    assert daemon._changed_inputs() == set()
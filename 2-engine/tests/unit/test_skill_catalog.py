@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test the persistent skill catalogue behind SkillManager.
+
+Tests that:
+1. A warm start serves skills from the catalogue without parsing any file
+2. refresh() re-parses only new or modified files and drops deleted ones
+3. Tag and declared agent indexes follow reloads
+4. The watch task hot-reloads edited skills
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.framework import skill_manager as skill_manager_module
+from agents.framework.skill_manager import AgentSkill, SkillManager
+
+SKILL_MD = """---
+name: {name}
+description: {description}
+tags: [{tags}]
+agents: [{agents}]
+---
+
+# {name}
+
+Body of {name}.
+"""
+
+
+def write_skill(root: Path, name: str, description: str = "does things", tags: str = "testing",
+                agents: str = "") -> Path:
+    path = root / name / "SKILL.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(SKILL_MD.format(name=name, description=description, tags=tags, agents=agents))
+    return path
+
+
+@pytest.fixture
+def skill_dirs(tmp_path):
+    tier1 = tmp_path / "tier1"
+    tier1.mkdir()
+    (tier1 / "deploy.json").write_text(
+        '{"name": "deploy", "description": "Deploy", "category": "ops", "agents": ["devops"]}'
+    )
+    tier2 = tmp_path / "tier2"
+    write_skill(tier2, "tdd", tags="testing, quality")
+    write_skill(tier2, "review", tags="quality", agents="developer")
+    return tier1, tier2
+
+
+def make_manager(skill_dirs, tmp_path) -> SkillManager:
+    tier1, tier2 = skill_dirs
+    manager = SkillManager(skills_path=tier1, catalog_path=tmp_path / "catalog.db")
+    manager.set_tier2_path(tier2)
+    return manager
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    calls = []
+    original = AgentSkill.from_markdown.__func__
+
+    def counting(cls, path):
+        calls.append(path)
+        return original(cls, path)
+
+    monkeypatch.setattr(skill_manager_module.AgentSkill, "from_markdown", classmethod(counting))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_warm_start_parses_nothing(skill_dirs, tmp_path, parse_count):
+    cold = make_manager(skill_dirs, tmp_path)
+    await cold.load_all()
+    assert len(parse_count) == 2
+
+    warm = make_manager(skill_dirs, tmp_path)
+    skills = await warm.load_all()
+    assert len(parse_count) == 2
+
+    assert sorted(s.name for s in skills) == ["deploy", "review", "tdd"]
+    tdd = warm.get_skill("tdd")
+    assert tdd.tags == ["testing", "quality"]
+    assert tdd.content == "# tdd\n\nBody of tdd."
+    assert tdd.file_path == skill_dirs[1] / "tdd" / "SKILL.md"
+    assert warm.get_skill("deploy").category == "ops"
+    assert warm.list_categories() == ["ops"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_incremental(skill_dirs, tmp_path, parse_count):
+    _, tier2 = skill_dirs
+    manager = make_manager(skill_dirs, tmp_path)
+    await manager.load_all()
+    parse_count.clear()
+
+    write_skill(tier2, "tdd", description="does more things", tags="testing")
+    write_skill(tier2, "lint", tags="quality")
+    (tier2 / "review" / "SKILL.md").unlink()
+
+    summary = await manager.refresh()
+    assert summary == {"added": ["lint"], "updated": ["tdd"], "removed": ["review"]}
+    assert sorted(p.parent.name for p in parse_count) == ["lint", "tdd"]
+    assert [s.name for s in manager.search_skills_by_tag("quality")] == ["lint"]
+    assert [s.name for s in manager.search_skills_by_tag("testing")] == ["tdd"]
+
+    assert await manager.refresh() == {"added": [], "updated": [], "removed": []}
+
+    restarted = make_manager(skill_dirs, tmp_path)
+    await restarted.load_all()
+    assert sorted(restarted.list_tier2_skills()) == ["lint", "tdd"]
+    assert restarted.get_skill("tdd").description == "does more things"
+
+
+@pytest.mark.asyncio
+async def test_declared_agent_skills(skill_dirs, tmp_path):
+    manager = make_manager(skill_dirs, tmp_path)
+    await manager.load_all()
+
+    assert [s.name for s in manager.get_skills_for_agent("developer")] == ["review"]
+    assert [s.name for s in manager.get_skills_for_agent("devops")] == ["deploy"]
+    assert len(manager.get_skills_for_agent("someone-else")) == 3
+
+    manager.map_skill_to_agent("deploy", "developer")
+    assert [s.name for s in manager.get_skills_for_agent("developer")] == ["deploy", "review"]
+    assert manager._get_catalog().skills_for_agent("developer") == ["review"]
+    assert manager._get_catalog().skills_with_tag("quality") == ["review", "tdd"]
+
+
+@pytest.mark.asyncio
+async def test_watch_hot_reloads(skill_dirs, tmp_path):
+    _, tier2 = skill_dirs
+    manager = make_manager(skill_dirs, tmp_path)
+    await manager.load_all()
+
+    reloaded = asyncio.Event()
+    summaries = []
+
+    def on_change(summary):
+        summaries.append(summary)
+        reloaded.set()
+
+    manager.start_watching(interval=0.05, on_change=on_change)
+    write_skill(tier2, "review", description="reviews code carefully", tags="quality", agents="developer")
+    await asyncio.wait_for(reloaded.wait(), timeout=5)
+    await manager.stop_watching()
+
+    assert summaries == [{"added": [], "updated": ["review"], "removed": []}]
+    assert manager.get_skill("review").description == "reviews code carefully"
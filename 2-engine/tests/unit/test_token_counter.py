@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test the shared token counting service.
+
+Tests that:
+1. The heuristic matches the previous optimizer and compressor estimates
+2. Counts are memoized by content and bounded by the LRU
+3. A local BPE rank file gives exact counts offline
+4. Conversation totals only count appended or changed messages
+"""
+
+import base64
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from helpers.core.token_counter import (
+    BPETokenizer,
+    HeuristicTokenizer,
+    MessageTokenCounter,
+    TokenCounter,
+    Tokenizer,
+    load_tokenizer,
+)
+
+
+class CountingTokenizer(Tokenizer):
+    """Whitespace tokenizer that records how often it is called"""
+
+    name = "words"
+
+    def __init__(self):
+        self.calls = 0
+
+    def count(self, text, language=None):
+        self.calls += 1
+        return len(text.split())
+
+
+@pytest.fixture
+def rank_file(tmp_path):
+    tokens = [bytes([b]) for b in range(256)] + [b"he", b"ll", b"hell", b"hello", b" w", b" world"]
+    path = tmp_path / "tiny.tiktoken"
+    path.write_bytes(b"".join(
+        base64.b64encode(token) + b" %d\n" % rank for rank, token in enumerate(tokens)
+    ))
+    return path
+
+
+class TestHeuristic:
+
+    def test_glm_estimate(self):
+        heuristic = HeuristicTokenizer()
+        assert heuristic.count("x" * 40) == 10
+        code = "def main():\n    pass\n" * 2
+        assert heuristic.count(code) == int(len(code) / 3.5)
+        assert heuristic.count("你好世界" * 3) == 8
+        assert heuristic.count("") == 0
+
+    def test_language_ratio(self):
+        heuristic = HeuristicTokenizer()
+        assert heuristic.count("x" * 100, "python") == 30
+        assert heuristic.count("x" * 100, "default") == 40
+        assert heuristic.count("x" * 100, "unknown") == 40
+
+
+class TestTokenCounter:
+
+    def test_memoized_by_content(self):
+        tokenizer = CountingTokenizer()
+        counter = TokenCounter(tokenizer)
+        long_text = "word " * 1000
+
+        assert counter.count("a b c") == 3
+        assert counter.count("a b " + "c") == 3
+        assert counter.count(long_text) == counter.count("word " * 1000) == 1000
+        assert tokenizer.calls == 2
+        assert counter.get_stats()["hits"] == 2
+
+    def test_lru_bound_and_disabled_cache(self):
+        tokenizer = CountingTokenizer()
+        counter = TokenCounter(tokenizer, cache_size=2)
+        for text in ("a", "b", "c", "a"):
+            counter.count(text)
+        assert counter.get_stats()["entries"] == 2
+        assert tokenizer.calls == 4
+
+        uncached = TokenCounter(tokenizer, cache_size=0)
+        uncached.count("a")
+        uncached.count("a")
+        assert tokenizer.calls == 6
+
+    def test_heuristic_cache_keys_include_language(self):
+        counter = TokenCounter()
+        assert counter.count("x" * 100, "python") == 30
+        assert counter.count("x" * 100, "markdown") == 50
+
+    def test_failing_tokenizer_falls_back(self):
+        class Broken(Tokenizer):
+            def count(self, text, language=None):
+                raise ValueError("bad vocab")
+
+        counter = TokenCounter(Broken())
+        assert counter.count("x" * 40) == 10
+        assert counter.get_stats()["fallbacks"] == 1
+
+
+class TestBPETokenizer:
+
+    def test_exact_counts_from_rank_file(self, rank_file):
+        tokenizer = load_tokenizer(rank_file)
+
+        assert isinstance(tokenizer, BPETokenizer)
+        assert tokenizer.count("hello") == 1
+        assert tokenizer.count("hello world") == 2
+        assert tokenizer.count("help") == 3  # "he" + "l" + "p"
+
+
+class TestMessageTokenCounter:
+
+    def test_appending_counts_only_new_messages(self):
+        tokenizer = CountingTokenizer()
+        tally = MessageTokenCounter(TokenCounter(tokenizer, cache_size=0))
+        history = [{"role": "user", "content": f"message number {i}"} for i in range(50)]
+
+        assert tally.count(history) == 150
+        assert tokenizer.calls == 50
+
+        history.append({"role": "assistant", "content": "one more"})
+        assert tally.count(history) == 152
+        assert tokenizer.calls == 51
+
+    def test_edited_history_is_recounted_from_the_change(self):
+        tokenizer = CountingTokenizer()
+        tally = MessageTokenCounter(TokenCounter(tokenizer, cache_size=0))
+        history = [{"content": "a b"}, {"content": "c"}, {"content": "d e f"}]
+        tally.count(history)
+
+        assert tally.count([{"content": "a b"}, {"content": "x y"}]) == 4
+        assert tokenizer.calls == 4
+        assert tally.count([]) == 0
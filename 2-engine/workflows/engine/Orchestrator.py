@@ -8,14 +8,16 @@ import logging
 import asyncio
 import uuid
 import json
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable, Awaitable, Set
+from typing import Dict, List, Optional, Any, Set
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
 from agents.framework.base_agent import BaseAgent, AgentTask, AgentResult
 from workflows.engine.state.event_bus import EventBus, Event, EventType
+from workflows.engine.state.checkpoint_journal import CheckpointJournal
 
 logger = logging.getLogger(__name__)
 
@@ -115,6 +117,7 @@ class AgentOrchestrator:
     Features:
     - Execute workflows with multiple agents
     - Handle dependencies between steps
+    - Run independent steps concurrently (ready-queue DAG scheduling)
     - Retry failed steps
     - Track workflow progress
     - Emit events for monitoring
@@ -127,7 +130,12 @@ class AgentOrchestrator:
         memory_base_path: Optional[Path] = None,
         max_concurrent_agents: int = 5,
         enable_checkpoints: bool = True,
-        enable_state_management: bool = True
+        enable_state_management: bool = True,
+        max_concurrent_per_agent: Optional[int] = None,
+        agent_concurrency_limits: Optional[Dict[str, int]] = None,
+        checkpoint_journal: bool = False,
+        journal_fsync_every: int = 1,
+        journal_compact_every: int = 256
     ):
         """
         Initialize the orchestrator.
@@ -136,14 +144,26 @@ class AgentOrchestrator:
             event_bus: Optional event bus for emitting events
             task_router: Optional task router for agent selection
             memory_base_path: Optional path for agent memory
-            max_concurrent_agents: Maximum concurrent agents
+            max_concurrent_agents: Maximum steps executing at once (global)
             enable_checkpoints: Enable workflow checkpoints
             enable_state_management: Enable state management
+            max_concurrent_per_agent: Default limit of concurrent steps per
+                agent (None = only the global limit applies)
+            agent_concurrency_limits: Per-agent overrides of
+                max_concurrent_per_agent, keyed by agent name
+            checkpoint_journal: Append one record per step transition to a
+                per-workflow journal instead of rewriting the checkpoint file
+            journal_fsync_every: Journal records between fsyncs; above 1, a
+                crash can lose the last completed steps, which then re-run
+            journal_compact_every: Journal records before compaction into
+                a snapshot
         """
         self.event_bus = event_bus
         self._task_router = task_router
         self._memory_base_path = memory_base_path
-        self._max_concurrent_agents = max_concurrent_agents
+        self._max_concurrent_agents = max(1, max_concurrent_agents)
+        self._max_concurrent_per_agent = max_concurrent_per_agent
+        self._agent_concurrency_limits = dict(agent_concurrency_limits or {})
         self._enable_checkpoints = enable_checkpoints
         self._enable_state_management = enable_state_management
 
@@ -154,6 +174,14 @@ class AgentOrchestrator:
         else:
             self._checkpoint_dir = None
 
+        self._journal: Optional[CheckpointJournal] = None
+        if self._checkpoint_dir and checkpoint_journal:
+            self._journal = CheckpointJournal(
+                self._checkpoint_dir,
+                fsync_every=journal_fsync_every,
+                compact_every=journal_compact_every,
+            )
+
         self._agents: Dict[str, BaseAgent] = {}
         self._workflows: Dict[str, Workflow] = {}
         self._lock: Optional[asyncio.Lock] = None
@@ -208,14 +236,15 @@ class AgentOrchestrator:
                 logger.info(f"Resuming from checkpoint: {len(completed_steps)} steps already completed")
 
                 # Restore step states from checkpoint
+                steps_by_id = {step.id: step for step in workflow.steps}
                 for step_data in checkpoint.get('steps', []):
-                    for step in workflow.steps:
-                        if step.id == step_data['id']:
-                            step.status = WorkflowStatus(step_data['status'])
-                            step.retry_count = step_data.get('retry_count', 0)
-                            step.error = step_data.get('error')
-                            step.started_at = step_data.get('started_at')
-                            step.completed_at = step_data.get('completed_at')
+                    step = steps_by_id.get(step_data['id'])
+                    if step is not None:
+                        step.status = WorkflowStatus(step_data['status'])
+                        step.retry_count = step_data.get('retry_count', 0)
+                        step.error = step_data.get('error')
+                        step.started_at = step_data.get('started_at')
+                        step.completed_at = step_data.get('completed_at')
 
         workflow.status = WorkflowStatus.RUNNING
         workflow.started_at = datetime.now().isoformat()
@@ -233,67 +262,8 @@ class AgentOrchestrator:
                 )
             )
 
-            # Execute steps in dependency order with deadlock detection
-            failed = False
-            no_progress_count = 0
-            max_no_progress = len(workflow.steps) * 2  # Allow some slack for parallel steps
-
-            while len(completed_steps) < len(workflow.steps) and not failed:
-                previous_count = len(completed_steps)
-                progress_made = False
-
-                for step in workflow.steps:
-                    if step.id in completed_steps:
-                        continue
-
-                    # Check if dependencies are met
-                    if not all(dep_id in completed_steps for dep_id in step.depends_on):
-                        continue
-
-                    # Execute step
-                    try:
-                        result = await self._execute_step(step)
-                        step.status = WorkflowStatus.COMPLETED
-                        step.result = result
-                        step.completed_at = datetime.now().isoformat()
-                        completed_steps.add(step.id)
-                        progress_made = True
-
-                        # Save checkpoint after each completed step
-                        if self._enable_checkpoints and self._checkpoint_dir:
-                            self._save_checkpoint(workflow, completed_steps)
-
-                    except Exception as e:
-                        logger.error(f"Step {step.name} failed: {e}")
-                        step.status = WorkflowStatus.FAILED
-                        step.error = str(e)
-                        step.completed_at = datetime.now().isoformat()
-
-                        # Check if we should retry
-                        if step.retry_count < step.max_retries:
-                            step.retry_count += 1
-                            step.status = WorkflowStatus.PENDING
-                            logger.info(f"Retrying step {step.name} (attempt {step.retry_count})")
-                        else:
-                            failed = True
-                            progress_made = True
-
-                # Check for progress (deadlock detection)
-                current_count = len(completed_steps)
-                if current_count == previous_count:
-                    no_progress_count += 1
-                else:
-                    no_progress_count = 0
-
-                # Detect deadlock
-                if no_progress_count > max_no_progress:
-                    deps = self._build_dependency_graph(workflow, completed_steps)
-                    raise RuntimeError(
-                        f"Workflow deadlock detected. "
-                        f"Completed: {len(completed_steps)}/{len(workflow.steps)}. "
-                        f"Blocked steps: {deps['blocked']}. "
-                        f"Circular dependencies: {deps['circular']}"
-                    )
+            # Execute steps concurrently in dependency order
+            failed = await self._run_dag(workflow, completed_steps)
 
             if failed:
                 workflow.status = WorkflowStatus.FAILED
@@ -327,6 +297,141 @@ class AgentOrchestrator:
 
         return workflow
 
+    async def _run_dag(self, workflow: Workflow, completed_steps: Set[str]) -> bool:
+        """
+        Execute pending steps with a ready-queue DAG scheduler.
+
+        Steps are topologically ordered once. Every step whose dependencies
+        are satisfied is dispatched immediately, bounded by the global and
+        per-agent concurrency limits, and dependents are unblocked as each
+        completion arrives instead of rescanning the whole step list.
+
+        Args:
+            workflow: Workflow being executed
+            completed_steps: Set of completed step IDs (updated in place)
+
+        Returns:
+            True if a step failed after exhausting its retries
+
+        Raises:
+            RuntimeError: Workflow deadlock (circular or missing dependencies)
+        """
+        order = self._topological_order(workflow, completed_steps)
+        steps_by_id = {step.id: step for step in order}
+
+        # Count of unmet dependencies per step, and reverse edges to unblock
+        remaining: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {}
+        for step in order:
+            unmet = [dep_id for dep_id in step.depends_on if dep_id not in completed_steps]
+            remaining[step.id] = len(unmet)
+            for dep_id in unmet:
+                dependents.setdefault(dep_id, []).append(step.id)
+
+        ready = deque(step for step in order if remaining[step.id] == 0)
+        running: Dict[asyncio.Task, WorkflowStep] = {}
+        global_slots = asyncio.Semaphore(self._max_concurrent_agents)
+        agent_slots: Dict[str, Optional[asyncio.Semaphore]] = {}
+        failed = False
+
+        try:
+            while running or (ready and not failed):
+                # Dispatch everything that is ready; limits are enforced by slots
+                while ready and not failed:
+                    step = ready.popleft()
+                    if step.agent_name not in agent_slots:
+                        agent_slots[step.agent_name] = self._agent_semaphore(step.agent_name)
+                    task = asyncio.create_task(
+                        self._execute_step_bounded(
+                            step, global_slots, agent_slots[step.agent_name]
+                        )
+                    )
+                    running[task] = step
+
+                done, _ = await asyncio.wait(
+                    running.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    step = running.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.error(f"Step {step.name} failed: {e}")
+                        step.status = WorkflowStatus.FAILED
+                        step.error = str(e)
+                        step.completed_at = datetime.now().isoformat()
+
+                        # Check if we should retry
+                        if step.retry_count < step.max_retries:
+                            step.retry_count += 1
+                            step.status = WorkflowStatus.PENDING
+                            logger.info(f"Retrying step {step.name} (attempt {step.retry_count})")
+                            ready.append(step)
+
+                            # The journal is cheap enough to record retries too
+                            if self._journal:
+                                self._save_checkpoint(workflow, completed_steps, step)
+                        else:
+                            failed = True
+                        continue
+
+                    step.status = WorkflowStatus.COMPLETED
+                    step.result = result
+                    step.completed_at = datetime.now().isoformat()
+                    completed_steps.add(step.id)
+
+                    # Save checkpoint after each completed step
+                    if self._enable_checkpoints and self._checkpoint_dir:
+                        self._save_checkpoint(workflow, completed_steps, step)
+
+                    for dependent_id in dependents.get(step.id, []):
+                        remaining[dependent_id] -= 1
+                        if remaining[dependent_id] == 0:
+                            ready.append(steps_by_id[dependent_id])
+        finally:
+            # Never leave steps running behind a cancelled or aborted workflow
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+        return failed
+
+    def _agent_semaphore(self, agent_name: str) -> Optional[asyncio.Semaphore]:
+        """
+        Create the per-agent concurrency slot for a workflow run.
+
+        Args:
+            agent_name: Name of the agent
+
+        Returns:
+            Semaphore bounding the agent, or None if it is unbounded
+        """
+        limit = self._agent_concurrency_limits.get(agent_name, self._max_concurrent_per_agent)
+        if limit is None:
+            return None
+        return asyncio.Semaphore(max(1, limit))
+
+    async def _execute_step_bounded(
+        self,
+        step: WorkflowStep,
+        global_slots: asyncio.Semaphore,
+        agent_slots: Optional[asyncio.Semaphore],
+    ) -> AgentResult:
+        """
+        Execute a step once an agent slot and a global slot are free.
+
+        The agent slot is taken first so a step waiting on a busy agent
+        does not hold a global slot other agents could use.
+        """
+        if agent_slots is None:
+            async with global_slots:
+                return await self._execute_step(step)
+
+        async with agent_slots:
+            async with global_slots:
+                return await self._execute_step(step)
+
     async def _execute_step(self, step: WorkflowStep) -> AgentResult:
         """
         Execute a single workflow step.
@@ -475,41 +580,43 @@ class AgentOrchestrator:
     # CHECKPOINTING METHODS
     # ==========================================================================
 
-    def _save_checkpoint(self, workflow: Workflow, completed_steps: Set[str]) -> None:
+    def _save_checkpoint(
+        self,
+        workflow: Workflow,
+        completed_steps: Set[str],
+        step: Optional[WorkflowStep] = None,
+    ) -> None:
         """
         Save workflow checkpoint.
 
+        In journal mode only the transition of ``step`` is appended (the
+        journal is compacted into a full snapshot periodically); otherwise,
+        or when no step is given, the full checkpoint file is rewritten.
+
         Args:
             workflow: Current workflow instance
             completed_steps: Set of completed step IDs
+            step: Step whose state just changed
         """
         if not self._checkpoint_dir:
             return
 
-        checkpoint_path = self._checkpoint_dir / f"{workflow.id}.json"
-
-        # Prepare checkpoint data with step states
-        steps_data = []
-        for step in workflow.steps:
-            steps_data.append({
-                'id': step.id,
-                'name': step.name,
-                'status': step.status.value,
-                'retry_count': step.retry_count,
-                'error': step.error,
-                'started_at': step.started_at,
-                'completed_at': step.completed_at,
-            })
-
-        checkpoint_data = {
-            'workflow_id': workflow.id,
-            'workflow_name': workflow.name,
-            'completed_steps': list(completed_steps),
-            'steps': steps_data,
-            'timestamp': datetime.now().isoformat()
-        }
-
         try:
+            if self._journal:
+                compact = step is None
+                if step is not None:
+                    record = self._checkpoint_step_data(step)
+                    record['completed'] = step.id in completed_steps
+                    record['timestamp'] = datetime.now().isoformat()
+                    compact = self._journal.append(workflow.id, record)
+                if compact:
+                    self._journal.compact(workflow.id, self._checkpoint_data(workflow, completed_steps))
+                logger.debug(f"Journaled checkpoint: {len(completed_steps)} steps completed")
+                return
+
+            checkpoint_path = self._checkpoint_dir / f"{workflow.id}.json"
+            checkpoint_data = self._checkpoint_data(workflow, completed_steps)
+
             # Atomic write: write to temp file first, then rename
             temp_path = checkpoint_path.with_suffix('.tmp')
             temp_path.write_text(json.dumps(checkpoint_data, indent=2))
@@ -519,6 +626,37 @@ class AgentOrchestrator:
         except Exception as e:
             logger.error(f"Failed to save checkpoint: {e}")
 
+    def _checkpoint_data(self, workflow: Workflow, completed_steps: Set[str]) -> Dict[str, Any]:
+        """
+        Build the full checkpoint document for a workflow.
+
+        Args:
+            workflow: Current workflow instance
+            completed_steps: Set of completed step IDs
+
+        Returns:
+            Checkpoint data dict
+        """
+        return {
+            'workflow_id': workflow.id,
+            'workflow_name': workflow.name,
+            'completed_steps': list(completed_steps),
+            'steps': [self._checkpoint_step_data(step) for step in workflow.steps],
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def _checkpoint_step_data(self, step: WorkflowStep) -> Dict[str, Any]:
+        """Checkpointed state of a single step."""
+        return {
+            'id': step.id,
+            'name': step.name,
+            'status': step.status.value,
+            'retry_count': step.retry_count,
+            'error': step.error,
+            'started_at': step.started_at,
+            'completed_at': step.completed_at,
+        }
+
     def _load_checkpoint(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """
         Load workflow checkpoint if exists.
@@ -534,11 +672,16 @@ class AgentOrchestrator:
 
         checkpoint_path = self._checkpoint_dir / f"{workflow_id}.json"
 
-        if not checkpoint_path.exists():
+        if not self._journal and not checkpoint_path.exists():
             return None
 
         try:
-            data = json.loads(checkpoint_path.read_text())
+            if self._journal:
+                data = self._journal.load(workflow_id)
+                if data is None:
+                    return None
+            else:
+                data = json.loads(checkpoint_path.read_text())
             logger.info(f"Loaded checkpoint: {len(data['completed_steps'])} steps completed")
             return data
         except Exception as e:
@@ -555,6 +698,14 @@ class AgentOrchestrator:
         if not self._checkpoint_dir:
             return
 
+        if self._journal:
+            try:
+                self._journal.delete(workflow_id)
+                logger.debug(f"Deleted checkpoint journal for {workflow_id}")
+            except Exception as e:
+                logger.error(f"Failed to delete checkpoint: {e}")
+            return
+
         checkpoint_path = self._checkpoint_dir / f"{workflow_id}.json"
         if checkpoint_path.exists():
             try:
@@ -567,6 +718,56 @@ class AgentOrchestrator:
     # DEADLOCK DETECTION METHODS
     # ==========================================================================
 
+    def _topological_order(self, workflow: Workflow, completed_steps: Set[str]) -> List[WorkflowStep]:
+        """
+        Order pending steps so each step follows its dependencies (Kahn's algorithm).
+
+        Args:
+            workflow: Workflow to order
+            completed_steps: Set of already completed step IDs
+
+        Returns:
+            Pending steps in a valid execution order
+
+        Raises:
+            RuntimeError: Some steps can never run (circular or missing dependencies)
+        """
+        pending = [step for step in workflow.steps if step.id not in completed_steps]
+        pending_ids = {step.id for step in pending}
+
+        in_degree: Dict[str, int] = {}
+        dependents: Dict[str, List[WorkflowStep]] = {}
+        for step in pending:
+            in_degree[step.id] = 0
+            for dep_id in step.depends_on:
+                if dep_id in completed_steps:
+                    continue
+                # Unknown dependencies can never be satisfied
+                in_degree[step.id] += 1
+                if dep_id in pending_ids:
+                    dependents.setdefault(dep_id, []).append(step)
+
+        queue = deque(step for step in pending if in_degree[step.id] == 0)
+        order: List[WorkflowStep] = []
+        while queue:
+            step = queue.popleft()
+            order.append(step)
+            for dependent in dependents.get(step.id, []):
+                in_degree[dependent.id] -= 1
+                if in_degree[dependent.id] == 0:
+                    queue.append(dependent)
+
+        if len(order) < len(pending):
+            deps = self._build_dependency_graph(workflow, completed_steps)
+            raise RuntimeError(
+                f"Workflow deadlock detected. "
+                f"Completed: {len(completed_steps)}/{len(workflow.steps)}. "
+                f"Blocked steps: {deps['blocked']}. "
+                f"Circular dependencies: {deps['circular']}"
+            )
+
+        return order
+
     def _build_dependency_graph(self, workflow: Workflow, completed_steps: Set[str]) -> Dict[str, Any]:
         """
         Build dependency graph to debug deadlocks.
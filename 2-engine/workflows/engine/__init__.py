@@ -4,7 +4,8 @@ Orchestration Module - Multi-agent coordination and workflow management
 
 # Optional resilience components - only import if available
 try:
-    from .resilience.circuit_breaker import CircuitBreaker, CircuitState, CircuitBreakerError
+    from .resilience.circuit_breaker import CircuitBreaker, CircuitState
+    from .exceptions import CircuitBreakerError
 except ImportError:
     CircuitBreaker = None
     CircuitState = None
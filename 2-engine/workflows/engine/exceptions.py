@@ -2,11 +2,14 @@
 Resilience Exceptions - Custom exceptions for resilience patterns
 """
 
+from typing import Optional
+
 __all__ = [
     "ResilienceError",
     "CircuitBreakerError",
     "CircuitBreakerOpenError",
     "CircuitBreakerClosedError",
+    "BulkheadFullError",
     "RetryExhaustedError",
     "FallbackFailedError",
     "TimeoutError",
@@ -25,7 +28,19 @@ class CircuitBreakerError(ResilienceError):
 
 class CircuitBreakerOpenError(CircuitBreakerError):
     """Raised when circuit breaker is open."""
-    pass
+
+    def __init__(
+        self,
+        message: str = "Circuit breaker is open",
+        service: Optional[str] = None,
+        remaining_time: Optional[float] = None,
+        failure_count: int = 0,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.service = service
+        self.remaining_time = remaining_time
+        self.failure_count = failure_count
 
 
 class CircuitBreakerClosedError(CircuitBreakerError):
@@ -33,6 +48,16 @@ class CircuitBreakerClosedError(CircuitBreakerError):
     pass
 
 
+class BulkheadFullError(CircuitBreakerError):
+    """Raised when a circuit breaker's concurrent call limit is reached."""
+
+    def __init__(self, message: str, service: Optional[str] = None, limit: int = 0):
+        super().__init__(message)
+        self.message = message
+        self.service = service
+        self.limit = limit
+
+
 class RetryExhaustedError(ResilienceError):
     """Raised when retry attempts are exhausted."""
     pass
@@ -0,0 +1,520 @@
+"""
+Persistent Inverted Index for Codebase Context Extraction
+
+ContextExtractor used to answer every task by walking the repository once
+per file pattern, reading every file and scanning it line by line for each
+keyword. This module builds a token -> (file, lines) inverted index once,
+keeps it current by re-indexing only files whose mtime or size changed, and
+ranks files for a query with BM25.
+
+Tokens are identifiers, lowercased, plus their snake_case / camelCase parts,
+so "function" finds ``test_function`` and "token" finds ``TokenCompressor``.
+Query terms of four or more characters that are not indexed themselves match
+the indexed tokens they are a prefix of ("authen" -> "authentication").
+
+The index lives in SQLite: in memory by default, or in a file (index_path)
+so it survives restarts.
+"""
+
+import fnmatch
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from helpers.core.sqlite_utils import immediate_transaction
+
+logger = logging.getLogger(__name__)
+
+
+IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+CAMEL_PART = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+
+MIN_TOKEN_LENGTH = 2
+MAX_TOKEN_LENGTH = 64
+MIN_PREFIX_LENGTH = 4
+MAX_PREFIX_EXPANSIONS = 32
+MAX_LINES_PER_POSTING = 20
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS postings (
+    token TEXT NOT NULL,
+    file_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    lines TEXT NOT NULL,
+    PRIMARY KEY (token, file_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS postings_file ON postings (file_id);
+
+CREATE TABLE IF NOT EXISTS vocabulary (
+    token TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+@lru_cache(maxsize=262144)
+def split_identifier(identifier: str) -> Tuple[str, ...]:
+    """
+    Split an identifier into lowercase index tokens.
+
+    Returns the whole identifier plus its snake_case and camelCase parts,
+    e.g. ``parseHTTPRequest_v2`` -> parsehttprequest_v2, parse, http,
+    request, v2.
+
+    Args:
+        identifier: Identifier text
+
+    Returns:
+        Unique tokens within the length limits
+    """
+    tokens = {identifier.lower()}
+    for part in identifier.split('_'):
+        if not part:
+            continue
+        if part.isalpha() and part.islower():
+            tokens.add(part)
+            continue
+        tokens.add(part.lower())
+        for sub in CAMEL_PART.findall(part):
+            tokens.add(sub.lower())
+    return tuple(
+        t for t in tokens
+        if MIN_TOKEN_LENGTH <= len(t) <= MAX_TOKEN_LENGTH
+    )
+
+
+def tokenize_query(text: str) -> List[str]:
+    """
+    Tokenize a keyword or phrase into lowercase query tokens.
+
+    Identifiers are kept whole: the index already holds the parts of every
+    compound identifier, so "function" finds ``test_function``, while a
+    compound query like ``missing_term_xyz`` does not degrade into its
+    common parts.
+    """
+    tokens: List[str] = []
+    for identifier in IDENTIFIER.findall(text):
+        token = identifier.lower()
+        if MIN_TOKEN_LENGTH <= len(token) <= MAX_TOKEN_LENGTH and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+@dataclass
+class SearchHit:
+    """
+    A ranked file returned by CodeIndex.search.
+
+    Attributes:
+        path: Path relative to the indexed root
+        score: BM25 score
+        line_numbers: 1-based lines containing query tokens (ascending)
+        size_bytes: File size when indexed
+        mtime: Modification time when indexed (epoch seconds)
+    """
+    path: str
+    score: float
+    line_numbers: List[int] = field(default_factory=list)
+    size_bytes: int = 0
+    mtime: float = 0.0
+
+
+class CodeIndex:
+    """
+    Inverted index over the source files below a root directory.
+
+    Example:
+        ```python
+        index = CodeIndex(Path('/path/to/code'), index_path=Path('.cache/code.db'))
+        index.refresh()                      # full build first time, then deltas
+        hits = index.search(['authentication', 'UserService'], limit=10)
+        ```
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        patterns: Iterable[str],
+        skip_directories: Iterable[str] = (),
+        index_path: Optional[Path] = None,
+        max_file_bytes: int = 1_000_000,
+    ):
+        """
+        Open (or create) the index.
+
+        Args:
+            root: Directory to index
+            patterns: Filename glob patterns to index (e.g. '*.py')
+            skip_directories: Directory names (or globs) pruned from the walk
+            index_path: SQLite file to persist the index (None = in memory)
+            max_file_bytes: Larger files are not indexed
+        """
+        self.root = Path(root)
+        self.patterns: Set[str] = set(patterns)
+        self.max_file_bytes = max_file_bytes
+        self.last_refresh: Optional[float] = None
+
+        self._skip_names = {d for d in skip_directories if not _is_glob(d)}
+        self._skip_globs = [d for d in skip_directories if _is_glob(d)]
+
+        self._lock = threading.Lock()
+        if index_path is not None:
+            Path(index_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(index_path) if index_path is not None else ':memory:',
+            check_same_thread=False,
+            isolation_level=None,  # Explicit transactions only
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        # Corpus totals for BM25, kept in memory
+        self._doc_count = 0
+        self._total_length = 0
+        self._load_totals()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    @property
+    def file_count(self) -> int:
+        """Number of indexed files."""
+        return self._doc_count
+
+    def add_patterns(self, patterns: Iterable[str]) -> bool:
+        """
+        Start indexing additional filename patterns.
+
+        Args:
+            patterns: Glob patterns
+
+        Returns:
+            True if any pattern was new (the index needs a refresh)
+        """
+        new = set(patterns) - self.patterns
+        if new:
+            self.patterns |= new
+            self.last_refresh = None
+        return bool(new)
+
+    # ------------------------------------------------------------------
+    # Walking and indexing
+    # ------------------------------------------------------------------
+
+    def walk(self) -> Iterator[Tuple[str, os.stat_result]]:
+        """
+        Single pass over the tree, pruning skipped directories.
+
+        Yields:
+            (path relative to root, stat result) for each matching file
+        """
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError as e:
+                logger.debug(f"Cannot scan {directory}: {e}")
+                continue
+
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not self._skip_directory(entry.name):
+                                stack.append(entry.path)
+                        elif entry.is_file() and self._matches(entry.name):
+                            yield os.path.relpath(entry.path, self.root), entry.stat()
+                    except OSError as e:
+                        logger.debug(f"Cannot stat {entry.path}: {e}")
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index up to date with the tree.
+
+        Only files that are new or whose mtime/size changed are re-read;
+        files that disappeared are removed.
+
+        Returns:
+            Counts of 'added', 'updated', 'removed' and 'unchanged' files
+        """
+        with self._lock:
+            known = {
+                path: (file_id, mtime_ns, size)
+                for file_id, path, mtime_ns, size in self._conn.execute(
+                    "SELECT id, path, mtime_ns, size FROM files"
+                )
+            }
+
+        counts = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        seen: Set[str] = set()
+        pending: List[Tuple[str, os.stat_result, Optional[int]]] = []
+
+        for path, stat in self.walk():
+            seen.add(path)
+            existing = known.get(path)
+            if existing and existing[1] == stat.st_mtime_ns and existing[2] == stat.st_size:
+                counts['unchanged'] += 1
+                continue
+            pending.append((path, stat, existing[0] if existing else None))
+            counts['updated' if existing else 'added'] += 1
+
+            if len(pending) >= 500:
+                self._index_files(pending)
+                pending = []
+
+        if pending:
+            self._index_files(pending)
+
+        removed = [(file_id,) for path, (file_id, _, _) in known.items() if path not in seen]
+        if removed:
+            with immediate_transaction(self._conn, self._lock) as conn:
+                for (file_id,) in removed:
+                    self._remove_file(conn, file_id)
+            counts['removed'] = len(removed)
+
+        self.last_refresh = time.monotonic()
+        if counts['added'] or counts['updated'] or counts['removed']:
+            self._load_totals()
+            logger.info(
+                f"Code index refreshed: {counts['added']} added, {counts['updated']} updated, "
+                f"{counts['removed']} removed, {counts['unchanged']} unchanged"
+            )
+        return counts
+
+    def _index_files(self, files: List[Tuple[str, os.stat_result, Optional[int]]]) -> None:
+        """Tokenize and (re-)insert a batch of files in one transaction."""
+        parsed = []
+        for path, stat, file_id in files:
+            postings: Dict[str, List] = {}
+            length = 0
+            if stat.st_size <= self.max_file_bytes:
+                try:
+                    with open(self.root / path, 'r', encoding='utf-8', errors='ignore') as f:
+                        postings, length = self._tokenize_file(f)
+                except OSError as e:
+                    logger.debug(f"Could not read {path}: {e}")
+            parsed.append((path, stat, file_id, postings, length))
+
+        document_frequencies: Counter = Counter()
+        with immediate_transaction(self._conn, self._lock) as conn:
+            for path, stat, file_id, postings, length in parsed:
+                if file_id is not None:
+                    self._remove_file(conn, file_id)
+                cursor = conn.execute(
+                    "INSERT INTO files (path, mtime_ns, size, length) VALUES (?, ?, ?, ?)",
+                    (path, stat.st_mtime_ns, stat.st_size, length),
+                )
+                new_id = cursor.lastrowid
+                conn.executemany(
+                    "INSERT INTO postings (token, file_id, tf, lines) VALUES (?, ?, ?, ?)",
+                    [
+                        (token, new_id, tf, ','.join(map(str, lines)))
+                        for token, (tf, lines) in postings.items()
+                    ],
+                )
+                document_frequencies.update(postings.keys())
+
+            conn.executemany(
+                "INSERT INTO vocabulary (token, df) VALUES (?, ?) "
+                "ON CONFLICT(token) DO UPDATE SET df = df + excluded.df",
+                document_frequencies.items(),
+            )
+
+    @staticmethod
+    def _tokenize_file(lines: Iterable[str]) -> Tuple[Dict[str, List], int]:
+        """
+        Build the postings of one file.
+
+        Returns:
+            (token -> [term frequency, first line numbers], token count)
+        """
+        postings: Dict[str, List] = {}
+        length = 0
+
+        for line_number, line in enumerate(lines, 1):
+            for identifier in IDENTIFIER.findall(line):
+                for token in split_identifier(identifier):
+                    length += 1
+                    entry = postings.get(token)
+                    if entry is None:
+                        postings[token] = [1, [line_number]]
+                    else:
+                        entry[0] += 1
+                        token_lines = entry[1]
+                        if token_lines[-1] != line_number and len(token_lines) < MAX_LINES_PER_POSTING:
+                            token_lines.append(line_number)
+
+        return postings, length
+
+    def _remove_file(self, conn: sqlite3.Connection, file_id: int) -> None:
+        """Delete a file and its postings, keeping document frequencies right."""
+        tokens = [row[0] for row in conn.execute(
+            "SELECT token FROM postings WHERE file_id = ?", (file_id,)
+        )]
+        conn.executemany(
+            "UPDATE vocabulary SET df = df - 1 WHERE token = ?",
+            [(token,) for token in tokens],
+        )
+        conn.executemany(
+            "DELETE FROM vocabulary WHERE token = ? AND df <= 0",
+            [(token,) for token in tokens],
+        )
+        conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+        conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        keywords: List[str],
+        limit: int = 10,
+        patterns: Optional[Iterable[str]] = None,
+    ) -> List[SearchHit]:
+        """
+        Rank indexed files against keywords with BM25.
+
+        Args:
+            keywords: Keywords or phrases (tokenized like file contents)
+            limit: Maximum number of hits
+            patterns: Only return files whose name matches one of these globs
+
+        Returns:
+            Hits ordered by descending score
+        """
+        query_tokens: List[str] = []
+        for keyword in keywords:
+            for token in tokenize_query(keyword):
+                if token not in query_tokens:
+                    query_tokens.append(token)
+        if not query_tokens or self._doc_count == 0:
+            return []
+
+        patterns = list(patterns) if patterns else None
+        avg_length = self._total_length / self._doc_count or 1.0
+        hits: List[SearchHit] = []
+
+        with self._lock:
+            expanded = self._expand(query_tokens)
+            if not expanded:
+                return []
+
+            # BM25 summed inside SQLite: (token, idf) pairs joined to postings
+            weights = [
+                (token, math.log(1 + (self._doc_count - df + 0.5) / (df + 0.5)))
+                for token, df in expanded
+            ]
+            values = ', '.join('(?, ?)' for _ in weights)
+            params: List = [value for pair in weights for value in pair]
+            params += [BM25_K1 + 1, BM25_K1, 1 - BM25_B, BM25_B / avg_length]
+            sql = (
+                f"WITH query(token, idf) AS (VALUES {values}) "
+                "SELECT f.id, f.path, f.size, f.mtime_ns, "
+                "SUM(q.idf * p.tf * ? / (p.tf + ? * (? + ? * f.length))) AS score "
+                "FROM query q JOIN postings p ON p.token = q.token "
+                "JOIN files f ON f.id = p.file_id "
+                "GROUP BY f.id ORDER BY score DESC"
+            )
+            if patterns is None:
+                sql += " LIMIT ?"
+                params.append(limit)
+            ranked = self._conn.execute(sql, params).fetchall()
+
+            for file_id, path, size, mtime_ns, score in ranked:
+                if patterns and not any(
+                    fnmatch.fnmatch(os.path.basename(path), p) for p in patterns
+                ):
+                    continue
+                hits.append(SearchHit(
+                    path=path,
+                    score=score,
+                    line_numbers=self._line_numbers(file_id, expanded),
+                    size_bytes=size,
+                    mtime=mtime_ns / 1e9,
+                ))
+                if len(hits) >= limit:
+                    break
+
+        return hits
+
+    def _line_numbers(self, file_id: int, expanded: List[Tuple[str, int]]) -> List[int]:
+        """Union of the posting lines of a ranked file (lock held)."""
+        lines: Set[int] = set()
+        for token, _ in expanded:
+            row = self._conn.execute(
+                "SELECT lines FROM postings WHERE token = ? AND file_id = ?", (token, file_id)
+            ).fetchone()
+            if row:
+                lines.update(map(int, row[0].split(',')))
+        return sorted(lines)
+
+    def _expand(self, query_tokens: List[str]) -> List[Tuple[str, int]]:
+        """Resolve query tokens to indexed (token, df) pairs (lock held).
+
+        A token that is not indexed itself falls back to the indexed tokens
+        it is a prefix of.
+        """
+        resolved: Dict[str, int] = {}
+        for token in query_tokens:
+            rows = self._conn.execute(
+                "SELECT token, df FROM vocabulary WHERE token = ?", (token,)
+            ).fetchall()
+            if not rows and len(token) >= MIN_PREFIX_LENGTH:
+                rows = self._conn.execute(
+                    "SELECT token, df FROM vocabulary WHERE token > ? AND token < ? "
+                    "ORDER BY df DESC LIMIT ?",
+                    (token, token + '\U0010ffff', MAX_PREFIX_EXPANSIONS),
+                ).fetchall()
+            resolved.update(rows)
+        return list(resolved.items())
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _skip_directory(self, name: str) -> bool:
+        return name in self._skip_names or any(
+            fnmatch.fnmatch(name, pattern) for pattern in self._skip_globs
+        )
+
+    def _matches(self, name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self.patterns)
+
+    def _load_totals(self) -> None:
+        """Reload the corpus totals used by BM25."""
+        with self._lock:
+            self._doc_count, self._total_length = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM files"
+            ).fetchone()
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(c in pattern for c in '*?[')
@@ -2,17 +2,60 @@
 Task Complexity Analyzer for Blackbox5
 
 Analyzes task descriptions to determine complexity and routing decisions.
+
+Every description is lowercased once and scanned with precompiled patterns;
+the regex passes are skipped when a cheap substring check shows they cannot
+match. Results are memoized in an LRU keyed by a hash of the description,
+and analyze_many scores a batch, analyzing each distinct description once.
 """
 
+import hashlib
 import re
 import logging
-from typing import Dict, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
+# Technical indicators, counted on the original text
+ACRONYM_RUN = re.compile(r"[A-Z][A-Z]+")  # Acronyms: runs checked for word boundaries
+DOTTED = re.compile(r"\b\w+\.\w+\b")  # Dotted notation (modules, methods)
+DOTTED_HINT = re.compile(r"\.\w")
+TAG = re.compile(r"<[^>]+>")  # Code/HTML tags
+PATH = re.compile(r"/\w+/")  # Paths
+
+# Vague quantifiers, counted on the lowercased text
+VAGUE_WORDS = ("multiple", "several", "various", "number of")
+OR_MORE = re.compile(r"\d+ or more")
+
+# Structure
+LIST_ITEM = re.compile(r"^\s*[-*]\s", re.MULTILINE)
+NUMBERED_ITEM = re.compile(r"^\s*\d+\.", re.MULTILINE)
+SECTION = re.compile(r"^#+\s", re.MULTILINE)
+
+
+def _is_word_char(char: str) -> bool:
+    """Same test as the regex \\w class for str patterns."""
+    return char.isalnum() or char == "_"
+
+
+def _count_acronyms(text: str) -> int:
+    """Count matches of \\b[A-Z]{2,}\\b without running it at every position."""
+    count = 0
+    for match in ACRONYM_RUN.finditer(text):
+        start, end = match.span()
+        if start and _is_word_char(text[start - 1]):
+            continue
+        if end < len(text) and _is_word_char(text[end]):
+            continue
+        count += 1
+    return count
+
+
 class ComplexityLevel(str, Enum):
     """Task complexity levels."""
     TRIVIAL = "trivial"
@@ -41,6 +84,10 @@ class ComplexityScore:
     confidence: float = 0.8
     reasoning: str = ""
 
+    def copy(self) -> "ComplexityScore":
+        """Copy with its own factors dict."""
+        return ComplexityScore(self.level, self.score, dict(self.factors), self.confidence, self.reasoning)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
         return {
@@ -92,14 +139,20 @@ class TaskComplexityAnalyzer:
         "something", "somewhat", "somehow",
     ]
 
-    def __init__(self, confidence_threshold: float = 0.6):
+    def __init__(self, confidence_threshold: float = 0.6, cache_size: int = 4096):
         """
         Initialize the analyzer.
 
         Args:
             confidence_threshold: Minimum confidence for analysis
+            cache_size: Maximum number of memoized analyses (0 disables the cache)
         """
         self.confidence_threshold = confidence_threshold
+        self.cache_size = cache_size
+
+        self._cache: 'OrderedDict[bytes, ComplexityScore]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_stats = {'hits': 0, 'misses': 0}
 
     def analyze(self, task_description: str, task_type: str = "") -> ComplexityScore:
         """
@@ -112,6 +165,74 @@ class TaskComplexityAnalyzer:
         Returns:
             ComplexityScore with analysis results
         """
+        key = self._cache_key(task_description)
+        with self._cache_lock:
+            score = self._cache.get(key)
+            if score is not None:
+                self._cache.move_to_end(key)
+                self.cache_stats['hits'] += 1
+                return score.copy()
+        return self.analyze_many([task_description], task_type)[0]
+
+    def analyze_many(self, task_descriptions: Iterable[str], task_type: str = "") -> List[ComplexityScore]:
+        """
+        Analyze a batch of task descriptions.
+
+        Cached descriptions are served from the LRU and repeated descriptions
+        in the batch are analyzed once.
+
+        Args:
+            task_descriptions: Task description texts
+            task_type: Optional task type hint
+
+        Returns:
+            One ComplexityScore per description, in order
+        """
+        descriptions = list(task_descriptions)
+        keys = [self._cache_key(description) for description in descriptions]
+        found: Dict[bytes, ComplexityScore] = {}
+        missing: Dict[bytes, str] = {}
+
+        with self._cache_lock:
+            for key, description in zip(keys, descriptions):
+                if key in found or key in missing:
+                    self.cache_stats['hits'] += 1
+                    continue
+                score = self._cache.get(key)
+                if score is not None:
+                    self._cache.move_to_end(key)
+                    self.cache_stats['hits'] += 1
+                    found[key] = score
+                else:
+                    self.cache_stats['misses'] += 1
+                    missing[key] = description
+
+        for key, description in missing.items():
+            found[key] = self._analyze(description)
+
+        if missing and self.cache_size > 0:
+            with self._cache_lock:
+                for key in missing:
+                    self._cache[key] = found[key]
+                    self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        # Copies, so callers can't alter memoized factors
+        return [found[key].copy() for key in keys]
+
+    def clear_cache(self) -> None:
+        """Drop all memoized analyses."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _cache_key(task_description: str) -> bytes:
+        return hashlib.sha1(task_description.encode('utf-8', 'surrogatepass')).digest()
+
+    def _analyze(self, task_description: str) -> ComplexityScore:
+        """Analyze one description, bypassing the cache."""
+        text_lower = task_description.lower()
         factors = {}
         reasoning_parts = []
 
@@ -121,17 +242,17 @@ class TaskComplexityAnalyzer:
         reasoning_parts.append(length_reasoning)
 
         # Factor 2: Keyword complexity
-        keyword_score, keyword_reasoning = self._analyze_keywords(task_description)
+        keyword_score, keyword_reasoning = self._analyze_keywords(text_lower)
         factors["keywords"] = keyword_score
         reasoning_parts.append(keyword_reasoning)
 
         # Factor 3: Technical complexity
-        tech_score, tech_reasoning = self._analyze_technical(task_description)
+        tech_score, tech_reasoning = self._analyze_technical(task_description, text_lower)
         factors["technical"] = tech_score
         reasoning_parts.append(tech_reasoning)
 
         # Factor 4: Ambiguity
-        ambiguity_score, ambiguity_reasoning = self._analyze_ambiguity(task_description)
+        ambiguity_score, ambiguity_reasoning = self._analyze_ambiguity(text_lower)
         factors["ambiguity"] = ambiguity_score
         reasoning_parts.append(ambiguity_reasoning)
 
@@ -183,11 +304,10 @@ class TaskComplexityAnalyzer:
 
         return score, reasoning
 
-    def _analyze_keywords(self, text: str) -> Tuple[float, str]:
+    def _analyze_keywords(self, text_lower: str) -> Tuple[float, str]:
         """
         Analyze keywords for complexity indicators.
         """
-        text_lower = text.lower()
         high_count = sum(1 for kw in self.HIGH_COMPLEXITY_KEYWORDS if kw in text_lower)
         medium_count = sum(1 for kw in self.MEDIUM_COMPLEXITY_KEYWORDS if kw in text_lower)
         low_count = sum(1 for kw in self.LOW_COMPLEXITY_KEYWORDS if kw in text_lower)
@@ -210,22 +330,21 @@ class TaskComplexityAnalyzer:
 
         return score, reasoning
 
-    def _analyze_technical(self, text: str) -> Tuple[float, str]:
+    def _analyze_technical(self, text: str, text_lower: str) -> Tuple[float, str]:
         """
         Analyze technical complexity indicators.
         """
-        tech_indicators = [
-            r"\b[A-Z]{2,}\b",  # Acronyms
-            r"\b\w+\.\w+\b",  # Dotted notation (modules, methods)
-            r"<[^>]+>",  # Code/HTML tags
-            r"```",  # Code blocks
-            r"http[s]?://",  # URLs
-            r"/\w+/",  # Paths
-        ]
-
         tech_count = 0
-        for pattern in tech_indicators:
-            tech_count += len(re.findall(pattern, text))
+        if text_lower != text:  # some uppercase
+            tech_count += _count_acronyms(text)
+        if DOTTED_HINT.search(text):
+            tech_count += len(DOTTED.findall(text))
+        if "<" in text:
+            tech_count += len(TAG.findall(text))
+        tech_count += text.count("```")  # Code blocks
+        tech_count += text.count("http://") + text.count("https://")  # URLs
+        if "/" in text:
+            tech_count += len(PATH.findall(text))
 
         if tech_count > 10:
             score = 70
@@ -242,22 +361,16 @@ class TaskComplexityAnalyzer:
 
         return score, reasoning
 
-    def _analyze_ambiguity(self, text: str) -> Tuple[float, str]:
+    def _analyze_ambiguity(self, text_lower: str) -> Tuple[float, str]:
         """
         Detect ambiguity which increases complexity.
         """
-        text_lower = text.lower()
         ambiguity_count = sum(1 for phrase in self.AMBIGUITY_PHRASES if phrase in text_lower)
 
         # Also check for vague quantifiers
-        vague_patterns = [
-            r"\d+ or more",
-            r"multiple",
-            r"several",
-            r"various",
-            r"number of",
-        ]
-        vague_count = sum(len(re.findall(pattern, text_lower)) for pattern in vague_patterns)
+        vague_count = sum(text_lower.count(word) for word in VAGUE_WORDS)
+        if " or more" in text_lower:
+            vague_count += len(OR_MORE.findall(text_lower))
 
         total_ambiguity = ambiguity_count + vague_count
 
@@ -278,9 +391,9 @@ class TaskComplexityAnalyzer:
         Analyze structural complexity.
         """
         # Check for lists, steps, or sections
-        has_list = bool(re.search(r"^\s*[-*]\s", text, re.MULTILINE))
-        has_numbering = bool(re.search(r"^\s*\d+\.", text, re.MULTILINE))
-        has_sections = bool(re.search(r"^#+\s", text, re.MULTILINE))
+        has_list = ("-" in text or "*" in text) and bool(LIST_ITEM.search(text))
+        has_numbering = "." in text and bool(NUMBERED_ITEM.search(text))
+        has_sections = "#" in text and bool(SECTION.search(text))
 
         # Check for questions
         question_count = text.count("?")
@@ -340,7 +453,13 @@ class TaskComplexityAnalyzer:
 
     def get_statistics(self) -> Dict:
         """Get analyzer statistics."""
+        with self._cache_lock:
+            cached = len(self._cache)
         return {
             "type": "TaskComplexityAnalyzer",
             "confidence_threshold": self.confidence_threshold,
+            "cache_size": self.cache_size,
+            "cached": cached,
+            "cache_hits": self.cache_stats['hits'],
+            "cache_misses": self.cache_stats['misses'],
         }
@@ -10,13 +10,26 @@ Component 5 of the GSD (Goal-Driven Development) framework.
 """
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import fnmatch
+import os
 import re
 import logging
+import sqlite3
+import threading
 import time
 from datetime import datetime
 
+try:
+    from .code_index import CodeIndex, SearchHit
+except ImportError:
+    # Fallback for standalone usage (pipeline/ directory on sys.path)
+    from code_index import CodeIndex, SearchHit
+
 logger = logging.getLogger(__name__)
 
 
@@ -124,6 +137,94 @@ class ConversationContext:
         return cls(**data)
 
 
+@dataclass
+class DocEntry:
+    """
+    Cached, pre-split markdown document.
+
+    Keyed by path and validated against mtime/size, so an unchanged file is
+    never re-read or re-split.
+
+    Attributes:
+        mtime_ns: Modification time when read
+        size: File size when read
+        lines: Document lines
+        lower_lines: Lowercased lines (for keyword matching)
+        lower_text: Lowercased full text
+        words: Set of lowercased words in the document
+        headings: For each line, index of the nearest heading at or above it (-1 = none)
+    """
+    mtime_ns: int
+    size: int
+    lines: List[str]
+    lower_lines: List[str]
+    lower_text: str
+    words: frozenset
+    headings: List[int]
+
+    @classmethod
+    def from_content(cls, content: str, mtime_ns: int = 0, size: int = 0) -> 'DocEntry':
+        """Split a document once into lines, words and heading positions."""
+        lines = content.splitlines()
+        lower_text = content.lower()
+        headings = []
+        current = -1
+        for i, line in enumerate(lines):
+            if line.startswith('#'):
+                current = i
+            headings.append(current)
+        return cls(
+            mtime_ns=mtime_ns,
+            size=size,
+            lines=lines,
+            lower_lines=lower_text.splitlines(),
+            lower_text=lower_text,
+            words=frozenset(re.findall(r'\w+', lower_text)),
+            headings=headings,
+        )
+
+    def contains(self, keyword: str) -> bool:
+        """Substring test, answered from the word set when possible."""
+        return keyword in self.words or keyword in self.lower_text
+
+
+class ReadBudget:
+    """
+    Thread-safe cap on the bytes read from disk during one request.
+
+    Example:
+        ```python
+        budget = ReadBudget(4 * 1024 * 1024)
+        if budget.consume(stat.st_size):
+            content = path.read_text()
+        ```
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: Total bytes that may be read (0 = unlimited)
+        """
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    def consume(self, size: int) -> bool:
+        """
+        Reserve `size` bytes.
+
+        Returns:
+            True if the read fits in the budget, False if it must be skipped
+        """
+        with self._lock:
+            if self.max_bytes and self.bytes_read + size > self.max_bytes:
+                self.skipped += 1
+                return False
+            self.bytes_read += size
+            return True
+
+
 @dataclass
 class TaskContext:
     """
@@ -252,6 +353,9 @@ class ContextExtractor:
         '.md': 'markdown',
     }
 
+    # File patterns searched by default
+    DEFAULT_CODE_PATTERNS = ['*.py', '*.js', '*.ts', '*.tsx', '*.jsx', '*.java', '*.go', '*.rs']
+
     # Common directories to skip during search
     SKIP_DIRECTORIES = {
         'node_modules',
@@ -270,6 +374,7 @@ class ContextExtractor:
         'coverage',
         '.pytest_cache',
         '.mypy_cache',
+        '.cache',
         '.tox',
         '.eggs',
         '*.egg-info',
@@ -296,6 +401,12 @@ class ContextExtractor:
         max_context_tokens: int = 10000,
         max_files: int = 10,
         max_docs: int = 5,
+        index_path: Optional[Path] = None,
+        persist_index: bool = True,
+        index_refresh_interval: float = 30.0,
+        max_bytes_per_request: int = 32 * 1024 * 1024,
+        doc_cache_size: int = 2048,
+        io_workers: int = 4,
     ):
         """
         Initialize context extractor.
@@ -306,12 +417,35 @@ class ContextExtractor:
             max_context_tokens: Maximum tokens to extract
             max_files: Maximum number of files to include
             max_docs: Maximum number of doc sections to include
+            index_path: SQLite file for the persistent code index
+                (default: .cache/code_index.db under codebase_path)
+            persist_index: Keep the code index on disk across restarts
+                (False keeps it in memory for this extractor)
+            index_refresh_interval: Seconds between incremental index
+                refreshes (0 = refresh before every search)
+            max_bytes_per_request: Cap on bytes read from disk per search or
+                extract_context call (0 = unlimited)
+            doc_cache_size: Maximum number of parsed documents kept in memory
+            io_workers: Threads used for blocking file I/O
         """
         self.codebase_path = Path(codebase_path)
         self.docs_path = Path(docs_path) if docs_path else None
         self.max_context_tokens = max_context_tokens
         self.max_files = max_files
         self.max_docs = max_docs
+        if index_path is None and persist_index:
+            index_path = self.codebase_path / '.cache' / 'code_index.db'
+        self.index_path = Path(index_path) if index_path else None
+        self.index_refresh_interval = index_refresh_interval
+        self._index: Optional[CodeIndex] = None
+        self._index_lock = threading.Lock()
+        self.max_bytes_per_request = max_bytes_per_request
+        self.doc_cache_size = doc_cache_size
+        self.io_workers = io_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._doc_cache: 'OrderedDict[str, DocEntry]' = OrderedDict()
+        self._doc_cache_lock = threading.Lock()
+        self.doc_cache_stats = {'hits': 0, 'misses': 0}
 
         # Validate paths
         if not self.codebase_path.exists():
@@ -389,83 +523,163 @@ class ContextExtractor:
     async def search_codebase(
         self,
         keywords: List[str],
-        file_patterns: Optional[List[str]] = None
+        file_patterns: Optional[List[str]] = None,
+        read_budget: Optional[ReadBudget] = None,
     ) -> List[FileContext]:
         """
         Search codebase for files relevant to task.
 
+        Files are ranked with BM25 over the inverted code index, which is
+        built on first use and refreshed incrementally afterwards; only the
+        top-ranked files are read. Index and file I/O run in the I/O pool.
+
         Args:
             keywords: List of keywords to search for
             file_patterns: Optional file glob patterns
+            read_budget: Byte budget shared with other legs of the request
 
         Returns:
             List of FileContext for relevant files
         """
         if file_patterns is None:
-            file_patterns = ['*.py', '*.js', '*.ts', '*.tsx', '*.jsx', '*.java', '*.go', '*.rs']
+            file_patterns = self.DEFAULT_CODE_PATTERNS
+        if read_budget is None:
+            read_budget = ReadBudget(self.max_bytes_per_request)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            self._search_codebase_sync,
+            keywords,
+            file_patterns,
+            read_budget,
+        )
+
+    def _search_codebase_sync(
+        self,
+        keywords: List[str],
+        file_patterns: List[str],
+        read_budget: ReadBudget,
+    ) -> List[FileContext]:
+        index = self.get_index(file_patterns)
+        hits = index.search(keywords, limit=self.max_files, patterns=file_patterns)
 
         relevant_files = []
+        for hit in hits:
+            if not read_budget.consume(hit.size_bytes):
+                logger.debug(f"Read budget exhausted, skipping {hit.path}")
+                continue
+            file_context = self._file_context(hit, keywords)
+            if file_context:
+                relevant_files.append(file_context)
+
+        return relevant_files
 
-        # Search for each file pattern
-        for pattern in file_patterns:
+    def get_index(self, file_patterns: Optional[List[str]] = None) -> CodeIndex:
+        """
+        Get the code index, refreshing it if it is due.
+
+        Args:
+            file_patterns: Patterns that must be covered by the index
+
+        Returns:
+            Up-to-date CodeIndex
+        """
+        with self._index_lock:
+            if self._index is None:
+                self._index = self._create_index(file_patterns or self.DEFAULT_CODE_PATTERNS)
+            elif file_patterns:
+                self._index.add_patterns(file_patterns)
+
+            last_refresh = self._index.last_refresh
+            if last_refresh is None or time.monotonic() - last_refresh >= self.index_refresh_interval:
+                self._index.refresh()
+
+            return self._index
+
+    def refresh_index(self) -> Dict[str, int]:
+        """
+        Force an incremental refresh of the code index.
+
+        Returns:
+            Counts of added, updated, removed and unchanged files
+        """
+        with self._index_lock:
+            if self._index is None:
+                self._index = self._create_index(self.DEFAULT_CODE_PATTERNS)
+            return self._index.refresh()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool used for blocking file I/O."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.io_workers,
+                thread_name_prefix="context-io",
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the I/O pool and close the code index."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._index_lock:
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+
+    def _create_index(self, file_patterns: List[str]) -> CodeIndex:
+        if self.index_path is not None:
             try:
-                for file_path in self.codebase_path.rglob(pattern):
-                    # Skip common non-source directories
-                    if any(skip in str(file_path) for skip in self.SKIP_DIRECTORIES):
-                        continue
-
-                    # Read file and check for keywords
-                    try:
-                        stat = file_path.stat()
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-
-                        # Check if file contains keywords
-                        relevant_lines = []
-                        content_lower = content.lower()
-
-                        for keyword in keywords:
-                            if keyword.lower() in content_lower:
-                                # Find lines containing keyword
-                                for line_num, line in enumerate(content.splitlines(), 1):
-                                    if keyword.lower() in line.lower():
-                                        relevant_lines.append(f"{line_num}: {line.strip()}")
-                                        if len(relevant_lines) >= 20:
-                                            break
-                                if len(relevant_lines) >= 20:
-                                    break
-
-                        if relevant_lines:
-                            # Determine language
-                            ext = file_path.suffix
-                            language = self.LANGUAGE_EXTENSIONS.get(ext, 'text')
-
-                            file_context = FileContext(
-                                file_path=str(file_path.relative_to(self.codebase_path)),
-                                language=language,
-                                relevant_lines=relevant_lines[:20],
-                                summary=self._summarize_file(content, keywords),
-                                size_bytes=stat.st_size,
-                                last_modified=datetime.fromtimestamp(stat.st_mtime)
-                            )
-                            relevant_files.append(file_context)
-
-                    except (UnicodeDecodeError, PermissionError) as e:
-                        logger.debug(f"Could not read {file_path}: {e}")
-                        continue
-                    except Exception as e:
-                        logger.debug(f"Error processing {file_path}: {e}")
-                        continue
-
-            except Exception as e:
-                logger.warning(f"Error searching pattern {pattern}: {e}")
-                continue
+                return CodeIndex(
+                    self.codebase_path,
+                    patterns=file_patterns,
+                    skip_directories=self.SKIP_DIRECTORIES,
+                    index_path=self.index_path,
+                )
+            except (OSError, sqlite3.Error) as e:
+                # e.g. a read-only checkout: index in memory instead
+                logger.warning(f"Cannot open code index {self.index_path} ({e}), keeping it in memory")
+        return CodeIndex(
+            self.codebase_path,
+            patterns=file_patterns,
+            skip_directories=self.SKIP_DIRECTORIES,
+        )
+
+    def _file_context(self, hit: SearchHit, keywords: List[str]) -> Optional[FileContext]:
+        """
+        Build a FileContext for an index hit by reading the file.
+
+        Args:
+            hit: Ranked index hit
+            keywords: Keywords of the query (for the summary)
 
-        # Sort by relevance (number of matching lines)
-        relevant_files.sort(key=lambda f: len(f.relevant_lines), reverse=True)
+        Returns:
+            FileContext, or None if the file can no longer be read
+        """
+        file_path = self.codebase_path / hit.path
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except OSError as e:
+            logger.debug(f"Could not read {file_path}: {e}")
+            return None
 
-        # Limit to top N files
-        return relevant_files[:self.max_files]
+        lines = content.splitlines()
+        relevant_lines = [
+            f"{line_num}: {lines[line_num - 1].strip()}"
+            for line_num in hit.line_numbers[:20]
+            if line_num <= len(lines)
+        ]
+
+        return FileContext(
+            file_path=hit.path,
+            language=self.LANGUAGE_EXTENSIONS.get(file_path.suffix, 'text'),
+            relevant_lines=relevant_lines,
+            summary=self._summarize_file(content, keywords),
+            size_bytes=hit.size_bytes,
+            last_modified=datetime.fromtimestamp(hit.mtime)
+        )
 
     def _summarize_file(self, content: str, keywords: List[str]) -> str:
         """
@@ -522,73 +736,134 @@ class ContextExtractor:
 
     async def search_docs(
         self,
-        keywords: List[str]
+        keywords: List[str],
+        read_budget: Optional[ReadBudget] = None,
     ) -> List[DocSection]:
         """
         Search documentation for relevant sections.
 
+        Documents are read in the I/O pool and cached pre-split by path; a
+        document is only re-read when its mtime or size changes.
+
         Args:
             keywords: List of keywords to search for
+            read_budget: Byte budget shared with other legs of the request
 
         Returns:
             List of DocSection for relevant documentation
         """
-        if not self.docs_path or not self.docs_path.exists():
+        if not self.docs_path or not self.docs_path.exists() or not keywords:
             return []
-
+        if read_budget is None:
+            read_budget = ReadBudget(self.max_bytes_per_request)
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        doc_files = await loop.run_in_executor(executor, self._find_doc_files)
+        entries = await asyncio.gather(*(
+            loop.run_in_executor(executor, self._load_doc, path, stat, read_budget)
+            for path, stat in doc_files
+        ))
+
+        lowered = [keyword.lower() for keyword in keywords]
         relevant_docs = []
 
-        # Search common doc files
-        doc_patterns = ['README*.md', '*.md', 'docs/**/*.md', 'docs/**/*.txt']
+        for (path, _), entry in zip(doc_files, entries):
+            if entry is None:
+                continue
 
-        for pattern in doc_patterns:
-            try:
-                for doc_path in self.docs_path.rglob(pattern):
-                    # Skip hidden files
-                    if doc_path.name.startswith('.'):
-                        continue
-
-                    try:
-                        with open(doc_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-
-                        # Check for keywords
-                        keyword_matches = sum(
-                            1 for keyword in keywords
-                            if keyword.lower() in content.lower()
-                        )
-
-                        if keyword_matches > 0:
-                            # Extract sections
-                            sections = self._extract_doc_sections(
-                                content,
-                                keywords,
-                                max_sections=3
-                            )
-
-                            for section in sections:
-                                doc_section = DocSection(
-                                    section_path=str(doc_path.relative_to(self.docs_path)),
-                                    title=section['title'],
-                                    content=section['content'],
-                                    relevance_score=keyword_matches / len(keywords),
-                                    heading_level=section.get('level', 1)
-                                )
-                                relevant_docs.append(doc_section)
-
-                    except Exception as e:
-                        logger.debug(f"Could not read {doc_path}: {e}")
-                        continue
-
-            except Exception as e:
-                logger.debug(f"Error searching docs pattern {pattern}: {e}")
+            # Check for keywords
+            matched = [keyword for keyword in lowered if entry.contains(keyword)]
+            if not matched:
                 continue
 
+            section_path = os.path.relpath(path, self.docs_path)
+            for section in self._sections_from_entry(entry, matched, max_sections=3):
+                relevant_docs.append(DocSection(
+                    section_path=section_path,
+                    title=section['title'],
+                    content=section['content'],
+                    relevance_score=len(matched) / len(keywords),
+                    heading_level=section.get('level', 1)
+                ))
+
         # Sort by relevance
         relevant_docs.sort(key=lambda d: d.relevance_score, reverse=True)
 
         return relevant_docs[:self.max_docs]
 
+    def _find_doc_files(self) -> List[Tuple[str, os.stat_result]]:
+        """
+        Walk the docs tree once, pruning skipped directories.
+
+        Returns:
+            (path, stat) for every markdown file, and every .txt file under
+            a ``docs`` directory, excluding hidden files
+        """
+        doc_files = []
+        for directory, dirnames, filenames in os.walk(self.docs_path):
+            dirnames[:] = sorted(
+                d for d in dirnames
+                if d not in self.SKIP_DIRECTORIES
+                and not any(fnmatch.fnmatch(d, p) for p in self.SKIP_DIRECTORIES if '*' in p)
+            )
+            in_docs = 'docs' in Path(directory).relative_to(self.docs_path).parts
+            for filename in sorted(filenames):
+                if filename.startswith('.'):
+                    continue
+                if not (filename.endswith('.md') or (in_docs and filename.endswith('.txt'))):
+                    continue
+                path = os.path.join(directory, filename)
+                try:
+                    doc_files.append((path, os.stat(path)))
+                except OSError as e:
+                    logger.debug(f"Could not stat {path}: {e}")
+        return doc_files
+
+    def _load_doc(
+        self,
+        path: str,
+        stat: os.stat_result,
+        read_budget: ReadBudget,
+    ) -> Optional[DocEntry]:
+        """
+        Get a document from the section cache, reading it on a miss.
+
+        Args:
+            path: Document path
+            stat: Current stat of the document
+            read_budget: Byte budget charged for disk reads
+
+        Returns:
+            DocEntry, or None if unreadable or over budget
+        """
+        with self._doc_cache_lock:
+            entry = self._doc_cache.get(path)
+            if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self._doc_cache.move_to_end(path)
+                self.doc_cache_stats['hits'] += 1
+                return entry
+            self.doc_cache_stats['misses'] += 1
+
+        if not read_budget.consume(stat.st_size):
+            logger.debug(f"Read budget exhausted, skipping {path}")
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except OSError as e:
+            logger.debug(f"Could not read {path}: {e}")
+            return None
+
+        entry = DocEntry.from_content(content, stat.st_mtime_ns, stat.st_size)
+        with self._doc_cache_lock:
+            self._doc_cache[path] = entry
+            self._doc_cache.move_to_end(path)
+            while len(self._doc_cache) > self.doc_cache_size:
+                self._doc_cache.popitem(last=False)
+        return entry
+
     def _extract_doc_sections(
         self,
         content: str,
@@ -603,29 +878,51 @@ class ContextExtractor:
             keywords: Keywords to search for
             max_sections: Maximum sections to extract
 
+        Returns:
+            List of section dictionaries
+        """
+        return self._sections_from_entry(
+            DocEntry.from_content(content),
+            [keyword.lower() for keyword in keywords],
+            max_sections,
+        )
+
+    def _sections_from_entry(
+        self,
+        entry: DocEntry,
+        keywords: List[str],
+        max_sections: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract relevant sections from a pre-split document.
+
+        Args:
+            entry: Cached document
+            keywords: Lowercased keywords to search for
+            max_sections: Maximum sections to extract
+
         Returns:
             List of section dictionaries
         """
         sections = []
-        lines = content.splitlines()
+        lines = entry.lines
 
-        for i, line in enumerate(lines):
+        for i, line in enumerate(entry.lower_lines):
             # Check if line contains keywords
-            if any(keyword.lower() in line.lower() for keyword in keywords):
+            if any(keyword in line for keyword in keywords):
                 # Extract surrounding context
                 start = max(0, i - 3)
                 end = min(len(lines), i + 10)
                 section_content = '\n'.join(lines[start:end])
 
-                # Get section title (nearest heading)
+                # Get section title (nearest heading within 20 lines)
                 title = "Unknown Section"
                 level = 1
-                for j in range(i, max(0, i - 20), -1):
-                    if lines[j].startswith('#'):
-                        # Count heading level
-                        level = len(lines[j]) - len(lines[j].lstrip('#'))
-                        title = lines[j].lstrip('#').strip()
-                        break
+                heading = entry.headings[i]
+                if heading > max(0, i - 20):
+                    # Count heading level
+                    level = len(lines[heading]) - len(lines[heading].lstrip('#'))
+                    title = lines[heading].lstrip('#').strip()
 
                 sections.append({
                     'title': title,
@@ -726,19 +1023,21 @@ class ContextExtractor:
         keywords = self.extract_keywords(task_description)
         logger.info(f"Extracted {len(keywords)} keywords for task {task_id}: {keywords[:5]}")
 
-        # Search codebase
-        relevant_files = await self.search_codebase(keywords)
+        # Search codebase, documentation and conversation concurrently,
+        # sharing one read budget
+        read_budget = ReadBudget(self.max_bytes_per_request)
+        relevant_files, relevant_docs, conversation_context = await asyncio.gather(
+            self.search_codebase(keywords, read_budget=read_budget),
+            self.search_docs(keywords, read_budget=read_budget),
+            self.extract_conversation_context(conversation_history, keywords),
+        )
         logger.info(f"Found {len(relevant_files)} relevant files")
-
-        # Search documentation
-        relevant_docs = await self.search_docs(keywords)
         logger.info(f"Found {len(relevant_docs)} relevant docs")
-
-        # Extract conversation context
-        conversation_context = await self.extract_conversation_context(
-            conversation_history,
-            keywords
-        )
+        if read_budget.skipped:
+            logger.warning(
+                f"Read budget of {read_budget.max_bytes} bytes exhausted for task {task_id}: "
+                f"{read_budget.skipped} files skipped"
+            )
 
         # Calculate total tokens (rough estimate: 1 token ≈ 4 characters)
         file_chars = sum(len(f.summary) + sum(len(line) for line in f.relevant_lines) for f in relevant_files)
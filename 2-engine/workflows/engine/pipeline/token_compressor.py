@@ -12,6 +12,10 @@ Strategies:
 4. Code summarization - Summarize code to function signatures
 5. Deduplication - Remove redundant information
 
+The hybrid strategy scores every file, doc section and conversation turn
+(and each of their summaries) once, then packs the most relevant set into
+the token budget with ContextPacker.
+
 Component 10 of the enhanced GSD framework.
 """
 
@@ -19,10 +23,14 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum
+import math
 import re
 import logging
 from datetime import datetime
 from collections import defaultdict
+from functools import partial
+
+from helpers.core.token_counter import HeuristicTokenizer, get_token_counter
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +56,7 @@ class CompressionMetrics:
     items_kept: int
     time_taken: float
     quality_score: float  # Estimated quality preservation (0-1)
+    budget_utilization: float = 0.0  # compressed / target tokens
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -58,7 +67,8 @@ class CompressionMetrics:
             'items_removed': self.items_removed,
             'items_kept': self.items_kept,
             'time_taken': self.time_taken,
-            'quality_score': self.quality_score
+            'quality_score': self.quality_score,
+            'budget_utilization': self.budget_utilization
         }
 
 
@@ -78,26 +88,19 @@ class CompressionResult:
 
 
 class TokenEstimator:
-    """Estimate token count for text."""
+    """Estimate token count for text (backed by the shared TokenCounter)."""
 
     # Approximate tokens per character for different languages
-    TOKENS_PER_CHAR = {
-        'python': 0.3,  # Code is more token-dense
-        'javascript': 0.3,
-        'typescript': 0.3,
-        'java': 0.25,
-        'cpp': 0.25,
-        'markdown': 0.5,  # Text is less dense
-        'yaml': 0.4,
-        'json': 0.35,
-        'default': 0.4
-    }
+    TOKENS_PER_CHAR = HeuristicTokenizer.TOKENS_PER_CHAR
 
     @classmethod
     def estimate(cls, text: str, language: str = 'default') -> int:
         """
         Estimate token count for text.
 
+        Exact when a tokenizer file is configured, otherwise a per-language
+        characters-per-token ratio. Counts are memoized.
+
         Args:
             text: Text to estimate
             language: Language type for better accuracy
@@ -105,12 +108,7 @@ class TokenEstimator:
         Returns:
             Estimated token count
         """
-        if not text:
-            return 0
-
-        char_count = len(text)
-        ratio = cls.TOKENS_PER_CHAR.get(language, cls.TOKENS_PER_CHAR['default'])
-        return int(char_count * ratio)
+        return get_token_counter().count(text, language)
 
     @classmethod
     def estimate_file_context(cls, file_context: Any) -> int:
@@ -175,9 +173,10 @@ class RelevanceScorer:
         # Keyword matches in relevant lines (most important)
         relevant_lines = getattr(file_context, 'relevant_lines', [])
         if relevant_lines:
+            lowered = [line.lower() for line in relevant_lines]
             keyword_matches = sum(
-                sum(1 for line in relevant_lines if kw.lower() in line.lower())
-                for kw in keywords
+                sum(1 for line in lowered if kw in line)
+                for kw in (kw.lower() for kw in keywords)
             )
             score += min(keyword_matches / 10.0, 0.5)  # Max 0.5 from keywords
 
@@ -227,10 +226,33 @@ class RelevanceScorer:
 
         return min(score, 1.0)
 
+    def score_message(self, message: Any, keywords: List[str], position: int, total: int) -> float:
+        """
+        Score relevance of a conversation turn (0-1).
+
+        Factors:
+        - Keyword matches in the content
+        - Recency (later turns score higher)
+        """
+        content = message.get('content', '') if isinstance(message, dict) else str(message)
+        content_lower = content.lower()
+        keyword_matches = sum(1 for kw in keywords if kw.lower() in content_lower)
+        score = min(keyword_matches * 0.2, 0.6)
+
+        if total > 0:
+            score += 0.4 * (position + 1) / total
+
+        return min(score, 1.0)
+
 
 class ExtractiveSummarizer:
     """Extractive summarization - keep key sentences."""
 
+    SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+    IMPORTANT_PATTERN = re.compile(
+        r'important|note|warning|error|fix|implement|function|class|method'
+    )
+
     def __init__(self, max_sentences: int = 5):
         self.max_sentences = max_sentences
 
@@ -249,12 +271,13 @@ class ExtractiveSummarizer:
             return ""
 
         # Split into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = self.SENTENCE_SPLIT.split(text)
 
         if len(sentences) <= self.max_sentences:
             return text
 
         # Score each sentence
+        keywords = [kw.lower() for kw in keywords]
         scored = []
         for sentence in sentences:
             score = self._score_sentence(sentence, keywords)
@@ -273,10 +296,11 @@ class ExtractiveSummarizer:
     def _score_sentence(self, sentence: str, keywords: List[str]) -> float:
         """Score a sentence's importance."""
         score = 0.0
+        sentence_lower = sentence.lower()
 
         # Keyword matches
         for kw in keywords:
-            if kw.lower() in sentence.lower():
+            if kw.lower() in sentence_lower:
                 score += 2.0
 
         # Length (medium sentences are often more informative)
@@ -287,10 +311,7 @@ class ExtractiveSummarizer:
             score -= 0.5
 
         # Contains important patterns
-        if any(pattern in sentence.lower() for pattern in [
-            'important', 'note', 'warning', 'error', 'fix',
-            'implement', 'function', 'class', 'method'
-        ]):
+        if self.IMPORTANT_PATTERN.search(sentence_lower):
             score += 1.0
 
         return score
@@ -414,6 +435,135 @@ class Deduplicator:
         return '|'.join(signature_lines[:3])
 
 
+@dataclass
+class PackingUnit:
+    """One way to include a context item: the item itself or a summary of it."""
+    group: Tuple[str, int]  # ('file' | 'doc' | 'message', position in the context)
+    variant: str  # 'full', 'extractive' or 'code_summary'
+    item: Any  # FileContext, DocSection or message dict to emit
+    tokens: int
+    value: float
+
+
+class ContextPacker:
+    """
+    Select context units under a token budget.
+
+    Units sharing a group are alternatives (an item and its summaries); at
+    most one per group is chosen, maximizing total value while total tokens
+    stay within the budget (a multiple-choice knapsack).
+
+    Methods:
+    - 'dp': dynamic programming over the budget split into `resolution`
+      buckets. Token counts are rounded up, so the result never overshoots;
+      the rounding slack is then filled greedily with exact counts.
+    - 'greedy': best value per token first, upgrading an item to a larger
+      variant when it still fits
+    - 'auto': dp when units x buckets <= max_dp_cells, greedy otherwise
+    """
+
+    METHODS = ('auto', 'dp', 'greedy')
+
+    def __init__(self, method: str = 'auto', resolution: int = 256, max_dp_cells: int = 200000):
+        """
+        Initialize context packer.
+
+        Args:
+            method: 'auto', 'dp' or 'greedy'
+            resolution: Budget buckets for the dp table
+            max_dp_cells: Largest dp table 'auto' will build
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown packing method: {method} (expected one of {self.METHODS})")
+        self.method = method
+        self.resolution = resolution
+        self.max_dp_cells = max_dp_cells
+
+    def pack(self, units: List[PackingUnit], budget: int) -> List[PackingUnit]:
+        """
+        Choose at most one unit per group within budget.
+
+        Args:
+            units: Candidate units
+            budget: Token budget
+
+        Returns:
+            Chosen units, in group order of first appearance
+        """
+        groups: Dict[Tuple[str, int], List[PackingUnit]] = {}
+        for unit in units:
+            if unit.tokens <= budget:
+                groups.setdefault(unit.group, []).append(unit)
+        if not groups:
+            return []
+
+        method = self.method
+        if method == 'auto':
+            cells = sum(len(options) for options in groups.values()) * min(budget, self.resolution)
+            method = 'dp' if cells <= self.max_dp_cells else 'greedy'
+
+        chosen = self._dp(groups, budget) if method == 'dp' else {}
+        chosen = self._greedy(groups, budget, chosen)
+        return [chosen[group] for group in groups if group in chosen]
+
+    def _dp(self, groups: Dict[Tuple[str, int], List[PackingUnit]], budget: int) -> Dict[Tuple[str, int], PackingUnit]:
+        """Multiple-choice knapsack over a bucketed budget."""
+        scale = max(1, math.ceil(budget / self.resolution))
+        capacity = budget // scale
+
+        best = [0.0] * (capacity + 1)  # best[c] = max value within c buckets
+        choices = []
+        for options in groups.values():
+            current = best[:]
+            choice = bytearray(capacity + 1)  # 0 = skip group, k = options[k - 1]
+            for k, unit in enumerate(options, 1):
+                weight = math.ceil(unit.tokens / scale)
+                value = unit.value
+                for c in range(weight, capacity + 1):
+                    candidate = best[c - weight] + value
+                    if candidate > current[c]:
+                        current[c] = candidate
+                        choice[c] = k
+            best = current
+            choices.append(choice)
+
+        # Walk back from the full budget to recover the chosen units
+        chosen = {}
+        c = capacity
+        for (group, options), choice in zip(reversed(list(groups.items())), reversed(choices)):
+            k = choice[c]
+            if k:
+                unit = options[k - 1]
+                chosen[group] = unit
+                c -= math.ceil(unit.tokens / scale)
+        return chosen
+
+    def _greedy(
+        self,
+        groups: Dict[Tuple[str, int], List[PackingUnit]],
+        budget: int,
+        chosen: Dict[Tuple[str, int], PackingUnit]
+    ) -> Dict[Tuple[str, int], PackingUnit]:
+        """Add or upgrade units by value density while they fit."""
+        chosen = dict(chosen)
+        used = sum(unit.tokens for unit in chosen.values())
+
+        candidates = [unit for options in groups.values() for unit in options]
+        candidates.sort(key=lambda u: u.value / u.tokens if u.tokens else math.inf, reverse=True)
+
+        for unit in candidates:
+            current = chosen.get(unit.group)
+            if current is None:
+                if used + unit.tokens <= budget:
+                    chosen[unit.group] = unit
+                    used += unit.tokens
+            elif unit.value > current.value and used - current.tokens + unit.tokens <= budget:
+                chosen[unit.group] = unit
+                used += unit.tokens - current.tokens
+
+        return chosen
+
+
 class TokenCompressor:
     """
     Main token compression engine.
@@ -422,11 +572,22 @@ class TokenCompressor:
     while preserving important information.
     """
 
+    # Share of an item's relevance a summary is assumed to retain
+    VARIANT_RETENTION = {
+        'full': 1.0,
+        'extractive': 0.6,
+        'code_summary': 0.5
+    }
+
+    # Base value of any item, so irrelevant ones still fill spare budget
+    MIN_ITEM_VALUE = 0.05
+
     def __init__(
         self,
         max_tokens: int = 8000,
         target_ratio: float = 0.8,  # Target 80% of max
-        strategies: List[CompressionStrategy] = None
+        strategies: List[CompressionStrategy] = None,
+        packing: str = 'auto'
     ):
         """
         Initialize token compressor.
@@ -434,7 +595,10 @@ class TokenCompressor:
         Args:
             max_tokens: Maximum token limit
             target_ratio: Target compression ratio (0-1)
-            strategies: Compression strategies to try (in order)
+            strategies: Compression strategies the hybrid strategy draws on
+                (EXTRACTIVE and CODE_SUMMARY add summarized variants,
+                DEDUPLICATE drops duplicate files before packing)
+            packing: ContextPacker method ('auto', 'dp' or 'greedy')
         """
         self.max_tokens = max_tokens
         self.target_tokens = int(max_tokens * target_ratio)
@@ -450,6 +614,7 @@ class TokenCompressor:
         self.extractor = ExtractiveSummarizer()
         self.code_summarizer = CodeSummarizer()
         self.deduplicator = Deduplicator()
+        self.packer = ContextPacker(method=packing)
 
     def compress(
         self,
@@ -488,7 +653,8 @@ class TokenCompressor:
                     items_removed=0,
                     items_kept=self._count_items(task_context),
                     time_taken=(datetime.utcnow() - start_time).total_seconds(),
-                    quality_score=1.0
+                    quality_score=1.0,
+                    budget_utilization=self._utilization(original_tokens)
                 )
             )
 
@@ -511,12 +677,14 @@ class TokenCompressor:
             items_removed=self._count_items(task_context) - self._count_items(compressed),
             items_kept=self._count_items(compressed),
             time_taken=time_taken,
-            quality_score=self._estimate_quality(compressed, keywords)
+            quality_score=self._estimate_quality(compressed, keywords),
+            budget_utilization=self._utilization(compressed_tokens)
         )
 
         logger.info(
             f"Compression complete: {original_tokens} → {compressed_tokens} tokens "
-            f"({metrics.compression_ratio:.1%} reduction) in {time_taken:.2f}s"
+            f"({metrics.compression_ratio:.1%} reduction, "
+            f"{metrics.budget_utilization:.1%} of budget) in {time_taken:.2f}s"
         )
 
         return CompressionResult(
@@ -526,19 +694,177 @@ class TokenCompressor:
         )
 
     def _apply_hybrid_strategy(self, task_context: Any, keywords: List[str]) -> Any:
-        """Apply multiple compression strategies in sequence."""
-        context = task_context
+        """
+        Pack the most relevant items and summaries into the target budget.
 
-        for strategy in self.strategies:
-            # Check if we need more compression
-            current_tokens = self.estimator.estimate_task_context(context)
-            if current_tokens <= self.target_tokens:
-                break
+        Every candidate unit is scored and estimated once; ContextPacker
+        picks at most one variant per item. Summaries are only built for
+        items that do not fit whole. The task description and the
+        conversation summary are always kept.
+        """
+        from .context_extractor import TaskContext, ConversationContext
 
-            # Apply strategy
-            context = self._apply_single_strategy(context, keywords, strategy)
+        conv_ctx = getattr(task_context, 'conversation_context', None)
+        fixed_tokens = self.estimator.estimate(getattr(task_context, 'task_description', ''), 'markdown')
+        if conv_ctx:
+            fixed_tokens += self.estimator.estimate(getattr(conv_ctx, 'summary', ''), 'markdown')
+
+        budget = max(self.target_tokens - fixed_tokens, 0)
+        chosen = self.packer.pack(self._candidate_units(task_context, keywords, budget), budget)
+
+        kept = defaultdict(list)
+        for unit in chosen:
+            kept[unit.group[0]].append(unit.item)
+
+        if conv_ctx:
+            conv_ctx = ConversationContext(
+                summary=getattr(conv_ctx, 'summary'),
+                relevant_messages=kept['message'],
+                participant_count=getattr(conv_ctx, 'participant_count'),
+                message_count=getattr(conv_ctx, 'message_count')
+            )
+
+        return TaskContext(
+            task_id=getattr(task_context, 'task_id'),
+            task_description=getattr(task_context, 'task_description'),
+            relevant_files=kept['file'],
+            relevant_docs=kept['doc'],
+            conversation_context=conv_ctx,
+            total_tokens=0,
+            extraction_time=getattr(task_context, 'extraction_time'),
+            sources_searched=getattr(task_context, 'sources_searched'),
+            keywords=getattr(task_context, 'keywords', []),
+            extracted_at=getattr(task_context, 'extracted_at')
+        )
 
-        return context
+    def _candidate_units(self, task_context: Any, keywords: List[str], budget: int) -> List[PackingUnit]:
+        """
+        Build the packing units for every file, doc section and conversation turn.
+
+        Summaries are built lazily: only items that a packing of whole items
+        leaves out of the budget are offered summarized variants.
+        """
+        items = self._candidate_items(task_context, keywords)
+        whole = [
+            PackingUnit(
+                group=group,
+                variant='full',
+                item=item,
+                tokens=estimate(item),
+                value=relevance * self.VARIANT_RETENTION['full']
+            )
+            for group, relevance, item, estimate, _ in items
+        ]
+        fits = {unit.group for unit in self.packer.pack(whole, budget)}
+
+        units = []
+        for (group, relevance, _, estimate, summarize), full in zip(items, whole):
+            units.append(full)
+            if group in fits:
+                continue
+            smallest = full.tokens
+            for variant, item in summarize():
+                tokens = estimate(item)
+                if tokens >= smallest:
+                    continue  # Saves no tokens
+                smallest = tokens
+                units.append(PackingUnit(
+                    group=group,
+                    variant=variant,
+                    item=item,
+                    tokens=tokens,
+                    value=relevance * self.VARIANT_RETENTION[variant]
+                ))
+        return units
+
+    def _candidate_items(
+        self,
+        task_context: Any,
+        keywords: List[str]
+    ) -> List[Tuple[Tuple[str, int], float, Any, Callable[[Any], int], Callable[[], List[Tuple[str, Any]]]]]:
+        """Score every item: (group, relevance, item, token estimator, summary variant factory)."""
+        items = []
+
+        files = getattr(task_context, 'relevant_files', [])
+        if CompressionStrategy.DEDUPLICATE in self.strategies:
+            files = self.deduplicator.deduplicate_file_contexts(files)
+        for i, file_ctx in enumerate(files):
+            relevance = self.MIN_ITEM_VALUE + max(self.scorer.score_file_context(file_ctx, keywords), 0.0)
+            items.append((
+                ('file', i), relevance, file_ctx, self.estimator.estimate_file_context,
+                partial(self._file_summaries, file_ctx, keywords)
+            ))
+
+        for i, doc_ctx in enumerate(getattr(task_context, 'relevant_docs', [])):
+            relevance = self.MIN_ITEM_VALUE + self.scorer.score_doc_section(doc_ctx, keywords)
+            items.append((
+                ('doc', i), relevance, doc_ctx, self.estimator.estimate_doc_section,
+                partial(self._doc_summaries, doc_ctx, keywords)
+            ))
+
+        conv_ctx = getattr(task_context, 'conversation_context', None)
+        messages = getattr(conv_ctx, 'relevant_messages', []) if conv_ctx else []
+        for i, msg in enumerate(messages):
+            relevance = self.MIN_ITEM_VALUE + self.scorer.score_message(msg, keywords, i, len(messages))
+            items.append((
+                ('message', i), relevance, msg, self._estimate_message,
+                partial(self._message_summaries, msg, keywords)
+            ))
+
+        return items
+
+    def _file_summaries(self, file_ctx: Any, keywords: List[str]) -> List[Tuple[str, Any]]:
+        """Summarized variants of a FileContext."""
+        variants = []
+        lines = getattr(file_ctx, 'relevant_lines', [])
+        if CompressionStrategy.EXTRACTIVE in self.strategies:
+            summary = self.extractor.summarize_text('\n'.join(lines), keywords)
+            variants.append(('extractive', self._replace_lines(file_ctx, summary.split('\n'))))
+        if CompressionStrategy.CODE_SUMMARY in self.strategies:
+            summary = self.code_summarizer.summarize_code(
+                '\n'.join(lines),
+                getattr(file_ctx, 'language', 'python')
+            )
+            variants.append(('code_summary', self._replace_lines(file_ctx, summary.split('\n') if summary else [])))
+        return variants
+
+    def _doc_summaries(self, doc_ctx: Any, keywords: List[str]) -> List[Tuple[str, Any]]:
+        """Summarized variants of a DocSection."""
+        from .context_extractor import DocSection
+
+        if CompressionStrategy.EXTRACTIVE not in self.strategies:
+            return []
+        summary = self.extractor.summarize_text(getattr(doc_ctx, 'content', ''), keywords)
+        return [('extractive', DocSection(
+            section_path=getattr(doc_ctx, 'section_path'),
+            title=getattr(doc_ctx, 'title'),
+            content=summary,
+            relevance_score=getattr(doc_ctx, 'relevance_score', 0.5),
+            heading_level=getattr(doc_ctx, 'heading_level', 1)
+        ))]
+
+    def _message_summaries(self, msg: Any, keywords: List[str]) -> List[Tuple[str, Any]]:
+        """Summarized variants of a conversation message."""
+        if CompressionStrategy.EXTRACTIVE not in self.strategies or not isinstance(msg, dict):
+            return []
+        summary = self.extractor.summarize_text(msg.get('content', ''), keywords)
+        return [('extractive', {**msg, 'content': summary})]
+
+    def _estimate_message(self, msg: Any) -> int:
+        return self.estimator.estimate(str(msg), 'markdown')
+
+    def _replace_lines(self, file_context: Any, lines: List[str]) -> Any:
+        """Copy of a FileContext with different relevant lines."""
+        from .context_extractor import FileContext
+
+        return FileContext(
+            file_path=getattr(file_context, 'file_path'),
+            language=getattr(file_context, 'language'),
+            relevant_lines=lines,
+            summary=getattr(file_context, 'summary'),
+            size_bytes=getattr(file_context, 'size_bytes'),
+            last_modified=getattr(file_context, 'last_modified')
+        )
 
     def _apply_single_strategy(self, task_context: Any, keywords: List[str], strategy: CompressionStrategy) -> Any:
         """Apply a single compression strategy."""
@@ -728,6 +1054,10 @@ class TokenCompressor:
             extracted_at=getattr(task_context, 'extracted_at')
         )
 
+    def _utilization(self, tokens: int) -> float:
+        """Share of the target budget used."""
+        return tokens / self.target_tokens if self.target_tokens > 0 else 0.0
+
     def _count_items(self, task_context: Any) -> int:
         """Count total items in task context."""
         count = 0
@@ -11,16 +11,21 @@ Benefits:
 - Automatic recovery with half-open state
 - Per-agent circuit tracking
 - Integration with event bus for state changes
+- Works from any thread and from coroutines (sub-second deadlines, no signals)
+- Optional bulkhead limit on concurrent calls per breaker
 """
 
+import asyncio
+import contextvars
+import heapq
+import inspect
 import logging
 import threading
 import time
-import signal
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
-from typing import Callable, Optional, Dict, Any, TypeVar, Type
-from functools import wraps
+from typing import Awaitable, Callable, Optional, Dict, Any, TypeVar
+from functools import partial, wraps
 
 from .circuit_breaker_types import (
     CircuitState,
@@ -28,17 +33,13 @@ from .circuit_breaker_types import (
     CircuitBreakerStats,
     CallResult,
     CircuitBreakerPresets,
+    SlidingWindow,
 )
-from .exceptions import (
+from ..exceptions import (
+    BulkheadFullError,
     CircuitBreakerOpenError,
-    CircuitBreakerError,
-)
-from .event_bus import RedisEventBus, get_event_bus
-from .events import (
-    CircuitBreakerEvent,
-    EventType,
-    Topics,
 )
+from ..state.event_bus import Event, EventBus, EventType
 
 
 # Configure logging
@@ -47,6 +48,13 @@ logger = logging.getLogger(__name__)
 # Type variables
 T = TypeVar('T')
 
+# Worker threads per breaker used to enforce call_timeout on synchronous
+# calls with enforce_sync_timeout (max_concurrent_calls, if set, takes
+# precedence). A call that times out keeps running in its worker (threads
+# cannot be killed), but the caller gets control back at the deadline; a
+# service that hangs can only tie up its own breaker's workers.
+_TIMEOUT_WORKERS = 8
+
 
 class CircuitBreaker:
     """
@@ -58,11 +66,17 @@ class CircuitBreaker:
     - HALF_OPEN: Testing if service has recovered with limited calls
 
     State transitions:
-    CLOSED → OPEN: After failure_threshold consecutive failures
+    CLOSED → OPEN: After failure_threshold consecutive failures, or when the
+        sliding window (once it holds minimum_number_of_calls calls) reaches
+        failure_rate_threshold or slow_call_rate_threshold
     OPEN → HALF_OPEN: After timeout_seconds have elapsed
     HALF_OPEN → CLOSED: After success_threshold consecutive successes
     HALF_OPEN → OPEN: On any failure during recovery testing
 
+    At most half_open_max_calls recovery probes are in flight at once, and
+    config.max_concurrent_calls (if set) caps all calls in flight, so a
+    struggling service is never stampeded.
+
     Example:
         ```python
         # Create circuit breaker
@@ -77,6 +91,9 @@ class CircuitBreaker:
         except Exception as e:
             # Call failed
             logger.error(f"Agent failed: {e}")
+
+        # Protect a coroutine
+        result = await cb.acall(agent.execute_async, task_data)
         ```
 
     Attributes:
@@ -94,7 +111,7 @@ class CircuitBreaker:
         self,
         service_id: str,
         config: Optional[CircuitBreakerConfig] = None,
-        event_bus: Optional[RedisEventBus] = None,
+        event_bus: Optional[EventBus] = None,
     ):
         """
         Initialize a circuit breaker.
@@ -105,20 +122,26 @@ class CircuitBreaker:
             event_bus: Event bus for publishing state changes (optional)
         """
         self.service_id = service_id
-        self.config = config or CircuitBreakerConfig.default()
+        self.config = config or CircuitBreakerPresets.default()
         self.event_bus = event_bus
 
-        # State management
+        # State management (re-entrant: admitting a call may transition state)
         self._state = CircuitState.CLOSED
-        self._state_lock = threading.Lock()
+        self._state_lock = threading.RLock()
 
-        # Statistics
-        self.stats = CircuitBreakerStats()
+        # Statistics (lifetime counters + rolling window)
+        self.stats = CircuitBreakerStats(window=SlidingWindow.from_config(self.config))
 
-        # Half-open state tracking
+        # Half-open probes in flight / successes in the current half-open period
         self._half_open_calls = 0
         self._half_open_successes = 0
 
+        # Calls in flight (bulkhead)
+        self._active_calls = 0
+
+        # Workers for deadline-enforced sync calls, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+
         # Last state change time (for reset timeout)
         self._last_state_change = datetime.now()
 
@@ -191,6 +214,12 @@ class CircuitBreaker:
         """Check if circuit is half-open (testing recovery)."""
         return self.state == CircuitState.HALF_OPEN
 
+    @property
+    def active_calls(self) -> int:
+        """Number of calls currently in flight."""
+        with self._state_lock:
+            return self._active_calls
+
     def call(self, func: Callable[..., T], *args, **kwargs) -> T:
         """
         Execute a function with circuit breaker protection.
@@ -201,6 +230,11 @@ class CircuitBreaker:
         - Recording statistics
         - Publishing events
 
+        Safe to use from any thread. The function runs on the caller's
+        thread, unless enforce_sync_timeout is set: then it runs in one of
+        this breaker's worker threads (in a copy of the caller's context)
+        and the caller gets a TimeoutError at the call_timeout deadline.
+
         Args:
             func: Function to call
             *args: Positional arguments for the function
@@ -211,79 +245,96 @@ class CircuitBreaker:
 
         Raises:
             CircuitBreakerOpenError: If circuit is open
+            BulkheadFullError: If max_concurrent_calls calls are in flight
+            TimeoutError: If the call exceeds call_timeout (with enforce_sync_timeout)
             Exception: Any exception from the function call
         """
-        start_time = time.time()
-        state_at_call = self.state
+        probe = self._acquire()
+        start_time = time.perf_counter()
 
-        # Check if circuit is open
-        if self.is_open:
-            if self._should_attempt_reset():
-                self._transition_to(CircuitState.HALF_OPEN)
-                logger.info(f"Circuit {self.service_id} transitioning to HALF_OPEN")
-            else:
-                # Reject the call
-                self.stats.record_rejection()
-                remaining_time = self.config.timeout_seconds - (
-                    time.time() - self.stats.opened_at.timestamp()
-                )
+        try:
+            result = self._execute_with_timeout(func, args, kwargs)
+        except Exception as e:
+            self._on_failure(e, time.perf_counter() - start_time)
 
-                logger.warning(
-                    f"Circuit {self.service_id} is OPEN, rejecting call "
-                    f"({remaining_time:.1f}s until reset attempt)"
-                )
+            logger.debug(
+                f"Circuit {self.service_id}: Call failed "
+                f"(state: {self.state}, duration: {time.perf_counter() - start_time:.3f}s, "
+                f"error: {e})"
+            )
 
-                raise CircuitBreakerOpenError(
-                    message=f"Circuit breaker for {self.service_id} is open",
-                    service=self.service_id,
-                    remaining_time=remaining_time,
-                    failure_count=self.stats.current_failures,
-                )
+            raise
+        finally:
+            self._release(probe)
 
-        # Track half-open call limit
-        if self.is_half_open:
-            with self._state_lock:
-                if self._half_open_calls >= self.config.half_open_max_calls:
-                    logger.warning(
-                        f"Circuit {self.service_id}: Max half-open calls reached"
-                    )
-                    raise CircuitBreakerOpenError(
-                        message=f"Max half-open calls reached for {self.service_id}",
-                        service=self.service_id,
-                    )
-                self._half_open_calls += 1
+        self._on_success(time.perf_counter() - start_time)
 
-        # Execute the function with timeout
-        try:
-            result = self._execute_with_timeout(func, args, kwargs)
+        logger.debug(
+            f"Circuit {self.service_id}: Call succeeded "
+            f"(state: {self.state}, duration: {time.perf_counter() - start_time:.3f}s)"
+        )
 
-            # Success
-            duration = time.time() - start_time
-            self._on_success()
+        return result
 
-            logger.debug(
-                f"Circuit {self.service_id}: Call succeeded "
-                f"(state: {self.state}, duration: {duration:.2f}s)"
-            )
+    async def acall(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Execute a coroutine function (or blocking callable) with protection.
 
-            return result
+        Coroutine functions are awaited on the running loop; plain callables
+        run in a worker thread so they never block the loop. The call_timeout
+        deadline is enforced with asyncio, so it can be sub-second.
+        Cancellation of the caller is not counted as a failure.
 
+        Args:
+            func: Coroutine function or callable
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Result of the call
+
+        Raises:
+            CircuitBreakerOpenError: If circuit is open
+            BulkheadFullError: If max_concurrent_calls calls are in flight
+            TimeoutError: If the call exceeds call_timeout
+            Exception: Any exception from the function call
+        """
+        probe = self._acquire()
+        start_time = time.perf_counter()
+
+        try:
+            if inspect.iscoroutinefunction(func):
+                awaitable = func(*args, **kwargs)
+            else:
+                awaitable = asyncio.get_running_loop().run_in_executor(
+                    None, partial(contextvars.copy_context().run, func, *args, **kwargs)
+                )
+            result = await self._await_with_timeout(awaitable)
         except Exception as e:
-            # Failure
-            duration = time.time() - start_time
-            self._on_failure(e)
+            self._on_failure(e, time.perf_counter() - start_time)
 
             logger.debug(
-                f"Circuit {self.service_id}: Call failed "
-                f"(state: {self.state}, duration: {duration:.2f}s, error: {e})"
+                f"Circuit {self.service_id}: Async call failed "
+                f"(state: {self.state}, duration: {time.perf_counter() - start_time:.3f}s, "
+                f"error: {e})"
             )
 
             raise
+        finally:
+            self._release(probe)
+
+        self._on_success(time.perf_counter() - start_time)
+        return result
 
     def _execute_with_timeout(self, func: Callable, args: tuple, kwargs: dict) -> Any:
         """
         Execute function with timeout protection.
 
+        Only with enforce_sync_timeout (and a call_timeout) does the call
+        leave the caller's thread: the deadline is enforced by waiting on a
+        worker thread rather than with SIGALRM, so it works off the main
+        thread and below one second.
+
         Args:
             func: Function to execute
             args: Positional arguments
@@ -295,25 +346,134 @@ class CircuitBreaker:
         Raises:
             TimeoutError: If function call times out
         """
-        if self.config.call_timeout <= 0:
+        if not self.config.enforce_sync_timeout or self.config.call_timeout <= 0:
             return func(*args, **kwargs)
 
-        def timeout_handler(signum, frame):
+        future = self._get_executor().submit(
+            contextvars.copy_context().run, func, *args, **kwargs
+        )
+        try:
+            return future.result(timeout=self.config.call_timeout)
+        except FutureTimeoutError:
+            if future.done():
+                # The function itself raised a timeout error
+                raise
+            future.cancel()
             raise TimeoutError(
                 f"Function call exceeded timeout of {self.config.call_timeout}s"
-            )
+            ) from None
 
-        # Set signal handler for timeout
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(int(self.config.call_timeout))
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get this breaker's executor for deadline-enforced sync calls."""
+        with self._state_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_concurrent_calls or _TIMEOUT_WORKERS,
+                    thread_name_prefix=f"circuit-breaker-{self.service_id}",
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Release this breaker's worker threads (calls still running finish)."""
+        with self._state_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _await_with_timeout(self, awaitable: Awaitable[T]) -> T:
+        """
+        Await with the configured call_timeout.
+
+        Raises:
+            TimeoutError: If the awaitable does not finish in time
+        """
+        if self.config.call_timeout <= 0:
+            return await awaitable
 
         try:
-            result = func(*args, **kwargs)
-            return result
-        finally:
-            # Cancel alarm and restore old handler
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
+            return await asyncio.wait_for(awaitable, self.config.call_timeout)
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(
+                f"Function call exceeded timeout of {self.config.call_timeout}s"
+            ) from e
+
+    def _acquire(self) -> bool:
+        """
+        Admit a call or reject it.
+
+        Returns:
+            True if the call is a half-open recovery probe
+
+        Raises:
+            CircuitBreakerOpenError: If circuit is open or all probe slots are taken
+            BulkheadFullError: If max_concurrent_calls calls are in flight
+        """
+        with self._state_lock:
+            if self._state == CircuitState.OPEN:
+                if not self._should_attempt_reset():
+                    # Reject the call
+                    self.stats.record_rejection()
+                    remaining_time = self._remaining_open_time()
+
+                    logger.warning(
+                        f"Circuit {self.service_id} is OPEN, rejecting call "
+                        f"({remaining_time:.1f}s until reset attempt)"
+                    )
+
+                    raise CircuitBreakerOpenError(
+                        message=f"Circuit breaker for {self.service_id} is open",
+                        service=self.service_id,
+                        remaining_time=remaining_time,
+                        failure_count=self.stats.current_failures,
+                    )
+
+                self._transition_to(CircuitState.HALF_OPEN)
+                logger.info(f"Circuit {self.service_id} transitioning to HALF_OPEN")
+
+            probe = self._state == CircuitState.HALF_OPEN
+
+            # Track half-open call limit
+            if probe and self._half_open_calls >= self.config.half_open_max_calls:
+                self.stats.record_rejection()
+                logger.warning(
+                    f"Circuit {self.service_id}: Max half-open calls reached"
+                )
+                raise CircuitBreakerOpenError(
+                    message=f"Max half-open calls reached for {self.service_id}",
+                    service=self.service_id,
+                )
+
+            limit = self.config.max_concurrent_calls
+            if limit and self._active_calls >= limit:
+                self.stats.record_rejection()
+                logger.warning(
+                    f"Circuit {self.service_id}: Bulkhead full ({limit} calls in flight)"
+                )
+                raise BulkheadFullError(
+                    f"Concurrent call limit of {limit} reached for {self.service_id}",
+                    service=self.service_id,
+                    limit=limit,
+                )
+
+            self._active_calls += 1
+            if probe:
+                self._half_open_calls += 1
+            return probe
+
+    def _release(self, probe: bool) -> None:
+        """Free the slots taken by _acquire."""
+        with self._state_lock:
+            self._active_calls = max(0, self._active_calls - 1)
+            if probe:
+                self._half_open_calls = max(0, self._half_open_calls - 1)
+
+    def _remaining_open_time(self) -> float:
+        """Seconds until an open circuit may attempt a reset."""
+        if self.stats.opened_at is None:
+            return 0.0
+        return self.config.timeout_seconds - (
+            time.time() - self.stats.opened_at.timestamp()
+        )
 
     def _should_attempt_reset(self) -> bool:
         """
@@ -334,12 +494,21 @@ class CircuitBreaker:
 
         return elapsed >= self.config.timeout_seconds
 
-    def _on_success(self) -> None:
-        """Handle a successful call."""
-        self.stats.record_success()
+    def _on_success(self, duration: float = 0.0) -> None:
+        """
+        Handle a successful call.
+
+        Args:
+            duration: Call duration in seconds
+        """
+        self.stats.record_success(duration)
+
+        with self._state_lock:
+            if self._state == CircuitState.CLOSED:
+                # Slow successes can trip the circuit too
+                self._check_window()
 
-        if self.is_half_open:
-            with self._state_lock:
+            elif self._state == CircuitState.HALF_OPEN:
                 self._half_open_successes += 1
 
                 if self._half_open_successes >= self.config.success_threshold:
@@ -349,12 +518,13 @@ class CircuitBreaker:
                         f"transitioning to CLOSED after {self._half_open_successes} successes"
                     )
 
-    def _on_failure(self, exception: Exception) -> None:
+    def _on_failure(self, exception: Exception, duration: float = 0.0) -> None:
         """
         Handle a failed call.
 
         Args:
             exception: The exception that occurred
+            duration: Call duration in seconds
         """
         # Check if this exception type should trigger a failure
         should_count = isinstance(exception, self.config.exception_types)
@@ -366,24 +536,49 @@ class CircuitBreaker:
             )
             return
 
-        self.stats.record_failure()
+        self.stats.record_failure(duration)
 
-        if self.is_closed:
-            # Check if threshold reached
-            if self.stats.current_failures >= self.config.failure_threshold:
+        with self._state_lock:
+            if self._state == CircuitState.CLOSED:
+                # Check if threshold reached
+                if self.stats.current_failures >= self.config.failure_threshold:
+                    self._transition_to(CircuitState.OPEN)
+                    logger.warning(
+                        f"Circuit {self.service_id} opened after "
+                        f"{self.stats.current_failures} consecutive failures"
+                    )
+                else:
+                    self._check_window()
+
+            elif self._state == CircuitState.HALF_OPEN:
+                # Any failure in half-open opens the circuit again
                 self._transition_to(CircuitState.OPEN)
                 logger.warning(
-                    f"Circuit {self.service_id} opened after "
-                    f"{self.stats.current_failures} consecutive failures"
+                    f"Circuit {self.service_id} failed recovery test, "
+                    f"returning to OPEN state"
                 )
 
-        elif self.is_half_open:
-            # Any failure in half-open opens the circuit again
-            self._transition_to(CircuitState.OPEN)
-            logger.warning(
-                f"Circuit {self.service_id} failed recovery test, "
-                f"returning to OPEN state"
-            )
+    def _check_window(self) -> None:
+        """Open the circuit if the sliding window's rates cross a threshold (lock held)."""
+        config = self.config
+        if not (config.failure_rate_threshold or config.slow_call_rate_threshold):
+            return
+
+        calls, failure_rate, slow_call_rate = self.stats.window.rates()
+        if calls < config.minimum_number_of_calls:
+            return
+
+        if config.failure_rate_threshold and failure_rate >= config.failure_rate_threshold:
+            reason = f"failure rate {failure_rate:.0%}"
+        elif config.slow_call_rate_threshold and slow_call_rate >= config.slow_call_rate_threshold:
+            reason = f"slow-call rate {slow_call_rate:.0%}"
+        else:
+            return
+
+        self._transition_to(CircuitState.OPEN)
+        logger.warning(
+            f"Circuit {self.service_id} opened: {reason} over the last {calls} calls"
+        )
 
     def _transition_to(self, new_state: CircuitState) -> None:
         """
@@ -392,24 +587,25 @@ class CircuitBreaker:
         Args:
             new_state: New circuit state
         """
-        old_state = self.state
-
         with self._state_lock:
+            old_state = self._state
             if old_state == new_state:
                 return
 
             self._state = new_state
             self._last_state_change = datetime.now()
 
-            # Reset counters for state transitions
+            # Reset counters for state transitions (probes still in flight
+            # keep their slots until they finish)
             if new_state == CircuitState.HALF_OPEN:
-                self._half_open_calls = 0
                 self._half_open_successes = 0
             elif new_state == CircuitState.CLOSED:
                 self.stats.current_failures = 0
+                # Start the closed period with a clean window
+                self.stats.window.reset()
 
-        # Update stats
-        self.stats.transition_to(new_state)
+            # Update stats
+            self.stats.transition_to(new_state)
 
         # Publish event
         self._publish_state_change(old_state, new_state)
@@ -418,6 +614,9 @@ class CircuitBreaker:
         """
         Publish circuit breaker state change event.
 
+        The event bus is asynchronous, so the event is only published when the
+        transition happens on a thread with a running event loop.
+
         Args:
             old_state: Previous state
             new_state: New state
@@ -434,16 +633,31 @@ class CircuitBreaker:
             else:
                 event_type = EventType.CIRCUIT_HALF_OPEN
 
-            event = CircuitBreakerEvent.create(
-                event_type=event_type,
-                service=self.service_id,
-                state=new_state.value,
-                failure_count=self.stats.current_failures,
-                last_failure=self.stats.last_failure_time.isoformat() if self.stats.last_failure_time else None,
+            event = Event(
+                type=event_type.value,
+                data={
+                    'service': self.service_id,
+                    'state': new_state.value,
+                    'previous_state': old_state.value,
+                    'failure_count': self.stats.current_failures,
+                    'last_failure': (
+                        self.stats.last_failure_time.isoformat()
+                        if self.stats.last_failure_time else None
+                    ),
+                },
+                source=f"circuit_breaker.{self.service_id}",
             )
 
-            topic = Topics.circuit_breaker_topic(self.service_id)
-            self.event_bus.publish(topic, event)
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                logger.debug(
+                    f"No running event loop, circuit state event for "
+                    f"{self.service_id} not published"
+                )
+                return
+
+            loop.create_task(self.event_bus.publish(event))
 
             logger.debug(
                 f"Published circuit state change event: {old_state} → {new_state}"
@@ -457,7 +671,6 @@ class CircuitBreaker:
         with self._state_lock:
             old_state = self._state
             self._state = CircuitState.CLOSED
-            self._half_open_calls = 0
             self._half_open_successes = 0
             self._last_state_change = datetime.now()
 
@@ -477,49 +690,50 @@ class CircuitBreaker:
         """
         stats = self.stats.to_dict()
         stats['service_id'] = self.service_id
+        stats['active_calls'] = self.active_calls
         stats['config'] = self.config.to_dict()
         return stats
 
-    @contextmanager
-    def protect(self):
+    def protect(self) -> '_Protection':
         """
         Context manager for circuit breaker protection.
 
+        Works with both ``with`` and ``async with``. The async form also
+        enforces call_timeout by cancelling the block at the deadline and
+        raising TimeoutError.
+
         Example:
             ```python
             with circuit_breaker.protect():
                 result = risky_operation()
+
+            async with circuit_breaker.protect():
+                result = await risky_coroutine()
             ```
 
         Raises:
             CircuitBreakerOpenError: If circuit is open
+            BulkheadFullError: If max_concurrent_calls calls are in flight
         """
-        state_at_call = self.state
-
-        if self.is_open and not self._should_attempt_reset():
-            self.stats.record_rejection()
-            raise CircuitBreakerOpenError(
-                message=f"Circuit breaker for {self.service_id} is open",
-                service=self.service_id,
-            )
-
-        try:
-            yield
-        except Exception as e:
-            if isinstance(e, self.config.exception_types):
-                self._on_failure(e)
-            raise
+        return _Protection(self)
 
     def decorate(self, func: Callable[..., T]) -> Callable[..., T]:
         """
         Decorator to add circuit breaker protection to a function.
 
+        Coroutine functions are wrapped with acall(), other functions with
+        call().
+
         Example:
             ```python
             @circuit_breaker.decorate
             def risky_function():
                 # Potentially failing code
                 pass
+
+            @circuit_breaker.decorate
+            async def risky_coroutine():
+                pass
             ```
 
         Args:
@@ -528,6 +742,13 @@ class CircuitBreaker:
         Returns:
             Decorated function
         """
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await self.acall(func, *args, **kwargs)
+
+            return async_wrapper
 
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -536,6 +757,62 @@ class CircuitBreaker:
         return wrapper
 
 
+class _Protection:
+    """Sync/async context manager returned by CircuitBreaker.protect()."""
+
+    def __init__(self, breaker: CircuitBreaker):
+        self._breaker = breaker
+        self._probe = False
+        self._start = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timed_out = False
+
+    def __enter__(self) -> CircuitBreaker:
+        self._probe = self._breaker._acquire()
+        self._start = time.perf_counter()
+        return self._breaker
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._breaker._release(self._probe)
+        duration = time.perf_counter() - self._start
+
+        if exc is None:
+            self._breaker._on_success(duration)
+        elif isinstance(exc, Exception):
+            self._breaker._on_failure(exc, duration)
+        # Cancellation and other BaseExceptions are neither success nor failure
+        return False
+
+    async def __aenter__(self) -> CircuitBreaker:
+        breaker = self.__enter__()
+
+        timeout = breaker.config.call_timeout
+        if timeout > 0:
+            self._task = asyncio.current_task()
+            self._timer = asyncio.get_running_loop().call_later(timeout, self._expire)
+        return breaker
+
+    def _expire(self) -> None:
+        self._timed_out = True
+        self._task.cancel()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self._timer:
+            self._timer.cancel()
+
+        if self._timed_out and exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            if hasattr(self._task, "uncancel"):
+                self._task.uncancel()
+            error = TimeoutError(
+                f"Protected block exceeded timeout of {self._breaker.config.call_timeout}s"
+            )
+            self.__exit__(TimeoutError, error, None)
+            raise error from exc
+
+        return self.__exit__(exc_type, exc, tb)
+
+
 class CircuitBreakerManager:
     """
     Manager for creating and tracking multiple circuit breakers.
@@ -559,7 +836,7 @@ class CircuitBreakerManager:
         ```
     """
 
-    def __init__(self, event_bus: Optional[RedisEventBus] = None):
+    def __init__(self, event_bus: Optional[EventBus] = None):
         """
         Initialize the circuit breaker manager.
 
@@ -609,22 +886,67 @@ class CircuitBreakerManager:
             service_id: Service identifier
         """
         with self._lock:
-            if service_id in self._breakers:
-                del self._breakers[service_id]
-                logger.info(f"Removed circuit breaker for {service_id}")
+            breaker = self._breakers.pop(service_id, None)
+        if breaker is not None:
+            breaker.close()
+            logger.info(f"Removed circuit breaker for {service_id}")
 
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
         """
         Get statistics for all circuit breakers.
 
+        Per-breaker stats are cached until the breaker records a call, and
+        the manager lock is only held to copy the breaker table, so this
+        stays cheap with thousands of mostly idle breakers.
+
         Returns:
             Dictionary of service_id -> stats
         """
         with self._lock:
-            return {
-                service_id: cb.get_stats()
-                for service_id, cb in self._breakers.items()
-            }
+            breakers = list(self._breakers.items())
+
+        return {service_id: cb.get_stats() for service_id, cb in breakers}
+
+    def get_aggregate_stats(self) -> Dict[str, Any]:
+        """
+        Get a fleet-wide summary of all circuit breakers.
+
+        Only reads running window totals, never per-call history.
+
+        Returns:
+            Breaker counts by state, window totals and the services with the
+            highest window failure rates
+        """
+        with self._lock:
+            breakers = list(self._breakers.items())
+
+        states = {state.value: 0 for state in CircuitState}
+        calls = failures = slow = 0
+        worst = []
+
+        for service_id, cb in breakers:
+            states[cb.state.value] += 1
+            window_calls, failure_rate, slow_call_rate = cb.stats.window.rates()
+            calls += window_calls
+            failures += round(failure_rate * window_calls)
+            slow += round(slow_call_rate * window_calls)
+            if failure_rate > 0:
+                worst.append((failure_rate, service_id))
+
+        worst = heapq.nlargest(10, worst)
+        return {
+            'breakers': len(breakers),
+            'states': states,
+            'window_calls': calls,
+            'window_failures': failures,
+            'window_slow_calls': slow,
+            'failure_rate': failures / calls if calls else 0.0,
+            'slow_call_rate': slow / calls if calls else 0.0,
+            'highest_failure_rates': [
+                {'service_id': service_id, 'failure_rate': rate}
+                for rate, service_id in worst
+            ],
+        }
 
     def reset_all(self) -> None:
         """Reset all circuit breakers."""
@@ -661,7 +983,7 @@ _global_manager: Optional[CircuitBreakerManager] = None
 _manager_lock = threading.Lock()
 
 
-def get_circuit_breaker_manager(event_bus: Optional[RedisEventBus] = None) -> CircuitBreakerManager:
+def get_circuit_breaker_manager(event_bus: Optional[EventBus] = None) -> CircuitBreakerManager:
     """
     Get the global circuit breaker manager instance.
 
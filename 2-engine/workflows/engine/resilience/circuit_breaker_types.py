@@ -5,11 +5,14 @@ This module provides the core types and enums used by the circuit breaker
 implementation for state management and configuration.
 """
 
+import math
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any
-from threading import Lock
+from typing import Callable, Deque, Optional, Dict, Any, List, Tuple
+from threading import Lock, RLock
 
 
 class CircuitState(str, Enum):
@@ -39,10 +42,25 @@ class CircuitBreakerConfig:
         failure_threshold: Number of consecutive failures before opening
         timeout_seconds: Seconds to wait before transitioning from OPEN to HALF_OPEN
         success_threshold: Number of successes needed in HALF_OPEN to close circuit
-        call_timeout: Maximum seconds to wait for a call to complete
+        call_timeout: Maximum seconds to wait for a call to complete (fractions
+            allowed; 0 disables the deadline). Always enforced for acall()
+            and ``async with protect()``; sync call() only enforces it with
+            enforce_sync_timeout
+        enforce_sync_timeout: Run sync call() in a worker thread of the
+            breaker so call_timeout applies to it too (default: sync calls
+            run on the caller's thread without a deadline)
         half_open_max_calls: Max calls allowed in HALF_OPEN state (default: 1)
         reset_timeout: Seconds before allowing another reset attempt (prevents thrashing)
-        sliding_window_size: Number of recent calls to track for statistics
+        sliding_window_type: "count" (last N calls) or "time" (last N seconds)
+        sliding_window_size: Number of recent calls (or seconds) to track
+        minimum_number_of_calls: Calls needed in the window before rates can trip
+        failure_rate_threshold: Open when the window's failure rate reaches
+            this fraction (0 disables)
+        slow_call_duration_threshold: Seconds after which a call counts as
+            slow (0 disables)
+        slow_call_rate_threshold: Open when the window's slow-call rate
+            reaches this fraction (0 disables)
+        max_concurrent_calls: Bulkhead limit on calls in flight (0 = unlimited)
         exception_types: Tuple of exception types that should trigger failures
     """
 
@@ -50,9 +68,16 @@ class CircuitBreakerConfig:
     timeout_seconds: float = 60.0
     success_threshold: int = 2
     call_timeout: float = 30.0
+    enforce_sync_timeout: bool = False
     half_open_max_calls: int = 1
     reset_timeout: float = 10.0
+    sliding_window_type: str = "count"
     sliding_window_size: int = 100
+    minimum_number_of_calls: int = 10
+    failure_rate_threshold: float = 0.0
+    slow_call_duration_threshold: float = 0.0
+    slow_call_rate_threshold: float = 0.0
+    max_concurrent_calls: int = 0
 
     # Exception types to catch
     exception_types: tuple = (Exception,)
@@ -69,6 +94,19 @@ class CircuitBreakerConfig:
             raise ValueError("call_timeout must be >= 0")
         if self.half_open_max_calls < 1:
             raise ValueError("half_open_max_calls must be >= 1")
+        if self.max_concurrent_calls < 0:
+            raise ValueError("max_concurrent_calls must be >= 0")
+        if self.sliding_window_type not in ("count", "time"):
+            raise ValueError("sliding_window_type must be 'count' or 'time'")
+        if self.sliding_window_size < 1:
+            raise ValueError("sliding_window_size must be >= 1")
+        if self.minimum_number_of_calls < 1:
+            raise ValueError("minimum_number_of_calls must be >= 1")
+        for name in ("failure_rate_threshold", "slow_call_rate_threshold"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if self.slow_call_duration_threshold < 0:
+            raise ValueError("slow_call_duration_threshold must be >= 0")
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
@@ -77,12 +115,252 @@ class CircuitBreakerConfig:
             'timeout_seconds': self.timeout_seconds,
             'success_threshold': self.success_threshold,
             'call_timeout': self.call_timeout,
+            'enforce_sync_timeout': self.enforce_sync_timeout,
             'half_open_max_calls': self.half_open_max_calls,
             'reset_timeout': self.reset_timeout,
+            'sliding_window_type': self.sliding_window_type,
             'sliding_window_size': self.sliding_window_size,
+            'minimum_number_of_calls': self.minimum_number_of_calls,
+            'failure_rate_threshold': self.failure_rate_threshold,
+            'slow_call_duration_threshold': self.slow_call_duration_threshold,
+            'slow_call_rate_threshold': self.slow_call_rate_threshold,
+            'max_concurrent_calls': self.max_concurrent_calls,
         }
 
 
+# Latency histogram shared by all windows: bin 0 holds calls up to 0.1 ms,
+# then 8 bins per doubling (~9% resolution) up to ~28 minutes.
+_LATENCY_BASE = 1e-4
+_LATENCY_BINS_PER_OCTAVE = 8
+_LATENCY_BINS = _LATENCY_BINS_PER_OCTAVE * 24 + 1
+
+
+def _latency_bin(duration: float) -> int:
+    """Histogram bin for a call duration in seconds."""
+    if duration <= _LATENCY_BASE:
+        return 0
+    index = 1 + int(math.log2(duration / _LATENCY_BASE) * _LATENCY_BINS_PER_OCTAVE)
+    return min(index, _LATENCY_BINS - 1)
+
+
+def _latency_bin_upper(index: int) -> float:
+    """Upper bound (seconds) of a histogram bin."""
+    return _LATENCY_BASE * 2 ** (index / _LATENCY_BINS_PER_OCTAVE)
+
+
+class _TimeBucket:
+    """Aggregated outcomes of the calls made during one time slice."""
+
+    __slots__ = ("epoch", "calls", "failures", "slow", "latency")
+
+    def __init__(self, epoch: int):
+        self.epoch = epoch
+        self.calls = 0
+        self.failures = 0
+        self.slow = 0
+        self.latency: Dict[int, int] = {}
+
+
+class SlidingWindow:
+    """
+    Rolling window of call outcomes for one circuit breaker.
+
+    A count window keeps the last ``size`` calls; a time window keeps the
+    calls of the last ``size`` seconds in at most 60 time buckets. Both keep
+    running totals and a latency histogram, so recording is O(1) and rates
+    or percentiles never rescan the window. Snapshots are cached until the
+    window changes.
+    """
+
+    MAX_TIME_BUCKETS = 60
+
+    def __init__(
+        self,
+        window_type: str = "count",
+        size: int = 100,
+        slow_call_threshold: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a sliding window.
+
+        Args:
+            window_type: "count" or "time"
+            size: Number of calls (count) or seconds (time) to keep
+            slow_call_threshold: Seconds after which a call is slow (0 = never)
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.window_type = window_type
+        self.size = size
+        self.slow_call_threshold = slow_call_threshold
+        self._clock = clock
+
+        self._lock = Lock()
+        self._calls: Deque[Tuple[bool, bool, int]] = deque()
+        self._buckets: Deque[_TimeBucket] = deque()
+        self._bucket_count = min(size, self.MAX_TIME_BUCKETS)
+        self._bucket_width = size / self._bucket_count
+
+        self._total = 0
+        self._failures = 0
+        self._slow = 0
+        self._histogram: List[int] = [0] * _LATENCY_BINS
+
+        self._version = 0
+        self._snapshot_version = -1
+        self._snapshot: Dict[str, Any] = {}
+
+    @classmethod
+    def from_config(cls, config: CircuitBreakerConfig) -> "SlidingWindow":
+        """Create the window described by a breaker configuration."""
+        return cls(
+            window_type=config.sliding_window_type,
+            size=config.sliding_window_size,
+            slow_call_threshold=config.slow_call_duration_threshold,
+        )
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the window contents change."""
+        with self._lock:
+            self._expire()
+            return self._version
+
+    def record(self, success: bool, duration: float) -> None:
+        """
+        Record one completed call.
+
+        Args:
+            success: Whether the call succeeded
+            duration: Call duration in seconds
+        """
+        failed = not success
+        slow = self.slow_call_threshold > 0 and duration >= self.slow_call_threshold
+        index = _latency_bin(duration)
+
+        with self._lock:
+            if self.window_type == "count":
+                if len(self._calls) >= self.size:
+                    old_failed, old_slow, old_index = self._calls.popleft()
+                    self._total -= 1
+                    self._failures -= old_failed
+                    self._slow -= old_slow
+                    self._histogram[old_index] -= 1
+                self._calls.append((failed, slow, index))
+            else:
+                self._expire()
+                epoch = int(self._clock() / self._bucket_width)
+                if not self._buckets or self._buckets[-1].epoch != epoch:
+                    self._buckets.append(_TimeBucket(epoch))
+                bucket = self._buckets[-1]
+                bucket.calls += 1
+                bucket.failures += failed
+                bucket.slow += slow
+                bucket.latency[index] = bucket.latency.get(index, 0) + 1
+
+            self._total += 1
+            self._failures += failed
+            self._slow += slow
+            self._histogram[index] += 1
+            self._version += 1
+
+    def rates(self) -> Tuple[int, float, float]:
+        """
+        Current window totals.
+
+        Returns:
+            (calls, failure_rate, slow_call_rate)
+        """
+        with self._lock:
+            self._expire()
+            if self._total == 0:
+                return 0, 0.0, 0.0
+            return self._total, self._failures / self._total, self._slow / self._total
+
+    def percentiles(self, *quantiles: float) -> List[float]:
+        """
+        Approximate latency percentiles in seconds (upper bin bounds).
+
+        Args:
+            *quantiles: Quantiles in (0, 1], e.g. 0.5, 0.99
+
+        Returns:
+            One value per quantile (0.0 when the window is empty)
+        """
+        with self._lock:
+            self._expire()
+            return self._percentiles(quantiles)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Window statistics as a dictionary.
+
+        Returns:
+            Counts, rates and p50/p95/p99 latency in milliseconds
+        """
+        with self._lock:
+            self._expire()
+            if self._snapshot_version != self._version:
+                p50, p95, p99 = self._percentiles((0.5, 0.95, 0.99))
+                self._snapshot = {
+                    'type': self.window_type,
+                    'size': self.size,
+                    'calls': self._total,
+                    'failed_calls': self._failures,
+                    'slow_calls': self._slow,
+                    'failure_rate': self._failures / self._total if self._total else 0.0,
+                    'slow_call_rate': self._slow / self._total if self._total else 0.0,
+                    'latency_ms': {'p50': p50 * 1000, 'p95': p95 * 1000, 'p99': p99 * 1000},
+                }
+                self._snapshot_version = self._version
+            snapshot = dict(self._snapshot)
+            snapshot['latency_ms'] = dict(snapshot['latency_ms'])
+            return snapshot
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        with self._lock:
+            self._calls.clear()
+            self._buckets.clear()
+            self._total = self._failures = self._slow = 0
+            self._histogram = [0] * _LATENCY_BINS
+            self._version += 1
+
+    def _expire(self) -> None:
+        """Drop time buckets that have left the window (lock held)."""
+        if not self._buckets:
+            return
+        oldest = int(self._clock() / self._bucket_width) - self._bucket_count
+        while self._buckets and self._buckets[0].epoch <= oldest:
+            bucket = self._buckets.popleft()
+            self._total -= bucket.calls
+            self._failures -= bucket.failures
+            self._slow -= bucket.slow
+            for index, count in bucket.latency.items():
+                self._histogram[index] -= count
+            self._version += 1
+
+    def _percentiles(self, quantiles) -> List[float]:
+        """Walk the histogram once for all quantiles (lock held)."""
+        if self._total == 0:
+            return [0.0] * len(quantiles)
+
+        targets = sorted((max(1, math.ceil(q * self._total)), i) for i, q in enumerate(quantiles))
+        results = [0.0] * len(quantiles)
+        seen = 0
+        pending = 0
+        for index, count in enumerate(self._histogram):
+            if not count:
+                continue
+            seen += count
+            while pending < len(targets) and seen >= targets[pending][0]:
+                results[targets[pending][1]] = _latency_bin_upper(index)
+                pending += 1
+            if pending == len(targets):
+                break
+        return results
+
+
 @dataclass
 class CircuitBreakerStats:
     """
@@ -99,6 +377,7 @@ class CircuitBreakerStats:
         opened_at: When the circuit was opened (None if CLOSED)
         current_state: Current circuit state
         rejection_count: Number of calls rejected due to open circuit
+        window: Rolling window of recent call outcomes and latencies
     """
 
     total_calls: int = 0
@@ -111,9 +390,15 @@ class CircuitBreakerStats:
     opened_at: Optional[datetime] = None
     current_state: CircuitState = CircuitState.CLOSED
     rejection_count: int = 0
+    window: "SlidingWindow" = field(default_factory=lambda: SlidingWindow())
 
-    # Thread safety
-    _lock: Lock = field(default_factory=Lock)
+    # Thread safety (re-entrant: to_dict() reads the rate properties)
+    _lock: RLock = field(default_factory=RLock, repr=False, compare=False)
+
+    # to_dict() cache, invalidated by _version
+    _version: int = field(default=0, repr=False, compare=False)
+    _cache_key: Optional[int] = field(default=None, repr=False, compare=False)
+    _cache: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
 
     @property
     def success_rate(self) -> float:
@@ -147,26 +432,31 @@ class CircuitBreakerStats:
                 return None
             return (datetime.now() - self.opened_at).total_seconds()
 
-    def record_success(self) -> None:
-        """Record a successful call."""
+    def record_success(self, duration: float = 0.0) -> None:
+        """Record a successful call that took `duration` seconds."""
         with self._lock:
             self.total_calls += 1
             self.successful_calls += 1
             self.current_failures = 0
             self.last_success_time = datetime.now()
+            self._version += 1
+        self.window.record(True, duration)
 
-    def record_failure(self) -> None:
-        """Record a failed call."""
+    def record_failure(self, duration: float = 0.0) -> None:
+        """Record a failed call that took `duration` seconds."""
         with self._lock:
             self.total_calls += 1
             self.failed_calls += 1
             self.current_failures += 1
             self.last_failure_time = datetime.now()
+            self._version += 1
+        self.window.record(False, duration)
 
     def record_rejection(self) -> None:
         """Record a rejected call (circuit open)."""
         with self._lock:
             self.rejection_count += 1
+            self._version += 1
 
     def transition_to(self, new_state: CircuitState) -> None:
         """Record a state transition."""
@@ -174,6 +464,7 @@ class CircuitBreakerStats:
             if self.current_state != new_state:
                 self.state_transitions += 1
                 self.current_state = new_state
+                self._version += 1
 
                 # Track when circuit was opened
                 if new_state == CircuitState.OPEN:
@@ -182,24 +473,36 @@ class CircuitBreakerStats:
                     self.opened_at = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert stats to dictionary."""
+        """
+        Convert stats to dictionary.
+
+        The counter part is cached until the stats or window change, so
+        polling many idle breakers is cheap.
+        """
+        window = self.window.snapshot()
         with self._lock:
-            return {
-                'total_calls': self.total_calls,
-                'successful_calls': self.successful_calls,
-                'failed_calls': self.failed_calls,
-                'current_failures': self.current_failures,
-                'success_rate': self.success_rate,
-                'failure_rate': self.failure_rate,
-                'last_failure_time': self.last_failure_time.isoformat() if self.last_failure_time else None,
-                'last_success_time': self.last_success_time.isoformat() if self.last_success_time else None,
-                'state_transitions': self.state_transitions,
-                'opened_at': self.opened_at.isoformat() if self.opened_at else None,
-                'current_state': self.current_state.value,
-                'rejection_count': self.rejection_count,
-                'time_since_last_failure': self.time_since_last_failure,
-                'time_since_opened': self.time_since_opened,
-            }
+            if self._cache_key != self._version:
+                self._cache = {
+                    'total_calls': self.total_calls,
+                    'successful_calls': self.successful_calls,
+                    'failed_calls': self.failed_calls,
+                    'current_failures': self.current_failures,
+                    'success_rate': self.success_rate,
+                    'failure_rate': self.failure_rate,
+                    'last_failure_time': self.last_failure_time.isoformat() if self.last_failure_time else None,
+                    'last_success_time': self.last_success_time.isoformat() if self.last_success_time else None,
+                    'state_transitions': self.state_transitions,
+                    'opened_at': self.opened_at.isoformat() if self.opened_at else None,
+                    'current_state': self.current_state.value,
+                    'rejection_count': self.rejection_count,
+                }
+                self._cache_key = self._version
+
+            stats = dict(self._cache)
+            stats['time_since_last_failure'] = self.time_since_last_failure
+            stats['time_since_opened'] = self.time_since_opened
+            stats['window'] = window
+            return stats
 
     def reset(self) -> None:
         """Reset all statistics."""
@@ -213,6 +516,8 @@ class CircuitBreakerStats:
             self.state_transitions = 0
             self.opened_at = None
             self.rejection_count = 0
+            self._version += 1
+        self.window.reset()
 
 
 @dataclass
@@ -317,4 +622,4 @@ class CircuitBreakerPresets:
             )
 
         # Default
-        return CircuitBreakerConfig.default()
+        return CircuitBreakerPresets.default()
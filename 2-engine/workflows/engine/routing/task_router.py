@@ -2,17 +2,21 @@
 Task Router for Blackbox5
 
 Intelligently routes tasks to appropriate agents based on
-capabilities, complexity, and workload.
+capabilities, complexity, and workload. route_many assigns bursts of
+tasks in one pass, spreading them by load.
 """
 
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Optional, Set, Tuple, Any
+from collections import Counter
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
 
 from agents.framework.base_agent import BaseAgent, AgentTask
-from routing.complexity import TaskComplexityAnalyzer, ComplexityLevel
+from workflows.engine.pipeline.complexity import TaskComplexityAnalyzer, ComplexityLevel
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +134,10 @@ class TaskRouter:
     2. Workload balancing
     3. Performance-based routing
     4. Complexity-based routing
+
+    Available agents are kept in a capability -> agents inverted index,
+    updated on register/unregister and status changes, so finding the
+    candidates for a task only touches agents sharing a capability with it.
     """
 
     def __init__(
@@ -150,6 +158,14 @@ class TaskRouter:
         self._task_history: List[Tuple[str, str, bool]] = []
         self._lock = asyncio.Lock()
 
+        # Lowercased capabilities per agent; capability -> available agents
+        self._agent_capabilities: Dict[str, FrozenSet[str]] = {}
+        self._capability_index: Dict[str, Set[str]] = {}
+        self._available: Set[str] = set()
+        # Registration order, used to break score ties
+        self._order: Dict[str, int] = {}
+        self._registrations = itertools.count()
+
     async def register_agent(
         self,
         agent: BaseAgent,
@@ -170,7 +186,12 @@ class TaskRouter:
         )
 
         async with self._lock:
+            self._unindex_agent(agent.name)
             self._agents[agent.name] = caps
+            self._agent_capabilities[agent.name] = frozenset(cap.lower() for cap in caps.capabilities)
+            if agent.name not in self._order:
+                self._order[agent.name] = next(self._registrations)
+            self._index_agent(agent.name)
 
         logger.info(
             f"Registered agent: {agent.name} "
@@ -186,7 +207,10 @@ class TaskRouter:
         """
         async with self._lock:
             if agent_name in self._agents:
+                self._unindex_agent(agent_name)
                 del self._agents[agent_name]
+                del self._agent_capabilities[agent_name]
+                del self._order[agent_name]
 
         logger.info(f"Unregistered agent: {agent_name}")
 
@@ -207,95 +231,227 @@ class TaskRouter:
             complexity_score = self.complexity_analyzer.analyze(task.description)
             task.complexity = complexity_score.level
 
-        candidates = await self._get_candidates(task)
+        required = self._required_capabilities(task)
+        total = len(required)
+        ranked = heapq.nlargest(4, (
+            (self._calculate_score(name, matched, total), -self._order[name], name)
+            for name, matched in self._match_counts(required).items()
+        ))
 
-        if not candidates:
+        if not ranked:
             raise ValueError(
                 f"No available agents for task with requirements: "
                 f"{task.required_capabilities}"
             )
 
-        scored_candidates = await self._score_candidates(task, candidates)
-        best_agent, score = scored_candidates[0]
-
-        confidence = min(1.0, score / 100.0)
-        alternatives = [agent for agent, _ in scored_candidates[1:4]]
-
-        reasoning = self._build_reasoning(task, best_agent, score)
-
-        return RoutingDecision(
-            agent_name=best_agent,
-            confidence=confidence,
-            reasoning=reasoning,
-            alternative_agents=alternatives,
-        )
-
-    async def _get_candidates(self, task: Task) -> List[str]:
-        """Get list of candidate agents for a task."""
-        async with self._lock:
-            candidates = []
-            for name, caps in self._agents.items():
-                if not caps.available:
-                    continue
+        return self._decision(task, ranked[0][2], ranked[0][0], [name for _, _, name in ranked[1:]])
 
-                # If no capabilities required, all available agents are candidates
-                if not task.required_capabilities:
-                    candidates.append(name)
-                    continue
+    async def route_many(
+        self,
+        tasks: List[Task],
+        reserve: bool = False
+    ) -> List[Optional[RoutingDecision]]:
+        """
+        Route a batch of tasks with load-aware assignment.
 
-                # Check if agent has ANY matching capability (partial match)
-                agent_caps = set(cap.lower() for cap in caps.capabilities)
-                required = set(req.lower() for req in task.required_capabilities)
-                intersection = agent_caps & required
+        Tasks are assigned in priority order (highest first). Each assignment
+        counts against the chosen agent's load for the rest of the batch, so
+        a burst of similar tasks spreads over the best agents instead of all
+        landing on one, and agents stop receiving tasks at max_tasks.
 
-                # Include agents that have at least one matching capability
-                # or use can_handle for exact match (all required capabilities)
-                if intersection or required.issubset(agent_caps):
-                    candidates.append(name)
+        Candidates are scored once per distinct capability requirement and
+        kept in a heap; only agents whose load changed are re-scored.
 
-        return candidates
+        Args:
+            tasks: Tasks to route
+            reserve: Also add the assigned tasks to the agents' current load
+                (as update_agent_status(agent, +1) would)
 
-    async def _score_candidates(
+        Returns:
+            One RoutingDecision per task, in input order; None for tasks no
+            agent had room for
+        """
+        unrated = [task for task in tasks if task.complexity is None]
+        if unrated:
+            scores = self.complexity_analyzer.analyze_many(task.description for task in unrated)
+            for task, complexity_score in zip(unrated, scores):
+                task.complexity = complexity_score.level
+
+        assigned: Dict[str, int] = {}
+        full: Set[str] = set()  # agents that reached max_tasks in this batch
+        versions = dict.fromkeys(self._available, 0)
+        load_scores = {name: self._load_score(name) for name in self._available}
+        queues: Dict[FrozenSet[str], List[Tuple[float, int, str, int, int]]] = {}
+        decisions: List[Optional[RoutingDecision]] = [None] * len(tasks)
+
+        for index in sorted(range(len(tasks)), key=lambda i: -tasks[i].priority):
+            if len(full) == len(versions):
+                break
+            task = tasks[index]
+            required = self._required_capabilities(task)
+            total = len(required)
+
+            queue = queues.get(required)
+            if queue is None:
+                capability_scores = [self._capability_score(matched, total) for matched in range(total + 1)]
+                # Entries: (-score, registration order, agent, load version, matched)
+                queue = [
+                    (-(capability_scores[matched] + load_scores[name]),
+                     self._order[name], name, versions[name], matched)
+                    for name, matched in self._match_counts(required).items()
+                    if name not in full
+                ]
+                heapq.heapify(queue)
+                queues[required] = queue
+
+            top = self._pop_current(queue, total, versions, load_scores, full, 4)
+            if not top:
+                continue
+            for entry in top:
+                heapq.heappush(queue, entry)
+
+            best = top[0][2]
+            assigned[best] = assigned.get(best, 0) + 1
+            versions[best] += 1
+            load_scores[best] = self._load_score(best, assigned[best])
+            if not self._has_room(best, assigned[best]):
+                full.add(best)
+            decisions[index] = self._decision(task, best, -top[0][0], [entry[2] for entry in top[1:]])
+
+        if reserve:
+            for name, count in assigned.items():
+                self._agents[name].current_tasks += count
+                self._index_agent(name)
+
+        return decisions
+
+    def _pop_current(
         self,
-        task: Task,
-        candidates: List[str]
-    ) -> List[Tuple[str, float]]:
-        """Score candidates for a task."""
-        async with self._lock:
-            agent_caps = {name: self._agents[name] for name in candidates}
-
-        scores = []
-        for name, caps in agent_caps.items():
-            score = await self._calculate_score(task, caps)
-            scores.append((name, score))
+        queue: List[Tuple[float, int, str, int, int]],
+        total: int,
+        versions: Dict[str, int],
+        load_scores: Dict[str, float],
+        full: Set[str],
+        count: int
+    ) -> List[Tuple[float, int, str, int, int]]:
+        """
+        Pop up to count best entries scored at the agents' current batch load.
 
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores
+        An entry scored before its agent took a task is re-scored (assigning
+        only lowers scores, so the heap order stays valid) or dropped once the
+        agent is full.
+        """
+        current = []
+        while queue and len(current) < count:
+            _, order, name, version, matched = queue[0]
+            if version != versions[name]:
+                if name in full:
+                    heapq.heappop(queue)
+                else:
+                    heapq.heapreplace(queue, (
+                        -(self._capability_score(matched, total) + load_scores[name]),
+                        order, name, versions[name], matched
+                    ))
+                continue
+            current.append(heapq.heappop(queue))
+        return current
+
+    @staticmethod
+    def _required_capabilities(task: Task) -> FrozenSet[str]:
+        """Lowercased required capabilities of a task."""
+        return frozenset(req.lower() for req in task.required_capabilities)
+
+    def _match_counts(self, required: FrozenSet[str]) -> Dict[str, int]:
+        """
+        Available agents sharing at least one required capability.
 
-    async def _calculate_score(
+        Returns:
+            Agent name -> number of required capabilities it has (every
+            available agent, with 0, when nothing is required)
+        """
+        if not required:
+            return dict.fromkeys(self._available, 0)
+
+        counts: Counter = Counter()
+        for capability in required:
+            agents = self._capability_index.get(capability)
+            if agents:
+                counts.update(agents)
+        return counts
+
+    def _has_room(self, agent_name: str, extra_tasks: int = 0) -> bool:
+        """Whether an agent can take another task on top of extra_tasks."""
+        caps = self._agents[agent_name]
+        return caps.current_tasks + extra_tasks < caps.max_tasks
+
+    def _calculate_score(
         self,
-        task: Task,
-        caps: AgentCapabilities
+        agent_name: str,
+        matched: int,
+        total: int,
+        extra_tasks: int = 0
     ) -> float:
-        """Calculate routing score for an agent."""
-        score = 0.0
-
-        if task.required_capabilities:
-            matched = len(task.required_capabilities & set(caps.capabilities))
-            total = len(task.required_capabilities)
-            score += (matched / total) * 40
-        else:
-            score += 20
-
-        if caps.available:
-            availability_score = (1 - caps.utilization) * 30
-            score += availability_score
-
+        """Calculate routing score for an agent (extra_tasks: load assigned in this batch)."""
+        return self._capability_score(matched, total) + self._load_score(agent_name, extra_tasks)
+
+    @staticmethod
+    def _capability_score(matched: int, total: int) -> float:
+        """Score for matching `matched` of `total` required capabilities."""
+        if total:
+            return (matched / total) * 40
+        return 20.0
+
+    def _load_score(self, agent_name: str, extra_tasks: int = 0) -> float:
+        """Availability, load balance and success-rate part of the score."""
+        caps = self._agents[agent_name]
+        utilization = (caps.current_tasks + extra_tasks) / caps.max_tasks
+
+        # Candidates are always available
+        score = (1 - utilization) * 30
         score += caps.success_rate * 20
-        score += (1 - caps.utilization) * 10
+        score += (1 - utilization) * 10
 
         return score
 
+    def _index_agent(self, agent_name: str) -> None:
+        """Sync an agent's place in the capability index with its availability."""
+        if not self._agents[agent_name].available:
+            self._unindex_agent(agent_name)
+            return
+
+        if agent_name not in self._available:
+            self._available.add(agent_name)
+            for capability in self._agent_capabilities[agent_name]:
+                self._capability_index.setdefault(capability, set()).add(agent_name)
+
+    def _unindex_agent(self, agent_name: str) -> None:
+        """Remove an agent from the capability index."""
+        if agent_name not in self._available:
+            return
+
+        self._available.discard(agent_name)
+        for capability in self._agent_capabilities[agent_name]:
+            agents = self._capability_index.get(capability)
+            if agents is not None:
+                agents.discard(agent_name)
+                if not agents:
+                    del self._capability_index[capability]
+
+    def _decision(
+        self,
+        task: Task,
+        agent_name: str,
+        score: float,
+        alternatives: List[str]
+    ) -> RoutingDecision:
+        """Build the RoutingDecision for a chosen agent."""
+        return RoutingDecision(
+            agent_name=agent_name,
+            confidence=min(1.0, score / 100.0),
+            reasoning=self._build_reasoning(task, agent_name, score),
+            alternative_agents=alternatives,
+        )
+
     def _build_reasoning(
         self,
         task: Task,
@@ -330,6 +486,7 @@ class TaskRouter:
 
             caps = self._agents[agent_name]
             caps.current_tasks += task_change
+            self._index_agent(agent_name)
 
             if success is not None:
                 alpha = 0.2
@@ -360,6 +517,7 @@ class TaskRouter:
             if agent_name in self._agents:
                 caps = self._agents[agent_name]
                 caps.current_tasks = max(0, caps.current_tasks - 1)
+                self._index_agent(agent_name)
 
                 # Update success rate with exponential moving average
                 alpha = 0.2
@@ -0,0 +1,214 @@
+"""
+Checkpoint Journal - Append-Only Workflow Checkpoints
+
+Instead of rewriting the whole ``{workflow_id}.json`` checkpoint after every
+step, the journal appends one compact JSON line per step transition to
+``{workflow_id}.journal``. Each record is fsynced before ``append`` returns
+(batching fsyncs is opt-in, at the cost of losing the last unsynced steps on
+a power failure), and the journal is periodically compacted into a snapshot
+with the same layout as the classic checkpoint file, so loading is
+"snapshot + replay of the tail". A record torn by a crash is cut off the
+journal on load, so later appends start on a fresh line.
+
+Every record carries the full state of one step, so replaying a record that
+is already reflected in the snapshot (e.g. after a crash mid-compaction) is
+harmless.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, IO, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointJournal:
+    """
+    Per-workflow append-only checkpoint log with snapshot compaction.
+
+    Attributes:
+        checkpoint_dir: Directory holding snapshots and journals
+        fsync_every: Number of appended records between fsyncs
+        compact_every: Number of journal records before compaction is due
+    """
+
+    SNAPSHOT_SUFFIX = ".json"
+    JOURNAL_SUFFIX = ".journal"
+
+    def __init__(self, checkpoint_dir: Path, fsync_every: int = 1, compact_every: int = 256):
+        """
+        Initialize the journal.
+
+        Args:
+            checkpoint_dir: Directory holding snapshots and journals
+            fsync_every: Records between fsyncs (1 = fsync every record);
+                higher values batch fsyncs, but a crash can then lose up to
+                fsync_every - 1 step transitions, which are re-run on resume
+            compact_every: Journal length that triggers compaction
+        """
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.fsync_every = max(1, fsync_every)
+        self.compact_every = max(1, compact_every)
+
+        self._handles: Dict[str, IO[str]] = {}
+        self._unsynced: Dict[str, int] = {}
+        self._records: Dict[str, int] = {}
+
+    def snapshot_path(self, workflow_id: str) -> Path:
+        """Path of the compacted snapshot for a workflow."""
+        return self.checkpoint_dir / f"{workflow_id}{self.SNAPSHOT_SUFFIX}"
+
+    def journal_path(self, workflow_id: str) -> Path:
+        """Path of the append-only journal for a workflow."""
+        return self.checkpoint_dir / f"{workflow_id}{self.JOURNAL_SUFFIX}"
+
+    def append(self, workflow_id: str, record: Dict[str, Any]) -> bool:
+        """
+        Append one step-transition record.
+
+        Args:
+            workflow_id: Workflow the record belongs to
+            record: Step state (must contain the step ``id``)
+
+        Returns:
+            True if the journal is long enough to be compacted
+        """
+        handle = self._handle(workflow_id)
+        handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        handle.flush()
+
+        self._records[workflow_id] = self._records.get(workflow_id, 0) + 1
+        self._unsynced[workflow_id] = self._unsynced.get(workflow_id, 0) + 1
+        if self._unsynced[workflow_id] >= self.fsync_every:
+            self.sync(workflow_id)
+
+        return self._records[workflow_id] >= self.compact_every
+
+    def sync(self, workflow_id: str) -> None:
+        """Force buffered records of a workflow to disk."""
+        handle = self._handles.get(workflow_id)
+        if handle is not None and self._unsynced.get(workflow_id):
+            os.fsync(handle.fileno())
+        self._unsynced[workflow_id] = 0
+
+    def compact(self, workflow_id: str, snapshot: Dict[str, Any]) -> None:
+        """
+        Replace the journal with a snapshot of the full checkpoint.
+
+        The snapshot is written atomically (temp file + rename) before the
+        journal is truncated, so a crash in between only leaves records that
+        replay to the same state.
+
+        Args:
+            workflow_id: Workflow to compact
+            snapshot: Full checkpoint data (classic checkpoint layout)
+        """
+        snapshot_path = self.snapshot_path(workflow_id)
+        temp_path = snapshot_path.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            f.write(json.dumps(snapshot, separators=(",", ":")))
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.replace(snapshot_path)
+
+        self._close(workflow_id)
+        journal_path = self.journal_path(workflow_id)
+        if journal_path.exists():
+            journal_path.unlink()
+        self._records[workflow_id] = 0
+
+        logger.debug(f"Compacted checkpoint journal for {workflow_id}")
+
+    def load(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a checkpoint by replaying the journal tail over the snapshot.
+
+        Args:
+            workflow_id: Workflow to load
+
+        Returns:
+            Checkpoint data in the classic layout, or None if nothing exists
+        """
+        snapshot_path = self.snapshot_path(workflow_id)
+        journal_path = self.journal_path(workflow_id)
+        if not snapshot_path.exists() and not journal_path.exists():
+            return None
+
+        if snapshot_path.exists():
+            data = json.loads(snapshot_path.read_text())
+        else:
+            data = {
+                'workflow_id': workflow_id,
+                'workflow_name': '',
+                'completed_steps': [],
+                'steps': [],
+                'timestamp': None,
+            }
+
+        steps = {step['id']: step for step in data.get('steps', [])}
+        completed = list(data.get('completed_steps', []))
+        completed_set = set(completed)
+        records = 0
+
+        if journal_path.exists():
+            with open(journal_path, "rb+") as f:
+                valid_end = 0
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("record has no line end")
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn final write from a crash; everything before it is valid.
+                        # Cut it off, or the next append would extend the torn line
+                        logger.warning(f"Dropping truncated checkpoint record for {workflow_id}")
+                        self._close(workflow_id)
+                        f.truncate(valid_end)
+                        break
+                    valid_end += len(line)
+                    records += 1
+
+                    step_completed = record.pop('completed', False)
+                    timestamp = record.pop('timestamp', None)
+                    steps.setdefault(record['id'], {}).update(record)
+                    if step_completed and record['id'] not in completed_set:
+                        completed_set.add(record['id'])
+                        completed.append(record['id'])
+                    if timestamp:
+                        data['timestamp'] = timestamp
+
+        data['steps'] = list(steps.values())
+        data['completed_steps'] = completed
+        self._records[workflow_id] = records
+        return data
+
+    def delete(self, workflow_id: str) -> None:
+        """Remove the snapshot and journal of a finished workflow."""
+        self._close(workflow_id)
+        self._records.pop(workflow_id, None)
+        for path in (self.snapshot_path(workflow_id), self.journal_path(workflow_id)):
+            if path.exists():
+                path.unlink()
+
+    def close(self) -> None:
+        """Sync and close every open journal."""
+        for workflow_id in list(self._handles):
+            self._close(workflow_id)
+
+    def _handle(self, workflow_id: str) -> IO[str]:
+        handle = self._handles.get(workflow_id)
+        if handle is None:
+            handle = open(self.journal_path(workflow_id), "a")
+            self._handles[workflow_id] = handle
+        return handle
+
+    def _close(self, workflow_id: str) -> None:
+        handle = self._handles.pop(workflow_id, None)
+        if handle is not None:
+            if self._unsynced.get(workflow_id):
+                handle.flush()
+                os.fsync(handle.fileno())
+            handle.close()
+        self._unsynced.pop(workflow_id, None)
@@ -7,15 +7,20 @@ Supports both in-memory and Redis-backed implementations.
 
 import json
 import asyncio
+import fnmatch
 import logging
+import time
+from collections import deque
 from typing import (
     Callable,
+    Deque,
     Dict,
     List,
     Optional,
     Any,
     Awaitable,
-    Set
+    Set,
+    Tuple
 )
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
@@ -46,6 +51,11 @@ class EventType(str, Enum):
     SYSTEM_SHUTDOWN = "system.shutdown"
     SYSTEM_ERROR = "system.error"
 
+    # Circuit breaker events
+    CIRCUIT_OPENED = "circuit.opened"
+    CIRCUIT_CLOSED = "circuit.closed"
+    CIRCUIT_HALF_OPEN = "circuit.half_open"
+
     # Custom events
     CUSTOM = "custom"
 
@@ -118,6 +128,20 @@ class EventBusConfig:
     # Performance settings
     batch_size: int = 100
     flush_interval: float = 1.0  # seconds
+    num_workers: int = 2  # Dispatch workers draining the bus queue
+    subscriber_queue_size: int = 1000  # Per-subscription backlog bound
+    overflow_policy: str = "block"  # "block" (backpressure) or "drop_oldest"
+    latency_window: int = 10000  # Delivery latency samples kept for percentiles
+    stop_timeout: float = 10.0  # seconds stop() waits for queued events to be delivered
+
+    # Redis transport settings
+    publish_batch_window: float = 0.002  # seconds to coalesce publishes (0 = no batching)
+    redis_pool_size: int = 50  # Max connections in the shared per-process pool
+    use_streams: bool = False  # Redis Streams (XADD/XREADGROUP) instead of pub/sub
+    stream_name: str = "events"
+    stream_maxlen: int = 100000  # Approximate cap on stream length
+    consumer_group: str = "blackbox5"
+    consumer_name: Optional[str] = None  # Defaults to a per-bus unique name
 
     def __post_init__(self):
         """Normalize alias parameters."""
@@ -132,11 +156,92 @@ class EventBusConfig:
             self.redis_password = self.password
 
 
+@dataclass(eq=False)
+class Subscription:
+    """
+    A handler subscribed to an event pattern.
+
+    Each subscription has its own backlog queue and consumer task, so a slow
+    handler only backs up its own queue instead of stalling the bus.
+    ``pending`` counts events published to the subscription but not yet
+    taken by its consumer; ``has_space`` is set whenever it is below
+    ``limit``.
+    """
+
+    pattern: str
+    handler: EventHandler
+    limit: int
+    queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    has_space: asyncio.Event = field(default_factory=asyncio.Event)
+    consumer: Optional[asyncio.Task] = None
+    pending: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    failed: int = 0
+
+    def matches(self, event_type: str) -> bool:
+        """Check whether an event type matches this subscription's pattern."""
+        return topic_matches(self.pattern, event_type)
+
+
+@dataclass(eq=False)
+class _Delivery:
+    """
+    Completion of one event across the subscriptions it was handed to.
+
+    ``done`` resolves once every subscription's handler has returned (or
+    the overflow policy dropped the event for it).
+    """
+
+    remaining: int
+    done: asyncio.Future
+
+    def complete(self) -> None:
+        self.remaining -= 1
+        if self.remaining <= 0 and not self.done.done():
+            self.done.set_result(None)
+
+
+def topic_matches(pattern: str, event_type: str) -> bool:
+    """
+    Match an event type against a subscription pattern.
+
+    Supported patterns:
+        - exact event type ("task.completed")
+        - ".*" or "*" for every event
+        - prefix wildcards ("task.*", "agent.*")
+        - shell-style globs ("*.failed", "task.?tarted", "agent.[sc]*")
+    """
+    if pattern in (".*", "*"):
+        return True
+    if not _is_glob(pattern):
+        return pattern == event_type
+    return fnmatch.fnmatchcase(event_type, pattern)
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(char in pattern for char in "*?[")
+
+
 class EventBus:
     """
     In-memory event bus implementation.
 
-    Provides simple async pub/sub messaging within a single process.
+    Provides async pub/sub messaging within a single process.
+
+    Dispatch engine:
+    - ``num_workers`` dispatch workers drain the bus queue in batches of up
+      to ``batch_size`` events
+    - every subscription has a backlog of up to ``subscriber_queue_size``
+      events and its own consumer task (handlers of one subscription see
+      events in publish order)
+    - when a backlog is full, ``overflow_policy`` either makes publishers of
+      events matching that subscription wait ("block"; other topics are
+      unaffected) or drops the subscription's oldest event ("drop_oldest");
+      a handler publishing to its own full backlog gets its event dropped
+      for that subscription, since waiting on itself would never return
+    - the subscriber table is copy-on-write and dispatch never awaits, so
+      dispatch takes no lock and batches are fanned out atomically
     """
 
     def __init__(self, config: Optional[EventBusConfig] = None):
@@ -147,14 +252,23 @@ class EventBus:
             config: Event bus configuration
         """
         self.config = config or EventBusConfig()
-        self._subscribers: Dict[str, List[EventHandler]] = {}
+        # Copy-on-write: replaced wholesale on (un)subscribe, never mutated
+        self._subscribers: Dict[str, Tuple[Subscription, ...]] = {}
+        self._glob_patterns: Tuple[str, ...] = ()
+        self._match_cache: Dict[str, Tuple[Subscription, ...]] = {}
         self._event_queue: asyncio.Queue = asyncio.Queue(
             maxsize=self.config.max_queue_size
         )
         self._running = False
-        self._worker_task: Optional[asyncio.Task] = None
+        self._worker_tasks: List[asyncio.Task] = []
         self._lock = asyncio.Lock()
 
+        # Statistics
+        self._started_at: Optional[float] = None
+        self._published = 0
+        self._dropped = 0
+        self._latencies: Deque[float] = deque(maxlen=self.config.latency_window)
+
         logger.info("EventBus initialized (in-memory mode)")
 
     async def subscribe(
@@ -166,105 +280,272 @@ class EventBus:
         Subscribe to events of a specific type.
 
         Args:
-            event_type: Type of event to subscribe to (use ".*" for all)
+            event_type: Event type or pattern to subscribe to (exact type,
+                ".*" for all, or a glob such as "task.*")
             handler: Async function to call when event occurs
 
         Returns:
             Unsubscribe function
         """
+        subscription = Subscription(
+            pattern=event_type,
+            handler=handler,
+            limit=max(1, self.config.subscriber_queue_size),
+        )
+        subscription.has_space.set()
+
         async with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
+            subscribers = dict(self._subscribers)
+            subscribers[event_type] = subscribers.get(event_type, ()) + (subscription,)
+            self._set_subscribers(subscribers)
 
-            self._subscribers[event_type].append(handler)
+            if self._running:
+                self._start_consumer(subscription)
 
             logger.debug(f"Subscribed to {event_type}: {handler.__name__}")
 
         async def unsubscribe():
             async with self._lock:
-                if event_type in self._subscribers:
-                    self._subscribers[event_type].remove(handler)
+                if subscription in self._subscribers.get(event_type, ()):
+                    subscribers = dict(self._subscribers)
+                    remaining = tuple(
+                        s for s in subscribers[event_type] if s is not subscription
+                    )
+                    if remaining:
+                        subscribers[event_type] = remaining
+                    else:
+                        del subscribers[event_type]
+                    self._set_subscribers(subscribers)
+
+            if subscription.consumer:
+                subscription.consumer.cancel()
+            # Release publishers waiting on this subscription's backlog
+            subscription.limit = float("inf")
+            subscription.has_space.set()
 
         return unsubscribe
 
+    def _set_subscribers(self, subscribers: Dict[str, Tuple[Subscription, ...]]) -> None:
+        """Publish a new subscriber table and invalidate the match cache."""
+        self._subscribers = subscribers
+        self._glob_patterns = tuple(
+            pattern for pattern in subscribers
+            if pattern in (".*", "*") or _is_glob(pattern)
+        )
+        self._match_cache = {}
+
+    def _match(self, event_type: str) -> Tuple[Subscription, ...]:
+        """
+        Find subscriptions matching an event type.
+
+        Results are cached per event type until the subscriber table changes.
+        """
+        # Read both references once; writers replace them, never mutate
+        cache = self._match_cache
+        matches = cache.get(event_type)
+        if matches is None:
+            subscribers = self._subscribers
+            matches = subscribers.get(event_type, ())
+            for pattern in self._glob_patterns:
+                if pattern != event_type and topic_matches(pattern, event_type):
+                    matches += subscribers[pattern]
+            cache[event_type] = matches
+        return matches
+
     async def publish(self, event: Event) -> None:
         """
         Publish an event to all subscribers.
 
+        With the "block" overflow policy this waits while any matching
+        subscription's backlog is full (backpressure per subscriber; events
+        for other subscribers are unaffected). A handler publishing an event
+        that matches its own subscription cannot wait for that backlog,
+        which only its own consumer drains; if it is full the event is
+        dropped for that subscription and still delivered to the others.
+
         Args:
             event: Event to publish
         """
+        matching = None
+        if self._running:
+            matching = self._match(event.type)
+            if self.config.overflow_policy == "block":
+                current = asyncio.current_task()
+                own_full = None
+                for subscription in matching:
+                    if subscription.consumer is current and subscription.pending >= subscription.limit:
+                        own_full = subscription
+                        continue
+                    while subscription.pending >= subscription.limit:
+                        subscription.has_space.clear()
+                        await subscription.has_space.wait()
+                if own_full is not None:
+                    own_full.dropped += 1
+                    logger.warning(
+                        f"Dropping {event.type} for {own_full.handler.__name__}: "
+                        f"published from its own handler while its backlog is full"
+                    )
+                    matching = tuple(s for s in matching if s is not own_full)
+            for subscription in matching:
+                subscription.pending += 1
+
         try:
-            await self._event_queue.put(event)
+            self._event_queue.put_nowait((event, time.perf_counter(), matching))
+            self._published += 1
             logger.debug(f"Event queued: {event.type} ({event.event_id})")
         except asyncio.QueueFull:
+            for subscription in matching or ():
+                subscription.pending -= 1
+            self._dropped += 1
             logger.error(f"Event queue full, dropping event: {event.type}")
 
-    async def _process_event(self, event: Event) -> None:
+    async def _process_event(
+        self,
+        event: Event,
+        published_at: Optional[float] = None,
+        matching: Optional[Tuple[Subscription, ...]] = None,
+        delivered: Optional[asyncio.Future] = None
+    ) -> None:
         """
         Process a single event by notifying all subscribers.
 
+        While the bus is running the event is handed to each matching
+        subscription's backlog; otherwise handlers are called directly.
+        This never awaits while the bus is running, so a batch is fanned out
+        atomically and per-subscription ordering holds across workers.
+
         Args:
             event: Event to process
+            published_at: perf_counter() timestamp of publication
+            matching: Subscriptions reserved by publish(), if any
+            delivered: Future resolved once every matching handler has
+                returned (not if the bus stops before delivering)
         """
-        # Find matching subscribers
-        matching_handlers: List[EventHandler] = []
+        if published_at is None:
+            published_at = time.perf_counter()
 
-        async with self._lock:
-            # Exact match
-            if event.type in self._subscribers:
-                matching_handlers.extend(self._subscribers[event.type])
+        if not self._running:
+            await asyncio.gather(
+                *(self._deliver(subscription, event, published_at)
+                  for subscription in self._match(event.type)),
+                return_exceptions=True
+            )
+            if delivered is not None and not delivered.done():
+                delivered.set_result(None)
+            return
+
+        if matching is None:
+            matching = self._match(event.type)
+            for subscription in matching:
+                subscription.pending += 1
 
-            # Wildcard match
-            if ".*" in self._subscribers:
-                matching_handlers.extend(self._subscribers[".*"])
+        delivery = None
+        if delivered is not None:
+            delivery = _Delivery(len(matching), delivered)
+            if not matching:
+                delivery.complete()
 
-        # Notify all handlers concurrently
-        if matching_handlers:
-            tasks = [
-                self._safe_call(handler, event)
-                for handler in matching_handlers
-            ]
-            await asyncio.gather(*tasks, return_exceptions=True)
+        for subscription in matching:
+            self._enqueue(subscription, (event, published_at, delivery))
 
-    async def _safe_call(self, handler: EventHandler, event: Event) -> None:
+    def _enqueue(
+        self,
+        subscription: Subscription,
+        item: Tuple[Event, float, Optional[_Delivery]]
+    ) -> None:
+        """
+        Hand an event to a subscription's backlog, applying "drop_oldest".
+
+        Args:
+            subscription: Target subscription
+            item: (event, published_at, delivery) triple
         """
-        Safely call an event handler.
+        queue = subscription.queue
+        if (
+            self.config.overflow_policy == "drop_oldest"
+            and queue.qsize() >= subscription.limit
+        ):
+            _, _, dropped = queue.get_nowait()
+            queue.task_done()
+            subscription.pending -= 1
+            subscription.dropped += 1
+            if dropped is not None:
+                dropped.complete()
+        queue.put_nowait(item)
+
+    async def _deliver(self, subscription: Subscription, event: Event, published_at: float) -> None:
+        """
+        Call a subscription's handler, recording latency and errors.
 
         Args:
-            handler: Handler function
-            event: Event to pass to handler
+            subscription: Subscription to deliver to
+            event: Event to deliver
+            published_at: perf_counter() timestamp of publication
         """
+        self._latencies.append(time.perf_counter() - published_at)
         try:
-            await handler(event)
+            await subscription.handler(event)
+            subscription.delivered += 1
         except Exception as e:
+            subscription.failed += 1
             logger.error(
-                f"Error in event handler {handler.__name__}: {e}",
+                f"Error in event handler {subscription.handler.__name__}: {e}",
                 exc_info=True
             )
 
+    async def _consume(self, subscription: Subscription) -> None:
+        """
+        Consumer loop delivering one subscription's events in order.
+
+        Args:
+            subscription: Subscription to consume for
+        """
+        queue = subscription.queue
+        while True:
+            event, published_at, delivery = await queue.get()
+            subscription.pending -= 1
+            if subscription.pending < subscription.limit:
+                subscription.has_space.set()
+            try:
+                await self._deliver(subscription, event, published_at)
+                if delivery is not None:
+                    delivery.complete()
+            finally:
+                queue.task_done()
+
+    def _start_consumer(self, subscription: Subscription) -> None:
+        if subscription.consumer is None or subscription.consumer.done():
+            subscription.consumer = asyncio.create_task(self._consume(subscription))
+
     async def _event_loop(self) -> None:
         """
-        Main event processing loop.
+        Dispatch worker: drain the bus queue in batches and fan events out.
         """
-        logger.info("Event loop started")
+        logger.debug("Event dispatch worker started")
 
+        batch_size = max(1, self.config.batch_size)
         while self._running:
             try:
-                # Wait for event with timeout
-                event = await asyncio.wait_for(
-                    self._event_queue.get(),
-                    timeout=self.config.flush_interval
-                )
-                await self._process_event(event)
+                batch = [await self._event_queue.get()]
+                while len(batch) < batch_size:
+                    try:
+                        batch.append(self._event_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                try:
+                    for event, published_at, matching in batch:
+                        await self._process_event(event, published_at, matching)
+                finally:
+                    for _ in batch:
+                        self._event_queue.task_done()
 
-            except asyncio.TimeoutError:
-                # Timeout is expected, continue loop
-                continue
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Error in event loop: {e}", exc_info=True)
 
-        logger.info("Event loop stopped")
+        logger.debug("Event dispatch worker stopped")
 
     async def start(self) -> None:
         """
@@ -275,41 +556,91 @@ class EventBus:
             return
 
         self._running = True
-        self._worker_task = asyncio.create_task(self._event_loop())
+        self._started_at = time.perf_counter()
+
+        for subscriptions in self._subscribers.values():
+            for subscription in subscriptions:
+                self._start_consumer(subscription)
+
+        self._worker_tasks = [
+            asyncio.create_task(self._event_loop())
+            for _ in range(max(1, self.config.num_workers))
+        ]
 
-        logger.info("EventBus started")
+        logger.info(f"EventBus started ({len(self._worker_tasks)} dispatch workers)")
 
     async def stop(self) -> None:
         """
-        Stop the event bus.
+        Stop the event bus, delivering events that were already published.
+
+        Delivery gets up to ``stop_timeout`` seconds; events still queued
+        after that (e.g. behind a hung handler) are dropped, and the
+        dispatch workers and consumers are cancelled either way.
         """
         if not self._running:
             return
 
+        subscriptions = [s for subs in self._subscribers.values() for s in subs]
+        try:
+            await asyncio.wait_for(self._drain(subscriptions), self.config.stop_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"EventBus stop timed out after {self.config.stop_timeout}s, "
+                f"dropping undelivered events"
+            )
+
         self._running = False
 
-        # Wait for worker task
-        if self._worker_task:
-            self._worker_task.cancel()
-            try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                pass
+        tasks = list(self._worker_tasks)
+        tasks += [s.consumer for s in subscriptions if s.consumer]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Process remaining events
-        while not self._event_queue.empty():
-            event = await self._event_queue.get()
-            await self._process_event(event)
+        self._worker_tasks = []
+        self._dropped += self._discard(self._event_queue)
+        for subscription in subscriptions:
+            subscription.consumer = None
+            subscription.dropped += self._discard(subscription.queue)
+            subscription.pending = 0
+            subscription.has_space.set()
 
         logger.info("EventBus stopped")
 
+    async def _drain(self, subscriptions: List[Subscription]) -> None:
+        """Let workers dispatch what is queued, then let consumers drain."""
+        await self._event_queue.join()
+        for subscription in subscriptions:
+            await subscription.queue.join()
+
+    @staticmethod
+    def _discard(queue: asyncio.Queue) -> int:
+        """Empty a queue that nothing consumes any more; returns the count."""
+        discarded = 0
+        while not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
+            discarded += 1
+        return discarded
+
     async def get_statistics(self) -> Dict[str, Any]:
         """
         Get event bus statistics.
 
         Returns:
-            Dictionary with statistics
+            Dictionary with statistics, including publish throughput and
+            delivery latency percentiles (publish to handler start)
         """
+        subscriptions = [s for subs in self._subscribers.values() for s in subs]
+        elapsed = (time.perf_counter() - self._started_at) if self._started_at else 0.0
+        latencies = sorted(self._latencies)
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not latencies:
+                return None
+            index = min(len(latencies) - 1, int(len(latencies) * fraction))
+            return latencies[index] * 1000
+
         return {
             "running": self._running,
             "subscribers": {
@@ -318,32 +649,113 @@ class EventBus:
             },
             "queue_size": self._event_queue.qsize(),
             "queue_max_size": self.config.max_queue_size,
+            "workers": len(self._worker_tasks),
+            "published": self._published,
+            "dropped": self._dropped + sum(s.dropped for s in subscriptions),
+            "delivered": sum(s.delivered for s in subscriptions),
+            "handler_errors": sum(s.failed for s in subscriptions),
+            "publish_rate": (self._published / elapsed) if elapsed else 0.0,
+            "delivery_latency_ms": {
+                "p50": percentile(0.50),
+                "p99": percentile(0.99),
+                "max": latencies[-1] * 1000 if latencies else None,
+            },
+            "subscriber_backlog": {
+                s.pattern: s.queue.qsize() for s in subscriptions if s.queue.qsize()
+            },
         }
 
 
+# Connection pools shared by every RedisEventBus in the process, keyed by
+# (host, port, db, password)
+_REDIS_POOLS: Dict[Tuple[str, int, int, Optional[str]], Any] = {}
+
+
+def get_redis_pool(config: EventBusConfig) -> Any:
+    """
+    Get the process-wide Redis connection pool for a configuration.
+
+    Args:
+        config: Event bus configuration
+
+    Returns:
+        redis.asyncio.ConnectionPool shared by all buses with the same target
+
+    Raises:
+        ImportError: redis package not installed
+    """
+    import redis.asyncio as aioredis
+
+    key = (config.redis_host, config.redis_port, config.redis_db, config.redis_password)
+    pool = _REDIS_POOLS.get(key)
+    if pool is None:
+        pool = aioredis.ConnectionPool(
+            host=config.redis_host,
+            port=config.redis_port,
+            db=config.redis_db,
+            password=config.redis_password,
+            max_connections=config.redis_pool_size,
+            decode_responses=True
+        )
+        _REDIS_POOLS[key] = pool
+    return pool
+
+
+async def _aclose(resource: Any) -> None:
+    """Close a redis.asyncio client or pubsub (aclose() on redis-py >= 5)."""
+    close = getattr(resource, "aclose", None) or resource.close
+    await close()
+
+
 class RedisEventBus(EventBus):
     """
     Redis-backed event bus implementation.
 
-    Provides distributed pub/sub messaging across multiple processes.
+    Provides distributed messaging across multiple processes.
     Falls back to in-memory if Redis is not available.
+
+    - Publishes are coalesced for ``publish_batch_window`` seconds (or until
+      ``batch_size`` events are buffered) and sent in one pipeline.
+    - All buses in a process share one connection pool per Redis target.
+    - With ``use_streams`` events go to a Redis Stream read through a
+      consumer group, so they survive restarts and buses in the same group
+      share the work; otherwise Redis pub/sub is used.
+    - Stream entries are acknowledged only after every local handler has
+      returned, so an event still queued when the process dies is
+      redelivered.
     """
 
-    def __init__(self, config: Optional[EventBusConfig] = None):
+    def __init__(self, config: Optional[EventBusConfig] = None, redis_client: Any = None):
         """
         Initialize the Redis event bus.
 
         Args:
             config: Event bus configuration
+            redis_client: Optional pre-built redis.asyncio client (e.g. a fake
+                Redis for tests); implies use_redis. The caller keeps
+                ownership: stop() does not close it.
         """
         super().__init__(config)
-        self._redis_client = None
+        self._redis_client = redis_client
+        self._owns_client = False
         self._pubsub = None
         self._listener_task: Optional[asyncio.Task] = None
+        self._listener_stopping = False
         self._connection_state = "disconnected"
 
-        # Try to connect to Redis
-        if self.config.use_redis:
+        self._publish_buffer: List[Event] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._consumer_name = self.config.consumer_name or f"bus-{uuid.uuid4().hex[:12]}"
+        self._redis_published = 0
+        self._redis_batches = 0
+
+        # Stream entries handed to subscribers, acknowledged once delivered
+        self._unacked: List[Tuple[str, asyncio.Future]] = []
+
+        if redis_client is not None:
+            self.config.use_redis = True
+        elif self.config.use_redis:
+            # Try to connect to Redis
             self._connect_redis()
 
     @property
@@ -370,7 +782,7 @@ class RedisEventBus(EventBus):
 
     def _connect_redis(self) -> None:
         """
-        Connect to Redis server.
+        Connect to Redis server through the shared connection pool.
 
         Note: This requires the redis package. Falls back to in-memory
         if redis is not available.
@@ -378,17 +790,13 @@ class RedisEventBus(EventBus):
         try:
             import redis.asyncio as aioredis
 
-            self._redis_client = aioredis.Redis(
-                host=self.config.redis_host,
-                port=self.config.redis_port,
-                db=self.config.redis_db,
-                password=self.config.redis_password,
-                decode_responses=True
-            )
+            self._redis_client = aioredis.Redis(connection_pool=get_redis_pool(self.config))
+            self._owns_client = True
 
             logger.info(
                 f"Redis event bus configured: "
                 f"{self.config.redis_host}:{self.config.redis_port}"
+                f"{' (streams)' if self.config.use_streams else ''}"
             )
 
         except ImportError:
@@ -401,78 +809,247 @@ class RedisEventBus(EventBus):
         """
         Publish an event.
 
-        If Redis is available, publishes to Redis channel.
-        Otherwise, uses in-memory queue.
+        If Redis is available, the event is buffered and sent with the next
+        pipeline flush. Otherwise, uses in-memory queue.
 
         Args:
             event: Event to publish
         """
-        if self.config.use_redis and self._redis_client:
-            try:
-                # Publish to Redis
-                channel = f"events:{event.type}"
-                await self._redis_client.publish(channel, event.to_json())
+        if not (self.config.use_redis and self._redis_client):
+            # Use in-memory
+            await super().publish(event)
+            return
 
-                logger.debug(
-                    f"Published to Redis: {channel} ({event.event_id})"
-                )
+        self._publish_buffer.append(event)
 
-            except Exception as e:
-                logger.error(f"Failed to publish to Redis: {e}")
-                # Fall back to in-memory
+        if (
+            self.config.publish_batch_window <= 0
+            or len(self._publish_buffer) >= self.config.batch_size
+        ):
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self.config.publish_batch_window)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Send all buffered events to Redis in one pipeline.
+
+        Events that cannot be sent fall back to in-memory delivery.
+        """
+        if not self._publish_buffer:
+            return
+
+        batch, self._publish_buffer = self._publish_buffer, []
+
+        try:
+            pipe = self._redis_client.pipeline(transaction=False)
+            for event in batch:
+                if self.config.use_streams:
+                    pipe.xadd(
+                        self.config.stream_name,
+                        {"event": event.to_json()},
+                        maxlen=self.config.stream_maxlen,
+                        approximate=True
+                    )
+                else:
+                    pipe.publish(f"events:{event.type}", event.to_json())
+            await pipe.execute()
+
+            self._redis_published += len(batch)
+            self._redis_batches += 1
+            logger.debug(f"Published {len(batch)} events to Redis in one pipeline")
+
+        except Exception as e:
+            logger.error(f"Failed to publish to Redis: {e}")
+            # Fall back to in-memory
+            for event in batch:
                 await super().publish(event)
-        else:
-            # Use in-memory
-            await super().publish(event)
 
     async def _redis_listener(self) -> None:
         """
-        Listen for events from Redis.
+        Listen for events from Redis pub/sub.
         """
         if not self._redis_client:
             return
 
         try:
             self._pubsub = self._redis_client.pubsub()
-            await self._pubsub.subscribe("events:*")
+            await self._pubsub.psubscribe("events:*")
 
             async for message in self._pubsub.listen():
-                if message["type"] == "message":
+                if self._listener_stopping:
+                    break
+                if message["type"] in ("message", "pmessage"):
                     try:
                         event = Event.from_json(message["data"])
                         await self._process_event(event)
                     except Exception as e:
                         logger.error(f"Error processing Redis event: {e}")
 
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"Redis listener error: {e}")
 
+    async def _ensure_consumer_group(self) -> None:
+        """Create the stream and consumer group if they do not exist yet."""
+        try:
+            await self._redis_client.xgroup_create(
+                self.config.stream_name, self.config.consumer_group, id="$", mkstream=True
+            )
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _stream_listener(self) -> None:
+        """
+        Read events from the Redis Stream through the consumer group.
+
+        Entries still pending for this consumer (delivered before a restart
+        but never acknowledged) are processed first, then new entries are
+        read in batches of up to ``batch_size``. Entries are acknowledged
+        after every matching handler has returned; the acknowledgements go
+        out with the next read, so they trail delivery by at most one
+        ``flush_interval``.
+        """
+        stream = self.config.stream_name
+        group = self.config.consumer_group
+        block_ms = max(1, int(self.config.flush_interval * 1000))
+
+        try:
+            await self._ensure_consumer_group()
+            last_id = "0"  # Our own pending entries first
+            replaying = True
+
+            # redis-py may swallow a cancellation that lands mid-command,
+            # so stop() also signals through _listener_stopping
+            while self._running and not self._listener_stopping:
+                read_started = time.monotonic()
+                response = await self._redis_client.xreadgroup(
+                    group,
+                    self._consumer_name,
+                    {stream: last_id},
+                    count=self.config.batch_size,
+                    block=None if replaying else block_ms
+                )
+                entries = response[0][1] if response else []
+                if not entries:
+                    await self._ack_delivered()
+                    if replaying:
+                        replaying, last_id = False, ">"
+                    else:
+                        # Honour the block window even if the server returned early
+                        remaining = block_ms / 1000 - (time.monotonic() - read_started)
+                        await asyncio.sleep(max(0.0, remaining))
+                    continue
+
+                loop = asyncio.get_running_loop()
+                for entry_id, fields in entries:
+                    delivered = loop.create_future()
+                    try:
+                        await self._process_event(
+                            Event.from_json(fields["event"]), delivered=delivered
+                        )
+                    except Exception as e:
+                        # Undecodable entries would fail on every redelivery
+                        logger.error(f"Error processing Redis stream event {entry_id}: {e}")
+                        if not delivered.done():
+                            delivered.set_result(None)
+                    self._unacked.append((entry_id, delivered))
+                await self._ack_delivered()
+                if replaying:
+                    last_id = entries[-1][0]
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Redis stream listener error: {e}")
+
+    async def _ack_delivered(self) -> None:
+        """Acknowledge the stream entries whose handlers have all returned."""
+        done = [entry_id for entry_id, delivered in self._unacked if delivered.done()]
+        if not done:
+            return
+        self._unacked = [item for item in self._unacked if not item[1].done()]
+        await self._redis_client.xack(self.config.stream_name, self.config.consumer_group, *done)
+
     async def start(self) -> None:
         """
         Start the Redis event bus.
         """
         await super().start()
 
+        self._listener_stopping = False
+        self._unacked = []
         if self.config.use_redis and self._redis_client:
-            self._listener_task = asyncio.create_task(self._redis_listener())
-            logger.info("Redis listener started")
+            if self.config.use_streams:
+                self._listener_task = asyncio.create_task(self._stream_listener())
+                logger.info(
+                    f"Redis stream listener started "
+                    f"({self.config.consumer_group}/{self._consumer_name})"
+                )
+            else:
+                self._listener_task = asyncio.create_task(self._redis_listener())
+                logger.info("Redis listener started")
 
     async def stop(self) -> None:
         """
         Stop the Redis event bus.
+
+        Buffered publishes are sent, events already read from Redis are
+        delivered to local subscribers (within ``stop_timeout``) and their
+        stream entries acknowledged before the connection is closed.
         """
+        if self._flush_task and not self._flush_task.done():
+            # Cancelling could interrupt a flush that already took the buffer
+            await self._flush_task
+        if self._redis_client:
+            await self.flush()
+
         if self._listener_task:
+            self._listener_stopping = True
             self._listener_task.cancel()
             try:
                 await self._listener_task
             except asyncio.CancelledError:
                 pass
 
+        await super().stop()
+
+        if self._unacked:
+            try:
+                await self._ack_delivered()
+            except Exception as e:
+                logger.error(f"Failed to acknowledge delivered stream events: {e}")
+
         if self._pubsub:
-            await self._pubsub.unsubscribe("events:*")
-            await self._pubsub.close()
+            await self._pubsub.punsubscribe("events:*")
+            await _aclose(self._pubsub)
 
-        if self._redis_client:
-            await self._redis_client.close()
+        if self._redis_client and self._owns_client:
+            # Shared pools stay open for other buses in the process
+            await _aclose(self._redis_client)
 
-        await super().stop()
+    async def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get event bus statistics, including Redis publish batching.
+
+        Returns:
+            Dictionary with statistics
+        """
+        stats = await super().get_statistics()
+        stats["redis"] = {
+            "enabled": bool(self.config.use_redis and self._redis_client),
+            "mode": "streams" if self.config.use_streams else "pubsub",
+            "published": self._redis_published,
+            "batches": self._redis_batches,
+            "avg_batch_size": (
+                self._redis_published / self._redis_batches if self._redis_batches else 0.0
+            ),
+            "buffered": len(self._publish_buffer),
+        }
+        return stats
@@ -204,9 +204,18 @@ class StateManager:
     - Automatic backups before writes
     - Markdown validation
     - Retry logic with exponential backoff
+    - Optional SQLite store as the canonical state (use_store=True), with
+      STATE.md rendered as a view on wave boundaries or via render_state()
     """
 
-    def __init__(self, state_path: Optional[Path] = None, max_retries: int = 3, retry_delay: float = 0.5):
+    def __init__(
+        self,
+        state_path: Optional[Path] = None,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+        use_store: bool = False,
+        store_path: Optional[Path] = None
+    ):
         """
         Initialize state manager.
 
@@ -214,6 +223,10 @@ class StateManager:
             state_path: Path to STATE.md file (default: ./STATE.md)
             max_retries: Maximum number of retries for acquiring lock
             retry_delay: Initial retry delay in seconds (doubles each retry)
+            use_store: Keep canonical state in a SQLite store instead of
+                re-parsing STATE.md on every update
+            store_path: Path to the SQLite store (default: STATE.db next to
+                STATE.md); implies use_store
         """
         self.state_path = state_path or Path("STATE.md")
         self._lock_file = self.state_path.with_suffix('.lock')
@@ -221,6 +234,14 @@ class StateManager:
         self._max_retries = max_retries
         self._retry_delay = retry_delay
 
+        self._store = None
+        if use_store or store_path is not None:
+            try:
+                from .state_store import StateStore
+            except ImportError:
+                from state_store import StateStore
+            self._store = StateStore(store_path or self.state_path.with_suffix('.db'))
+
     @contextmanager
     def _lock_state(self):
         """
@@ -514,6 +535,8 @@ class StateManager:
         Update STATE.md with current workflow status.
 
         This method uses file locking and retry logic to handle concurrent access safely.
+        With the SQLite store enabled the state is written to the store in one
+        transaction and STATE.md is only re-rendered when the wave changes.
 
         Args:
             workflow_id: Workflow identifier
@@ -530,6 +553,16 @@ class StateManager:
         Raises:
             RuntimeError: If lock cannot be acquired after max_retries
         """
+        tasks = self._build_tasks(
+            wave_id, completed_tasks, current_wave_tasks, pending_waves, commit_hash
+        )
+
+        if self._store is not None:
+            self._update_store(
+                workflow_id, workflow_name, wave_id, total_waves, tasks, notes, metadata
+            )
+            return
+
         # Retry logic with exponential backoff
         for attempt in range(self._max_retries):
             try:
@@ -539,94 +572,6 @@ class StateManager:
                     if self.state_path.exists():
                         existing_state = self.load_state()
 
-                    # Build WorkflowState
-                    tasks = {}
-
-                    # Add completed tasks
-                    for task_dict in completed_tasks:
-                        task_id = task_dict.get('task_id', task_dict.get('agent_id', 'unknown'))
-                        # Extract task description from various fields
-                        description = (
-                            task_dict.get('description') or
-                            task_dict.get('task') or
-                            task_dict.get('prompt', 'Unknown')[:100]
-                        )
-
-                        # Get result info
-                        result = task_dict.get('result', {})
-                        files = []
-                        if result:
-                            files = result.get('files_modified', result.get('files_created', []))
-
-                        tasks[task_id] = TaskState(
-                            task_id=task_id,
-                            description=description,
-                            status='completed',
-                            wave_id=task_dict.get('wave_id', 0),
-                            commit_hash=task_dict.get('commit_hash'),
-                            files_modified=files,
-                            error=task_dict.get('error')
-                        )
-
-                    # Add current wave tasks
-                    for task_dict in current_wave_tasks:
-                        task_id = task_dict.get('task_id', task_dict.get('agent_id', 'unknown'))
-                        description = (
-                            task_dict.get('description') or
-                            task_dict.get('task') or
-                            task_dict.get('prompt', 'Unknown')[:100]
-                        )
-
-                        # Determine if in progress or pending
-                        result = task_dict.get('result')
-                        status = 'completed'
-                        if result:
-                            if result.get('success'):
-                                status = 'completed'
-                            elif result.get('error'):
-                                status = 'failed'
-                            else:
-                                status = 'in_progress'
-                        else:
-                            status = 'in_progress'
-
-                        # Get result info
-                        files = []
-                        if result:
-                            files = result.get('files_modified', result.get('files_created', []))
-
-                        # Use current wave commit hash if task doesn't have one
-                        task_commit = task_dict.get('commit_hash')
-                        if status == 'completed' and not task_commit and commit_hash:
-                            task_commit = commit_hash
-
-                        tasks[task_id] = TaskState(
-                            task_id=task_id,
-                            description=description,
-                            status=status,
-                            wave_id=wave_id,
-                            commit_hash=task_commit,
-                            files_modified=files,
-                            error=task_dict.get('error') or (result.get('error') if result else None)
-                        )
-
-                    # Add pending tasks
-                    for wave_num, wave_tasks in enumerate(pending_waves, start=wave_id + 1):
-                        for task_dict in wave_tasks:
-                            task_id = task_dict.get('task_id', task_dict.get('agent_id', f'wave{wave_num}_task{len(tasks)+1}'))
-                            description = (
-                                task_dict.get('description') or
-                                task_dict.get('task') or
-                                task_dict.get('prompt', 'Unknown')[:100]
-                            )
-
-                            tasks[task_id] = TaskState(
-                                task_id=task_id,
-                                description=description,
-                                status='pending',
-                                wave_id=wave_num
-                            )
-
                     # Preserve or create timestamps
                     started_at = existing_state.started_at if existing_state else datetime.now()
                     updated_at = datetime.now()
@@ -673,13 +618,260 @@ class StateManager:
                 else:
                     raise
 
+    def _build_tasks(
+        self,
+        wave_id: int,
+        completed_tasks: List[Dict[str, Any]],
+        current_wave_tasks: List[Dict[str, Any]],
+        pending_waves: List[List[Dict[str, Any]]],
+        commit_hash: Optional[str] = None
+    ) -> Dict[str, TaskState]:
+        """
+        Build TaskState objects from the task dictionaries passed to update().
+
+        Args:
+            wave_id: Current wave number
+            completed_tasks: Tasks from completed waves
+            current_wave_tasks: Tasks in current wave
+            pending_waves: Tasks in pending waves
+            commit_hash: Optional git commit hash for current wave
+
+        Returns:
+            Dictionary of task_id -> TaskState
+        """
+        tasks: Dict[str, TaskState] = {}
+
+        # Add completed tasks
+        for task_dict in completed_tasks:
+            task_id = task_dict.get('task_id', task_dict.get('agent_id', 'unknown'))
+            # Extract task description from various fields
+            description = (
+                task_dict.get('description') or
+                task_dict.get('task') or
+                task_dict.get('prompt', 'Unknown')[:100]
+            )
+
+            # Get result info
+            result = task_dict.get('result', {})
+            files = []
+            if result:
+                files = result.get('files_modified', result.get('files_created', []))
+
+            tasks[task_id] = TaskState(
+                task_id=task_id,
+                description=description,
+                status='completed',
+                wave_id=task_dict.get('wave_id', 0),
+                commit_hash=task_dict.get('commit_hash'),
+                files_modified=files,
+                error=task_dict.get('error')
+            )
+
+        # Add current wave tasks
+        for task_dict in current_wave_tasks:
+            task_id = task_dict.get('task_id', task_dict.get('agent_id', 'unknown'))
+            description = (
+                task_dict.get('description') or
+                task_dict.get('task') or
+                task_dict.get('prompt', 'Unknown')[:100]
+            )
+
+            # Determine if in progress or pending
+            result = task_dict.get('result')
+            status = 'completed'
+            if result:
+                if result.get('success'):
+                    status = 'completed'
+                elif result.get('error'):
+                    status = 'failed'
+                else:
+                    status = 'in_progress'
+            else:
+                status = 'in_progress'
+
+            # Get result info
+            files = []
+            if result:
+                files = result.get('files_modified', result.get('files_created', []))
+
+            # Use current wave commit hash if task doesn't have one
+            task_commit = task_dict.get('commit_hash')
+            if status == 'completed' and not task_commit and commit_hash:
+                task_commit = commit_hash
+
+            tasks[task_id] = TaskState(
+                task_id=task_id,
+                description=description,
+                status=status,
+                wave_id=wave_id,
+                commit_hash=task_commit,
+                files_modified=files,
+                error=task_dict.get('error') or (result.get('error') if result else None)
+            )
+
+        # Add pending tasks
+        for wave_num, wave_tasks in enumerate(pending_waves, start=wave_id + 1):
+            for task_dict in wave_tasks:
+                task_id = task_dict.get('task_id', task_dict.get('agent_id', f'wave{wave_num}_task{len(tasks)+1}'))
+                description = (
+                    task_dict.get('description') or
+                    task_dict.get('task') or
+                    task_dict.get('prompt', 'Unknown')[:100]
+                )
+
+                tasks[task_id] = TaskState(
+                    task_id=task_id,
+                    description=description,
+                    status='pending',
+                    wave_id=wave_num
+                )
+
+        return tasks
+
+    def _update_store(
+        self,
+        workflow_id: str,
+        workflow_name: str,
+        wave_id: int,
+        total_waves: int,
+        tasks: Dict[str, TaskState],
+        notes: Optional[List[str]],
+        metadata: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Write an update() to the SQLite store, rendering STATE.md on wave changes.
+        """
+        header = self._store.header()
+        if header is None and self.state_path.exists():
+            # Import a pre-existing STATE.md so started_at and notes survive
+            self.load_state()
+            header = self._store.header()
+        previous_wave, started_at = header if header else (None, datetime.now())
+
+        workflow_state = WorkflowState(
+            workflow_id=workflow_id,
+            workflow_name=workflow_name,
+            current_wave=wave_id,
+            total_waves=total_waves,
+            tasks=tasks,
+            started_at=started_at,
+            updated_at=datetime.now(),
+            metadata=metadata or {}
+        )
+        self._store.update_workflow(workflow_state, notes=notes)
+
+        logger.debug(f"Updated state store: Wave {wave_id}/{total_waves}, {len(tasks)} tasks total")
+
+        if previous_wave != wave_id or not self.state_path.exists():
+            self.render_state()
+
+    def update_task(
+        self,
+        task_id: str,
+        status: str,
+        description: Optional[str] = None,
+        wave_id: Optional[int] = None,
+        commit_hash: Optional[str] = None,
+        files_modified: Optional[List[str]] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Update a single task.
+
+        With the SQLite store this is a single-row upsert and STATE.md is not
+        rewritten; without it the whole STATE.md is reloaded and rewritten.
+
+        Args:
+            task_id: Task identifier
+            status: New status (pending, in_progress, completed, failed)
+            description: New description (kept if None)
+            wave_id: Wave the task belongs to (kept if None)
+            commit_hash: Commit hash (kept if None)
+            files_modified: Files modified (kept if None)
+            error: Error message (kept if None)
+
+        Raises:
+            RuntimeError: If no workflow state exists or the lock cannot be acquired
+        """
+        def apply(task: Optional[TaskState]) -> TaskState:
+            if task is None:
+                task = TaskState(
+                    task_id=task_id,
+                    description=description or 'Unknown',
+                    status=status,
+                    wave_id=wave_id or 0
+                )
+            task.status = status
+            if description is not None:
+                task.description = description
+            if wave_id is not None:
+                task.wave_id = wave_id
+            if commit_hash is not None:
+                task.commit_hash = commit_hash
+            if files_modified is not None:
+                task.files_modified = files_modified
+            if error is not None:
+                task.error = error
+            return task
+
+        if self._store is not None:
+            if self._store.current_wave() is None:
+                raise RuntimeError("No workflow state to update; call initialize() first")
+            self._store.upsert_task(apply(self._store.get_task(task_id)))
+            return
+
+        with self._lock_state():
+            state = self.load_state()
+            if not state:
+                raise RuntimeError("No workflow state to update; call initialize() first")
+            state.tasks[task_id] = apply(state.tasks.get(task_id))
+            state.updated_at = datetime.now()
+            self._write_state_atomic(state)
+
+    def render_state(self) -> bool:
+        """
+        Render STATE.md from the SQLite store.
+
+        The store is canonical, so a render that loses the race for the file
+        lock is skipped rather than retried; the next render catches up.
+
+        Returns:
+            True if STATE.md was written
+        """
+        if self._store is None:
+            return self.state_path.exists()
+
+        state = self._store.load()
+        if state is None:
+            return False
+
+        try:
+            with self._lock_state():
+                self._write_state_atomic(state)
+        except RuntimeError as e:
+            logger.warning(f"Skipped STATE.md render: {e}")
+            return False
+
+        logger.info(f"Rendered STATE.md: Wave {state.current_wave}/{state.total_waves}, {len(state.tasks)} tasks total")
+        return True
+
     def load_state(self) -> Optional[WorkflowState]:
         """
-        Load workflow state from STATE.md.
+        Load workflow state from the SQLite store or STATE.md.
+
+        An existing STATE.md is imported into an empty store on first load.
 
         Returns:
-            WorkflowState if file exists, None otherwise
+            WorkflowState if state exists, None otherwise
         """
+        if self._store is not None:
+            state = self._store.load()
+            if state is None and self.state_path.exists():
+                state = self.parse_state(self.state_path.read_text(encoding='utf-8'))
+                if state:
+                    self._store.replace(state)
+            return state
+
         if not self.state_path.exists():
             return None
 
@@ -727,6 +919,11 @@ class StateManager:
         Args:
             note: Note text to add
         """
+        if self._store is not None:
+            if self.load_state() is None or not self._store.add_note(note):
+                logger.warning("No existing state to add note to")
+            return
+
         # Retry logic with exponential backoff
         for attempt in range(self._max_retries):
             try:
@@ -757,7 +954,9 @@ class StateManager:
                     raise
 
     def clear(self) -> None:
-        """Clear the STATE.md file"""
+        """Clear the STATE.md file (and the SQLite store, if enabled)"""
+        if self._store is not None:
+            self._store.clear()
         if self.state_path.exists():
             self.state_path.unlink()
             logger.info("Cleared STATE.md")
@@ -814,6 +1013,9 @@ class StateManager:
                         metadata=metadata or {}
                     )
 
+                    if self._store is not None:
+                        self._store.replace(workflow_state)
+
                     # Write atomically with backup
                     self._write_state_atomic(workflow_state)
 
@@ -0,0 +1,314 @@
+"""
+Structured State Store - SQLite Backend for StateManager
+
+STATE.md is a good view for humans but a poor database: every update used to
+re-read, regex-parse, rebuild and rewrite the whole file under an exclusive
+lock. This module keeps the canonical workflow state in SQLite instead, with
+per-task upserts, so task transitions cost a single indexed write. STATE.md
+is rendered from the store only when requested (or on wave boundaries, see
+StateManager).
+
+The store mirrors STATE.md in holding one workflow at a time.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from helpers.core.sqlite_utils import immediate_transaction
+
+try:
+    from .state_manager import TaskState, WorkflowState
+except ImportError:
+    # Fallback for standalone usage (state/ directory on sys.path)
+    from state_manager import TaskState, WorkflowState
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflow (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    workflow_id TEXT NOT NULL,
+    workflow_name TEXT NOT NULL,
+    current_wave INTEGER NOT NULL,
+    total_waves INTEGER NOT NULL,
+    started_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    description TEXT NOT NULL,
+    status TEXT NOT NULL,
+    wave_id INTEGER NOT NULL,
+    files_modified TEXT NOT NULL DEFAULT '[]',
+    commit_hash TEXT,
+    error TEXT
+);
+
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    note TEXT NOT NULL
+);
+"""
+
+
+class StateStore:
+    """
+    SQLite-backed canonical workflow state.
+
+    A single connection is shared by all threads of the process (guarded by
+    a lock); other processes are serialized by SQLite's own file locking in
+    WAL mode.
+    """
+
+    def __init__(self, db_path: Path, busy_timeout: float = 5.0):
+        """
+        Open (or create) the state store.
+
+        Args:
+            db_path: Path to the SQLite database file
+            busy_timeout: Seconds to wait on a lock held by another process
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=busy_timeout,
+            check_same_thread=False,
+            isolation_level=None,  # Explicit transactions only
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def replace(self, state: WorkflowState) -> None:
+        """
+        Replace the stored workflow (header, tasks and notes) with `state`.
+
+        Args:
+            state: Complete workflow state
+        """
+        with immediate_transaction(self._conn, self._lock) as conn:
+            conn.execute("DELETE FROM tasks")
+            conn.execute("DELETE FROM notes")
+            self._write_header(conn, state)
+            self._write_tasks(conn, state.tasks.values())
+            conn.executemany(
+                "INSERT INTO notes (note) VALUES (?)",
+                [(note,) for note in state.notes],
+            )
+
+    def update_workflow(self, state: WorkflowState, notes: Optional[List[str]] = None) -> None:
+        """
+        Write the workflow header and task set, keeping existing notes.
+
+        Only tasks that are new or changed are written and tasks missing from
+        `state` are deleted, so an update that moves one task costs one row.
+
+        Args:
+            state: Workflow state (its notes are ignored)
+            notes: Notes to append
+        """
+        with immediate_transaction(self._conn, self._lock) as conn:
+            existing = {
+                row[0]: row
+                for row in conn.execute(
+                    "SELECT task_id, description, status, wave_id, files_modified, "
+                    "commit_hash, error FROM tasks"
+                )
+            }
+            changed = [
+                task for task in state.tasks.values()
+                if existing.get(task.task_id) != self._task_row(task)
+            ]
+            removed = [(task_id,) for task_id in existing if task_id not in state.tasks]
+
+            self._write_header(conn, state)
+            if removed:
+                conn.executemany("DELETE FROM tasks WHERE task_id = ?", removed)
+            self._write_tasks(conn, changed)
+            if notes:
+                conn.executemany(
+                    "INSERT INTO notes (note) VALUES (?)",
+                    [(note,) for note in notes],
+                )
+
+    def upsert_task(self, task: TaskState) -> None:
+        """
+        Insert or update a single task and bump the workflow timestamp.
+
+        Args:
+            task: Task state to store
+        """
+        with immediate_transaction(self._conn, self._lock) as conn:
+            self._write_tasks(conn, [task])
+            conn.execute(
+                "UPDATE workflow SET updated_at = ? WHERE id = 1",
+                (datetime.now().isoformat(),),
+            )
+
+    def add_note(self, note: str) -> bool:
+        """
+        Append a note.
+
+        Args:
+            note: Note text
+
+        Returns:
+            False if there is no workflow to add the note to
+        """
+        with immediate_transaction(self._conn, self._lock) as conn:
+            cursor = conn.execute(
+                "UPDATE workflow SET updated_at = ? WHERE id = 1",
+                (datetime.now().isoformat(),),
+            )
+            if cursor.rowcount == 0:
+                return False
+            conn.execute("INSERT INTO notes (note) VALUES (?)", (note,))
+            return True
+
+    def clear(self) -> None:
+        """Remove all stored state."""
+        with immediate_transaction(self._conn, self._lock) as conn:
+            conn.execute("DELETE FROM workflow")
+            conn.execute("DELETE FROM tasks")
+            conn.execute("DELETE FROM notes")
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def current_wave(self) -> Optional[int]:
+        """Current wave of the stored workflow, or None if empty."""
+        header = self.header()
+        return header[0] if header else None
+
+    def header(self) -> Optional[Tuple[int, datetime]]:
+        """
+        Cheap lookup of the stored workflow header.
+
+        Returns:
+            (current_wave, started_at), or None if the store is empty
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT current_wave, started_at FROM workflow WHERE id = 1"
+            ).fetchone()
+        return (row[0], datetime.fromisoformat(row[1])) if row else None
+
+    def get_task(self, task_id: str) -> Optional[TaskState]:
+        """Load a single task by ID."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT task_id, description, status, wave_id, files_modified, "
+                "commit_hash, error FROM tasks WHERE task_id = ?",
+                (task_id,),
+            ).fetchone()
+        return self._task_from_row(row) if row else None
+
+    def load(self) -> Optional[WorkflowState]:
+        """
+        Load the full workflow state.
+
+        Returns:
+            WorkflowState, or None if the store is empty
+        """
+        with self._lock:
+            header = self._conn.execute(
+                "SELECT workflow_id, workflow_name, current_wave, total_waves, "
+                "started_at, updated_at, metadata FROM workflow WHERE id = 1"
+            ).fetchone()
+            if header is None:
+                return None
+            task_rows = self._conn.execute(
+                "SELECT task_id, description, status, wave_id, files_modified, "
+                "commit_hash, error FROM tasks ORDER BY rowid"
+            ).fetchall()
+            notes = [row[0] for row in self._conn.execute("SELECT note FROM notes ORDER BY id")]
+
+        tasks = {row[0]: self._task_from_row(row) for row in task_rows}
+        return WorkflowState(
+            workflow_id=header[0],
+            workflow_name=header[1],
+            current_wave=header[2],
+            total_waves=header[3],
+            tasks=tasks,
+            started_at=datetime.fromisoformat(header[4]),
+            updated_at=datetime.fromisoformat(header[5]),
+            notes=notes,
+            metadata=json.loads(header[6]),
+        )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _write_header(self, conn: sqlite3.Connection, state: WorkflowState) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO workflow (id, workflow_id, workflow_name, current_wave, "
+            "total_waves, started_at, updated_at, metadata) VALUES (1, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                state.workflow_id,
+                state.workflow_name,
+                state.current_wave,
+                state.total_waves,
+                state.started_at.isoformat(),
+                state.updated_at.isoformat(),
+                json.dumps(state.metadata, default=str),
+            ),
+        )
+
+    def _write_tasks(self, conn: sqlite3.Connection, tasks: Iterable[TaskState]) -> None:
+        # Upserts keep the rowid, so ORDER BY rowid preserves insertion order
+        conn.executemany(
+            "INSERT INTO tasks (task_id, description, status, wave_id, files_modified, "
+            "commit_hash, error) VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(task_id) DO UPDATE SET description = excluded.description, "
+            "status = excluded.status, wave_id = excluded.wave_id, "
+            "files_modified = excluded.files_modified, commit_hash = excluded.commit_hash, "
+            "error = excluded.error",
+            [self._task_row(task) for task in tasks],
+        )
+
+    @staticmethod
+    def _task_row(task: TaskState) -> tuple:
+        return (
+            task.task_id,
+            task.description,
+            task.status,
+            task.wave_id,
+            json.dumps(task.files_modified),
+            task.commit_hash,
+            task.error,
+        )
+
+    @staticmethod
+    def _task_from_row(row: tuple) -> TaskState:
+        return TaskState(
+            task_id=row[0],
+            description=row[1],
+            status=row[2],
+            wave_id=row[3],
+            files_modified=json.loads(row[4]),
+            commit_hash=row[5],
+            error=row[6],
+        )
+
@@ -0,0 +1,129 @@
+"""
+Shared Fixtures for the Workflow Engine Tests
+=============================================
+
+Orchestrator fixtures used by the checkpoint tests. Checkpointed
+orchestrators are created in both checkpoint modes: rewriting the
+``{workflow_id}.json`` snapshot after every step, and the append-only
+journal (compacted every few records, so resumes also replay compactions).
+"""
+
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from agents.framework.base_agent import BaseAgent, AgentConfig, AgentTask, AgentResult
+from workflows.engine.Orchestrator import AgentOrchestrator
+
+
+# =============================================================================
+# MOCK AGENT FOR TESTING
+# =============================================================================
+
+class MockAgent(BaseAgent):
+    """A mock agent for testing orchestration."""
+
+    def __init__(self, name: str = "test_agent"):
+        config = AgentConfig(
+            name=name,
+            full_name=f"Test Agent {name}",
+            role="tester",
+            category="testing",
+            description="A test agent",
+        )
+        super().__init__(config)
+        self.execute_call_count = 0
+        self.execute_delay = 0.1  # Small delay for testing
+
+    async def execute(self, task: AgentTask) -> AgentResult:
+        """Execute task with optional delay."""
+        self.execute_call_count += 1
+        await asyncio.sleep(self.execute_delay)
+
+        return AgentResult(
+            success=True,
+            output=f"Executed task {task.id}",
+            metadata={"agent": self.name, "call_count": self.execute_call_count}
+        )
+
+    async def think(self, task: AgentTask) -> list:
+        """Return thinking steps."""
+        return [
+            f"Understanding task: {task.description}",
+            "Processing task",
+            "Returning result",
+        ]
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def temp_checkpoint_dir():
+    """Create a temporary directory for checkpoints."""
+    temp_dir = tempfile.mkdtemp(prefix="bb5_checkpoints_")
+    yield Path(temp_dir)
+    # Cleanup
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def mock_event_bus():
+    """Create a mock event bus."""
+    event_bus = Mock()
+    event_bus.publish = AsyncMock()
+    return event_bus
+
+
+@pytest.fixture(params=[False, True], ids=["snapshot", "journal"])
+def orchestrator_with_checkpoints(request, temp_checkpoint_dir, mock_event_bus):
+    """Create an orchestrator with checkpointing enabled, in each checkpoint mode."""
+    orchestrator = AgentOrchestrator(
+        event_bus=mock_event_bus,
+        task_router=None,
+        memory_base_path=temp_checkpoint_dir,
+        max_concurrent_agents=5,
+        enable_checkpoints=True,
+        checkpoint_journal=request.param,
+        journal_fsync_every=2,
+        journal_compact_every=4,
+    )
+    return orchestrator
+
+
+@pytest.fixture
+def orchestrator_without_checkpoints(temp_checkpoint_dir, mock_event_bus):
+    """Create an orchestrator with checkpointing disabled."""
+    orchestrator = AgentOrchestrator(
+        event_bus=mock_event_bus,
+        task_router=None,
+        memory_base_path=temp_checkpoint_dir,
+        max_concurrent_agents=5,
+        enable_checkpoints=False,
+    )
+    return orchestrator
+
+
+@pytest.fixture
+def registered_agents(orchestrator_with_checkpoints):
+    """Register mock agents with the orchestrator."""
+    agent1 = MockAgent("agent1")
+    agent2 = MockAgent("agent2")
+    agent3 = MockAgent("agent3")
+
+    asyncio.run(orchestrator_with_checkpoints.register_agent(agent1))
+    asyncio.run(orchestrator_with_checkpoints.register_agent(agent2))
+    asyncio.run(orchestrator_with_checkpoints.register_agent(agent3))
+
+    return {
+        "agent1": agent1,
+        "agent2": agent2,
+        "agent3": agent3,
+    }
+
+
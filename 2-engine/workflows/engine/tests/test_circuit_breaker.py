@@ -0,0 +1,386 @@
+"""
+Tests for the Circuit Breaker
+=============================
+
+Tests the CircuitBreaker's ability to:
+- Trip and recover through CLOSED / OPEN / HALF_OPEN
+- Enforce sub-second deadlines on sync calls from worker threads
+- Enforce the default 30s deadline on async calls, run sync calls inline
+  unless enforce_sync_timeout opts into the thread hop, and keep each
+  breaker's timeout workers and the caller's context variables
+- Protect coroutines (acall, async protect, async decorate)
+- Limit concurrent calls (bulkhead) and concurrent half-open probes
+- Trip on rolling failure and slow-call rates, report latency percentiles
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from workflows.engine.exceptions import BulkheadFullError, CircuitBreakerOpenError
+from workflows.engine.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerManager,
+)
+from workflows.engine.resilience.circuit_breaker_types import (
+    CircuitBreakerConfig,
+    CircuitBreakerPresets,
+    CircuitState,
+    SlidingWindow,
+)
+
+
+def make_breaker(name: str, **config) -> CircuitBreaker:
+    options = dict(failure_threshold=2, timeout_seconds=0.05, reset_timeout=0.0,
+                   success_threshold=1, call_timeout=0.0)
+    options.update(config)
+    return CircuitBreaker(name, CircuitBreakerConfig(**options))
+
+
+REQUEST_ID = contextvars.ContextVar("request_id", default=None)
+
+
+def fail():
+    raise ValueError("boom")
+
+
+class TestSyncCalls:
+    """Tests for the synchronous path."""
+
+    def test_trips_and_recovers(self):
+        cb = make_breaker("sync.trip")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                cb.call(fail)
+        assert cb.is_open
+
+        with pytest.raises(CircuitBreakerOpenError):
+            cb.call(lambda: "ok")
+
+        time.sleep(0.06)
+        assert cb.call(lambda: "ok") == "ok"
+        assert cb.is_closed
+
+    def test_recovery_needs_several_probes(self):
+        """success_threshold > half_open_max_calls still closes the circuit."""
+        cb = make_breaker("sync.probes", success_threshold=3, half_open_max_calls=1)
+        cb._transition_to(CircuitState.OPEN)
+        time.sleep(0.06)
+
+        for _ in range(3):
+            cb.call(lambda: None)
+        assert cb.is_closed
+
+    def test_sub_second_timeout_off_main_thread(self):
+        cb = make_breaker("sync.timeout", call_timeout=0.05, enforce_sync_timeout=True)
+        errors = []
+
+        def worker():
+            start = time.perf_counter()
+            try:
+                cb.call(time.sleep, 1.0)
+            except TimeoutError:
+                errors.append(time.perf_counter() - start)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert len(errors) == 1
+        assert errors[0] < 0.5
+        assert cb.stats.failed_calls == 1
+
+    def test_function_errors_pass_through_timeout_path(self):
+        cb = make_breaker("sync.errors", call_timeout=1.0, enforce_sync_timeout=True)
+
+        with pytest.raises(ValueError):
+            cb.call(fail)
+        assert cb.stats.failed_calls == 1
+
+    def test_calls_run_inline_by_default(self):
+        cb = CircuitBreaker("sync.inline")
+        assert cb.config.call_timeout == 30.0
+        assert not cb.config.enforce_sync_timeout
+
+        assert cb.call(threading.get_ident) == threading.get_ident()
+        assert cb._executor is None
+        assert CircuitBreakerPresets.default().call_timeout == 30.0
+        assert CircuitBreakerPresets.fast_recovery().call_timeout == 30.0
+
+    def test_deadline_workers_are_per_breaker_and_keep_context(self):
+        hung = make_breaker("sync.hung", call_timeout=0.05, max_concurrent_calls=2,
+                            enforce_sync_timeout=True)
+        healthy = make_breaker("sync.healthy", call_timeout=0.5, enforce_sync_timeout=True)
+        release = threading.Event()
+
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                hung.call(release.wait, 5)
+
+        # The hung service's workers are busy; other breakers are unaffected
+        token = REQUEST_ID.set("req-7")
+        try:
+            assert healthy.call(REQUEST_ID.get) == "req-7"
+        finally:
+            REQUEST_ID.reset(token)
+        assert healthy._executor is not hung._executor
+        assert hung._executor._max_workers == 2
+
+        release.set()
+        hung.close()
+        healthy.close()
+        assert hung._executor is None
+
+    def test_protect_records_success(self):
+        cb = make_breaker("sync.protect")
+        cb._transition_to(CircuitState.OPEN)
+        time.sleep(0.06)
+
+        with cb.protect():
+            pass
+
+        assert cb.is_closed
+
+
+class TestAsyncCalls:
+    """Tests for the coroutine path."""
+
+    @pytest.mark.asyncio
+    async def test_acall_trips_on_coroutine_failures(self):
+        cb = make_breaker("async.trip")
+
+        async def afail():
+            raise ValueError("boom")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await cb.acall(afail)
+
+        with pytest.raises(CircuitBreakerOpenError):
+            await cb.acall(afail)
+
+    @pytest.mark.asyncio
+    async def test_acall_blocking_callable_keeps_context(self):
+        cb = make_breaker("async.context")
+        REQUEST_ID.set("req-9")
+
+        assert await cb.acall(REQUEST_ID.get) == "req-9"
+
+    @pytest.mark.asyncio
+    async def test_acall_sub_second_timeout(self):
+        cb = make_breaker("async.timeout", call_timeout=0.05)
+
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            await cb.acall(asyncio.sleep, 1.0)
+
+        assert time.perf_counter() - start < 0.5
+        assert cb.stats.failed_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_acall_runs_blocking_callables_off_loop(self):
+        cb = make_breaker("async.blocking")
+        assert await cb.acall(lambda x: x * 2, 21) == 42
+
+    @pytest.mark.asyncio
+    async def test_async_protect_deadline(self):
+        cb = make_breaker("async.protect", call_timeout=0.05)
+
+        with pytest.raises(TimeoutError):
+            async with cb.protect():
+                await asyncio.sleep(1.0)
+
+        async with cb.protect():
+            await asyncio.sleep(0)
+
+        assert cb.stats.failed_calls == 1
+        assert cb.stats.successful_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancellation_is_not_a_failure(self):
+        cb = make_breaker("async.cancel")
+        task = asyncio.create_task(cb.acall(asyncio.sleep, 1.0))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cb.stats.failed_calls == 0
+        assert cb.active_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_decorate_coroutine_function(self):
+        cb = make_breaker("async.decorate")
+
+        @cb.decorate
+        async def double(x):
+            return x * 2
+
+        assert asyncio.iscoroutinefunction(double)
+        assert await double(4) == 8
+
+
+class TestConcurrencyLimits:
+    """Tests for the bulkhead and half-open probe limits."""
+
+    @pytest.mark.asyncio
+    async def test_bulkhead_rejects_excess_calls(self):
+        cb = make_breaker("bulkhead", max_concurrent_calls=2)
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return "done"
+
+        running = [asyncio.create_task(cb.acall(slow)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(BulkheadFullError):
+            await cb.acall(slow)
+
+        release.set()
+        assert await asyncio.gather(*running) == ["done", "done"]
+        assert cb.active_calls == 0
+        assert cb.stats.rejection_count == 1
+
+    @pytest.mark.asyncio
+    async def test_half_open_admits_limited_concurrent_probes(self):
+        cb = make_breaker("probes", half_open_max_calls=1, success_threshold=2)
+        cb._transition_to(CircuitState.OPEN)
+        await asyncio.sleep(0.06)
+        release = asyncio.Event()
+
+        async def probe():
+            await release.wait()
+
+        first = asyncio.create_task(cb.acall(probe))
+        await asyncio.sleep(0.01)
+        with pytest.raises(CircuitBreakerOpenError):
+            await cb.acall(probe)
+
+        release.set()
+        await first
+        assert cb.is_half_open
+        await cb.acall(probe)
+        assert cb.is_closed
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSlidingWindow:
+    """Tests for the rolling call window."""
+
+    def test_count_window_evicts_oldest(self):
+        window = SlidingWindow("count", size=4)
+        for success in [False, False, True, True, True, True]:
+            window.record(success, 0.001)
+
+        assert window.rates() == (4, 0.0, 0.0)
+
+    def test_time_window_expires_buckets(self):
+        clock = FakeClock()
+        window = SlidingWindow("time", size=10, clock=clock)
+        window.record(False, 0.01)
+        clock.now += 5
+        window.record(True, 0.01)
+
+        assert window.rates()[:2] == (2, 0.5)
+        clock.now += 6
+        assert window.rates()[:2] == (1, 0.0)
+        clock.now += 10
+        assert window.rates()[0] == 0
+
+    def test_latency_percentiles(self):
+        window = SlidingWindow("count", size=1000)
+        for i in range(1, 101):
+            window.record(True, i / 1000)
+
+        p50, p99 = window.percentiles(0.5, 0.99)
+        assert 0.045 <= p50 <= 0.055
+        assert 0.095 <= p99 <= 0.11
+        assert window.snapshot()['latency_ms']['p50'] == pytest.approx(p50 * 1000)
+
+
+class TestRateTripping:
+    """Tests for failure-rate and slow-call-rate thresholds."""
+
+    def test_intermittent_failures_trip_on_rate(self):
+        """40% failures never reach 5 consecutive, but trip a 30% threshold."""
+        cb = make_breaker("rate.failures", failure_threshold=5, failure_rate_threshold=0.3,
+                          minimum_number_of_calls=10, timeout_seconds=60)
+
+        for i in range(20):
+            if cb.is_open:
+                break
+            if i % 5 in (1, 3):
+                with pytest.raises(ValueError):
+                    cb.call(fail)
+            else:
+                cb.call(lambda: None)
+
+        assert cb.is_open
+        assert cb.stats.current_failures < 5
+
+    def test_minimum_number_of_calls(self):
+        cb = make_breaker("rate.minimum", failure_threshold=10, failure_rate_threshold=0.5,
+                          minimum_number_of_calls=10)
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                cb.call(fail)
+        assert cb.is_closed
+
+    def test_slow_successes_trip(self):
+        cb = make_breaker("rate.slow", slow_call_duration_threshold=0.01,
+                          slow_call_rate_threshold=0.5, minimum_number_of_calls=4,
+                          timeout_seconds=60)
+        for _ in range(4):
+            cb.call(time.sleep, 0.015)
+
+        assert cb.is_open
+        window = cb.get_stats()['window']
+        assert window['slow_calls'] == 4
+        assert window['latency_ms']['p50'] >= 10
+
+
+class TestManagerStats:
+    """Tests for CircuitBreakerManager views."""
+
+    def test_get_all_stats_and_aggregate(self):
+        manager = CircuitBreakerManager()
+        for i in range(50):
+            cb = manager.get_breaker(f"agent.stats{i}")
+            cb.call(lambda: None)
+            if i % 10 == 0:
+                with pytest.raises(ValueError):
+                    cb.call(fail)
+
+        stats = manager.get_all_stats()
+        assert len(stats) == 50
+        assert stats["agent.stats0"]['window']['failed_calls'] == 1
+
+        summary = manager.get_aggregate_stats()
+        assert summary['breakers'] == 50
+        assert summary['window_calls'] == 55
+        assert summary['window_failures'] == 5
+        assert summary['states']['closed'] == 50
+        assert summary['highest_failure_rates'][0]['failure_rate'] == 0.5
+
+    def test_stats_cached_until_next_call(self):
+        cb = make_breaker("stats.cache")
+        cb.call(lambda: None)
+        first = cb.get_stats()
+        assert cb.get_stats()['total_calls'] == first['total_calls'] == 1
+
+        cb.call(lambda: None)
+        assert cb.get_stats()['total_calls'] == 2
+        assert cb.get_stats()['window']['calls'] == 2
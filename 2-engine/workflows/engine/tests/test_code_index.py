@@ -0,0 +1,196 @@
+"""
+Tests for the Code Index
+========================
+
+Tests the CodeIndex's ability to:
+- Tokenize identifiers into snake_case / camelCase parts
+- Walk the tree once, pruning skipped directories (names and globs)
+- Refresh incrementally by mtime/size (add, update, remove)
+- Rank files with BM25 and match query prefixes
+- Persist across instances via index_path (by default under .cache)
+- Back ContextExtractor.search_codebase
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from workflows.engine.pipeline.code_index import CodeIndex, split_identifier, tokenize_query
+from workflows.engine.pipeline.context_extractor import ContextExtractor
+
+
+SKIP = ['node_modules', '__pycache__', '*.egg-info']
+
+
+@pytest.fixture
+def codebase(tmp_path: Path) -> Path:
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'auth.py').write_text(
+        "class AuthenticationService:\n"
+        "    def login(self, user):\n"
+        "        return validate_token(user)\n"
+        "\n"
+        "def validate_token(user):\n"
+        "    return user.token is not None\n"
+    )
+    (tmp_path / 'src' / 'billing.py').write_text(
+        "def charge(invoice):\n"
+        "    # token is only logged here\n"
+        "    return invoice.total\n"
+    )
+    (tmp_path / 'src' / 'ui.ts').write_text("export function renderLogin() {}\n")
+    (tmp_path / 'node_modules').mkdir()
+    (tmp_path / 'node_modules' / 'dep.js').write_text("function validate_token() {}\n")
+    (tmp_path / 'pkg.egg-info').mkdir()
+    (tmp_path / 'pkg.egg-info' / 'meta.py').write_text("validate_token = None\n")
+    return tmp_path
+
+
+def make_index(root: Path, **kwargs) -> CodeIndex:
+    return CodeIndex(root, patterns=['*.py', '*.ts', '*.js'], skip_directories=SKIP, **kwargs)
+
+
+def touch(path: Path, content: str) -> None:
+    """Rewrite a file and move its mtime forward so the change is detected."""
+    mtime = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(content)
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+class TestTokenization:
+    """Tests for identifier splitting."""
+
+    def test_split_identifier(self):
+        tokens = set(split_identifier('parseHTTPRequest_v2'))
+        assert {'parsehttprequest_v2', 'parse', 'http', 'request', 'v2'} <= tokens
+
+    def test_query_keeps_identifiers_whole(self):
+        assert tokenize_query('missing_term_xyz Circuit-breaker') == [
+            'missing_term_xyz', 'circuit', 'breaker'
+        ]
+
+
+class TestRefresh:
+    """Tests for walking and incremental refresh."""
+
+    def test_walk_prunes_skipped_directories(self, codebase):
+        index = make_index(codebase)
+        paths = sorted(path for path, _ in index.walk())
+        assert paths == [os.path.join('src', 'auth.py'), os.path.join('src', 'billing.py'),
+                         os.path.join('src', 'ui.ts')]
+
+    def test_incremental_refresh_counts(self, codebase):
+        index = make_index(codebase)
+        assert index.refresh() == {'added': 3, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        assert index.refresh() == {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 3}
+
+        touch(codebase / 'src' / 'billing.py', "def refund(invoice):\n    return 0\n")
+        touch(codebase / 'src' / 'new.py', "def refund_all():\n    pass\n")
+        (codebase / 'src' / 'ui.ts').unlink()
+
+        assert index.refresh() == {'added': 1, 'updated': 1, 'removed': 1, 'unchanged': 1}
+        assert index.file_count == 3
+        assert index.search(['charge']) == []
+        assert {hit.path for hit in index.search(['refund'])} == {
+            os.path.join('src', 'billing.py'), os.path.join('src', 'new.py')
+        }
+
+    def test_persists_across_instances(self, codebase, tmp_path):
+        db = tmp_path / 'cache' / 'code.db'
+        first = make_index(codebase, index_path=db)
+        first.refresh()
+        first.close()
+
+        second = make_index(codebase, index_path=db)
+        assert second.file_count == 3
+        assert second.refresh()['unchanged'] == 3
+        assert second.search(['login'])
+
+
+class TestSearch:
+    """Tests for BM25 ranking and matching."""
+
+    def test_bm25_prefers_denser_matches(self, codebase):
+        index = make_index(codebase)
+        index.refresh()
+
+        hits = index.search(['token'])
+        assert [hit.path for hit in hits] == [
+            os.path.join('src', 'auth.py'), os.path.join('src', 'billing.py')
+        ]
+        assert hits[0].score > hits[1].score
+        assert hits[0].line_numbers == [3, 5, 6]
+
+    def test_prefix_and_camel_case_matching(self, codebase):
+        index = make_index(codebase)
+        index.refresh()
+
+        assert [hit.path for hit in index.search(['authentication'])] == [
+            os.path.join('src', 'auth.py')
+        ]
+        assert [hit.path for hit in index.search(['authen'])] == [
+            os.path.join('src', 'auth.py')
+        ]
+        assert index.search(['missing_term_xyz']) == []
+
+    def test_pattern_filter_and_limit(self, codebase):
+        index = make_index(codebase)
+        index.refresh()
+
+        assert [hit.path for hit in index.search(['login'], patterns=['*.ts'])] == [
+            os.path.join('src', 'ui.ts')
+        ]
+        assert len(index.search(['token', 'login'], limit=1)) == 1
+
+
+class TestContextExtractorIntegration:
+    """Tests for ContextExtractor backed by the index."""
+
+    @pytest.mark.asyncio
+    async def test_search_codebase_reads_only_hits(self, codebase):
+        extractor = ContextExtractor(codebase, index_refresh_interval=0)
+        results = await extractor.search_codebase(['validate_token'])
+
+        assert [r.file_path for r in results] == [os.path.join('src', 'auth.py')]
+        assert results[0].relevant_lines == [
+            "3: return validate_token(user)",
+            "5: def validate_token(user):",
+        ]
+        assert results[0].language == 'python'
+
+    @pytest.mark.asyncio
+    async def test_refresh_interval_and_new_patterns(self, codebase):
+        extractor = ContextExtractor(codebase, index_refresh_interval=3600)
+        assert await extractor.search_codebase(['charge'])
+
+        touch(codebase / 'src' / 'late.py', "def charge_later():\n    pass\n")
+        assert len(await extractor.search_codebase(['charge_later'])) == 0
+        assert extractor.refresh_index()['added'] == 1
+        assert len(await extractor.search_codebase(['charge_later'])) == 1
+
+        (codebase / 'README.md').write_text("charge docs\n")
+        results = await extractor.search_codebase(['charge'], file_patterns=['*.md'])
+        assert [r.file_path for r in results] == ['README.md']
+
+    @pytest.mark.asyncio
+    async def test_index_persisted_under_project_cache(self, codebase):
+        extractor = ContextExtractor(codebase, index_refresh_interval=3600)
+        assert extractor.index_path == codebase / '.cache' / 'code_index.db'
+        assert await extractor.search_codebase(['charge'])
+        extractor.close()
+        assert extractor.index_path.exists()
+
+        reopened = ContextExtractor(codebase, index_refresh_interval=3600)
+        assert reopened.refresh_index()['added'] == 0
+        reopened.close()
+
+        assert ContextExtractor(codebase, persist_index=False).index_path is None
+
+    @pytest.mark.asyncio
+    async def test_unwritable_index_path_falls_back_to_memory(self, codebase):
+        (codebase / 'blocked').write_text("not a directory\n")
+        extractor = ContextExtractor(codebase, index_path=codebase / 'blocked' / 'code.db',
+                                     index_refresh_interval=0)
+        assert await extractor.search_codebase(['validate_token'])
+        extractor.close()
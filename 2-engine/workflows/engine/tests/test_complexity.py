@@ -0,0 +1,89 @@
+"""
+Tests for TaskComplexityAnalyzer
+================================
+
+Tests the compiled analyzer and its memoization:
+- Scores and reasoning match the original heuristics
+- Repeated descriptions are served from the LRU
+- analyze_many keeps order and analyzes each distinct description once
+"""
+
+import pytest
+
+from workflows.engine.pipeline.complexity import ComplexityLevel, TaskComplexityAnalyzer
+
+
+@pytest.mark.parametrize("description, factors, reasoning", [
+    (
+        "Rename the helper and move it to utils, then delete the old one and remove imports",
+        {"length": 30, "keywords": 20, "technical": 20, "ambiguity": 20, "structure": 30},
+        "Moderate length (16 words) indicates standard task. Low-complexity keywords suggest simple task (4). "
+        "Minimal technical content. Clear and specific description. Simple paragraph structure",
+    ),
+    (
+        "Maybe refactor stuff, things etc. and so on - possibly several various number of modules, "
+        "3 or more, 12 or more",
+        {"length": 30, "keywords": 60, "technical": 20, "ambiguity": 70, "structure": 30},
+        "Moderate length (21 words) indicates standard task. High-complexity keywords present (1). "
+        "Minimal technical content. High ambiguity detected (11 vague phrases). Simple paragraph structure",
+    ),
+    (
+        "Update `config.yaml` and api.client.get() per https://example.com/docs/ and /usr/local/ paths, "
+        "see <div> tags, JSON, HTTP, REST API, AWS S3",
+        {"length": 30, "keywords": 40, "technical": 70, "ambiguity": 20, "structure": 30},
+        "Moderate length (18 words) indicates standard task. No strong complexity indicators. "
+        "High technical content (12 technical elements). Clear and specific description. Simple paragraph structure",
+    ),
+    (
+        "# Overview\n\n- item one\n- item two\n\n1. first\n2. second\n\n## Details\nWhat? Why? How? When?",
+        {"length": 30, "keywords": 40, "technical": 20, "ambiguity": 20, "structure": 60},
+        "Moderate length (18 words) indicates standard task. No strong complexity indicators. "
+        "Minimal technical content. Clear and specific description. Highly structured with lists, numbering, and sections",
+    ),
+])
+def test_analysis_matches_heuristics(description, factors, reasoning):
+    score = TaskComplexityAnalyzer(cache_size=0).analyze(description)
+    assert score.factors == factors
+    assert score.reasoning == reasoning
+    assert score.score == int(sum(factors.values()) / len(factors))
+
+
+def test_acronyms_need_word_boundaries():
+    analyzer = TaskComplexityAnalyzer(cache_size=0)
+    # JSON, API and AWS count; ABCd, xAB and AB_ are inside words
+    assert analyzer._analyze_technical("JSON API AWS ABCd xAB AB_", "")[1] == "Some technical elements (3)"
+
+
+def test_repeated_descriptions_hit_the_cache():
+    analyzer = TaskComplexityAnalyzer(cache_size=2)
+    first = analyzer.analyze("Design a scalable distributed architecture")
+    first.factors["length"] = 0  # callers get copies
+
+    again = analyzer.analyze("Design a scalable distributed architecture")
+    assert again.factors["length"] == 10
+    assert again.level == ComplexityLevel.LOW
+    assert analyzer.cache_stats == {"hits": 1, "misses": 1}
+
+    analyzer.analyze("Fix typo")
+    analyzer.analyze("Rename a variable")
+    analyzer.analyze("Design a scalable distributed architecture")
+    stats = analyzer.get_statistics()
+    assert stats["cached"] == 2
+    assert (stats["cache_hits"], stats["cache_misses"]) == (1, 4)
+
+
+def test_analyze_many_keeps_order_and_dedupes(monkeypatch):
+    analyzer = TaskComplexityAnalyzer()
+    analyzer.analyze("Fix typo")
+
+    analyzed = []
+    original = analyzer._analyze
+    monkeypatch.setattr(analyzer, "_analyze", lambda text: analyzed.append(text) or original(text))
+
+    descriptions = ["Fix typo", "Design a distributed system", "Fix typo", "Design a distributed system", ""]
+    scores = analyzer.analyze_many(descriptions)
+
+    assert analyzed == ["Design a distributed system", ""]
+    assert [s.to_dict() for s in scores] == [
+        TaskComplexityAnalyzer(cache_size=0).analyze(d).to_dict() for d in descriptions
+    ]
@@ -0,0 +1,115 @@
+"""
+Tests for the Context Extractor
+===============================
+
+Tests the ContextExtractor's ability to:
+- Cache pre-split documentation sections by path and mtime
+- Re-read documents only when they change
+- Cap the bytes read from disk per request
+- Run code, docs and conversation extraction concurrently
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from workflows.engine.pipeline.context_extractor import ContextExtractor, ReadBudget
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / 'service.py').write_text("def deploy_service():\n    return 'deploy'\n")
+    (tmp_path / 'README.md').write_text(
+        "# Project\n\n## Deployment\nRun the deploy script.\n"
+    )
+    (tmp_path / 'docs').mkdir()
+    (tmp_path / 'docs' / 'ops.txt').write_text("Deploy on Fridays is forbidden.\n")
+    (tmp_path / 'docs' / 'guide.md').write_text("# Guide\nNothing relevant here.\n")
+    (tmp_path / 'node_modules').mkdir()
+    (tmp_path / 'node_modules' / 'README.md').write_text("# Dep\ndeploy\n")
+    return tmp_path
+
+
+def make_extractor(root: Path, **kwargs) -> ContextExtractor:
+    return ContextExtractor(root, docs_path=root, index_refresh_interval=0, **kwargs)
+
+
+class TestDocSectionCache:
+    """Tests for cached documentation search."""
+
+    @pytest.mark.asyncio
+    async def test_sections_and_skipped_directories(self, project):
+        extractor = make_extractor(project)
+        sections = await extractor.search_docs(['deploy'])
+
+        assert sorted({s.section_path for s in sections}) == [
+            'README.md', os.path.join('docs', 'ops.txt')
+        ]
+        readme = next(s for s in sections if s.section_path == 'README.md')
+        assert readme.title == 'Deployment'
+        assert readme.heading_level == 2
+        extractor.close()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_documents_are_not_reread(self, project):
+        extractor = make_extractor(project)
+        await extractor.search_docs(['deploy'])
+        assert extractor.doc_cache_stats == {'hits': 0, 'misses': 3}
+
+        budget = ReadBudget(0)
+        await extractor.search_docs(['deploy'], read_budget=budget)
+        assert extractor.doc_cache_stats == {'hits': 3, 'misses': 3}
+        assert budget.bytes_read == 0
+
+        readme = project / 'README.md'
+        readme.write_text("# Project\n\n## Rollout\nDeploy with care, deploy often.\n")
+        mtime = readme.stat().st_mtime_ns + 10**9
+        os.utime(readme, ns=(mtime, mtime))
+
+        sections = await extractor.search_docs(['deploy'])
+        assert extractor.doc_cache_stats['misses'] == 4
+        assert 'Rollout' in [s.title for s in sections]
+        extractor.close()
+
+    def test_extract_doc_sections_matches_uncached_behaviour(self, project):
+        extractor = make_extractor(project)
+        content = "intro deploy\n" + "# Far Heading\n" + "filler\n" * 25 + "deploy again\n"
+
+        sections = extractor._extract_doc_sections(content, ['DEPLOY'], max_sections=3)
+        assert [s['title'] for s in sections] == ["Unknown Section", "Unknown Section"]
+
+
+class TestReadBudget:
+    """Tests for the per-request byte cap."""
+
+    def test_consume(self):
+        budget = ReadBudget(100)
+        assert budget.consume(60)
+        assert not budget.consume(60)
+        assert budget.consume(40)
+        assert (budget.bytes_read, budget.skipped) == (100, 1)
+        assert ReadBudget(0).consume(10**12)
+
+    @pytest.mark.asyncio
+    async def test_budget_limits_document_reads(self, project):
+        extractor = make_extractor(project, max_bytes_per_request=1)
+        assert await extractor.search_docs(['deploy']) == []
+        assert extractor.doc_cache_stats['misses'] == 3
+        extractor.close()
+
+
+class TestExtractContext:
+    """Tests for the concurrent extraction legs."""
+
+    @pytest.mark.asyncio
+    async def test_legs_run_together(self, project):
+        extractor = make_extractor(project)
+        history = [{'role': 'user', 'content': 'please deploy the service'}]
+
+        context = await extractor.extract_context('t1', 'Deploy the service', history)
+
+        assert [f.file_path for f in context.relevant_files] == ['service.py']
+        assert context.relevant_docs
+        assert context.conversation_context.relevant_messages
+        extractor.close()
@@ -0,0 +1,226 @@
+"""
+Tests for the In-Memory EventBus Dispatch Engine
+================================================
+
+Tests the EventBus's ability to:
+- Match exact, ".*", prefix and glob subscriptions
+- Keep per-subscriber ordering across dispatch workers
+- Isolate slow subscribers (backpressure / drop_oldest)
+- Stop within stop_timeout and never deadlock a handler on its own backlog
+- Report throughput and delivery latency statistics
+"""
+
+import asyncio
+import pytest
+
+from workflows.engine.state.event_bus import (
+    Event,
+    EventBus,
+    EventBusConfig,
+    topic_matches,
+)
+
+
+def make_event(event_type: str, i: int = 0) -> Event:
+    return Event(type=event_type, data={"i": i}, source="test")
+
+
+class TestTopicMatching:
+    """Tests for subscription pattern matching."""
+
+    def test_patterns(self):
+        assert topic_matches("task.completed", "task.completed")
+        assert not topic_matches("task.completed", "task.failed")
+        assert topic_matches(".*", "anything.at.all")
+        assert topic_matches("task.*", "task.started")
+        assert not topic_matches("task.*", "agent.started")
+        assert topic_matches("*.failed", "agent.failed")
+        assert topic_matches("agent.[sc]*", "agent.completed")
+
+
+class TestDispatch:
+    """Tests for dispatch behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_delivers_to_all_matching_subscribers(self):
+        bus = EventBus(EventBusConfig(num_workers=3))
+        received = {"all": [], "task": [], "failed": [], "exact": []}
+
+        async def on_all(event):
+            received["all"].append(event.type)
+
+        async def on_task(event):
+            received["task"].append(event.type)
+
+        async def on_failed(event):
+            received["failed"].append(event.type)
+
+        async def on_exact(event):
+            received["exact"].append(event.type)
+
+        await bus.subscribe(".*", on_all)
+        await bus.subscribe("task.*", on_task)
+        await bus.subscribe("*.failed", on_failed)
+        await bus.subscribe("agent.started", on_exact)
+        await bus.start()
+
+        for event_type in ["task.started", "task.failed", "agent.started", "agent.failed"]:
+            await bus.publish(make_event(event_type))
+        await bus.stop()
+
+        assert len(received["all"]) == 4
+        assert received["task"] == ["task.started", "task.failed"]
+        assert received["failed"] == ["task.failed", "agent.failed"]
+        assert received["exact"] == ["agent.started"]
+
+    @pytest.mark.asyncio
+    async def test_order_preserved_with_slow_subscriber(self):
+        """Backpressure from a slow subscriber does not reorder events."""
+        bus = EventBus(EventBusConfig(num_workers=4, subscriber_queue_size=5, batch_size=8))
+        fast, slow = [], []
+
+        async def on_fast(event):
+            fast.append(event.data["i"])
+
+        async def on_slow(event):
+            await asyncio.sleep(0.001)
+            slow.append(event.data["i"])
+
+        await bus.subscribe("work", on_fast)
+        await bus.subscribe("work", on_slow)
+        await bus.start()
+
+        for i in range(200):
+            await bus.publish(make_event("work", i))
+        await bus.stop()
+
+        assert fast == list(range(200))
+        assert slow == list(range(200))
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_block_other_topics(self):
+        bus = EventBus(EventBusConfig(subscriber_queue_size=1))
+        release = asyncio.Event()
+        other = []
+
+        async def stuck(event):
+            await release.wait()
+
+        async def on_other(event):
+            other.append(event.data["i"])
+
+        await bus.subscribe("stuck", stuck)
+        await bus.subscribe("other", on_other)
+        await bus.start()
+
+        await bus.publish(make_event("stuck"))
+        await bus.publish(make_event("stuck"))
+        for i in range(10):
+            await bus.publish(make_event("other", i))
+        await asyncio.sleep(0.05)
+
+        assert other == list(range(10))
+
+        release.set()
+        await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_policy(self):
+        bus = EventBus(EventBusConfig(subscriber_queue_size=3, overflow_policy="drop_oldest"))
+        received = []
+
+        async def handler(event):
+            received.append(event.data["i"])
+
+        await bus.subscribe("x", handler)
+        await bus.start()
+        for i in range(10):
+            await bus.publish(make_event("x", i))
+        await bus.stop()
+
+        stats = await bus.get_statistics()
+        assert received == [7, 8, 9]
+        assert stats["dropped"] == 7
+
+    @pytest.mark.asyncio
+    async def test_stop_gives_up_on_hung_handler(self):
+        bus = EventBus(EventBusConfig(stop_timeout=0.1))
+        never = asyncio.Event()
+
+        async def hung(event):
+            await never.wait()
+
+        await bus.subscribe("x", hung)
+        await bus.start()
+        for i in range(3):
+            await bus.publish(make_event("x", i))
+
+        await asyncio.wait_for(bus.stop(), timeout=2)
+
+        stats = await bus.get_statistics()
+        assert not stats["running"]
+        assert stats["delivered"] == 0
+        assert stats["dropped"] == 2  # The third was cancelled mid-handler
+        assert stats["subscriber_backlog"] == {}
+
+    @pytest.mark.asyncio
+    async def test_handler_publishing_into_own_full_backlog(self):
+        bus = EventBus(EventBusConfig(subscriber_queue_size=1))
+        received, others = [], []
+
+        async def echo(event):
+            received.append(event.data["i"])
+            if event.data["i"] == 0:
+                await bus.publish(make_event("x", 10))
+                await bus.publish(make_event("x", 11))
+
+        async def other(event):
+            others.append(event.data["i"])
+
+        await bus.subscribe("x", echo)
+        await bus.subscribe("x", other)
+        await bus.start()
+        await bus.publish(make_event("x", 0))
+        await asyncio.wait_for(bus.stop(), timeout=2)
+
+        stats = await bus.get_statistics()
+        assert received == [0, 10]
+        assert others == [0, 10, 11]
+        assert stats["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self):
+        bus = EventBus()
+        received = []
+
+        async def handler(event):
+            received.append(event.type)
+
+        unsubscribe = await bus.subscribe("x", handler)
+        await bus.start()
+        await bus.publish(make_event("x"))
+        await asyncio.sleep(0.01)
+        await unsubscribe()
+        await bus.publish(make_event("x"))
+        await bus.stop()
+
+        assert received == ["x"]
+
+    @pytest.mark.asyncio
+    async def test_statistics(self):
+        bus = EventBus()
+
+        async def handler(event):
+            pass
+
+        await bus.subscribe("x", handler)
+        await bus.start()
+        for i in range(100):
+            await bus.publish(make_event("x", i))
+        await bus.stop()
+
+        stats = await bus.get_statistics()
+        assert stats["published"] == 100
+        assert stats["delivered"] == 100
+        assert stats["publish_rate"] > 0
+        assert stats["delivery_latency_ms"]["p99"] >= stats["delivery_latency_ms"]["p50"]
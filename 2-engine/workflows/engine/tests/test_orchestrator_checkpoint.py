@@ -10,18 +10,11 @@ Tests the AgentOrchestrator's ability to:
 - Clean up checkpoints after completion
 """
 
-import asyncio
 import pytest
-import tempfile
 import json
-from pathlib import Path
 from datetime import datetime
-from unittest.mock import Mock, AsyncMock
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "01-core"))
-
-from orchestration.Orchestrator import (
+from workflows.engine.Orchestrator import (
     AgentOrchestrator,
     Workflow,
     WorkflowStep,
@@ -31,44 +24,9 @@ from agents.framework.base_agent import BaseAgent, AgentConfig, AgentTask, Agent
 
 
 # =============================================================================
-# MOCK AGENT FOR TESTING
+# FAILING AGENT FOR TESTING
 # =============================================================================
 
-class MockAgent(BaseAgent):
-    """A mock agent for testing orchestration."""
-
-    def __init__(self, name: str = "test_agent"):
-        config = AgentConfig(
-            name=name,
-            full_name=f"Test Agent {name}",
-            role="tester",
-            category="testing",
-            description="A test agent",
-        )
-        super().__init__(config)
-        self.execute_call_count = 0
-        self.execute_delay = 0.1  # Small delay for testing
-
-    async def execute(self, task: AgentTask) -> AgentResult:
-        """Execute task with optional delay."""
-        self.execute_call_count += 1
-        await asyncio.sleep(self.execute_delay)
-
-        return AgentResult(
-            success=True,
-            output=f"Executed task {task.id}",
-            metadata={"agent": self.name, "call_count": self.execute_call_count}
-        )
-
-    async def think(self, task: AgentTask) -> list:
-        """Return thinking steps."""
-        return [
-            f"Understanding task: {task.description}",
-            "Processing task",
-            "Returning result",
-        ]
-
-
 class FailingAgent(BaseAgent):
     """An agent that fails on specific steps."""
 
@@ -100,72 +58,6 @@ class FailingAgent(BaseAgent):
         return ["Thinking about task"]
 
 
-# =============================================================================
-# FIXTURES
-# =============================================================================
-
-@pytest.fixture
-def temp_checkpoint_dir():
-    """Create a temporary directory for checkpoints."""
-    temp_dir = tempfile.mkdtemp(prefix="bb5_checkpoints_")
-    yield Path(temp_dir)
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-@pytest.fixture
-def mock_event_bus():
-    """Create a mock event bus."""
-    event_bus = Mock()
-    event_bus.publish = AsyncMock()
-    return event_bus
-
-
-@pytest.fixture
-def orchestrator_with_checkpoints(temp_checkpoint_dir, mock_event_bus):
-    """Create an orchestrator with checkpointing enabled."""
-    orchestrator = AgentOrchestrator(
-        event_bus=mock_event_bus,
-        task_router=None,
-        memory_base_path=temp_checkpoint_dir,
-        max_concurrent_agents=5,
-        enable_checkpoints=True,
-    )
-    return orchestrator
-
-
-@pytest.fixture
-def orchestrator_without_checkpoints(temp_checkpoint_dir, mock_event_bus):
-    """Create an orchestrator with checkpointing disabled."""
-    orchestrator = AgentOrchestrator(
-        event_bus=mock_event_bus,
-        task_router=None,
-        memory_base_path=temp_checkpoint_dir,
-        max_concurrent_agents=5,
-        enable_checkpoints=False,
-    )
-    return orchestrator
-
-
-@pytest.fixture
-def registered_agents(orchestrator_with_checkpoints):
-    """Register mock agents with the orchestrator."""
-    agent1 = MockAgent("agent1")
-    agent2 = MockAgent("agent2")
-    agent3 = MockAgent("agent3")
-
-    asyncio.run(orchestrator_with_checkpoints.register_agent(agent1))
-    asyncio.run(orchestrator_with_checkpoints.register_agent(agent2))
-    asyncio.run(orchestrator_with_checkpoints.register_agent(agent3))
-
-    return {
-        "agent1": agent1,
-        "agent2": agent2,
-        "agent3": agent3,
-    }
-
-
 # =============================================================================
 # CHECKPOINT CREATION TESTS
 # =============================================================================
@@ -237,7 +129,6 @@ class TestCheckpointCreation:
         )
 
         # Manually create a checkpoint to test its structure
-        from orchestration.Orchestrator import AgentOrchestrator
         orchestrator_with_checkpoints._save_checkpoint(workflow, {"step1"})
 
         checkpoint_file = temp_checkpoint_dir / "checkpoints" / f"{workflow.id}.json"
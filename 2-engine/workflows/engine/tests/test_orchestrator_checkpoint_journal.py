@@ -0,0 +1,138 @@
+"""
+Tests for Journal-Mode Orchestrator Checkpoints
+===============================================
+
+The checkpoint and resume tests run in both modes (see conftest.py); these
+test the journal itself:
+- One appended record per step transition
+- Snapshot + tail replay on load
+- Compaction into a snapshot
+- Tolerance of a torn final record, which is cut off on load
+"""
+
+import json
+import pytest
+
+from agents.framework.base_agent import AgentTask
+from workflows.engine.Orchestrator import (
+    AgentOrchestrator,
+    Workflow,
+    WorkflowStep,
+    WorkflowStatus,
+)
+from workflows.engine.state.checkpoint_journal import CheckpointJournal
+
+
+@pytest.fixture
+def orchestrator_with_checkpoints(temp_checkpoint_dir, mock_event_bus):
+    """Create an orchestrator with journal-mode checkpointing."""
+    return AgentOrchestrator(
+        event_bus=mock_event_bus,
+        task_router=None,
+        memory_base_path=temp_checkpoint_dir,
+        max_concurrent_agents=5,
+        enable_checkpoints=True,
+        checkpoint_journal=True,
+        journal_fsync_every=2,
+        journal_compact_every=4,
+    )
+
+
+def make_workflow(count: int) -> Workflow:
+    """Create a sequential workflow with `count` steps."""
+    return Workflow(
+        id="journal-test",
+        name="Journal Test",
+        steps=[
+            WorkflowStep(
+                id=f"step{i}",
+                name=f"Step {i}",
+                agent_name="agent1",
+                task=AgentTask(id=f"task{i}", description=f"Task {i}"),
+                depends_on=[f"step{i - 1}"] if i else [],
+            )
+            for i in range(count)
+        ],
+    )
+
+
+class TestCheckpointJournal:
+    """Tests for the append-only journal."""
+
+    def test_append_writes_one_record_per_transition(
+        self, orchestrator_with_checkpoints, temp_checkpoint_dir
+    ):
+        """Each saved transition is a single compact line, not a rewrite."""
+        workflow = make_workflow(3)
+        completed = set()
+        for step in workflow.steps[:3]:
+            step.status = WorkflowStatus.COMPLETED
+            completed.add(step.id)
+            orchestrator_with_checkpoints._save_checkpoint(workflow, completed, step)
+
+        journal = temp_checkpoint_dir / "checkpoints" / f"{workflow.id}.journal"
+        lines = journal.read_text().splitlines()
+        assert len(lines) == 3
+        assert [json.loads(line)['id'] for line in lines] == ["step0", "step1", "step2"]
+        assert not (temp_checkpoint_dir / "checkpoints" / f"{workflow.id}.json").exists()
+
+    def test_compaction_and_tail_replay(
+        self, orchestrator_with_checkpoints, temp_checkpoint_dir
+    ):
+        """Loading replays the tail over the compacted snapshot."""
+        workflow = make_workflow(6)
+        completed = set()
+        for step in workflow.steps[:5]:
+            step.status = WorkflowStatus.COMPLETED
+            completed.add(step.id)
+            orchestrator_with_checkpoints._save_checkpoint(workflow, completed, step)
+
+        checkpoint_dir = temp_checkpoint_dir / "checkpoints"
+        snapshot = json.loads((checkpoint_dir / f"{workflow.id}.json").read_text())
+        assert len(snapshot['completed_steps']) == 4
+        assert len((checkpoint_dir / f"{workflow.id}.journal").read_text().splitlines()) == 1
+
+        data = orchestrator_with_checkpoints._load_checkpoint(workflow.id)
+        assert set(data['completed_steps']) == completed
+        assert len(data['steps']) == 6
+
+    def test_torn_record_is_ignored(self, temp_checkpoint_dir):
+        """A partially written last line does not break loading."""
+        journal = CheckpointJournal(temp_checkpoint_dir)
+        journal.append("wf", {"id": "a", "status": "completed", "completed": True})
+        journal.close()
+        with open(journal.journal_path("wf"), "a") as f:
+            f.write('{"id": "b", "stat')
+
+        data = journal.load("wf")
+        assert data['completed_steps'] == ["a"]
+        assert [s['id'] for s in data['steps']] == ["a"]
+
+    def test_appends_after_torn_record_survive_reload(self, temp_checkpoint_dir):
+        """Loading cuts the torn line off, so later records start on their own line."""
+        journal = CheckpointJournal(temp_checkpoint_dir)
+        journal.append("wf", {"id": "a", "status": "completed", "completed": True})
+        journal.close()
+        with open(journal.journal_path("wf"), "a") as f:
+            f.write('{"id": "b", "stat')
+
+        journal.load("wf")
+        journal.append("wf", {"id": "b", "status": "completed", "completed": True})
+        journal.close()
+
+        data = CheckpointJournal(temp_checkpoint_dir).load("wf")
+        assert data['completed_steps'] == ["a", "b"]
+        assert journal.journal_path("wf").read_text().count("\n") == 2
+
+    @pytest.mark.asyncio
+    async def test_journal_removed_after_completion(
+        self, orchestrator_with_checkpoints, registered_agents, temp_checkpoint_dir
+    ):
+        """Snapshot and journal are both cleaned up when the workflow ends."""
+        workflow = make_workflow(6)
+
+        result = await orchestrator_with_checkpoints.execute_workflow(workflow)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        checkpoint_dir = temp_checkpoint_dir / "checkpoints"
+        assert list(checkpoint_dir.iterdir()) == []
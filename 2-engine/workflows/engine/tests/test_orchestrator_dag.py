@@ -0,0 +1,240 @@
+"""
+Tests for Orchestrator DAG Scheduling
+=====================================
+
+Tests the AgentOrchestrator's ready-queue scheduler:
+- Independent steps run concurrently
+- Dependents start only after their dependencies complete
+- Global and per-agent concurrency limits are respected
+- Failures stop new dispatches and retries are re-queued
+- Cancelling a workflow cancels its running steps and waits for them
+"""
+
+import asyncio
+import time
+import pytest
+
+from workflows.engine.Orchestrator import (
+    AgentOrchestrator,
+    Workflow,
+    WorkflowStep,
+    WorkflowStatus,
+)
+from agents.framework.base_agent import BaseAgent, AgentConfig, AgentTask, AgentResult
+
+
+# =============================================================================
+# MOCK AGENT FOR TESTING
+# =============================================================================
+
+class TrackingAgent(BaseAgent):
+    """A mock agent that records execution order and peak concurrency."""
+
+    def __init__(self, name: str, delay: float = 0.05, fail_times: int = 0):
+        config = AgentConfig(
+            name=name,
+            full_name=f"Tracking Agent {name}",
+            role="tester",
+            category="testing",
+            description="A test agent that tracks concurrency",
+        )
+        super().__init__(config)
+        self.delay = delay
+        self.fail_times = fail_times
+        self.active = 0
+        self.peak = 0
+        self.started = []
+        self.finished = []
+
+    async def execute(self, task: AgentTask) -> AgentResult:
+        """Execute task, tracking how many run at once."""
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.started.append(task.id)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_times > 0:
+                self.fail_times -= 1
+                raise Exception(f"Simulated failure for task {task.id}")
+            self.finished.append(task.id)
+            return AgentResult(success=True, output=f"Executed task {task.id}")
+        finally:
+            self.active -= 1
+
+    async def think(self, task: AgentTask) -> list:
+        return ["Thinking about task"]
+
+
+def make_step(step_id: str, agent_name: str, depends_on: list = None) -> WorkflowStep:
+    """Create a workflow step whose task ID matches the step ID."""
+    return WorkflowStep(
+        id=step_id,
+        name=f"Step {step_id}",
+        agent_name=agent_name,
+        task=AgentTask(id=step_id, description=f"Task {step_id}"),
+        depends_on=depends_on or [],
+    )
+
+
+# =============================================================================
+# SCHEDULING TESTS
+# =============================================================================
+
+class TestDagScheduling:
+    """Tests for concurrent dependency-ordered execution."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        """A fan-out of independent steps takes ~one step's latency."""
+        orchestrator = AgentOrchestrator(enable_checkpoints=False, max_concurrent_agents=10)
+        agent = TrackingAgent("worker", delay=0.1)
+        await orchestrator.register_agent(agent)
+
+        workflow = Workflow(
+            name="Fan-out",
+            steps=[make_step(f"s{i}", "worker") for i in range(10)],
+        )
+
+        start = time.perf_counter()
+        result = await orchestrator.execute_workflow(workflow)
+        elapsed = time.perf_counter() - start
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert agent.peak == 10
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_dependents_wait_for_dependencies(self):
+        """A join step starts only after every branch has finished."""
+        orchestrator = AgentOrchestrator(enable_checkpoints=False)
+        agent = TrackingAgent("worker", delay=0.02)
+        await orchestrator.register_agent(agent)
+
+        workflow = Workflow(
+            name="Diamond",
+            steps=[
+                make_step("join", "worker", depends_on=["left", "right"]),
+                make_step("left", "worker", depends_on=["root"]),
+                make_step("right", "worker", depends_on=["root"]),
+                make_step("root", "worker"),
+            ],
+        )
+
+        result = await orchestrator.execute_workflow(workflow)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert agent.started[0] == "root"
+        assert agent.started[-1] == "join"
+        assert set(agent.finished[1:3]) == {"left", "right"}
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_limit(self):
+        """No more than max_concurrent_agents steps run at once."""
+        orchestrator = AgentOrchestrator(enable_checkpoints=False, max_concurrent_agents=3)
+        agent = TrackingAgent("worker", delay=0.02)
+        await orchestrator.register_agent(agent)
+
+        workflow = Workflow(
+            name="Bounded",
+            steps=[make_step(f"s{i}", "worker") for i in range(12)],
+        )
+
+        result = await orchestrator.execute_workflow(workflow)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert agent.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_per_agent_concurrency_limit(self):
+        """Per-agent limits bound one agent without throttling the others."""
+        orchestrator = AgentOrchestrator(
+            enable_checkpoints=False,
+            max_concurrent_agents=10,
+            max_concurrent_per_agent=4,
+            agent_concurrency_limits={"slow": 1},
+        )
+        slow = TrackingAgent("slow", delay=0.02)
+        fast = TrackingAgent("fast", delay=0.02)
+        await orchestrator.register_agent(slow)
+        await orchestrator.register_agent(fast)
+
+        steps = [make_step(f"slow{i}", "slow") for i in range(4)]
+        steps += [make_step(f"fast{i}", "fast") for i in range(8)]
+
+        result = await orchestrator.execute_workflow(Workflow(name="Mixed", steps=steps))
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert slow.peak == 1
+        assert fast.peak == 4
+
+    @pytest.mark.asyncio
+    async def test_retry_then_success(self):
+        """A failing step is re-queued and its dependents still run."""
+        orchestrator = AgentOrchestrator(enable_checkpoints=False)
+        flaky = TrackingAgent("flaky", delay=0.01, fail_times=2)
+        worker = TrackingAgent("worker", delay=0.01)
+        await orchestrator.register_agent(flaky)
+        await orchestrator.register_agent(worker)
+
+        workflow = Workflow(
+            name="Retry",
+            steps=[make_step("a", "flaky"), make_step("b", "worker", depends_on=["a"])],
+        )
+
+        result = await orchestrator.execute_workflow(workflow)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert workflow.steps[0].retry_count == 2
+        assert worker.finished == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_failure_blocks_dependents(self):
+        """Dependents of a step that exhausted its retries never run."""
+        orchestrator = AgentOrchestrator(enable_checkpoints=False)
+        broken = TrackingAgent("broken", delay=0.01, fail_times=100)
+        worker = TrackingAgent("worker", delay=0.01)
+        await orchestrator.register_agent(broken)
+        await orchestrator.register_agent(worker)
+
+        workflow = Workflow(
+            name="Failure",
+            steps=[make_step("a", "broken"), make_step("b", "worker", depends_on=["a"])],
+        )
+
+        result = await orchestrator.execute_workflow(workflow)
+
+        assert result.status == WorkflowStatus.FAILED
+        assert worker.started == []
+
+    @pytest.mark.asyncio
+    async def test_cancel_waits_for_running_steps(self):
+        """Running steps have unwound by the time the cancelled workflow returns."""
+        orchestrator = AgentOrchestrator(enable_checkpoints=False)
+        agent = TrackingAgent("worker", delay=10)
+        await orchestrator.register_agent(agent)
+
+        workflow = Workflow(
+            name="Cancelled",
+            steps=[make_step(f"s{i}", "worker") for i in range(3)],
+        )
+        run = asyncio.create_task(orchestrator.execute_workflow(workflow))
+        while agent.active < 3:
+            await asyncio.sleep(0.01)
+
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        assert agent.active == 0
+        assert agent.finished == []
+
+    def test_topological_order_rejects_missing_dependency(self):
+        """Steps depending on unknown IDs are reported as a deadlock."""
+        orchestrator = AgentOrchestrator(enable_checkpoints=False)
+        workflow = Workflow(
+            name="Missing",
+            steps=[make_step("a", "worker", depends_on=["ghost"])],
+        )
+
+        with pytest.raises(RuntimeError, match="deadlock"):
+            orchestrator._topological_order(workflow, set())
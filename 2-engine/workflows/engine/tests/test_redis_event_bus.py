@@ -0,0 +1,232 @@
+"""
+Tests for the Redis EventBus Transport
+======================================
+
+Runs RedisEventBus against a local fake Redis (fakeredis) to test:
+- Pipelined, batched publishing
+- Pub/sub delivery across buses
+- Redis Streams mode with consumer groups and acknowledgement after delivery
+- Flushing buffered publishes on stop and leaving caller-owned clients open
+- The shared per-process connection pool
+"""
+
+import asyncio
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("redis")
+
+from workflows.engine.state.event_bus import (
+    Event,
+    EventBusConfig,
+    RedisEventBus,
+    get_redis_pool,
+)
+
+
+def make_event(event_type: str, i: int = 0) -> Event:
+    return Event(type=event_type, data={"i": i}, source="test")
+
+
+@pytest.fixture
+def server():
+    """A fake Redis server shared by all clients of one test."""
+    return fakeredis.FakeServer()
+
+
+def make_bus(server, **config) -> RedisEventBus:
+    client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    return RedisEventBus(EventBusConfig(**config), redis_client=client)
+
+
+async def wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+class TestBatchedPublish:
+    """Tests for the batching publisher."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_are_pipelined(self, server):
+        bus = make_bus(server, use_streams=True, batch_size=50, publish_batch_window=0.05)
+
+        for i in range(120):
+            await bus.publish(make_event("task.started", i))
+        await bus.flush()
+
+        stats = await bus.get_statistics()
+        assert stats["redis"]["published"] == 120
+        assert stats["redis"]["batches"] == 3
+        assert await bus._redis_client.xlen("events") == 120
+
+    @pytest.mark.asyncio
+    async def test_window_flushes_partial_batch(self, server):
+        bus = make_bus(server, use_streams=True, batch_size=100, publish_batch_window=0.01)
+
+        await bus.publish(make_event("x"))
+        assert await bus._redis_client.xlen("events") == 0
+        await asyncio.sleep(0.05)
+
+        assert await bus._redis_client.xlen("events") == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_window(self, server):
+        bus = make_bus(server, use_streams=True, batch_size=100, publish_batch_window=0.05)
+        await bus.start()
+
+        for i in range(3):
+            await bus.publish(make_event("x", i))
+        await bus.stop()
+
+        # The bus did not create the client, so it is still usable
+        assert await bus._redis_client.xlen("events") == 3
+
+
+class TestPubSubMode:
+    """Tests for pub/sub delivery."""
+
+    @pytest.mark.asyncio
+    async def test_delivers_across_buses(self, server):
+        publisher = make_bus(server)
+        subscriber = make_bus(server)
+        received = []
+
+        async def handler(event):
+            received.append(event.data["i"])
+
+        await subscriber.subscribe("task.*", handler)
+        await subscriber.start()
+        await asyncio.sleep(0.05)
+
+        for i in range(10):
+            await publisher.publish(make_event("task.completed", i))
+        await publisher.flush()
+
+        await wait_for(lambda: len(received) == 10)
+        await subscriber.stop()
+        assert received == list(range(10))
+
+
+class TestStreamsMode:
+    """Tests for Redis Streams delivery."""
+
+    @pytest.mark.asyncio
+    async def test_consumer_group_delivers_and_acks(self, server):
+        consumer = make_bus(server, use_streams=True, flush_interval=0.01)
+        received = []
+
+        async def handler(event):
+            received.append(event.data["i"])
+
+        await consumer.subscribe(".*", handler)
+        await consumer.start()
+        await asyncio.sleep(0.05)
+
+        publisher = make_bus(server, use_streams=True)
+        for i in range(25):
+            await publisher.publish(make_event("agent.started", i))
+        await publisher.flush()
+
+        await wait_for(lambda: len(received) == 25)
+        await consumer.stop()
+
+        assert received == list(range(25))
+        pending = await publisher._redis_client.xpending("events", "blackbox5")
+        assert pending["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_entries_acked_only_after_handler_returns(self, server):
+        consumer = make_bus(server, use_streams=True, flush_interval=0.01)
+        release = asyncio.Event()
+        received = []
+
+        async def handler(event):
+            await release.wait()
+            received.append(event.data["i"])
+
+        await consumer.subscribe(".*", handler)
+        await consumer.start()
+        await asyncio.sleep(0.05)
+
+        publisher = make_bus(server, use_streams=True)
+        for i in range(3):
+            await publisher.publish(make_event("x", i))
+        await publisher.flush()
+
+        async def pending_count():
+            return (await publisher._redis_client.xpending("events", "blackbox5"))["pending"]
+
+        await wait_for(lambda: len(consumer._unacked) == 3)
+        await asyncio.sleep(0.05)
+        assert await pending_count() == 3
+
+        release.set()
+        await wait_for(lambda: received == [0, 1, 2])
+        await asyncio.sleep(0.05)
+        assert await pending_count() == 0
+        await consumer.stop()
+
+    @pytest.mark.asyncio
+    async def test_undelivered_entries_stay_pending(self, server):
+        """Entries still queued when stop() gives up are redelivered later."""
+        consumer = make_bus(server, use_streams=True, flush_interval=0.01,
+                            consumer_name="worker-1", stop_timeout=0.05)
+
+        async def hung(event):
+            await asyncio.Event().wait()
+
+        await consumer.subscribe(".*", hung)
+        await consumer.start()
+        await asyncio.sleep(0.05)
+
+        publisher = make_bus(server, use_streams=True)
+        for i in range(2):
+            await publisher.publish(make_event("x", i))
+        await publisher.flush()
+        await wait_for(lambda: len(consumer._unacked) == 2)
+        await consumer.stop()
+
+        pending = await publisher._redis_client.xpending("events", "blackbox5")
+        assert pending["pending"] == 2
+
+    @pytest.mark.asyncio
+    async def test_pending_entries_replayed_on_restart(self, server):
+        """Entries read but never acknowledged are redelivered to the same consumer."""
+        client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        await client.xgroup_create("events", "blackbox5", id="$", mkstream=True)
+        await client.xadd("events", {"event": make_event("x", 7).to_json()})
+        await client.xreadgroup("blackbox5", "worker-1", {"events": ">"})
+
+        bus = make_bus(server, use_streams=True, consumer_name="worker-1", flush_interval=0.01)
+        received = []
+
+        async def handler(event):
+            received.append(event.data["i"])
+
+        await bus.subscribe("x", handler)
+        await bus.start()
+        await wait_for(lambda: received == [7])
+        await bus.stop()
+
+
+class TestConnectionPool:
+    """Tests for the shared connection pool."""
+
+    def test_pool_shared_per_target(self):
+        a = get_redis_pool(EventBusConfig(redis_host="localhost", redis_port=6390))
+        b = get_redis_pool(EventBusConfig(redis_host="localhost", redis_port=6390))
+        c = get_redis_pool(EventBusConfig(redis_host="localhost", redis_port=6391))
+
+        assert a is b
+        assert a is not c
+
+    def test_buses_share_pool(self):
+        config = dict(use_redis=True, redis_port=6392)
+        first = RedisEventBus(EventBusConfig(**config))
+        second = RedisEventBus(EventBusConfig(**config))
+
+        assert first._redis_client.connection_pool is second._redis_client.connection_pool
@@ -0,0 +1,219 @@
+"""
+Tests for the SQLite State Store
+================================
+
+Tests the StateStore and StateManager(use_store=True) ability to:
+- Write only new or changed tasks on update_workflow, keeping notes
+- Upsert a single task on update_task without rewriting STATE.md
+- Append notes, and refuse them before a workflow exists
+- Render STATE.md on wave changes and on render_state(), in a form
+  parse_state reads back
+- Roll back a transaction whose block raises (immediate_transaction)
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from helpers.core.sqlite_utils import immediate_transaction
+from workflows.engine.state.state_manager import StateManager, TaskState, WorkflowState
+from workflows.engine.state.state_store import StateStore
+
+
+def make_state(tasks, wave: int = 1, notes=None) -> WorkflowState:
+    return WorkflowState(
+        workflow_id="wf-1",
+        workflow_name="Build feature",
+        current_wave=wave,
+        total_waves=3,
+        tasks={task.task_id: task for task in tasks},
+        started_at=datetime(2026, 1, 1, 9, 0, 0),
+        updated_at=datetime(2026, 1, 1, 9, 0, 0),
+        notes=notes or [],
+    )
+
+
+def make_task(task_id: str, status: str = "pending", wave_id: int = 1, **kwargs) -> TaskState:
+    return TaskState(task_id=task_id, description=f"Do {task_id}", status=status,
+                     wave_id=wave_id, **kwargs)
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    store = StateStore(tmp_path / "STATE.db")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> StateManager:
+    manager = StateManager(state_path=tmp_path / "STATE.md", use_store=True)
+    manager.initialize(
+        workflow_id="wf-1",
+        workflow_name="Build feature",
+        total_waves=2,
+        all_waves=[
+            [{"task_id": "t1", "description": "Write parser"},
+             {"task_id": "t2", "description": "Write tests"}],
+            [{"task_id": "t3", "description": "Ship it"}],
+        ],
+    )
+    return manager
+
+
+class TestStateStore:
+    """Tests for the store's writes and reads."""
+
+    def test_update_workflow_writes_only_changes(self, store):
+        store.replace(make_state([make_task("t1"), make_task("t2"), make_task("t3")], notes=["first"]))
+
+        before = store._conn.total_changes
+        store.update_workflow(
+            make_state([make_task("t1", status="completed", commit_hash="abc123"), make_task("t2")]),
+            notes=["second"],
+        )
+        # Header, t1 and the note are written, t3 deleted; t2 is untouched
+        assert store._conn.total_changes - before == 4
+
+        state = store.load()
+        assert list(state.tasks) == ["t1", "t2"]
+        assert state.tasks["t1"].status == "completed"
+        assert state.tasks["t1"].commit_hash == "abc123"
+        assert state.notes == ["first", "second"]
+
+    def test_upsert_task_keeps_order_and_bumps_timestamp(self, store):
+        store.replace(make_state([make_task("t1"), make_task("t2")]))
+
+        store.upsert_task(make_task("t1", status="failed", error="boom", files_modified=["a.py"]))
+        store.upsert_task(make_task("t4", wave_id=2))
+
+        state = store.load()
+        assert list(state.tasks) == ["t1", "t2", "t4"]
+        assert state.tasks["t1"].error == "boom"
+        assert state.tasks["t1"].files_modified == ["a.py"]
+        assert state.updated_at > datetime(2026, 1, 1, 9, 0, 0)
+        assert store.get_task("t4").wave_id == 2
+        assert store.get_task("missing") is None
+
+    def test_add_note_needs_a_workflow(self, store):
+        assert not store.add_note("too early")
+        assert store.load() is None
+
+        store.replace(make_state([make_task("t1")]))
+        assert store.add_note("checked in")
+        assert store.load().notes == ["checked in"]
+
+    def test_state_shared_between_instances(self, store, tmp_path):
+        store.replace(make_state([make_task("t1")], wave=2))
+        other = StateStore(tmp_path / "STATE.db")
+        try:
+            assert other.header()[0] == 2
+            assert other.load().tasks["t1"].description == "Do t1"
+        finally:
+            other.close()
+
+
+class TestStateManagerWithStore:
+    """Tests for StateManager backed by the store."""
+
+    def test_update_task_does_not_rewrite_state_md(self, manager):
+        rendered = manager.state_path.read_text()
+
+        manager.update_task("t1", "completed", commit_hash="abc123", files_modified=["parser.py"])
+        manager.update_task("t5", "in_progress", description="Hotfix", wave_id=1)
+
+        assert manager.state_path.read_text() == rendered
+        state = manager.load_state()
+        assert state.tasks["t1"].status == "completed"
+        assert state.tasks["t1"].description == "Write parser"
+        assert state.tasks["t1"].files_modified == ["parser.py"]
+        assert state.tasks["t5"].description == "Hotfix"
+
+    def test_update_task_requires_initialize(self, tmp_path):
+        manager = StateManager(state_path=tmp_path / "STATE.md", use_store=True)
+        with pytest.raises(RuntimeError):
+            manager.update_task("t1", "completed")
+
+    def test_add_note(self, manager, tmp_path):
+        manager.add_note("Parser needs review")
+        assert manager.load_state().notes == ["Parser needs review"]
+
+        empty = StateManager(state_path=tmp_path / "other" / "STATE.md", use_store=True)
+        empty.add_note("ignored")
+        assert empty.load_state() is None
+
+    def test_update_renders_state_md_on_wave_change(self, manager):
+        wave_one = dict(
+            workflow_id="wf-1", workflow_name="Build feature", wave_id=1, total_waves=2,
+            completed_tasks=[],
+            pending_waves=[[{"task_id": "t3", "description": "Ship it"}]],
+        )
+        manager.update(current_wave_tasks=[
+            {"task_id": "t1", "description": "Write parser"},
+            {"task_id": "t2", "description": "Write tests"},
+        ], **wave_one)
+        rendered = manager.state_path.read_text()
+        assert "**Status:** Wave 1/2" in rendered
+        assert "## 🔄 In Progress (2 tasks)" in rendered
+
+        # Same wave: the store changes, STATE.md does not
+        manager.update(current_wave_tasks=[
+            {"task_id": "t1", "description": "Write parser", "result": {"success": True}},
+            {"task_id": "t2", "description": "Write tests"},
+        ], commit_hash="abc123", notes=["t1 done"], **wave_one)
+        assert manager.state_path.read_text() == rendered
+        assert manager.load_state().tasks["t1"].commit_hash == "abc123"
+
+        assert manager.render_state()
+        rendered = manager.state_path.read_text()
+        assert "- [x] **t1**: Write parser" in rendered
+        assert "  - Commit: `abc123`" in rendered
+        assert "- t1 done" in rendered
+
+        manager.update(
+            workflow_id="wf-1", workflow_name="Build feature", wave_id=2, total_waves=2,
+            completed_tasks=[
+                {"task_id": "t1", "description": "Write parser", "wave_id": 1, "commit_hash": "abc123"},
+                {"task_id": "t2", "description": "Write tests", "wave_id": 1},
+            ],
+            current_wave_tasks=[{"task_id": "t3", "description": "Ship it"}],
+            pending_waves=[],
+        )
+        assert "**Status:** Wave 2/2" in manager.state_path.read_text()
+
+    def test_rendered_state_md_is_imported_by_a_fresh_store(self, manager, tmp_path):
+        manager.update_task("t1", "completed", commit_hash="abc123")
+        manager.add_note("Parser merged")
+        assert manager.render_state()
+
+        fresh = StateManager(state_path=manager.state_path, store_path=tmp_path / "fresh.db")
+        state = fresh.load_state()
+        assert state.workflow_id == "wf-1"
+        assert state.tasks["t1"].status == "completed"
+        assert state.tasks["t1"].commit_hash == "abc123"
+        assert state.notes == ["Parser merged"]
+        assert fresh._store.header() is not None
+
+
+class TestImmediateTransaction:
+    """Tests for the shared transaction helper."""
+
+    def test_commits_and_rolls_back(self, tmp_path):
+        conn = sqlite3.connect(str(tmp_path / "t.db"), isolation_level=None)
+        conn.execute("CREATE TABLE items (name TEXT)")
+        lock = threading.Lock()
+
+        with immediate_transaction(conn, lock) as tx:
+            tx.execute("INSERT INTO items VALUES ('kept')")
+        with pytest.raises(ValueError):
+            with immediate_transaction(conn, lock) as tx:
+                tx.execute("INSERT INTO items VALUES ('lost')")
+                raise ValueError("abort")
+
+        assert conn.execute("SELECT name FROM items").fetchall() == [("kept",)]
+        assert not conn.in_transaction
+        assert not lock.locked()
+        conn.close()
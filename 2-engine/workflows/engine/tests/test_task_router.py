@@ -0,0 +1,134 @@
+"""
+Tests for TaskRouter
+====================
+
+Tests the capability index and batch routing:
+- Candidates come from the capability index, which follows availability
+- route() ranks by capability match, load and success rate
+- route_many() spreads bursts by load, honours priority and max_tasks
+"""
+
+import pytest
+
+from agents.framework.base_agent import AgentConfig, SimpleAgent
+from workflows.engine.pipeline.complexity import ComplexityLevel
+from workflows.engine.routing.task_router import Task, TaskRouter
+
+
+def make_agent(name: str, capabilities):
+    return SimpleAgent(AgentConfig(
+        name=name,
+        full_name=name.title(),
+        role="tester",
+        category="testing",
+        description="Routing test agent",
+        capabilities=list(capabilities),
+    ))
+
+
+def make_task(task_id: str, capabilities=(), priority: int = 5) -> Task:
+    return Task(
+        id=task_id,
+        description=f"Task {task_id}",
+        priority=priority,
+        required_capabilities=set(capabilities),
+        complexity=ComplexityLevel.LOW,
+    )
+
+
+async def make_router(*agents) -> TaskRouter:
+    router = TaskRouter()
+    for name, capabilities in agents:
+        await router.register_agent(make_agent(name, capabilities))
+    return router
+
+
+@pytest.mark.asyncio
+async def test_route_prefers_best_capability_match():
+    router = await make_router(
+        ("frontend", ["React", "css"]),
+        ("fullstack", ["react", "python", "sql"]),
+        ("backend", ["python", "sql"]),
+    )
+
+    decision = await router.route(make_task("t1", {"react", "Python"}))
+    assert decision.agent_name == "fullstack"
+    assert decision.alternative_agents == ["frontend", "backend"]
+    assert decision.confidence == pytest.approx(1.0)
+
+    with pytest.raises(ValueError):
+        await router.route(make_task("t2", {"rust"}))
+
+
+@pytest.mark.asyncio
+async def test_index_follows_availability():
+    router = await make_router(("a", ["python"]), ("b", ["python"]))
+
+    for _ in range(5):
+        await router.update_agent_status("a", +1)
+    assert (await router.route(make_task("t1", {"python"}))).agent_name == "b"
+
+    await router.unregister_agent("b")
+    with pytest.raises(ValueError):
+        await router.route(make_task("t2", {"python"}))
+
+    await router.record_task_completion("a", "t0", success=True)
+    assert (await router.route(make_task("t3", {"python"}))).agent_name == "a"
+    assert (await router.route(make_task("t4"))).agent_name == "a"
+
+
+@pytest.mark.asyncio
+async def test_route_many_spreads_burst_by_load():
+    router = await make_router(("a", ["python"]), ("b", ["python"]), ("c", ["python"]), ("d", ["css"]))
+
+    decisions = await router.route_many([make_task(f"t{i}", {"python"}) for i in range(6)])
+    counts = {}
+    for decision in decisions:
+        counts[decision.agent_name] = counts.get(decision.agent_name, 0) + 1
+    assert counts == {"a": 2, "b": 2, "c": 2}
+
+    # Without reserve the router's own load is untouched
+    assert (await router.get_statistics())["agent_status"]["a"]["current_tasks"] == 0
+
+
+@pytest.mark.asyncio
+async def test_route_many_respects_capacity_and_reserve():
+    router = await make_router(("a", ["python"]), ("b", ["python"]))
+
+    decisions = await router.route_many([make_task(f"t{i}", {"python"}) for i in range(12)], reserve=True)
+    assert sum(d is not None for d in decisions) == 10
+    assert decisions[-2:] == [None, None]
+
+    stats = await router.get_statistics()
+    assert stats["available_agents"] == 0
+    assert stats["agent_status"]["a"]["current_tasks"] == 5
+    with pytest.raises(ValueError):
+        await router.route(make_task("late", {"python"}))
+
+
+@pytest.mark.asyncio
+async def test_route_many_assigns_by_priority():
+    router = await make_router(("strong", ["python", "sql"]), ("weak", ["python"]))
+    await router.update_agent_status("strong", +4)  # room for one more task
+    for _ in range(5):
+        await router.update_agent_status("weak", 0, success=False)
+
+    low, high = make_task("low", {"python", "sql"}, priority=1), make_task("high", {"python", "sql"}, priority=9)
+    decisions = await router.route_many([low, high])
+    assert decisions[1].agent_name == "strong"
+    assert decisions[0].agent_name == "weak"
+
+
+@pytest.mark.asyncio
+async def test_route_many_matches_route_for_single_tasks():
+    router = await make_router(
+        ("a", ["python", "sql"]), ("b", ["python"]), ("c", ["css", "html"]), ("d", ["sql"])
+    )
+    await router.update_agent_status("a", +2, success=False)
+
+    for capabilities in ({"python"}, {"sql", "python"}, {"html"}, set()):
+        single = await router.route(make_task("x", capabilities))
+        [batched] = await router.route_many([make_task("x", capabilities)])
+        assert batched.agent_name == single.agent_name
+        assert batched.alternative_agents == single.alternative_agents
+        assert batched.confidence == pytest.approx(single.confidence)
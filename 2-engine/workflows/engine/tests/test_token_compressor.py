@@ -0,0 +1,175 @@
+"""
+Tests for the Token Compressor
+==============================
+
+Tests the TokenCompressor's ability to:
+- Pick at most one variant per item within a token budget
+- Find the optimal set with the dp packer where greedy falls short
+- Pack a TaskContext into its target in one pass, summarizing when needed
+- Summarize only the items that do not fit whole
+- Report budget utilization
+"""
+
+import pytest
+
+from helpers.core.token_counter import configure_token_counter
+from workflows.engine.pipeline.context_extractor import (
+    ConversationContext,
+    DocSection,
+    FileContext,
+    TaskContext,
+)
+from workflows.engine.pipeline.token_compressor import (
+    CompressionStrategy,
+    ContextPacker,
+    PackingUnit,
+    TokenCompressor,
+)
+
+
+@pytest.fixture(autouse=True)
+def heuristic_counter():
+    configure_token_counter()
+
+
+def unit(group: int, tokens: int, value: float, variant: str = 'full') -> PackingUnit:
+    return PackingUnit(group=('file', group), variant=variant, item=group, tokens=tokens, value=value)
+
+
+def make_context(files: int = 30, docs: int = 10, messages: int = 10) -> TaskContext:
+    code = "def handle_{0}(event):\n    if event.kind == '{0}':\n        return route(event)\n"
+    return TaskContext(
+        task_id='task-1',
+        task_description='Add retry handling to the event router',
+        relevant_files=[
+            FileContext(
+                file_path=f'src/{"router" if i % 3 == 0 else "module"}_{i}.py',
+                language='python',
+                relevant_lines=(code.format(f'retry_{i}') * (5 + i)).split('\n'),
+                summary=f'Module {i}',
+                size_bytes=4000
+            )
+            for i in range(files)
+        ],
+        relevant_docs=[
+            DocSection(
+                section_path=f'docs/guide_{i}.md',
+                title='Retry policy' if i % 2 else 'Overview',
+                content='The router retries failed events. ' * (20 + 5 * i),
+                relevance_score=0.5
+            )
+            for i in range(docs)
+        ],
+        conversation_context=ConversationContext(
+            summary='Discussed retry semantics',
+            relevant_messages=[
+                {'role': 'user', 'content': f'What about retry number {i}? ' * 20}
+                for i in range(messages)
+            ],
+            participant_count=2,
+            message_count=messages
+        ),
+        total_tokens=0,
+        extraction_time=0.1,
+        sources_searched=50,
+        keywords=['retry', 'router']
+    )
+
+
+class TestContextPacker:
+    """Tests for budgeted unit selection."""
+
+    @pytest.mark.parametrize('method', ['dp', 'greedy'])
+    def test_one_unit_per_group_within_budget(self, method):
+        units = [
+            unit(0, 60, 1.0), unit(0, 20, 0.6, 'extractive'),
+            unit(1, 50, 0.9), unit(1, 10, 0.5, 'code_summary'),
+            unit(2, 500, 5.0),
+        ]
+        chosen = ContextPacker(method=method).pack(units, 80)
+
+        assert sum(u.tokens for u in chosen) <= 80
+        assert len({u.group for u in chosen}) == len(chosen)
+        assert [u.group for u in chosen] == [('file', 0), ('file', 1)]
+
+    def test_dp_beats_greedy_on_density_trap(self):
+        units = [unit(0, 10, 2.0), unit(1, 100, 15.0)]
+
+        assert [u.group[1] for u in ContextPacker(method='greedy').pack(units, 100)] == [0]
+        assert [u.group[1] for u in ContextPacker(method='dp').pack(units, 100)] == [1]
+
+    def test_dp_fills_rounding_slack(self):
+        units = [unit(i, 7, 1.0) for i in range(20)]
+        chosen = ContextPacker(method='dp', resolution=10).pack(units, 100)
+
+        assert len(chosen) == 14
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            ContextPacker(method='simulated-annealing')
+
+
+class TestTokenCompressor:
+    """Tests for one-pass hybrid compression."""
+
+    def test_packs_into_target_and_reports_utilization(self):
+        context = make_context()
+        compressor = TokenCompressor(max_tokens=2000)
+        result = compressor.compress(context)
+        compressed = result.compressed_context
+        tokens = compressor.estimator.estimate_task_context(compressed)
+
+        assert result.metrics.original_tokens > compressor.target_tokens
+        assert tokens == result.metrics.compressed_tokens <= compressor.target_tokens
+        assert result.metrics.budget_utilization == pytest.approx(tokens / compressor.target_tokens)
+        assert result.metrics.budget_utilization > 0.9
+        assert result.to_dict()['metrics']['budget_utilization'] == result.metrics.budget_utilization
+        assert compressed.task_description == context.task_description
+        assert compressed.conversation_context.summary == 'Discussed retry semantics'
+
+    def test_tight_budget_uses_summaries(self):
+        context = make_context(files=10, docs=0, messages=0)
+        result = TokenCompressor(max_tokens=400).compress(context)
+        full = {f.file_path: len(f.relevant_lines) for f in context.relevant_files}
+
+        assert result.compressed_context.relevant_files
+        assert any(
+            len(f.relevant_lines) < full[f.file_path]
+            for f in result.compressed_context.relevant_files
+        )
+
+    def test_summaries_built_only_for_items_left_out(self, monkeypatch):
+        context = make_context(files=10, docs=0, messages=0)
+        compressor = TokenCompressor(max_tokens=1000)
+        summarized = []
+        summarize_code = compressor.code_summarizer.summarize_code
+
+        def counting(code, language):
+            summarized.append(code)
+            return summarize_code(code, language)
+
+        monkeypatch.setattr(compressor.code_summarizer, 'summarize_code', counting)
+        compressed = compressor.compress(context).compressed_context
+        originals = {id(f) for f in context.relevant_files}
+
+        assert any(id(f) in originals for f in compressed.relevant_files)
+        assert 0 < len(summarized) < len(context.relevant_files)
+
+    def test_without_summaries_only_whole_items(self):
+        context = make_context()
+        compressor = TokenCompressor(
+            max_tokens=2000,
+            strategies=[CompressionStrategy.RELEVANCE]
+        )
+        compressed = compressor.compress(context).compressed_context
+        originals = {id(f) for f in context.relevant_files}
+
+        assert all(id(f) in originals for f in compressed.relevant_files)
+        assert compressor.estimator.estimate_task_context(compressed) <= compressor.target_tokens
+
+    def test_duplicate_files_packed_once(self):
+        context = make_context(files=3, docs=0, messages=0)
+        context.relevant_files.append(context.relevant_files[0])
+        compressed = TokenCompressor(max_tokens=500).compress(context).compressed_context
+        paths = [f.file_path for f in compressed.relevant_files]
+        assert len(paths) == len(set(paths))
@@ -19,17 +19,12 @@ log_event() {
     local message="$2"
     local timestamp=$(date -u +%Y-%m-%dT%H:%M:%SZ)
 
-    (
-        flock -x 200 || exit 1
-        cat >> "$EVENTS_FILE" << EOF
-- timestamp: "$timestamp"
-  agent: $AGENT_NAME
-  type: $type
-  message: "$message"
-  run_dir: "$RUN_DIR"
-
-EOF
-    ) 200>"$PROJECT_ROOT/5-project-memory/blackbox5/.autonomous/agents/communications/.events.lock"
+    "$PROJECT_ROOT/bin/bb5-log-event" --events-file "$EVENTS_FILE" \
+        timestamp="$timestamp" \
+        agent="$AGENT_NAME" \
+        type="$type" \
+        message="$message" \
+        run_dir="$RUN_DIR"
 }
 
 update_heartbeat() {
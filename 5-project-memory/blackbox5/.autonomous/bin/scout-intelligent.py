@@ -9,10 +9,13 @@ Usage:
     scout-intelligent.py [--parallel] [--output-dir DIR]
 
 This uses the Claude Code Task primitive to spawn specialized analyzer agents.
-Each agent runs independently and returns structured findings.
+Each agent runs independently and returns structured findings. With
+--parallel, analyzers run on a pool of pre-started Claude Code workers
+(agents.scout.max_parallel at a time).
 """
 
 import argparse
+import asyncio
 import json
 import os
 import subprocess
@@ -23,11 +26,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # Import path resolution library and unified communication
-import sys
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir.parent / "lib"))
 from paths import PathResolver, get_path_resolver
@@ -47,6 +48,10 @@ OUTPUT_DIR = config.get_path('paths.analysis_dir') / config.get_str('agents.scou
 SCOUT_CONFIG = config.get_agent_config('scout')
 TIMEOUT_SECONDS = config.get_int('agents.scout.timeout_seconds', 300)
 MAX_ANALYZERS = config.get_int('agents.scout.max_analyzers', 5)
+MAX_PARALLEL = config.get_int('agents.scout.max_parallel', MAX_ANALYZERS)
+
+# Tools and permissions granted to analyzer subagents
+ANALYZER_CLI_ARGS = ["--allowed-tools", "Read,Glob,Grep,Bash", "--permission-mode", "delegate"]
 
 # Analyzer definitions - each spawns a Claude Code instance
 ANALYZERS = [
@@ -291,6 +296,48 @@ class ScoutReport:
     summary: Dict[str, Any]
 
 
+def parse_analyzer_output(analyzer: Dict[str, str], stdout: str) -> Dict[str, Any]:
+    """Turn an analyzer's JSON output into a result entry."""
+    analyzer_id = analyzer["id"]
+    analyzer_name = analyzer["name"]
+
+    try:
+        output = json.loads(stdout)
+        # The output might be wrapped in a Claude response structure
+        if "content" in output:
+            content = output["content"]
+            if isinstance(content, str):
+                # Try to parse content as JSON
+                data = json.loads(content)
+            else:
+                data = content
+        else:
+            data = output
+
+        # Ensure required fields
+        return {
+            "analyzer": analyzer_id,
+            "name": analyzer_name,
+            "opportunities": data.get("opportunities", []),
+            "patterns": data.get("patterns", []),
+            "summary": data.get("summary", "Analysis complete"),
+            "error": False
+        }
+
+    except json.JSONDecodeError as e:
+        print(f"⚠️  {analyzer_name} returned invalid JSON: {e}")
+        # Try to extract JSON from the output
+        return {
+            "analyzer": analyzer_id,
+            "name": analyzer_name,
+            "opportunities": [],
+            "patterns": [],
+            "summary": f"JSON parse error: {e}",
+            "error": True,
+            "raw_output": stdout[:500]
+        }
+
+
 def spawn_analyzer(analyzer: Dict[str, str], project_dir: Path, engine_dir: Path) -> Dict[str, Any]:
     """Spawn a Claude Code subagent to run an analyzer."""
     analyzer_id = analyzer["id"]
@@ -318,8 +365,7 @@ def spawn_analyzer(analyzer: Dict[str, str], project_dir: Path, engine_dir: Path
             "claude",
             "--print",
             "--output-format", "json",
-            "--allowed-tools", "Read,Glob,Grep,Bash",
-            "--permission-mode", "delegate",
+            *ANALYZER_CLI_ARGS,
             prompt
         ]
 
@@ -343,42 +389,7 @@ def spawn_analyzer(analyzer: Dict[str, str], project_dir: Path, engine_dir: Path
                 "error": True
             }
 
-        # Parse the output
-        try:
-            output = json.loads(result.stdout)
-            # The output might be wrapped in a Claude response structure
-            if "content" in output:
-                content = output["content"]
-                if isinstance(content, str):
-                    # Try to parse content as JSON
-                    data = json.loads(content)
-                else:
-                    data = content
-            else:
-                data = output
-
-            # Ensure required fields
-            return {
-                "analyzer": analyzer_id,
-                "name": analyzer_name,
-                "opportunities": data.get("opportunities", []),
-                "patterns": data.get("patterns", []),
-                "summary": data.get("summary", "Analysis complete"),
-                "error": False
-            }
-
-        except json.JSONDecodeError as e:
-            print(f"⚠️  {analyzer_name} returned invalid JSON: {e}")
-            # Try to extract JSON from the output
-            return {
-                "analyzer": analyzer_id,
-                "name": analyzer_name,
-                "opportunities": [],
-                "patterns": [],
-                "summary": f"JSON parse error: {e}",
-                "error": True,
-                "raw_output": result.stdout[:500]
-            }
+        return parse_analyzer_output(analyzer, result.stdout)
 
     except subprocess.TimeoutExpired:
         print(f"⏱️  {analyzer_name} timed out after 5 minutes")
@@ -392,7 +403,7 @@ def spawn_analyzer(analyzer: Dict[str, str], project_dir: Path, engine_dir: Path
         }
 
     except FileNotFoundError:
-        print(f"❌ Claude Code CLI not found. Is it installed?")
+        print("❌ Claude Code CLI not found. Is it installed?")
         return {
             "analyzer": analyzer_id,
             "name": analyzer_name,
@@ -554,6 +565,76 @@ def print_summary(report: ScoutReport, json_file: Path, yaml_file: Path):
     print("\n" + "="*60)
 
 
+def run_analyzers_pooled(
+    analyzers: List[Dict[str, str]],
+    project_dir: Path,
+    engine_dir: Path
+) -> List[Dict[str, Any]]:
+    """
+    Run analyzers on a pool of pre-started Claude Code workers.
+
+    At most MAX_PARALLEL analyzers run at once, each in its own CLI session;
+    the session for a slot's next analyzer starts while the current one
+    runs, instead of cold-starting after it finishes.
+    """
+    sys.path.insert(0, str(engine_dir))
+    from interface.client.ClaudeCodeClient import ClaudeCodeClient
+    from interface.client.SubagentPool import SubagentPool
+
+    def failed(analyzer: Dict[str, str], summary: str) -> Dict[str, Any]:
+        return {
+            "analyzer": analyzer["id"],
+            "name": analyzer["name"],
+            "opportunities": [],
+            "patterns": [],
+            "summary": summary,
+            "error": True
+        }
+
+    async def run_all() -> List[Dict[str, Any]]:
+        pool = SubagentPool(
+            size=max(1, min(MAX_PARALLEL, len(analyzers))),
+            client=ClaudeCodeClient(claude_path="claude"),
+            extra_args=ANALYZER_CLI_ARGS,
+            cwd=project_dir,
+            default_timeout=TIMEOUT_SECONDS
+        )
+
+        async def run_one(analyzer: Dict[str, str]) -> Dict[str, Any]:
+            print(f"🔍 Queueing {analyzer['name']}...")
+            prompt = analyzer["prompt"].format(
+                project_dir=str(project_dir),
+                engine_dir=str(engine_dir)
+            )
+            try:
+                result = await pool.submit(prompt)
+            except Exception as e:
+                return failed(analyzer, f"Failed: {e}")
+            if not result.success:
+                return failed(analyzer, f"Error: {(result.error or '')[:200]}")
+            return parse_analyzer_output(analyzer, result.output)
+
+        results = []
+        async with pool:
+            for next_done in asyncio.as_completed([run_one(a) for a in analyzers]):
+                result = await next_done
+                results.append(result)
+                status = "✅" if not result.get("error") else "❌"
+                print(f"   {status} {result['name']} complete ({len(result.get('opportunities', []))} opportunities)")
+            stats = pool.get_stats()
+
+        print(f"   Workers started: {stats['worker_starts']}, "
+              f"mean startup {stats['mean_startup_seconds']:.1f}s, "
+              f"warm first reply {stats['mean_warm_first_event_seconds']:.1f}s")
+        return results
+
+    try:
+        return asyncio.run(run_all())
+    except FileNotFoundError:
+        print("❌ Claude Code CLI not found. Is it installed?")
+        return [failed(a, "Claude Code CLI not found") for a in analyzers]
+
+
 AGENT_NAME = "scout-intelligent"
 
 
@@ -610,30 +691,8 @@ def main():
     results = []
 
     if args.parallel:
-        print("\n🚀 Running analyzers in parallel...")
-        with ThreadPoolExecutor(max_workers=len(analyzers_to_run)) as executor:
-            futures = {
-                executor.submit(spawn_analyzer, a, PROJECT_DIR, ENGINE_DIR): a
-                for a in analyzers_to_run
-            }
-
-            for future in as_completed(futures):
-                analyzer = futures[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    status = "✅" if not result.get("error") else "❌"
-                    print(f"   {status} {analyzer['name']} complete ({len(result.get('opportunities', []))} opportunities)")
-                except Exception as e:
-                    print(f"   ❌ {analyzer['name']} failed: {e}")
-                    results.append({
-                        "analyzer": analyzer["id"],
-                        "name": analyzer["name"],
-                        "opportunities": [],
-                        "patterns": [],
-                        "summary": f"Failed: {e}",
-                        "error": True
-                    })
+        print(f"\n🚀 Running analyzers in parallel (up to {MAX_PARALLEL} at a time)...")
+        results = run_analyzers_pooled(analyzers_to_run, PROJECT_DIR, ENGINE_DIR)
     else:
         print("\n🚀 Running analyzers sequentially...")
         for analyzer in analyzers_to_run:
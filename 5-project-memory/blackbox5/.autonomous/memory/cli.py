@@ -27,7 +27,7 @@ from typing import Optional
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from vector_store import VectorStore
+from vector_store import get_vector_store
 
 
 def cmd_retain(args):
@@ -64,7 +64,7 @@ def cmd_retain(args):
 
 def cmd_recall(args):
     """RECALL command - search memories"""
-    store = VectorStore()
+    store = get_vector_store()
 
     results = store.search(
         query=args.query,
@@ -133,7 +133,7 @@ def cmd_reflect(args):
 
 def cmd_stats(args):
     """STATS command - show memory statistics"""
-    store = VectorStore()
+    store = get_vector_store()
     stats = store.get_stats()
 
     print("\n" + "="*70)
@@ -149,10 +149,9 @@ def cmd_stats(args):
 
     print(f"\nStorage: {stats['storage_dir']}")
 
-    # Memory file size
-    mem_file = Path(stats['storage_dir']) / "memories.json"
-    if mem_file.exists():
-        size_kb = mem_file.stat().st_size / 1024
+    # Memory file size (vector matrix + metadata log)
+    if stats.get('storage_bytes'):
+        size_kb = stats['storage_bytes'] / 1024
         print(f"File Size: {size_kb:.1f} KB")
 
     print("\n" + "="*70)
@@ -161,13 +160,16 @@ def cmd_stats(args):
 
 def cmd_export(args):
     """EXPORT command - export memories to JSON"""
-    store = VectorStore()
+    store = get_vector_store()
 
     output_file = Path(args.output)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Export all memories
-    memories = [m.to_dict() for m in store.memories.values()]
+    memories = [
+        dict(m.to_dict(), embedding=store.get_embedding(m.id))
+        for m in store.memories.values()
+    ]
 
     with open(output_file, 'w') as f:
         json.dump(memories, f, indent=2)
@@ -178,7 +180,7 @@ def cmd_export(args):
 
 def cmd_import(args):
     """IMPORT command - import memories from JSON"""
-    store = VectorStore()
+    store = get_vector_store()
 
     input_file = Path(args.input)
     if not input_file.exists():
@@ -206,7 +208,7 @@ def cmd_import(args):
 
 def cmd_add(args):
     """ADD command - quickly add a memory"""
-    store = VectorStore()
+    store = get_vector_store()
 
     memory_id = store.add_memory(
         content=args.content,
@@ -220,7 +222,7 @@ def cmd_add(args):
 
 def cmd_dashboard(args):
     """DASHBOARD command - visual memory overview"""
-    store = VectorStore()
+    store = get_vector_store()
     stats = store.get_stats()
 
     # Try to use rich for better formatting
@@ -243,7 +245,11 @@ def cmd_dashboard(args):
 
         # Stats grid
         console.print(f"\n[bold]Total Memories:[/bold] {stats['total_memories']}")
-        console.print(f"[bold]Embedding Cache:[/bold] {stats.get('embedding_cache_size', 0)} entries\n")
+        cache = stats.get('embedding_cache') or {}
+        console.print(
+            f"[bold]Embedding Cache:[/bold] {stats.get('embedding_cache_size', 0)} entries "
+            f"({cache.get('hits', 0)} hits / {cache.get('misses', 0)} misses)\n"
+        )
 
         # Network distribution table
         table = Table(title="Memory Distribution by Network", box=box.ROUNDED)
@@ -285,7 +291,11 @@ def cmd_dashboard(args):
         print("="*70)
 
         print(f"\nTotal Memories: {stats['total_memories']}")
-        print(f"Embedding Cache: {stats.get('embedding_cache_size', 0)} entries")
+        cache = stats.get('embedding_cache') or {}
+        print(
+            f"Embedding Cache: {stats.get('embedding_cache_size', 0)} entries "
+            f"({cache.get('hits', 0)} hits / {cache.get('misses', 0)} misses)"
+        )
 
         print("\nBy Network:")
         max_count = max(stats['networks'].values()) if stats['networks'] else 1
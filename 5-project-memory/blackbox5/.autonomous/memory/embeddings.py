@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Embedders and Embedding Cache for Hindsight Memory
+
+Embedders turn a batch of texts into a [n, dim] float32 matrix:
+- OpenAIEmbedder: text-embedding-3-small, one API call per batch
+- SentenceTransformerEmbedder: local model (needs sentence-transformers)
+- HashingEmbedder: bag-of-words hashing, always available offline
+
+EmbeddingCache persists embeddings in SQLite as float32 blobs, namespaced
+by embedder so vectors of different models never mix, with LRU eviction
+once it holds more than max_entries.
+
+Usage:
+    cache = EmbeddingCache(Path("data/embeddings.db"))
+    embedder = HashingEmbedder()
+    vectors = cache.get_many(embedder.name, keys)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+
+# SQLite host parameter limit is 999 on older builds
+SQLITE_BATCH = 500
+
+# Buffered recency updates written once this many hits accumulate
+TOUCH_FLUSH_THRESHOLD = 1000
+
+
+def text_hash(text: str) -> str:
+    """Cache key of a text (same scheme as the legacy JSON cache)"""
+    return hashlib.md5(text.encode()).hexdigest()
+
+
+# ----------------------------------------------------------------------
+# Embedders
+# ----------------------------------------------------------------------
+
+class Embedder:
+    """
+    Base class for embedders.
+
+    Subclasses set `name` (cache namespace; include the model and anything
+    that changes the vectors) and implement embed().
+    """
+
+    name = "embedder"
+    batch_size = 64
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed a batch of texts.
+
+        Args:
+            texts: At most batch_size texts
+
+        Returns:
+            float32 array of shape [len(texts), dim]
+        """
+        raise NotImplementedError
+
+
+class HashingEmbedder(Embedder):
+    """
+    Offline bag-of-words embedder.
+
+    Hashes the first 50 words into `dim` buckets with a stable hash, so the
+    same text embeds identically in every process.
+    """
+
+    batch_size = 1024
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for word in text.lower().split()[:50]:
+                vectors[i, zlib.crc32(word.encode()) % self.dim] += 1
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+class OpenAIEmbedder(Embedder):
+    """OpenAI embeddings API, one request per batch"""
+
+    batch_size = 100
+
+    def __init__(self, api_key: str, model: str = "text-embedding-3-small"):
+        import openai
+
+        self.client = openai.OpenAI(api_key=api_key)
+        self.model = model
+        self.name = f"openai:{model}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        response = self.client.embeddings.create(
+            model=self.model,
+            input=[text[:8000] for text in texts],  # OpenAI limit
+        )
+        data = sorted(response.data, key=lambda item: item.index)
+        return np.array([item.embedding for item in data], dtype=np.float32)
+
+
+class SentenceTransformerEmbedder(Embedder):
+    """Local sentence-transformers model (pip install sentence-transformers)"""
+
+    batch_size = 64
+
+    def __init__(self, model: str = "all-MiniLM-L6-v2"):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model)
+        self.name = f"sentence-transformers:{model}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(
+            self.model.encode(texts, batch_size=self.batch_size, normalize_embeddings=True),
+            dtype=np.float32,
+        )
+
+
+# ----------------------------------------------------------------------
+# Cache
+# ----------------------------------------------------------------------
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    embedder TEXT NOT NULL,
+    key TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (embedder, key)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used);
+"""
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache with LRU eviction.
+
+    Vectors are stored as raw float32 bytes. Recency updates for hits are
+    buffered and written with the next put(), close(), or once
+    TOUCH_FLUSH_THRESHOLD hits accumulate.
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = 100_000):
+        """
+        Open (or create) the cache.
+
+        Args:
+            db_path: SQLite file
+            max_entries: Entries kept before least recently used ones are evicted
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None,  # Explicit transactions only
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        self._touched: Dict[tuple, float] = {}
+        self._entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        return self._entries
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction (lock held)."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        else:
+            self._conn.execute("COMMIT")
+
+    def get_many(self, embedder: str, keys: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up cached vectors.
+
+        Args:
+            embedder: Embedder name (cache namespace)
+            keys: Text hashes
+
+        Returns:
+            key -> vector for the keys that were cached
+        """
+        found: Dict[str, np.ndarray] = {}
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(keys), SQLITE_BATCH):
+                chunk = keys[start:start + SQLITE_BATCH]
+                placeholders = ",".join("?" * len(chunk))
+                for key, blob in self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE embedder = ? AND key IN ({placeholders})",
+                    [embedder, *chunk],
+                ):
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+                    self._touched[(embedder, key)] = now
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(set(keys)) - len(found)
+            if len(self._touched) >= TOUCH_FLUSH_THRESHOLD:
+                with self._transaction() as conn:
+                    self._flush_touched(conn)
+        return found
+
+    def put_many(self, embedder: str, vectors: Dict[str, np.ndarray]) -> None:
+        """
+        Store vectors, evicting least recently used entries if over capacity.
+
+        Args:
+            embedder: Embedder name (cache namespace)
+            vectors: key -> vector
+        """
+        now = time.time()
+        with self._lock, self._transaction() as conn:
+            self._flush_touched(conn)
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (embedder, key, vector, last_used) VALUES (?, ?, ?, ?)",
+                [
+                    (embedder, key, np.asarray(vector, dtype=np.float32).tobytes(), now)
+                    for key, vector in vectors.items()
+                ],
+            )
+            self.stats["writes"] += conn.total_changes - before
+            self._entries = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+            if self._entries > self.max_entries:
+                # Evict down to 90% so eviction is not paid on every put
+                excess = self._entries - int(self.max_entries * 0.9)
+                conn.execute(
+                    "DELETE FROM embeddings WHERE (embedder, key) IN "
+                    "(SELECT embedder, key FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+                self.stats["evictions"] += excess
+                self._entries -= excess
+
+    def _flush_touched(self, conn: sqlite3.Connection) -> None:
+        """Write buffered recency updates (lock held)."""
+        if self._touched:
+            conn.executemany(
+                "UPDATE embeddings SET last_used = ? WHERE embedder = ? AND key = ?",
+                [(used, embedder, key) for (embedder, key), used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def import_json(self, json_file: Path, embedder: str, dim: int) -> int:
+        """
+        Import a legacy .embedding_cache.json (text hash -> float list).
+
+        Only vectors of dimension `dim` are imported; the legacy file did
+        not record which model produced each vector.
+
+        Returns:
+            Number of vectors imported
+        """
+        with open(json_file) as f:
+            data = json.load(f)
+        vectors = {
+            key: np.asarray(values, dtype=np.float32)
+            for key, values in data.items()
+            if len(values) == dim
+        }
+        if vectors:
+            self.put_many(embedder, vectors)
+        return len(vectors)
+
+    def clear(self) -> None:
+        """Remove every cached embedding"""
+        with self._lock, self._transaction() as conn:
+            conn.execute("DELETE FROM embeddings")
+            self._touched.clear()
+            self._entries = 0
+
+    def close(self) -> None:
+        """Write pending recency updates and close the connection"""
+        with self._lock:
+            if self._touched:
+                with self._transaction() as conn:
+                    self._flush_touched(conn)
+            self._conn.close()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters plus size"""
+        with self._lock:
+            return {**self.stats, "entries": self._entries, "max_entries": self.max_entries}
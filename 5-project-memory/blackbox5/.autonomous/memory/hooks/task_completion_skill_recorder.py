@@ -29,6 +29,10 @@ from typing import Any
 
 import yaml
 
+# atomic_io (event journal writer) lives in the project's bin directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "bin"))
+from atomic_io import atomic_append_yaml_event
+
 
 def load_yaml_file(filepath: Path) -> dict:
     """Load and parse YAML file."""
@@ -114,17 +118,8 @@ def record_usage_log(usage_data: dict, entry: dict) -> dict:
 
 
 def record_event(events_file: Path, event: dict) -> None:
-    """Record skill usage event in events.yaml."""
-    try:
-        with open(events_file, 'r') as f:
-            events = yaml.safe_load(f) or []
-    except FileNotFoundError:
-        events = []
-
-    events.append(event)
-
-    with open(events_file, 'w') as f:
-        yaml.dump(events, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    """Record skill usage event in the events.yaml journal."""
+    atomic_append_yaml_event(event, events_file)
 
 
 def get_env_or_default(env_var: str, default: Any = None) -> Any:
@@ -21,7 +21,7 @@ from typing import List, Optional
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from vector_store import VectorStore
+from vector_store import get_vector_store
 
 
 def format_results(results, verbose: bool = False) -> str:
@@ -67,7 +67,7 @@ def main():
     args = parser.parse_args()
 
     # Initialize vector store
-    store = VectorStore()
+    store = get_vector_store()
 
     # Search
     results = store.search(
@@ -27,7 +27,7 @@ from dataclasses import dataclass
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from vector_store import VectorStore
+from vector_store import get_vector_store
 
 
 @dataclass
@@ -61,7 +61,7 @@ class ReflectEngine:
 
     def __init__(self, openai_api_key: Optional[str] = None):
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
-        self.vector_store = VectorStore()
+        self.vector_store = get_vector_store()
         self.contradictions: List[Contradiction] = []
         self.patterns: List[Pattern] = []
 
@@ -325,9 +325,9 @@ Output JSON array of relationships."""
 
     async def _store_memories(self, memories: List[Memory]):
         """Store memories in vector store"""
-        from vector_store import VectorStore
+        from vector_store import get_vector_store
 
-        store = VectorStore()
+        store = get_vector_store()
 
         for memory in memories:
             # Generate embedding if not present
@@ -352,9 +352,9 @@ Output JSON array of relationships."""
 
     async def _store_entities(self, entities: List[Entity]):
         """Store entities in vector store as special memory type"""
-        from vector_store import VectorStore
+        from vector_store import get_vector_store
 
-        store = VectorStore()
+        store = get_vector_store()
 
         for entity in entities:
             # Create a memory for each entity (for searchability)
@@ -378,9 +378,9 @@ Output JSON array of relationships."""
 
     async def _store_relationships(self, relationships: List[Relationship]):
         """Store relationships in vector store"""
-        from vector_store import VectorStore
+        from vector_store import get_vector_store
 
-        store = VectorStore()
+        store = get_vector_store()
 
         for rel in relationships:
             # Create a memory for each relationship
@@ -19,7 +19,7 @@ from typing import List, Dict, Any, Optional
 # Add memory module to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from vector_store import VectorStore
+from vector_store import get_vector_store
 
 
 def get_active_task_context(project_dir: Path) -> List[str]:
@@ -87,7 +87,7 @@ def recall_memories_for_session(
     Returns:
         Dictionary with memories and metadata
     """
-    store = VectorStore()
+    store = get_vector_store()
 
     # Build search queries from context
     queries = build_search_queries(project_dir)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test the embedders, the embedding cache and batched embedding.
+
+Tests that:
+1. The cache evicts least recently used entries, counting hits as uses
+2. Hits, misses and writes are counted
+3. embed_many embeds duplicate texts once and serves repeats from the cache
+4. embed_many splits texts into batches of the embedder's batch_size
+5. A failing embedder falls back to the local one, uncached
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import embeddings
+from embeddings import Embedder, EmbeddingCache, HashingEmbedder
+from vector_store import VectorStore
+
+
+class RecordingEmbedder(Embedder):
+    """Hashing vectors, recording every batch it is asked to embed"""
+
+    name = "recording"
+    batch_size = 2
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batches = []
+        self._hashing = HashingEmbedder()
+
+    def embed(self, texts):
+        self.batches.append(list(texts))
+        if self.fail:
+            raise RuntimeError("service unavailable")
+        return self._hashing.embed(texts)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Deterministic time for last_used ordering"""
+    now = [0.0]
+
+    def tick():
+        now[0] += 1
+        return now[0]
+
+    monkeypatch.setattr(embeddings, "time", SimpleNamespace(time=tick))
+
+
+def vector(value: float) -> np.ndarray:
+    return np.full(4, value, dtype=np.float32)
+
+
+def open_store(tmp_path: Path, embedder: Embedder) -> VectorStore:
+    return VectorStore(tmp_path, embedder=embedder)
+
+
+def test_cache_evicts_least_recently_used(tmp_path, clock):
+    cache = EmbeddingCache(tmp_path / "embeddings.db", max_entries=10)
+    for i in range(10):
+        cache.put_many("e", {f"k{i}": vector(i)})
+
+    assert list(cache.get_many("e", ["k0"])) == ["k0"]
+    cache.put_many("e", {"k10": vector(10)})
+
+    # Over capacity: evicts down to 90%, oldest first; k0 was just used
+    kept = cache.get_many("e", [f"k{i}" for i in range(11)])
+    assert sorted(kept) == sorted(["k0", *(f"k{i}" for i in range(3, 11))])
+    assert len(cache) == 9
+    assert cache.get_stats()["evictions"] == 2
+    np.testing.assert_array_equal(kept["k7"], vector(7))
+    cache.close()
+
+
+def test_cache_stats_and_namespaces(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.db")
+    cache.put_many("e", {"a": vector(1), "b": vector(2)})
+    cache.put_many("e", {"a": vector(3)})
+
+    assert list(cache.get_many("e", ["a", "missing", "missing"])) == ["a"]
+    assert cache.get_many("other", ["a"]) == {}
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 2, 3)
+    assert stats["entries"] == len(cache) == 2
+    cache.close()
+
+    reopened = EmbeddingCache(tmp_path / "embeddings.db")
+    np.testing.assert_array_equal(reopened.get_many("e", ["a"])["a"], vector(3))
+    reopened.close()
+
+
+def test_embed_many_embeds_duplicates_once(tmp_path):
+    embedder = RecordingEmbedder()
+    store = open_store(tmp_path, embedder)
+    texts = ["alpha", "beta", "alpha", "gamma", "beta"]
+
+    vectors = store.embed_many(texts)
+
+    assert sorted(text for batch in embedder.batches for text in batch) == ["alpha", "beta", "gamma"]
+    np.testing.assert_array_equal(vectors[0], vectors[2])
+    np.testing.assert_array_equal(vectors[1], vectors[4])
+    np.testing.assert_array_equal(vectors[3], HashingEmbedder().embed(["gamma"])[0])
+
+    embedder.batches.clear()
+    again = store.embed_many(["gamma", "alpha"])
+    assert embedder.batches == []
+    np.testing.assert_array_equal(again[1], vectors[0])
+
+
+def test_embed_many_splits_batches(tmp_path):
+    embedder = RecordingEmbedder()
+    store = open_store(tmp_path, embedder)
+
+    store.embed_many([f"text {i}" for i in range(5)])
+
+    assert [len(batch) for batch in embedder.batches] == [2, 2, 1]
+    assert len(store.embed_many([f"text {i}" for i in range(7)])) == 7
+    assert embedder.batches[3:] == [["text 5", "text 6"]]
+
+
+def test_failed_embedder_falls_back_uncached(tmp_path):
+    embedder = RecordingEmbedder(fail=True)
+    store = open_store(tmp_path, embedder)
+
+    vectors = store.embed_many(["first text", "second text", "third text"])
+
+    expected = HashingEmbedder().embed(["first text", "second text", "third text"])
+    np.testing.assert_array_equal(np.stack(vectors), expected)
+    assert len(embedder.batches) == 2
+
+    # Fallback vectors are not cached under the failing embedder's name
+    store.embed_many(["first text"])
+    assert len(embedder.batches) == 3
+    assert store.get_stats()["embedding_cache"]["writes"] == 0
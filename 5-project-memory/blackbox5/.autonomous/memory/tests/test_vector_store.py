@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test the Hindsight vector store.
+
+Tests that:
+1. Added memories are searchable, filterable by network and deletable
+2. Reopening a store replays its log to the same state
+3. A torn final log record is cut off, so later appends survive a reopen
+4. The vector file grows when full and the old generation is removed
+5. Stores on one directory see each other's rows instead of reusing them
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import vector_store
+from embeddings import HashingEmbedder
+from vector_store import VectorStore
+
+
+def open_store(storage_dir: Path) -> VectorStore:
+    return VectorStore(storage_dir, embedder=HashingEmbedder(), embedding_cache_size=0)
+
+
+def log_records(storage_dir: Path):
+    with open(storage_dir / "memories.log") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_add_search_delete(tmp_path):
+    store = open_store(tmp_path)
+    auth = store.add_memory("login uses jwt tokens", "world")
+    store.add_memory("billing runs nightly invoices", "experience")
+    store.add_memory("I prefer short functions", "opinion")
+
+    memory, score = store.search("jwt tokens for login", top_k=1)[0]
+    assert memory.id == auth and score > 0.5
+    assert [m.network for m, _ in store.search("invoices", network="experience")] == ["experience"]
+    assert store.search("invoices", network="unknown") == []
+
+    assert store.delete_memory(auth)
+    assert not store.delete_memory(auth)
+    assert auth not in [m.id for m, _ in store.search("jwt tokens for login", top_k=3)]
+    assert store.get_stats()["dead_rows"] == 1
+
+
+def test_readding_content_replaces_row(tmp_path):
+    store = open_store(tmp_path)
+    first = store.add_memory("same content", "world", {"version": 1})
+    second = store.add_memory("same content", "world", {"version": 2})
+
+    assert first == second
+    assert store.get_stats()["vector_rows"] == 1
+    assert store.get_memory(first).metadata == {"version": 2}
+
+
+def test_reopen_replays_log(tmp_path):
+    store = open_store(tmp_path)
+    ids = store.add_memories([
+        {"content": f"memory number {i}", "network": "world" if i % 2 else "opinion"}
+        for i in range(6)
+    ])
+    store.delete_memory(ids[0])
+    expected = [(m.id, round(s, 5)) for m, s in store.search("memory number 3", top_k=3)]
+    store.close()
+
+    reopened = open_store(tmp_path)
+    assert set(m.id for m in reopened.get_all_memories()) == set(ids[1:])
+    assert [(m.id, round(s, 5)) for m, s in reopened.search("memory number 3", top_k=3)] == expected
+    assert reopened.get_embedding(ids[1]) == pytest.approx(store.get_embedding(ids[1]))
+
+
+def test_torn_log_tail_is_cut_off(tmp_path):
+    store = open_store(tmp_path)
+    kept = store.add_memory("kept memory", "world")
+    store.close()
+    with open(tmp_path / "memories.log", "a") as f:
+        f.write('{"op": "add", "id": "torn", "cont')
+
+    reopened = open_store(tmp_path)
+    assert [m.id for m in reopened.get_all_memories()] == [kept]
+    added = reopened.add_memory("added after the crash", "world")
+    reopened.close()
+
+    assert all(record.get("id") != "torn" for record in log_records(tmp_path))
+    assert set(m.id for m in open_store(tmp_path).get_all_memories()) == {kept, added}
+
+
+def test_vector_file_grows(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_store, "INITIAL_CAPACITY", 4)
+    store = open_store(tmp_path)
+    ids = [store.add_memory(f"growing memory {i}", "world") for i in range(10)]
+
+    assert store._matrix.shape[0] == 16
+    assert [p.name for p in tmp_path.glob("vectors-*.npy")] == [store._vectors_file.name]
+    assert store.search("growing memory 9", top_k=1)[0][0].id == ids[9]
+    store.close()
+
+    reopened = open_store(tmp_path)
+    assert len(reopened.get_all_memories()) == 10
+    assert reopened.search("growing memory 2", top_k=1)[0][0].id == ids[2]
+
+
+def test_stores_share_rows_through_the_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_store, "INITIAL_CAPACITY", 4)
+    first = open_store(tmp_path)
+    second = open_store(tmp_path)
+
+    a = first.add_memory("written by the first store", "world")
+    b = second.add_memory("written by the second store", "world")
+    more = first.add_memories([{"content": f"first store batch {i}", "network": "world"} for i in range(4)])
+
+    rows = [record["row"] for record in log_records(tmp_path) if record["op"] == "add"]
+    assert len(rows) == len(set(rows)) == 6
+    assert set(first.memories) == {a, b, *more}
+
+    second.delete_memory(a)
+    second.compact()
+    first.add_memory("after compaction", "world")
+    assert len(open_store(tmp_path).get_all_memories()) == 6
+    assert first.search("written by the second store", top_k=1)[0][0].id == b
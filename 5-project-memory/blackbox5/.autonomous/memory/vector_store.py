@@ -2,27 +2,61 @@
 """
 Vector Store for Hindsight Memory
 
-Hybrid approach: JSON storage + in-memory vectors
-- Stores memories in JSON files (refactor-proof)
-- Generates embeddings on-the-fly
-- Keeps vectors in memory for fast similarity search
-- Scales to ~10K memories before needing SQLite
+Hybrid approach: binary vectors + append-only metadata log
+- Vectors live in a float32 .npy matrix of pre-normalized rows, memory-mapped
+  on load, so search is one matrix-vector product plus argpartition
+- Memory metadata lives in an append-only JSON-lines log (memories.log), so
+  inserts and deletes are O(1) instead of rewriting the whole store
+- compact() rewrites both files without dead rows
+- An existing memories.json is imported on first load
+- Embeddings are generated in batches by a pluggable Embedder and cached in
+  SQLite (embeddings.db) with LRU eviction
+
+Open stores through get_vector_store() so callers in one process share an
+instance. Writers in different processes serialize on a lock file
+(storage_dir/.lock) and replay each other's log records before allocating
+vector rows.
 
 Usage:
-    store = VectorStore()
+    store = get_vector_store()
     store.add_memory(memory)
     results = store.search("query", top_k=5)
 """
 
 import json
 import os
+import threading
 import numpy as np
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import hashlib
 
+from embeddings import (
+    Embedder,
+    EmbeddingCache,
+    HashingEmbedder,
+    OpenAIEmbedder,
+    text_hash,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within the process
+    fcntl = None
+
+
+# Storage directory used when none is given
+DEFAULT_STORAGE_DIR = Path(__file__).parent / "data"
+
+# Rows preallocated in a new vector file; the file doubles when full
+INITIAL_CAPACITY = 1024
+
+# Dead rows (deleted/replaced) tolerated before compact() runs on its own
+COMPACT_DEAD_RATIO = 0.5
+
 
 @dataclass
 class VectorMemory:
@@ -58,145 +92,472 @@ class VectorMemory:
 
 class VectorStore:
     """
-    Vector store with JSON persistence and in-memory search.
+    Vector store with binary vector storage and an append-only metadata log.
+
+    On disk (storage_dir):
+    - vectors-<generation>.npy: float32 [capacity, dim] matrix of unit rows
+    - memories.log: JSON lines; "vectors" records name the current matrix
+      file, "add" records map a memory to its row, "delete" records drop it
+    - .lock: flock taken around every write; the writer first replays log
+      records appended by other processes
 
-    Stores memories as JSON files, loads vectors into memory for fast search.
-    Generates embeddings on-demand if not cached.
+    In memory, `memories` holds metadata (embedding=None; see
+    get_embedding()) and a network-id column per row drives filtering.
     """
 
-    def __init__(self, storage_dir: Optional[Path] = None, openai_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        storage_dir: Optional[Path] = None,
+        openai_api_key: Optional[str] = None,
+        embedder: Optional[Embedder] = None,
+        embedding_cache_size: int = 100_000,
+    ):
         """
         Initialize vector store.
 
         Args:
-            storage_dir: Directory for JSON storage (default: .autonomous/memory/data/)
+            storage_dir: Directory for storage (default: .autonomous/memory/data/)
             openai_api_key: OpenAI API key for embeddings (or set OPENAI_API_KEY env var)
+            embedder: Embedder to use (default: OpenAI if a key is set, else
+                the offline HashingEmbedder)
+            embedding_cache_size: Cached embeddings kept before LRU eviction
+                (0 disables the cache)
         """
         if storage_dir is None:
-            storage_dir = Path(__file__).parent / "data"
+            storage_dir = DEFAULT_STORAGE_DIR
 
-        self.storage_dir = storage_dir
+        self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         # OpenAI API key
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
 
-        # In-memory cache
+        # In-memory metadata
         self.memories: Dict[str, VectorMemory] = {}
-        self.vectors: Dict[str, np.ndarray] = {}
+
+        # Vector matrix and row bookkeeping
+        self._log_file = self.storage_dir / "memories.log"
+        self._vectors_file: Optional[Path] = None
+        self._generation = 0
+        self._matrix: Optional[np.ndarray] = None   # memmap [capacity, dim]
+        self._row_count = 0                           # rows in use (live + dead)
+        self._rows: Dict[str, int] = {}               # memory id -> row
+        self._row_ids: List[Optional[str]] = []       # row -> memory id (None = dead)
+        self._network_ids = np.zeros(0, dtype=np.int16)  # row -> network id (-1 = dead)
+        self._network_names: List[str] = []
+        self._network_index: Dict[str, int] = {}
+        self._log = None
+        self._log_inode: Optional[int] = None        # log file replayed so far
+        self._log_offset = 0                          # bytes of it replayed
+
+        # Writers: threads of this process, then processes sharing the directory
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+
+        # Embedders: the configured one, and an offline fallback for failures
+        self.fallback_embedder = HashingEmbedder()
+        self.embedder = embedder or self._default_embedder()
 
         # Embedding cache to avoid redundant API calls
-        self._embedding_cache: Dict[str, np.ndarray] = {}
-        self._cache_file = self.storage_dir / ".embedding_cache.json"
-        self._load_embedding_cache()
+        self._embedding_cache: Optional[EmbeddingCache] = None
+        if embedding_cache_size > 0:
+            self._embedding_cache = EmbeddingCache(
+                self.storage_dir / "embeddings.db", max_entries=embedding_cache_size
+            )
+            self._import_legacy_cache()
 
         # Load existing memories
         self._load_all()
 
+    @property
+    def dimension(self) -> Optional[int]:
+        """Embedding dimension (None until the first memory is stored)"""
+        return None if self._matrix is None else self._matrix.shape[1]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
     def _load_all(self):
-        """Load all memories from disk into memory"""
-        json_file = self.storage_dir / "memories.json"
-        if json_file.exists():
-            with open(json_file) as f:
-                data = json.load(f)
-                for item in data:
-                    memory = VectorMemory.from_dict(item)
-                    self.memories[memory.id] = memory
-                    if memory.embedding:
-                        self.vectors[memory.id] = np.array(memory.embedding)
+        """Load metadata from the log and memory-map the vector matrix"""
+        with self._locked():
+            if not self._log_file.exists():
+                legacy_file = self.storage_dir / "memories.json"
+                if legacy_file.exists():
+                    self._import_legacy(legacy_file)
 
         print(f"Loaded {len(self.memories)} memories into vector store")
 
+    @contextmanager
+    def _locked(self):
+        """
+        Serialize a write with other threads and processes.
+
+        On first entry the store catches up with the log, so rows allocated
+        by other processes are known before this one allocates its own.
+        """
+        with self._lock:
+            if self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+
+            with open(self.storage_dir / ".lock", "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                self._lock_depth = 1
+                try:
+                    self._catch_up()
+                    yield
+                finally:
+                    self._lock_depth = 0
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _catch_up(self):
+        """Replay log records written since the last replay or write"""
+        try:
+            stat = self._log_file.stat()
+        except FileNotFoundError:
+            return
+        if stat.st_ino != self._log_inode:
+            # New store, or another process compacted the log: start over
+            if self._log_inode is not None:
+                self._reset()
+            self._log_inode, self._log_offset = stat.st_ino, 0
+            self._replay_log()
+        elif stat.st_size != self._log_offset:
+            self._replay_log()
+
+    def _reset(self):
+        """Drop the in-memory state before replaying a replaced log"""
+        self._close_log()
+        self.memories = {}
+        self._vectors_file = None
+        self._matrix = None
+        self._row_count = 0
+        self._rows = {}
+        self._row_ids = []
+        self._network_ids = np.zeros(0, dtype=np.int16)
+
+    def _replay_log(self):
+        """Apply the records of memories.log after the replayed offset"""
+        records = []
+        with open(self._log_file, "rb+") as f:
+            f.seek(self._log_offset)
+            valid_end = self._log_offset
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("record has no line end")
+                    records.append(json.loads(line))
+                except ValueError:
+                    # A torn final write is expected after a crash. Cut it
+                    # off, or the next append would extend the torn line
+                    print(f"Warning: Dropping corrupt log record at byte {valid_end}")
+                    self._close_log()
+                    f.truncate(valid_end)
+                    break
+                valid_end += len(line)
+        self._log_offset = valid_end
+
+        vectors_file = self._vectors_file
+        for record in records:
+            op = record.get("op")
+            if op == "vectors":
+                vectors_file = self.storage_dir / record["file"]
+                self._generation = record.get("generation", 0)
+            elif op == "add":
+                memory = VectorMemory.from_dict(record)
+                previous = self._rows.get(memory.id)
+                if previous is not None and previous != record["row"]:
+                    self._clear_row(previous)
+                self.memories[memory.id] = memory
+                self._set_row(memory.id, record["row"], memory.network)
+            elif op == "delete":
+                self.memories.pop(record["id"], None)
+                row = self._rows.pop(record["id"], None)
+                if row is not None:
+                    self._clear_row(row)
+
+        if vectors_file != self._vectors_file:
+            if vectors_file is None or not vectors_file.exists():
+                if self.memories:
+                    print(f"Warning: Vector file missing, {len(self.memories)} memories are not searchable")
+                self._reset()
+                return
+            self._matrix = np.load(vectors_file, mmap_mode="r+")
+            self._vectors_file = vectors_file
+
+    def _import_legacy(self, json_file: Path):
+        """One-time import of the old memories.json format"""
+        with open(json_file) as f:
+            data = json.load(f)
+
+        memories = [VectorMemory.from_dict(item) for item in data]
+        missing = [m for m in memories if not m.embedding]
+        embedded = dict(zip((m.id for m in missing), self.embed_many([m.content for m in missing])))
+        vectors = [
+            np.asarray(m.embedding, dtype=np.float32) if m.embedding else embedded[m.id]
+            for m in memories
+        ]
+        self._write_snapshot(memories, vectors)
+        print(f"Imported {len(memories)} memories from {json_file.name}")
+
+    def _write_snapshot(self, memories: List[VectorMemory], vectors: List[np.ndarray]):
+        """
+        Write a fresh vector file and log holding exactly `memories`.
+
+        The new log is moved into place atomically; it names the new vector
+        file, so a crash at any point leaves a consistent store behind.
+        """
+        self._close_log()
+        dim = len(vectors[0]) if vectors else (self.dimension or 0)
+        previous_file = self._vectors_file
+        self._generation += 1
+        vectors_file = self.storage_dir / f"vectors-{self._generation}.npy"
+
+        matrix = None
+        if dim:
+            capacity = max(INITIAL_CAPACITY, len(vectors))
+            matrix = np.lib.format.open_memmap(
+                vectors_file, mode="w+", dtype=np.float32, shape=(capacity, dim)
+            )
+            for row, vector in enumerate(vectors):
+                matrix[row] = self._normalize(vector)
+            matrix.flush()
+
+        tmp_log = self._log_file.with_suffix(".log.tmp")
+        with open(tmp_log, "w") as f:
+            if matrix is not None:
+                f.write(json.dumps(self._vectors_record(vectors_file)) + "\n")
+            for row, memory in enumerate(memories):
+                f.write(json.dumps(self._add_record(memory, row)) + "\n")
+        os.replace(tmp_log, self._log_file)
+        stat = self._log_file.stat()
+        self._log_inode, self._log_offset = stat.st_ino, stat.st_size
+
+        if previous_file and previous_file != vectors_file and previous_file.exists():
+            previous_file.unlink()
+
+        # Reset in-memory state to the snapshot
+        self.memories = {}
+        self._rows = {}
+        self._row_ids = []
+        self._matrix = matrix
+        self._vectors_file = vectors_file if matrix is not None else None
+        self._row_count = len(memories)
+        self._network_ids = np.full(0 if matrix is None else matrix.shape[0], -1, dtype=np.int16)
+        for row, memory in enumerate(memories):
+            memory.embedding = None
+            self.memories[memory.id] = memory
+            self._row_ids.append(None)
+            self._set_row(memory.id, row, memory.network)
+
     def _save_all(self):
-        """Save all memories to disk"""
-        json_file = self.storage_dir / "memories.json"
-        data = [m.to_dict() for m in self.memories.values()]
-        with open(json_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Save all memories to disk (compacts the log and vector file)"""
+        self.compact()
+
+    def compact(self):
+        """Rewrite the store without dead rows and superseded log records"""
+        with self._locked():
+            memories = list(self.memories.values())
+            vectors = [self._matrix[self._rows[m.id]] for m in memories] if self._matrix is not None else []
+            self._write_snapshot(memories, vectors)
+
+    def close(self):
+        """Flush vectors, close the metadata log and the embedding cache"""
+        if self._matrix is not None:
+            self._matrix.flush()
+        self._close_log()
+        if self._embedding_cache is not None:
+            self._embedding_cache.close()
+            self._embedding_cache = None
+
+    def _close_log(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _append_log(self, *records: Dict[str, Any]):
+        """Append records to memories.log in one write"""
+        if self._log is None:
+            self._log = open(self._log_file, "a")
+        self._log.write("".join(json.dumps(record) + "\n" for record in records))
+        self._log.flush()
+        self._log_offset = self._log.tell()
+        if self._log_inode is None:
+            self._log_inode = os.fstat(self._log.fileno()).st_ino
+
+    def _vectors_record(self, vectors_file: Path) -> Dict[str, Any]:
+        return {"op": "vectors", "file": vectors_file.name, "generation": self._generation}
+
+    @staticmethod
+    def _add_record(memory: VectorMemory, row: int) -> Dict[str, Any]:
+        record = memory.to_dict()
+        del record["embedding"]
+        record["op"] = "add"
+        record["row"] = row
+        return record
+
+    # ------------------------------------------------------------------
+    # Matrix bookkeeping
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _network_id(self, network: str) -> int:
+        network_id = self._network_index.get(network)
+        if network_id is None:
+            network_id = len(self._network_names)
+            self._network_names.append(network)
+            self._network_index[network] = network_id
+        return network_id
+
+    def _set_row(self, memory_id: str, row: int, network: str):
+        if row >= len(self._row_ids):
+            self._row_ids.extend([None] * (row + 1 - len(self._row_ids)))
+            self._row_count = len(self._row_ids)
+        if row >= len(self._network_ids):
+            network_ids = np.full(max(row + 1, 2 * len(self._network_ids)), -1, dtype=np.int16)
+            network_ids[:len(self._network_ids)] = self._network_ids
+            self._network_ids = network_ids
+        self._rows[memory_id] = row
+        self._row_ids[row] = memory_id
+        self._network_ids[row] = self._network_id(network)
+
+    def _clear_row(self, row: int):
+        self._row_ids[row] = None
+        self._network_ids[row] = -1
+
+    def _allocate_row(self, dim: int) -> int:
+        """Return the next free row, creating or growing the vector file"""
+        if self._matrix is None:
+            self._generation += 1
+            self._vectors_file = self.storage_dir / f"vectors-{self._generation}.npy"
+            self._matrix = np.lib.format.open_memmap(
+                self._vectors_file, mode="w+", dtype=np.float32, shape=(INITIAL_CAPACITY, dim)
+            )
+            self._network_ids = np.full(INITIAL_CAPACITY, -1, dtype=np.int16)
+            self._append_log(self._vectors_record(self._vectors_file))
+        elif self._row_count >= self._matrix.shape[0]:
+            self._grow()
+
+        row = self._row_count
+        self._row_count += 1
+        self._row_ids.append(None)
+        return row
+
+    def _grow(self):
+        """Double the vector file capacity (amortized O(1) per insert)"""
+        old_file = self._vectors_file
+        capacity = self._matrix.shape[0] * 2
+        self._generation += 1
+        new_file = self.storage_dir / f"vectors-{self._generation}.npy"
+
+        matrix = np.lib.format.open_memmap(
+            new_file, mode="w+", dtype=np.float32, shape=(capacity, self._matrix.shape[1])
+        )
+        matrix[:self._row_count] = self._matrix[:self._row_count]
+        matrix.flush()
+        self._append_log(self._vectors_record(new_file))
+
+        network_ids = np.full(capacity, -1, dtype=np.int16)
+        network_ids[:self._row_count] = self._network_ids[:self._row_count]
+        self._network_ids = network_ids
+        self._matrix = matrix
+        self._vectors_file = new_file
+        old_file.unlink()
 
     def _generate_id(self, content: str) -> str:
         """Generate unique ID from content"""
         return hashlib.md5(content.encode()).hexdigest()[:12]
 
-    def _load_embedding_cache(self):
-        """Load embedding cache from disk"""
-        if self._cache_file.exists():
+    def _default_embedder(self) -> Embedder:
+        """OpenAI embeddings when a key is set, else the offline embedder"""
+        if self.openai_api_key:
             try:
-                with open(self._cache_file) as f:
-                    cache_data = json.load(f)
-                    for text_hash, embedding_list in cache_data.items():
-                        self._embedding_cache[text_hash] = np.array(embedding_list)
-                print(f"Loaded {len(self._embedding_cache)} cached embeddings")
-            except Exception as e:
-                print(f"Warning: Could not load embedding cache: {e}")
-
-    def _save_embedding_cache(self):
-        """Save embedding cache to disk"""
+                return OpenAIEmbedder(self.openai_api_key)
+            except ImportError:
+                print("Warning: openai package not installed, using local embeddings")
+        return self.fallback_embedder
+
+    def _import_legacy_cache(self):
+        """One-time import of .embedding_cache.json into the SQLite cache"""
+        legacy_file = self.storage_dir / ".embedding_cache.json"
+        if not legacy_file.exists() or len(self._embedding_cache) > 0:
+            return
         try:
-            cache_data = {
-                text_hash: embedding.tolist()
-                for text_hash, embedding in self._embedding_cache.items()
-            }
-            with open(self._cache_file, 'w') as f:
-                json.dump(cache_data, f)
+            # The JSON cache held OpenAI vectors (1536-dim) and per-process
+            # hashing vectors; only the former are worth keeping
+            imported = self._embedding_cache.import_json(legacy_file, "openai:text-embedding-3-small", 1536)
+            print(f"Imported {imported} cached embeddings from {legacy_file.name}")
         except Exception as e:
-            print(f"Warning: Could not save embedding cache: {e}")
+            print(f"Warning: Could not import embedding cache: {e}")
 
-    def _generate_embedding(self, text: str) -> np.ndarray:
+    def embed_many(self, texts: List[str]) -> List[np.ndarray]:
         """
-        Generate embedding for text using OpenAI API.
+        Embed texts in batches, deduplicated and served from the cache.
 
-        Falls back to simple hashing if OpenAI is not available.
-        Uses caching to avoid redundant API calls.
-        """
-        # Check cache first
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        if text_hash in self._embedding_cache:
-            return self._embedding_cache[text_hash]
+        Args:
+            texts: Texts to embed (duplicates are embedded once)
 
-        # Try OpenAI if API key is available
-        if self.openai_api_key:
+        Returns:
+            One float32 vector per input text, in order
+        """
+        keys = [text_hash(text) for text in texts]
+        unique: Dict[str, str] = dict(zip(keys, texts))
+
+        embedder = self.embedder
+        vectors: Dict[str, np.ndarray] = {}
+        if self._embedding_cache is not None:
+            vectors = self._embedding_cache.get_many(embedder.name, list(unique))
+
+        missing = [key for key in unique if key not in vectors]
+        computed: Dict[str, np.ndarray] = {}
+        for start in range(0, len(missing), embedder.batch_size):
+            batch = missing[start:start + embedder.batch_size]
+            batch_texts = [unique[key] for key in batch]
             try:
-                import openai
-                client = openai.OpenAI(api_key=self.openai_api_key)
-
-                response = client.embeddings.create(
-                    model="text-embedding-3-small",
-                    input=text[:8000],  # OpenAI limit
-                )
-
-                embedding = np.array(response.data[0].embedding)
-
-                # Cache and save
-                self._embedding_cache[text_hash] = embedding
-                self._save_embedding_cache()
-
-                return embedding
-
+                batch_vectors = embedder.embed(batch_texts)
+                computed.update(zip(batch, batch_vectors))
             except Exception as e:
-                print(f"OpenAI embedding failed: {e}")
+                if embedder is self.fallback_embedder:
+                    raise
+                print(f"{embedder.name} embedding failed: {e}")
                 print("Falling back to local embedding...")
+                # Not cached under the primary embedder's name
+                vectors.update(zip(batch, self.fallback_embedder.embed(batch_texts)))
 
-        # Fallback: Simple bag-of-words embedding
-        words = text.lower().split()
-        embedding = np.zeros(384)
-        for i, word in enumerate(words[:50]):
-            idx = hash(word) % 384
-            embedding[idx] += 1
-        # Normalize
-        norm = np.linalg.norm(embedding)
-        if norm > 0:
-            embedding = embedding / norm
+        if computed and self._embedding_cache is not None:
+            self._embedding_cache.put_many(embedder.name, computed)
+        vectors.update(computed)
 
-        # Cache even fallback embeddings
-        self._embedding_cache[text_hash] = embedding
+        return [vectors[key] for key in keys]
 
-        return embedding
+    def _generate_embedding(self, text: str) -> np.ndarray:
+        """
+        Generate embedding for text with the configured embedder.
+
+        Falls back to the local embedder if it fails.
+        Uses caching to avoid redundant API calls.
+        """
+        return self.embed_many([text])[0]
 
     def add_memory(self, content: str, network: str, metadata: Optional[Dict] = None) -> str:
         """
         Add a memory to the store.
 
+        Writes one vector row and appends one log record; re-adding the same
+        content replaces the memory in place.
+
         Args:
             content: Memory content
             network: Memory network (world/experience/opinion/observation)
@@ -204,29 +565,66 @@ class VectorStore:
 
         Returns:
             Memory ID
+
+        Raises:
+            ValueError: If the embedding dimension differs from the store's
         """
-        memory_id = self._generate_id(content)
-
-        # Generate embedding
-        embedding = self._generate_embedding(content)
-
-        # Create memory
-        memory = VectorMemory(
-            id=memory_id,
-            content=content,
-            network=network,
-            embedding=embedding.tolist(),
-            metadata=metadata or {},
-        )
+        return self.add_memories([{"content": content, "network": network, "metadata": metadata}])[0]
 
-        # Store in memory
-        self.memories[memory_id] = memory
-        self.vectors[memory_id] = embedding
+    def add_memories(self, batch: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add many memories with batched embedding and a single log write.
 
-        # Persist to disk
-        self._save_all()
+        Args:
+            batch: Dicts with "content", "network" and optional "metadata"
 
-        return memory_id
+        Returns:
+            Memory IDs, in input order
+
+        Raises:
+            ValueError: If an embedding dimension differs from the store's
+        """
+        if not batch:
+            return []
+
+        # Generate embeddings
+        embeddings = self.embed_many([item["content"] for item in batch])
+
+        with self._locked():
+            dimension = self.dimension or len(embeddings[0])
+            for embedding in embeddings:
+                if len(embedding) != dimension:
+                    raise ValueError(
+                        f"Embedding dimension {len(embedding)} does not match store dimension {dimension}"
+                    )
+
+            memory_ids = []
+            records = []
+            for item, embedding in zip(batch, embeddings):
+                memory_id = self._generate_id(item["content"])
+
+                # Create memory
+                memory = VectorMemory(
+                    id=memory_id,
+                    content=item["content"],
+                    network=item["network"],
+                    metadata=item.get("metadata") or {},
+                )
+
+                # Write the vector row; the log record pointing at it follows
+                row = self._rows.get(memory_id)
+                if row is None:
+                    row = self._allocate_row(dimension)
+                self._matrix[row] = self._normalize(embedding)
+                records.append(self._add_record(memory, row))
+
+                # Store in memory
+                self.memories[memory_id] = memory
+                self._set_row(memory_id, row, memory.network)
+                memory_ids.append(memory_id)
+
+            self._append_log(*records)
+        return memory_ids
 
     def search(self, query: str, top_k: int = 5, network: Optional[str] = None) -> List[Tuple[VectorMemory, float]]:
         """
@@ -239,51 +637,75 @@ class VectorStore:
 
         Returns:
             List of (memory, similarity_score) tuples
+
+        Raises:
+            ValueError: If the query embedding dimension differs from the store's
         """
-        if not self.memories:
+        if not self.memories or self._matrix is None or top_k <= 0:
             return []
 
         # Generate query embedding
-        query_vec = self._generate_embedding(query)
-
-        # Calculate similarities
-        results = []
-        for memory_id, memory in self.memories.items():
-            # Filter by network if specified
-            if network and memory.network != network:
-                continue
-
-            # Get vector
-            vec = self.vectors.get(memory_id)
-            if vec is None:
-                continue
-
-            # Cosine similarity
-            norm_product = np.linalg.norm(query_vec) * np.linalg.norm(vec)
-            if norm_product == 0:
-                similarity = 0.0
-            else:
-                similarity = np.dot(query_vec, vec) / norm_product
-
-            results.append((memory, float(similarity)))
+        query_vec = self._normalize(self._generate_embedding(query))
+        if len(query_vec) != self.dimension:
+            raise ValueError(
+                f"Query embedding dimension {len(query_vec)} does not match store dimension {self.dimension}"
+            )
+
+        # Cosine similarity of unit rows: one matrix-vector product
+        count = self._row_count
+        scores = self._matrix[:count] @ query_vec
+
+        # Mask dead rows and other networks
+        network_ids = self._network_ids[:count]
+        if network:
+            network_id = self._network_index.get(network)
+            if network_id is None:
+                return []
+            mask = network_ids == network_id
+        else:
+            mask = network_ids >= 0
+        candidates = int(mask.sum())
+        if candidates == 0:
+            return []
+        scores = np.where(mask, scores, -np.inf)
 
-        # Sort by similarity (descending)
-        results.sort(key=lambda x: x[1], reverse=True)
+        # Top-k without sorting every score
+        k = min(top_k, candidates)
+        if k < count:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(count)
+        top = top[np.argsort(-scores[top], kind="stable")][:k]
 
-        return results[:top_k]
+        return [(self.memories[self._row_ids[row]], float(scores[row])) for row in top]
 
     def get_memory(self, memory_id: str) -> Optional[VectorMemory]:
         """Get a memory by ID"""
         return self.memories.get(memory_id)
 
+    def get_embedding(self, memory_id: str) -> Optional[List[float]]:
+        """Get the stored (unit-normalized) embedding of a memory"""
+        row = self._rows.get(memory_id)
+        if row is None or self._matrix is None:
+            return None
+        return self._matrix[row].tolist()
+
     def delete_memory(self, memory_id: str) -> bool:
         """Delete a memory"""
-        if memory_id in self.memories:
+        with self._locked():
+            if memory_id not in self.memories:
+                return False
+
+            self._append_log({"op": "delete", "id": memory_id})
             del self.memories[memory_id]
-            del self.vectors[memory_id]
-            self._save_all()
-            return True
-        return False
+            row = self._rows.pop(memory_id, None)
+            if row is not None:
+                self._clear_row(row)
+
+            dead = self._row_count - len(self.memories)
+            if self._row_count >= INITIAL_CAPACITY and dead > self._row_count * COMPACT_DEAD_RATIO:
+                self.compact()
+        return True
 
     def get_stats(self) -> Dict[str, Any]:
         """Get store statistics"""
@@ -304,16 +726,28 @@ class VectorStore:
             reverse=True
         )[:5]
 
+        storage_bytes = sum(
+            path.stat().st_size
+            for path in (self._log_file, self._vectors_file)
+            if path is not None and path.exists()
+        )
+
         return {
             "total_memories": len(self.memories),
             "networks": networks,
             "storage_dir": str(self.storage_dir),
+            "storage_bytes": storage_bytes,
+            "dimension": self.dimension,
+            "vector_rows": self._row_count,
+            "dead_rows": self._row_count - len(self.memories),
             "timeline": dates,
             "recent_memories": [
                 {"id": m.id, "content": m.content[:80] + "...", "network": m.network, "created": m.created_at}
                 for m in recent
             ],
-            "embedding_cache_size": len(self._embedding_cache),
+            "embedder": self.embedder.name,
+            "embedding_cache_size": len(self._embedding_cache) if self._embedding_cache is not None else 0,
+            "embedding_cache": self._embedding_cache.get_stats() if self._embedding_cache is not None else None,
         }
 
     def get_all_memories(self) -> List[VectorMemory]:
@@ -322,9 +756,38 @@ class VectorStore:
 
     def clear_cache(self):
         """Clear the embedding cache"""
-        self._embedding_cache.clear()
-        if self._cache_file.exists():
-            self._cache_file.unlink()
+        if self._embedding_cache is not None:
+            self._embedding_cache.clear()
+        legacy_file = self.storage_dir / ".embedding_cache.json"
+        if legacy_file.exists():
+            legacy_file.unlink()
+
+
+# Process-wide stores by storage directory (see get_vector_store)
+_shared_stores: Dict[Path, VectorStore] = {}
+_shared_lock = threading.Lock()
+
+
+def get_vector_store(storage_dir: Optional[Path] = None, **kwargs) -> VectorStore:
+    """
+    Get the process-wide VectorStore for a storage directory.
+
+    Callers in one process share a single instance, and with it the row
+    allocator of the vector file.
+
+    Args:
+        storage_dir: Directory for storage (default: .autonomous/memory/data/)
+        **kwargs: VectorStore arguments, used when the store is first opened
+
+    Returns:
+        The shared VectorStore
+    """
+    key = Path(storage_dir or DEFAULT_STORAGE_DIR).resolve()
+    with _shared_lock:
+        store = _shared_stores.get(key)
+        if store is None:
+            store = _shared_stores[key] = VectorStore(key, **kwargs)
+        return store
 
 
 # Simple CLI for testing
@@ -339,7 +802,7 @@ if __name__ == "__main__":
     parser.add_argument("--stats", action="store_true", help="Show stats")
     args = parser.parse_args()
 
-    store = VectorStore()
+    store = get_vector_store()
 
     if args.add:
         memory_id = store.add_memory(args.add, args.network)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+VectorStore Benchmark
+
+Measures, at each store size:
+- load:    opening the store (log replay + memory-mapping the matrix)
+- insert:  add_memory() rate on top of the loaded store
+- query:   search() latency, unfiltered and filtered by network
+- embed:   one text per call vs embed_many() batches, cold (cache misses,
+           each call pays a simulated API round trip) and warm (cache hits)
+
+and compares with the previous design (memories.json rewritten on every
+insert, Python loop over every memory per query) up to --legacy-max.
+
+Embeddings are random unit vectors so only the store itself is timed.
+
+Usage:
+    python vector_store_benchmark.py
+    python vector_store_benchmark.py --sizes 10000 100000 1000000 --dim 384
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from embeddings import Embedder, HashingEmbedder
+from vector_store import VectorMemory, VectorStore
+
+NETWORKS = ["world", "experience", "opinion", "observation"]
+
+
+class RandomEmbedder(Embedder):
+    """Random vectors: no API calls, so only the store is timed"""
+
+    name = "random"
+    rng = np.random.default_rng(0)
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    def embed(self, texts):
+        return self.rng.standard_normal((len(texts), self.dim)).astype(np.float32)
+
+
+def random_embedding_store(storage_dir: Path, dim: int) -> VectorStore:
+    return VectorStore(storage_dir, embedder=RandomEmbedder(dim), embedding_cache_size=0)
+
+
+def populate(storage_dir: Path, size: int, dim: int) -> None:
+    """Write a store of `size` memories in one snapshot"""
+    rng = np.random.default_rng(1)
+    store = random_embedding_store(storage_dir, dim)
+    memories = [
+        VectorMemory(id=f"m{i:09d}", content=f"memory {i}", network=NETWORKS[i % len(NETWORKS)])
+        for i in range(size)
+    ]
+    vectors = [rng.standard_normal(dim).astype(np.float32) for _ in range(size)]
+    store._write_snapshot(memories, vectors)
+    store.close()
+
+
+def legacy_write(json_file: Path, size: int, dim: int) -> None:
+    rng = np.random.default_rng(1)
+    data = [
+        VectorMemory(
+            id=f"m{i:09d}", content=f"memory {i}", network=NETWORKS[i % len(NETWORKS)],
+            embedding=rng.standard_normal(dim).tolist(),
+        ).to_dict()
+        for i in range(size)
+    ]
+    with open(json_file, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def legacy_load(json_file: Path):
+    with open(json_file) as f:
+        data = json.load(f)
+    memories = {item["id"]: VectorMemory.from_dict(item) for item in data}
+    vectors = {m.id: np.array(m.embedding) for m in memories.values()}
+    return memories, vectors
+
+
+def legacy_search(memories, vectors, query_vec, top_k=5):
+    results = []
+    for memory_id, memory in memories.items():
+        vec = vectors[memory_id]
+        similarity = np.dot(query_vec, vec) / (np.linalg.norm(query_vec) * np.linalg.norm(vec))
+        results.append((memory, float(similarity)))
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results[:top_k]
+
+
+def legacy_insert(json_file: Path, memories) -> None:
+    data = [m.to_dict() for m in memories.values()]
+    with open(json_file, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+class RemoteEmbedder(HashingEmbedder):
+    """Offline embedder plus a fixed round trip per call, like an embeddings API"""
+
+    batch_size = 100
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    def embed(self, texts):
+        time.sleep(self.latency)
+        return super().embed(texts)
+
+
+def run_embedding_benchmark(count: int, latency: float) -> None:
+    """Compare per-text and batched embedding through the SQLite cache"""
+    texts = [f"memory {i} about topic {i % 97} and detail {i % 13}" for i in range(count)]
+    for label, batched in (("embed 1-by-1", False), ("embed_many", True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = VectorStore(Path(tmp), embedder=RemoteEmbedder(latency))
+            for phase in ("cold", "warm"):
+                start = time.perf_counter()
+                if batched:
+                    store.embed_many(texts)
+                else:
+                    for text in texts:
+                        store.embed_many([text])
+                elapsed = time.perf_counter() - start
+                print(f"{count:>9}  {phase:<8}{label:<16}{elapsed * 1000:>10.1f}{'':>10}"
+                      f"  {count / elapsed:>9.0f}/s")
+            cache = store.get_stats()["embedding_cache"]
+            print(f"{'':>9}  {'':<8}{'cache':<16}  hits={cache['hits']} misses={cache['misses']}")
+            store.close()
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    p50 = statistics.median(samples) * 1000
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000
+    return f"{p50:>10.3f}{p99:>10.3f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VectorStore load/insert/query benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--inserts", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--embed-texts", type=int, default=1000)
+    parser.add_argument("--embed-latency", type=float, default=0.01,
+                        help="Simulated seconds per embedding API call")
+    parser.add_argument("--legacy-max", type=int, default=10000,
+                        help="Largest size also run with the old JSON store")
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print(f"{'size':>9}  {'store':<8}{'phase':<16}{'p50 ms':>10}{'p99 ms':>10}  {'rate':>12}")
+    print("-" * 72)
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage_dir = Path(tmp)
+            populate(storage_dir, size, args.dim)
+
+            load, store = timed(random_embedding_store, storage_dir, args.dim)
+            print(f"{size:>9}  {'new':<8}{'load':<16}{percentiles([load])}")
+
+            inserts = [timed(store.add_memory, f"new memory {i}", "world")[0] for i in range(args.inserts)]
+            print(f"{size:>9}  {'new':<8}{'insert':<16}{percentiles(inserts)}"
+                  f"  {len(inserts) / sum(inserts):>9.0f}/s")
+
+            for label, network in (("query", None), ("query+network", "opinion")):
+                queries = [timed(store.search, "q", top_k=10, network=network)[0]
+                           for _ in range(args.queries)]
+                print(f"{size:>9}  {'new':<8}{label:<16}{percentiles(queries)}")
+            store.close()
+
+        if size <= args.legacy_max:
+            with tempfile.TemporaryDirectory() as tmp:
+                json_file = Path(tmp) / "memories.json"
+                legacy_write(json_file, size, args.dim)
+
+                load, (memories, vectors) = timed(legacy_load, json_file)
+                print(f"{size:>9}  {'legacy':<8}{'load':<16}{percentiles([load])}")
+
+                inserts = [timed(legacy_insert, json_file, memories)[0] for _ in range(3)]
+                print(f"{size:>9}  {'legacy':<8}{'insert':<16}{percentiles(inserts)}"
+                      f"  {len(inserts) / sum(inserts):>9.1f}/s")
+
+                query_vec = np.random.default_rng(2).standard_normal(args.dim)
+                queries = [timed(legacy_search, memories, vectors, query_vec)[0] for _ in range(5)]
+                print(f"{size:>9}  {'legacy':<8}{'query':<16}{percentiles(queries)}")
+        print("-" * 72)
+
+    run_embedding_benchmark(args.embed_texts, args.embed_latency)
+    print("-" * 72)
+
+
+if __name__ == "__main__":
+    main()
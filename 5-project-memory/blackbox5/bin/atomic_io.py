@@ -6,20 +6,29 @@ Provides thread-safe and process-safe file operations using:
 - File locking (fcntl on Unix)
 - Atomic writes (temp file + rename)
 - Automatic backups
+- Append-only event journals instead of events.yaml rewrites
 """
 
 import fcntl
 import logging
 import os
+import sys
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 import yaml
 
+# The event journal is shared with the engine and health monitor (bin/lib)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "bin" / "lib"))
+from event_journal import EventJournal
+
 logger = logging.getLogger(__name__)
 
+# Open event journals by events.yaml path
+_journals: Dict[Path, EventJournal] = {}
+
 
 @contextmanager
 def file_lock(lock_path: Path, timeout: Optional[float] = None):
@@ -141,60 +150,58 @@ def atomic_append_yaml_event(
     lock_timeout: Optional[float] = None
 ) -> None:
     """
-    Append event to YAML list atomically with file locking.
+    Append event to the journal of an events.yaml file.
 
-    This is specifically for events.yaml files that are lists of events.
-    Uses read-modify-write pattern with proper locking.
+    The event is appended to filepath's journal (events.yaml ->
+    events.journal/) with a single O_APPEND write and mirrored into the
+    YAML file with one append, so the cost no longer grows with the number
+    of logged events. Events already in the YAML file are imported into the
+    journal the first time it is used; export_yaml_events() rebuilds the
+    file from the journal.
 
     Args:
         event: Event dictionary to append
-        filepath: Target file path
-        lock_timeout: Maximum time to wait for lock
+        filepath: events.yaml file the journal belongs to
+        lock_timeout: Maximum time to wait for the journal lock
 
     Raises:
         TimeoutError: If lock cannot be acquired
     """
-    filepath = Path(filepath)
-    lock_path = filepath.with_suffix(filepath.suffix + '.lock')
-
-    with file_lock(lock_path, timeout=lock_timeout):
-        # Read existing events
-        events = []
-        if filepath.exists():
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    events = yaml.safe_load(f) or []
-            except Exception as e:
-                logger.warning(f"Failed to read existing events: {e}")
-                events = []
+    journal = _event_journal(Path(filepath), lock_timeout)
+    journal.record(event)
+    logger.debug(f"Appended event to: {journal.directory}")
 
-        # Append new event
-        events.append(event)
 
-        # Write atomically (within lock, so no need for separate atomic write)
-        temp_fd, temp_path = tempfile.mkstemp(
-            dir=filepath.parent,
-            prefix=filepath.name + '.tmp.'
-        )
-        try:
-            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                yaml.dump(
-                    events,
-                    f,
-                    default_flow_style=False,
-                    sort_keys=False,
-                    allow_unicode=True
-                )
+def export_yaml_events(
+    filepath: Path,
+    lock_timeout: Optional[float] = None
+) -> None:
+    """
+    Rebuild an events.yaml file (a YAML list of events) from its journal.
 
-            os.replace(temp_path, filepath)
-            logger.debug(f"Appended event to: {filepath}")
+    Args:
+        filepath: events.yaml file to write
+        lock_timeout: Maximum time to wait for the journal lock
 
-        except Exception:
-            try:
-                os.unlink(temp_path)
-            except OSError:
-                pass
-            raise
+    Raises:
+        TimeoutError: If lock cannot be acquired
+    """
+    _event_journal(Path(filepath), lock_timeout).export_events_file()
+
+
+def _event_journal(filepath: Path, lock_timeout: Optional[float]) -> EventJournal:
+    """Journal for an events.yaml file, seeded from the file on first use."""
+    journal = _journals.get(filepath)
+    if journal is not None:
+        journal.lock_timeout = lock_timeout
+        return journal
+
+    journal = EventJournal.for_events_file(filepath, lock_timeout=lock_timeout)
+    imported = journal.seed_from_events_file()
+    if imported:
+        logger.info(f"Imported {imported} events from {filepath} into {journal.directory}")
+    _journals[filepath] = journal
+    return journal
 
 
 def load_yaml_locked(
@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+Event Journal - Append-Only Segmented Event Log
+
+Replaces the read-modify-write of events.yaml (load every event, append one,
+dump them all back) with an append-only journal, so logging an event costs
+the same with ten events of history as with a million.
+
+Layout, next to the events file (events.yaml -> events.journal/):
+
+    events.journal/
+        .lock                 # flock, taken to rotate, import or mirror
+        000001.jsonl          # one compact JSON event per line
+        000001.idx            # sparse index: {"offset", "ts", "at"} per line
+        000002.jsonl
+        000002.idx
+
+Each event is appended with a single write() on an O_APPEND descriptor, so
+concurrent writers (agents in other processes) never interleave records and
+append() takes no lock; only rotation does. A segment is rotated once it reaches
+max_segment_bytes or has been written to for max_segment_age seconds. Every
+segment's first record, and then one record per index_stride bytes, gets an
+index entry with its byte offset and timestamp, so readers can seek into a
+segment by time instead of scanning it.
+
+events.yaml is kept as a mirror for tools that tail or grep it: record()
+appends the event to the journal and then the same event, as a YAML list
+item, to events.yaml (one append, never a rewrite). That append is made
+under the journal lock, so record() serializes writers for the length of
+one small write; use append() where no mirror is needed.
+The journal is the source of truth; export_events_file() rebuilds the
+mirror from it. Every writer goes through record(): Python agents through
+2-engine/helpers/legacy/event_logger.py and
+5-project-memory/blackbox5/bin/atomic_io.py, shell agents through the
+bin/bb5-log-event CLI.
+
+This is the one implementation of the on-disk format: the writers above and
+the health monitor's reader (bin/lib/health_monitor/event_reader.py) locate
+it in bin/lib.
+
+Usage:
+    from event_journal import EventJournal
+
+    journal = EventJournal.for_events_file(Path("events.yaml"))
+    journal.seed_from_events_file()
+    journal.record({"timestamp": "2026-01-01T00:00:00", "agent": "planner", "type": "start"})
+    for event in journal.iter_events():
+        ...
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import yaml
+
+try:
+    import fcntl
+except ImportError:  # Windows: rotation is only serialized within the process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx"
+LOCK_NAME = ".lock"
+HEAD_BYTES = 64 * 1024  # Read to find where an events file's header ends
+
+
+@dataclass
+class Segment:
+    """One journal segment file and its sparse index."""
+    number: int
+    path: Path
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_suffix(INDEX_SUFFIX)
+
+
+@dataclass
+class IndexEntry:
+    """Sparse index entry: where a record starts and when it happened."""
+    offset: int
+    timestamp: str  # The event's own timestamp (ISO 8601)
+    appended_at: float  # time.time() when it was appended
+
+
+class EventJournal:
+    """
+    Append-only, segment-rotated event log.
+
+    Attributes:
+        directory: Journal directory
+        max_segment_bytes: Segment size that triggers rotation
+        max_segment_age: Seconds of writing to one segment before rotation (None = never)
+        index_stride: Bytes between sparse index entries
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_segment_bytes: int = 8 * 1024 * 1024,
+        max_segment_age: Optional[float] = 24 * 60 * 60,
+        index_stride: int = 64 * 1024,
+        lock_timeout: Optional[float] = None
+    ):
+        """
+        Initialize the journal.
+
+        Args:
+            directory: Journal directory (created on first append)
+            max_segment_bytes: Segment size that triggers rotation
+            max_segment_age: Seconds of writing to one segment before rotation (None = never)
+            index_stride: Bytes between sparse index entries
+            lock_timeout: Maximum time to wait for the rotation lock (None = block)
+        """
+        self.directory = Path(directory)
+        self.max_segment_bytes = max(1, max_segment_bytes)
+        self.max_segment_age = max_segment_age
+        self.index_stride = max(1, index_stride)
+        self.lock_timeout = lock_timeout
+
+        self._lock = threading.RLock()
+        self._lock_depth = 0  # Nesting of locked() while the flock is held
+        self._fd: Optional[int] = None
+        self._index_fd: Optional[int] = None
+        self._segment: Optional[Segment] = None
+        self._segment_opened_at = 0.0
+
+        # events.yaml mirrored by record(); set by for_events_file()
+        self.events_file: Optional[Path] = None
+
+    @classmethod
+    def for_events_file(cls, events_file: Path, **kwargs) -> "EventJournal":
+        """Journal behind an events.yaml file (events.yaml -> events.journal/)."""
+        events_file = Path(events_file)
+        journal = cls(events_file.with_suffix(".journal"), **kwargs)
+        journal.events_file = events_file
+        return journal
+
+    # =========================================================================
+    # WRITING
+    # =========================================================================
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """
+        Append one event.
+
+        Args:
+            event: Event data; a "timestamp" is added if missing
+        """
+        self.append_many([event])
+
+    def append_many(self, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        Append events in order.
+
+        Events are written in as few write() calls as segment rotation
+        allows, each call landing contiguously in one segment.
+
+        Args:
+            events: Event dicts; a "timestamp" is added where missing
+
+        Returns:
+            Number of events appended
+        """
+        encoded = [self._encode(event) for event in events]
+        if not encoded:
+            return 0
+
+        with self._lock:
+            position = 0
+            while position < len(encoded):
+                fd = self._writable()
+                size = os.fstat(fd).st_size
+                chunk = []
+                chunk_bytes = 0
+                while position < len(encoded):
+                    line = encoded[position][0]
+                    if chunk and size + chunk_bytes + len(line) > self.max_segment_bytes:
+                        break
+                    chunk.append(encoded[position])
+                    chunk_bytes += len(line)
+                    position += 1
+                self._write_chunk(fd, chunk)
+        return len(encoded)
+
+    def import_events(self, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        Seed an empty journal with existing history (e.g. from events.yaml).
+
+        Runs under the journal lock and does nothing if the journal already
+        has events, so concurrent migrations import the history once.
+
+        Returns:
+            Number of events imported
+        """
+        with self.locked():
+            if not self.is_empty():
+                return 0
+            return self.append_many(events)
+
+    def close(self) -> None:
+        """Close the open segment."""
+        with self._lock:
+            self._close_segment()
+
+    def _encode(self, event: Dict[str, Any]) -> Tuple[bytes, str]:
+        if "timestamp" not in event:
+            event = {"timestamp": datetime.now().isoformat(), **event}
+        line = json.dumps(event, separators=(",", ":"), ensure_ascii=False, default=str) + "\n"
+        return line.encode("utf-8"), str(event["timestamp"])
+
+    def _write_chunk(self, fd: int, chunk: List[Tuple[bytes, str]]) -> None:
+        """Write records with one O_APPEND write and index the ones that cross a stride."""
+        data = b"".join(line for line, _ in chunk)
+        written = os.write(fd, data)
+        while written < len(data):  # Only for writes beyond what the OS takes at once
+            written += os.write(fd, data[written:])
+
+        # With O_APPEND the descriptor ends right after our data, wherever
+        # other writers' records landed
+        start = os.lseek(fd, 0, os.SEEK_CUR) - len(data)
+        now = time.time()
+        index_lines = []
+        for line, timestamp in chunk:
+            end = start + len(line)
+            if start == 0 or start // self.index_stride != end // self.index_stride:
+                index_lines.append(json.dumps(
+                    {"offset": start, "ts": timestamp, "at": now}, separators=(",", ":")
+                ) + "\n")
+            start = end
+        if index_lines:
+            os.write(self._index_fd, "".join(index_lines).encode("utf-8"))
+
+    def _writable(self) -> int:
+        """Descriptor of the segment to append to, rotating if it is due."""
+        if self._fd is not None and not self._due(self._fd, self._segment_opened_at):
+            return self._fd
+
+        with self.locked():
+            segments = self.segments()
+            latest = segments[-1] if segments else None
+            if latest is not None:
+                # Another writer may already have rotated, or the latest
+                # segment may still have room
+                fd = os.open(latest.path, os.O_WRONLY | os.O_APPEND)
+                opened_at = self._opened_at(latest)
+                if not self._due(fd, opened_at):
+                    self._adopt(latest, fd, opened_at)
+                    return fd
+                os.close(fd)
+
+            number = latest.number + 1 if latest is not None else 1
+            segment = Segment(number, self.directory / f"{number:06d}{SEGMENT_SUFFIX}")
+            fd = os.open(segment.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_EXCL, 0o644)
+            self._adopt(segment, fd, time.time())
+            logger.debug(f"Started event journal segment {segment.path}")
+            return fd
+
+    def _due(self, fd: int, opened_at: float) -> bool:
+        """Whether a segment should be rotated before the next append."""
+        if os.fstat(fd).st_size >= self.max_segment_bytes:
+            return True
+        return self.max_segment_age is not None and time.time() - opened_at >= self.max_segment_age
+
+    def _adopt(self, segment: Segment, fd: int, opened_at: float) -> None:
+        self._close_segment()
+        self._segment = segment
+        self._fd = fd
+        self._index_fd = os.open(segment.index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._segment_opened_at = opened_at
+
+    def _opened_at(self, segment: Segment) -> float:
+        """When writing to a segment started: its first index entry, else its mtime."""
+        index = self.read_index(segment)
+        if index:
+            return index[0].appended_at
+        try:
+            return segment.path.stat().st_mtime
+        except OSError:
+            return time.time()
+
+    def _close_segment(self) -> None:
+        for fd in (self._fd, self._index_fd):
+            if fd is not None:
+                os.close(fd)
+        self._fd = self._index_fd = None
+        self._segment = None
+
+    # =========================================================================
+    # EVENTS.YAML MIRROR
+    # =========================================================================
+
+    def seed_from_events_file(self) -> int:
+        """
+        Import the history in events.yaml into an empty journal.
+
+        Returns:
+            Number of events imported (0 once the journal has events)
+        """
+        if self.events_file is None or not self.events_file.exists() or not self.is_empty():
+            return 0
+        try:
+            events = load_events_file(self.events_file)
+        except (OSError, yaml.YAMLError) as e:
+            logger.warning(f"Cannot import {self.events_file}: {e}")
+            return 0
+        return self.import_events(events)
+
+    def record(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append an event to the journal and mirror it into events.yaml.
+
+        The mirror is a single append of one YAML list item, made under the
+        journal lock so it never lands in a file export_events_file() is
+        replacing.
+
+        Args:
+            event: Event data; a "timestamp" is added if missing
+
+        Returns:
+            The event as recorded
+        """
+        if "timestamp" not in event:
+            event = {"timestamp": datetime.now().isoformat(), **event}
+        self.append(event)
+        if self.events_file is None:
+            return event
+
+        with self.locked():
+            if not self._normalize_events_file():
+                return event
+            with open(self.events_file, "a+b") as f:
+                prefix = b""
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    prefix = b"" if f.read(1) == b"\n" else b"\n"
+                f.write(prefix + render_events([event]).encode("utf-8"))
+        return event
+
+    def export_events_file(self) -> Path:
+        """
+        Rewrite events.yaml from the journal, keeping its comment header.
+
+        Returns:
+            Path of the rewritten file
+        """
+        if self.events_file is None:
+            raise ValueError(f"Journal {self.directory} has no events file")
+        with self.locked():
+            self._replace_events_file(self._events_file_header(), self.iter_events())
+        return self.events_file
+
+    def _events_file_header(self) -> str:
+        """Leading comment lines of events.yaml."""
+        try:
+            with open(self.events_file, "rb") as f:
+                head = f.read(HEAD_BYTES).decode("utf-8", errors="ignore")
+        except FileNotFoundError:
+            return ""
+        return _split_header(head)[0]
+
+    def _normalize_events_file(self) -> bool:
+        """
+        Make events.yaml a plain YAML list, so events can be appended to it.
+
+        A file that keeps its events under an "events:" key (the older
+        event_logger layout, or a fresh file holding "events: []") is
+        rewritten once as its comment header followed by the list.
+
+        Returns:
+            False if the file cannot be read as events and was left alone
+        """
+        try:
+            with open(self.events_file, "rb") as f:
+                head = f.read(HEAD_BYTES).decode("utf-8", errors="ignore")
+        except FileNotFoundError:
+            return True
+        header, body = _split_header(head)
+        if not body or body.startswith("-"):
+            return True
+
+        try:
+            events = load_events_file(self.events_file)
+        except (OSError, yaml.YAMLError) as e:
+            logger.warning(f"Not mirroring to {self.events_file}: {e}")
+            return False
+        self._replace_events_file(header, events)
+        logger.info(f"Converted {self.events_file} to a list of {len(events)} events")
+        return True
+
+    def _replace_events_file(self, header: str, events: Iterable[Dict[str, Any]]) -> None:
+        """Atomically replace events.yaml with a header and a list of events."""
+        self.events_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=self.events_file.parent, prefix=self.events_file.name + ".tmp.")
+        try:
+            with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
+                f.write(header)
+                batch = []
+                for event in events:
+                    batch.append(event)
+                    if len(batch) >= 1000:
+                        f.write(render_events(batch))
+                        batch = []
+                f.write(render_events(batch))
+            os.replace(temp_path, self.events_file)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    # =========================================================================
+    # READING
+    # =========================================================================
+
+    def segments(self) -> List[Segment]:
+        """Journal segments, oldest first."""
+        if not self.directory.exists():
+            return []
+        segments = []
+        for path in self.directory.glob(f"*{SEGMENT_SUFFIX}"):
+            try:
+                segments.append(Segment(int(path.stem), path))
+            except ValueError:
+                continue
+        segments.sort(key=lambda segment: segment.number)
+        return segments
+
+    def is_empty(self) -> bool:
+        """Whether the journal holds no events."""
+        return all(segment.path.stat().st_size == 0 for segment in self.segments())
+
+    def read_index(self, segment: Segment) -> List[IndexEntry]:
+        """Sparse index of a segment, ordered by offset."""
+        entries = []
+        try:
+            with open(segment.index_path, "rb") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        entries.append(IndexEntry(entry["offset"], entry["ts"], entry["at"]))
+                    except (ValueError, KeyError):
+                        continue  # Torn entry; the segment itself is intact
+        except FileNotFoundError:
+            return []
+        entries.sort(key=lambda entry: entry.offset)
+        return entries
+
+    def read_segment(self, segment: Segment, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Events of one segment, starting at a record offset.
+
+        A final line without a newline (a write in progress or torn by a
+        crash) is not returned.
+        """
+        with open(segment.path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping corrupt event record in {segment.path}")
+
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Every event in the journal, oldest segment first."""
+        for segment in self.segments():
+            yield from self.read_segment(segment)
+
+    @contextmanager
+    def locked(self):
+        """
+        Hold the journal's cross-process lock (rotation, imports, mirroring).
+
+        Reentrant within the instance: the flock is taken once, under the
+        instance's own lock.
+        """
+        with self._lock:
+            if self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / LOCK_NAME, "a") as lock_file:
+                if fcntl is not None:
+                    self._acquire(lock_file)
+                self._lock_depth = 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth = 0
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _acquire(self, lock_file) -> None:
+        if self.lock_timeout is None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            return
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Could not acquire lock on {self.directory} within {self.lock_timeout}s")
+                time.sleep(0.05)
+
+
+def load_events_file(events_file: Path) -> List[Dict[str, Any]]:
+    """
+    Events stored in an events.yaml file.
+
+    Accepts both layouts in use: a YAML list of events, or a mapping with
+    an "events" list.
+
+    Raises:
+        OSError, yaml.YAMLError: If the file cannot be read or parsed
+    """
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(events_file, "r", encoding="utf-8") as f:
+        content = yaml.load(f, Loader=loader) or []
+    if isinstance(content, dict):
+        content = content.get("events") or []
+    if not isinstance(content, list):
+        return []
+    return [event for event in content if isinstance(event, dict)]
+
+
+def render_events(events: List[Dict[str, Any]]) -> str:
+    """Events as YAML list items, as they appear in events.yaml."""
+    if not events:
+        return ""
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(events, Dumper=dumper, sort_keys=False, allow_unicode=True, default_flow_style=False)
+
+
+def _split_header(text: str) -> Tuple[str, str]:
+    """Split YAML text into its leading comment/blank lines and the rest."""
+    position = 0
+    for line in text.splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            break
+        position += len(line)
+    return text[:position], text[position:]
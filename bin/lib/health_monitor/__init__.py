@@ -1,11 +1,15 @@
 """BB5 Health Monitor - Core library for system health monitoring."""
 
 from .config import Config
+from .event_reader import EventReader
 from .models import Task, Agent, Event, HealthSnapshot, Metric
 from .collectors import (
     collect_queue,
     collect_heartbeat,
     collect_events,
+    collect_events_between,
+    collect_task_activity,
+    get_event_reader,
     collect_metrics,
     collect_skills,
     collect_run_metrics,
@@ -17,16 +21,24 @@ from .calculators import (
     calculate_agent_health,
     calculate_throughput,
     calculate_commit_compliance,
-    detect_stuck_tasks
+    calculate_task_components,
+    calculate_agent_components,
+    calculate_metric_components,
+    combine_health_components,
+    detect_stuck_tasks,
+    latest_event_by_task
 )
 from .database import (
     init_database,
     save_snapshot,
+    save_snapshots,
+    SnapshotWriter,
+    close_database,
     save_metric,
     get_recent_snapshots,
     get_metrics_range
 )
-from .utils import format_duration, parse_timestamp, get_bb5_root, get_health_color, get_health_emoji
+from .utils import format_duration, parse_timestamp, file_signature, get_bb5_root, get_health_color, get_health_emoji
 from .alerts import AlertManager, AlertConfig
 
 __version__ = "1.0.0"
@@ -40,10 +52,15 @@ __all__ = [
     "Event",
     "HealthSnapshot",
     "Metric",
+    # Event log
+    "EventReader",
     # Collectors
     "collect_queue",
     "collect_heartbeat",
     "collect_events",
+    "collect_events_between",
+    "collect_task_activity",
+    "get_event_reader",
     "collect_metrics",
     "collect_skills",
     "collect_run_metrics",
@@ -54,16 +71,25 @@ __all__ = [
     "calculate_agent_health",
     "calculate_throughput",
     "calculate_commit_compliance",
+    "calculate_task_components",
+    "calculate_agent_components",
+    "calculate_metric_components",
+    "combine_health_components",
     "detect_stuck_tasks",
+    "latest_event_by_task",
     # Database
     "init_database",
     "save_snapshot",
+    "save_snapshots",
+    "SnapshotWriter",
+    "close_database",
     "save_metric",
     "get_recent_snapshots",
     "get_metrics_range",
     # Utils
     "format_duration",
     "parse_timestamp",
+    "file_signature",
     "get_bb5_root",
     "get_health_color",
     "get_health_emoji",
@@ -6,7 +6,7 @@ import subprocess
 from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 from .models import Task, Agent, Event, StuckTask, HealthStatus
 from .utils import format_duration, get_bb5_root
@@ -71,8 +71,31 @@ def calculate_agent_health(agents: List[Agent], timeout_seconds: int = 120) -> T
     return score, "healthy"
 
 
-def detect_stuck_tasks(tasks: List[Task], events: List[Event], multiplier: float = 2.0) -> List[StuckTask]:
-    """Detect tasks that appear stuck based on elapsed time vs estimate."""
+def latest_event_by_task(events: List[Event]) -> Dict[str, Event]:
+    """Index events by task id, keeping each task's latest event."""
+    latest: Dict[str, Event] = {}
+    for event in events:
+        if not event.task_id:
+            continue
+        current = latest.get(event.task_id)
+        if current is None or event.timestamp > current.timestamp:
+            latest[event.task_id] = event
+    return latest
+
+
+def detect_stuck_tasks(
+    tasks: List[Task],
+    events: List[Event],
+    multiplier: float = 2.0,
+    latest_events: Optional[Dict[str, Event]] = None
+) -> List[StuckTask]:
+    """Detect tasks that appear stuck based on elapsed time vs estimate.
+
+    latest_events maps task id to its latest event (see
+    collect_task_activity); without it the index is built from events.
+    """
+    if latest_events is None:
+        latest_events = latest_event_by_task(events)
     stuck = []
 
     for task in tasks:
@@ -86,9 +109,7 @@ def detect_stuck_tasks(tasks: List[Task], events: List[Event], multiplier: float
         threshold = task.estimated_minutes * multiplier
 
         if elapsed > threshold:
-            # Find last event for this task
-            task_events = [e for e in events if e.task_id == task.id]
-            last_event = max(task_events, key=lambda e: e.timestamp) if task_events else None
+            last_event = latest_events.get(task.id)
 
             if last_event:
                 time_since_event = datetime.now() - last_event.timestamp
@@ -111,28 +132,53 @@ def detect_stuck_tasks(tasks: List[Task], events: List[Event], multiplier: float
     return stuck
 
 
-def calculate_health_score(
-    tasks: List[Task],
-    agents: List[Agent],
-    events: List[Event],
-    metrics: Dict[str, Any],
-    timeout_seconds: int = 120
-) -> Tuple[int, HealthStatus, Dict[str, Any]]:
-    """Calculate overall health score (0-100) and status.
+# Score components and their weights, in reporting order
+HEALTH_WEIGHTS = {
+    'throughput': 0.25,
+    'quality': 0.25,
+    'efficiency': 0.20,
+    'reliability': 0.15,
+    'queue': 0.15,
+}
 
-    Weights:
-    - throughput: 25% (tasks/day vs target)
-    - quality: 25% (success rate from metrics)
-    - efficiency: 20% (time saved from metrics)
-    - reliability: 15% (agent uptime)
-    - queue_health: 15% (queue status)
-    """
-    # Get component scores
+
+def calculate_task_components(tasks: List[Task]) -> Dict[str, Dict[str, Any]]:
+    """Score components derived from the task queue (throughput, queue)."""
     throughput = calculate_throughput(tasks)
     queue_score, queue_status = calculate_queue_health(tasks)
+
+    # Normalize throughput (target: 5 tasks/day = 100%)
+    throughput_score = min(100, (throughput / 5) * 100)
+
+    return {
+        'throughput': {
+            'score': throughput_score,
+            'value': throughput,
+            'target': 5,
+            'weight': HEALTH_WEIGHTS['throughput'],
+        },
+        'queue': {
+            'score': queue_score,
+            'status': queue_status,
+            'weight': HEALTH_WEIGHTS['queue'],
+        },
+    }
+
+
+def calculate_agent_components(agents: List[Agent], timeout_seconds: int = 120) -> Dict[str, Dict[str, Any]]:
+    """Score components derived from agent heartbeats (reliability)."""
     agent_score, agent_status = calculate_agent_health(agents, timeout_seconds)
+    return {
+        'reliability': {
+            'score': agent_score,
+            'status': agent_status,
+            'weight': HEALTH_WEIGHTS['reliability'],
+        },
+    }
+
 
-    # Extract metrics from dashboard data
+def calculate_metric_components(metrics: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Score components taken from the metrics dashboard (quality, efficiency)."""
     dashboard_metrics = metrics.get('metrics', {})
 
     # Quality: success rate (default to 100 if not available)
@@ -141,56 +187,61 @@ def calculate_health_score(
     # Efficiency: time saved metric
     efficiency_score = dashboard_metrics.get('efficiency', {}).get('value', 100)
 
-    # Normalize throughput (target: 5 tasks/day = 100%)
-    throughput_score = min(100, (throughput / 5) * 100)
+    return {
+        'quality': {
+            'score': quality_score,
+            'weight': HEALTH_WEIGHTS['quality'],
+        },
+        'efficiency': {
+            'score': efficiency_score,
+            'weight': HEALTH_WEIGHTS['efficiency'],
+        },
+    }
+
+
+def combine_health_components(
+    components: Dict[str, Dict[str, Any]]
+) -> Tuple[int, HealthStatus, Dict[str, Any]]:
+    """Weighted health score, status and details from all score components."""
+    details = {name: components[name] for name in HEALTH_WEIGHTS}
 
     # Calculate weighted score
-    score = int(
-        (throughput_score * 0.25) +
-        (quality_score * 0.25) +
-        (efficiency_score * 0.20) +
-        (agent_score * 0.15) +
-        (queue_score * 0.15)
-    )
+    score = int(sum(details[name]['score'] * weight for name, weight in HEALTH_WEIGHTS.items()))
 
     # Determine status
-    if agent_status == "critical" or score < 40:
+    if details['reliability']['status'] == "critical" or score < 40:
         status = HealthStatus.CRITICAL
-    elif score < 60 or queue_status == "critical":
+    elif score < 60 or details['queue']['status'] == "critical":
         status = HealthStatus.WARNING
     else:
         status = HealthStatus.HEALTHY
 
-    details = {
-        'throughput': {
-            'score': throughput_score,
-            'value': throughput,
-            'target': 5,
-            'weight': 0.25,
-        },
-        'quality': {
-            'score': quality_score,
-            'weight': 0.25,
-        },
-        'efficiency': {
-            'score': efficiency_score,
-            'weight': 0.20,
-        },
-        'reliability': {
-            'score': agent_score,
-            'status': agent_status,
-            'weight': 0.15,
-        },
-        'queue': {
-            'score': queue_score,
-            'status': queue_status,
-            'weight': 0.15,
-        },
-    }
-
     return score, status, details
 
 
+def calculate_health_score(
+    tasks: List[Task],
+    agents: List[Agent],
+    events: List[Event],
+    metrics: Dict[str, Any],
+    timeout_seconds: int = 120
+) -> Tuple[int, HealthStatus, Dict[str, Any]]:
+    """Calculate overall health score (0-100) and status.
+
+    Weights:
+    - throughput: 25% (tasks/day vs target)
+    - quality: 25% (success rate from metrics)
+    - efficiency: 20% (time saved from metrics)
+    - reliability: 15% (agent uptime)
+    - queue_health: 15% (queue status)
+    """
+    components = {}
+    components.update(calculate_task_components(tasks))
+    components.update(calculate_metric_components(metrics))
+    components.update(calculate_agent_components(agents, timeout_seconds))
+    return combine_health_components(components)
+
+
 def calculate_commit_compliance(days: int = 30, threshold: float = 75.0) -> Dict[str, Any]:
     """Calculate commit compliance for completed tasks.
 
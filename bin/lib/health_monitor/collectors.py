@@ -4,16 +4,22 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
 from .config import get_config
+from .event_reader import EventReader
 from .models import Task, Agent, Event, TaskStatus, Metric
-from .utils import parse_timestamp
+from .utils import file_signature, parse_timestamp
 
 logger = logging.getLogger(__name__)
 
+_event_reader: Optional[EventReader] = None
+
+# Parsed inputs by path, reused while the file's stat signature is unchanged
+_parsed_cache: Dict[Path, Tuple[Tuple[int, int, int], Any]] = {}
+
 
 def _safe_read_yaml(path: Path) -> Optional[Dict[str, Any]]:
     """Safely read a YAML file, returning None on error."""
@@ -21,8 +27,9 @@ def _safe_read_yaml(path: Path) -> Optional[Dict[str, Any]]:
         logger.debug(f"File not found: {path}")
         return None
     try:
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
         with open(path, 'r') as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=loader) or {}
     except Exception as e:
         logger.error(f"Error reading {path}: {e}")
         return None
@@ -41,10 +48,38 @@ def _safe_read_json(path: Path) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _cached(path: Path, build: Callable[[Path], Any]) -> Any:
+    """
+    Result of build(path), rebuilt only when the file changed.
+
+    A file modified between the stat and the read is cached under its old
+    signature and therefore rebuilt on the next call.
+    """
+    signature = file_signature(path)
+    cached = _parsed_cache.get(path)
+    if cached is not None and signature is not None and cached[0] == signature:
+        return cached[1]
+
+    value = build(path)
+    if signature is None:
+        _parsed_cache.pop(path, None)
+    else:
+        _parsed_cache[path] = (signature, value)
+    return value
+
+
+def clear_cache() -> None:
+    """Forget parsed inputs so the next collection re-reads every file."""
+    _parsed_cache.clear()
+
+
 def collect_queue() -> List[Task]:
-    """Collect tasks from queue.yaml."""
-    config = get_config()
-    data = _safe_read_yaml(config.queue_path)
+    """Collect tasks from queue.yaml (re-parsed only when the file changed)."""
+    return list(_cached(get_config().queue_path, _read_queue))
+
+
+def _read_queue(path: Path) -> List[Task]:
+    data = _safe_read_yaml(path)
 
     if not data:
         return []
@@ -74,9 +109,12 @@ def collect_queue() -> List[Task]:
 
 
 def collect_heartbeat() -> List[Agent]:
-    """Collect agent heartbeats from heartbeat.yaml."""
-    config = get_config()
-    data = _safe_read_yaml(config.heartbeat_path)
+    """Collect agent heartbeats from heartbeat.yaml (re-parsed only when the file changed)."""
+    return list(_cached(get_config().heartbeat_path, _read_heartbeat))
+
+
+def _read_heartbeat(path: Path) -> List[Agent]:
+    data = _safe_read_yaml(path)
 
     if not data:
         return []
@@ -107,52 +145,43 @@ def collect_heartbeat() -> List[Agent]:
     return agents
 
 
-def collect_events(limit: int = 100) -> List[Event]:
-    """Collect events from events.yaml."""
+def get_event_reader() -> EventReader:
+    """Shared EventReader for the configured events file."""
+    global _event_reader
     config = get_config()
-    data = _safe_read_yaml(config.events_path)
+    if _event_reader is None or _event_reader.events_path != config.events_path:
+        _event_reader = EventReader(config.events_path)
+    return _event_reader
 
-    if not data:
-        return []
 
-    # Handle both list and dict formats
-    if isinstance(data, list):
-        event_list = data
-    elif isinstance(data, dict):
-        event_list = data.get('events', [])
-    else:
-        return []
+def collect_events(limit: int = 100) -> List[Event]:
+    """Collect the most recent events, read from the end of the event log."""
+    return get_event_reader().tail(limit)
+
+
+def collect_events_between(start: datetime, end: Optional[datetime] = None) -> List[Event]:
+    """Collect events with start <= timestamp <= end (end defaults to now)."""
+    return get_event_reader().between(start, end)
 
-    events = []
-    for item in event_list[-limit:]:
-        try:
-            event = Event(
-                timestamp=parse_timestamp(item.get('timestamp')) or datetime.now(),
-                event_type=item.get('type', 'unknown'),
-                task_id=item.get('task_id'),
-                agent=item.get('agent'),
-                message=item.get('message'),
-                data=item.get('data', {}),
-            )
-            events.append(event)
-        except Exception as e:
-            logger.warning(f"Error parsing event: {e}")
 
-    return events
+def collect_task_activity() -> Dict[str, Event]:
+    """Latest event per task id over the whole event history.
+
+    Only events appended since the previous call are read.
+    """
+    reader = get_event_reader()
+    reader.refresh()
+    return reader.latest_by_task()
 
 
 def collect_metrics() -> Dict[str, Any]:
-    """Collect metrics from metrics-dashboard.yaml."""
-    config = get_config()
-    data = _safe_read_yaml(config.metrics_path)
-    return data or {}
+    """Collect metrics from metrics-dashboard.yaml (re-parsed only when the file changed)."""
+    return dict(_cached(get_config().metrics_path, _safe_read_yaml) or {})
 
 
 def collect_skills() -> Dict[str, Any]:
-    """Collect skills from skill-registry.yaml."""
-    config = get_config()
-    data = _safe_read_yaml(config.skills_path)
-    return data or {}
+    """Collect skills from skill-registry.yaml (re-parsed only when the file changed)."""
+    return dict(_cached(get_config().skills_path, _safe_read_yaml) or {})
 
 
 def collect_run_metrics() -> List[Dict[str, Any]]:
@@ -9,16 +9,30 @@ import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-from .collectors import collect_queue, collect_heartbeat, collect_events, collect_metrics
-from .calculators import calculate_health_score, detect_stuck_tasks
-from .database import init_database, save_snapshot
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .collectors import collect_queue, collect_heartbeat, collect_metrics, collect_task_activity
+from .calculators import (
+    calculate_agent_components,
+    calculate_metric_components,
+    calculate_task_components,
+    combine_health_components,
+    detect_stuck_tasks,
+)
+from .config import get_config
+from .database import SnapshotWriter, close_database, init_database
 from .models import HealthSnapshot
 from .alerts import AlertManager, AlertConfig
+from .utils import file_signature
 
 logger = logging.getLogger(__name__)
 
+# Task components use a 7-day throughput window, so they are refreshed at
+# least this often even when the queue is unchanged
+TASK_COMPONENTS_MAX_AGE_SECONDS = 60.0
+
+_UNSEEN = object()
+
 
 @dataclass
 class DaemonConfig:
@@ -30,10 +44,20 @@ class DaemonConfig:
     stuck_task_multiplier: float = 2.0
     pid_file: Path = Path("/tmp/bb5-watch.pid")
     log_file: Optional[Path] = None
+    snapshot_batch_size: int = 10
+    snapshot_max_delay_seconds: float = 60.0
 
 
 class MonitoringDaemon:
-    """BB5 Health Monitoring Daemon."""
+    """
+    BB5 Health Monitoring Daemon.
+
+    Checks are incremental: inputs are re-parsed only when their file
+    changed (stat signature), and only the score components fed by a
+    changed input are recomputed. Reliability and stuck tasks depend on the
+    clock and are evaluated on every check. Snapshots are written in
+    batches over one persistent database connection.
+    """
 
     def __init__(self, config: DaemonConfig, alert_manager: Optional[AlertManager] = None):
         self.config = config
@@ -42,6 +66,15 @@ class MonitoringDaemon:
         self.last_check: Optional[datetime] = None
         self.health_score = 100
         self.status = "healthy"
+        self.snapshot_writer = SnapshotWriter(
+            batch_size=config.snapshot_batch_size,
+            max_delay_seconds=config.snapshot_max_delay_seconds
+        )
+
+        self._signatures: Dict[str, Any] = {}
+        self._components: Dict[str, Dict[str, Any]] = {}
+        self._task_components_at: Optional[float] = None
+        self._queue_counts: Tuple[int, int, int] = (0, 0, 0)
 
     def run(self) -> None:
         """Main monitoring loop."""
@@ -65,6 +98,11 @@ class MonitoringDaemon:
                 logger.error(f"Check failed: {e}", exc_info=True)
                 time.sleep(self.config.check_interval_seconds)
 
+        try:
+            self.snapshot_writer.flush()
+        except Exception as e:
+            logger.error(f"Failed to save pending snapshots: {e}")
+        close_database()
         logger.info("BB5 Watch daemon stopped")
 
     def _handle_signal(self, signum, frame):
@@ -79,30 +117,45 @@ class MonitoringDaemon:
 
     def _check_all(self) -> None:
         """Run all enabled checks."""
-        logger.debug("Running health checks")
+        changed = self._changed_inputs()
+        logger.debug(f"Running health checks (changed: {sorted(changed) or 'none'})")
 
-        # Collect data
+        # Collect data (cached by the collectors while files are unchanged)
         tasks = collect_queue()
         agents = collect_heartbeat()
-        events = collect_events()
-        metrics = collect_metrics()
 
-        # Calculate health score
-        score, status, details = calculate_health_score(
-            tasks, agents, events, metrics,
-            timeout_seconds=self.config.heartbeat_timeout_seconds
+        # Recompute the score components whose inputs changed
+        now = time.monotonic()
+        if ('queue' in changed or self._task_components_at is None
+                or now - self._task_components_at >= TASK_COMPONENTS_MAX_AGE_SECONDS):
+            self._components.update(calculate_task_components(tasks))
+            self._queue_counts = (
+                sum(1 for t in tasks if t.is_pending),
+                sum(1 for t in tasks if t.is_in_progress),
+                sum(1 for t in tasks if t.is_completed),
+            )
+            self._task_components_at = now
+        if 'metrics' in changed:
+            self._components.update(calculate_metric_components(collect_metrics()))
+        self._components.update(
+            calculate_agent_components(agents, self.config.heartbeat_timeout_seconds)
         )
 
+        # Calculate health score
+        score, status, details = combine_health_components(self._components)
+
         self.health_score = score
         self.status = status.value
 
         # Detect stuck tasks
-        stuck = detect_stuck_tasks(tasks, events, multiplier=self.config.stuck_task_multiplier)
+        stuck = detect_stuck_tasks(
+            tasks, [],
+            multiplier=self.config.stuck_task_multiplier,
+            latest_events=collect_task_activity()
+        )
 
         # Create snapshot
-        pending = sum(1 for t in tasks if t.is_pending)
-        in_progress = sum(1 for t in tasks if t.is_in_progress)
-        completed = sum(1 for t in tasks if t.is_completed)
+        pending, in_progress, completed = self._queue_counts
         online = sum(1 for a in agents if a.is_online())
         stale = sum(1 for a in agents if a.is_stale())
 
@@ -119,8 +172,8 @@ class MonitoringDaemon:
             stuck_tasks=len(stuck),
         )
 
-        # Save to database
-        save_snapshot(snapshot, details)
+        # Save to database (batched)
+        self.snapshot_writer.add(snapshot, details)
 
         # Send alerts if needed
         if self.alert_manager:
@@ -128,6 +181,22 @@ class MonitoringDaemon:
 
         logger.info(f"Health check complete: {score}/100 ({status.value})")
 
+    def _changed_inputs(self) -> Set[str]:
+        """Inputs whose file changed since the previous check."""
+        config = get_config()
+        inputs = {
+            'queue': config.queue_path,
+            'heartbeat': config.heartbeat_path,
+            'metrics': config.metrics_path,
+        }
+        changed = set()
+        for name, path in inputs.items():
+            signature = file_signature(path)
+            if self._signatures.get(name, _UNSEEN) != signature:
+                self._signatures[name] = signature
+                changed.add(name)
+        return changed
+
     def _send_alerts(self, score: int, status, agents: list, stuck: list, tasks: list) -> None:
         """Send alerts for critical issues."""
         # Alert on critical health score
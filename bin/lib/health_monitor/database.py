@@ -3,9 +3,12 @@
 import json
 import logging
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .config import get_config
 from .models import HealthSnapshot, Metric, HealthStatus
@@ -40,16 +43,93 @@ CREATE TABLE IF NOT EXISTS metrics (
 
 CREATE INDEX IF NOT EXISTS idx_snapshots_time ON snapshots(timestamp);
 CREATE INDEX IF NOT EXISTS idx_metrics_time_name ON metrics(timestamp, name);
+
+-- Snapshots downsampled per minute, hour and day (UTC buckets), kept up to
+-- date on insert; averages are the *_sum columns divided by samples
+CREATE TABLE IF NOT EXISTS snapshot_rollups (
+    resolution TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    health_score_sum INTEGER NOT NULL,
+    health_score_min INTEGER NOT NULL,
+    health_score_max INTEGER NOT NULL,
+    status_worst INTEGER NOT NULL,
+    queue_pending_sum INTEGER NOT NULL,
+    queue_in_progress_sum INTEGER NOT NULL,
+    queue_completed_sum INTEGER NOT NULL,
+    agents_online_sum INTEGER NOT NULL,
+    agents_stale_sum INTEGER NOT NULL,
+    agents_total_sum INTEGER NOT NULL,
+    stuck_tasks_sum INTEGER NOT NULL,
+    PRIMARY KEY (resolution, bucket)
+) WITHOUT ROWID;
 """
 
+# Rollup resolutions and their bucket size in seconds
+ROLLUP_RESOLUTIONS = {'1m': 60, '1h': 3600, '1d': 86400}
+
+# Status severity stored in snapshot_rollups.status_worst
+STATUS_RANK = {HealthStatus.HEALTHY: 0, HealthStatus.WARNING: 1, HealthStatus.CRITICAL: 2}
+RANKED_STATUS = {rank: status for status, rank in STATUS_RANK.items()}
+
+SNAPSHOT_COLUMNS = (
+    'queue_pending', 'queue_in_progress', 'queue_completed',
+    'agents_online', 'agents_stale', 'agents_total', 'stuck_tasks',
+)
+
+INSERT_SNAPSHOT = """
+    INSERT INTO snapshots
+    (timestamp, health_score, status, queue_pending, queue_in_progress,
+     queue_completed, agents_online, agents_stale, agents_total, stuck_tasks, details)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPSERT_ROLLUP = """
+    INSERT INTO snapshot_rollups VALUES (?, ?, 1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(resolution, bucket) DO UPDATE SET
+        samples = samples + 1,
+        health_score_sum = health_score_sum + excluded.health_score_sum,
+        health_score_min = MIN(health_score_min, excluded.health_score_min),
+        health_score_max = MAX(health_score_max, excluded.health_score_max),
+        status_worst = MAX(status_worst, excluded.status_worst),
+""" + ",\n".join(
+    f"        {column}_sum = {column}_sum + excluded.{column}_sum" for column in SNAPSHOT_COLUMNS
+)
+
+# Persistent connections by database path, shared by all threads under _db_lock
+_connections: Dict[Path, sqlite3.Connection] = {}
+_db_lock = threading.RLock()
+
 
 def _get_connection() -> sqlite3.Connection:
-    """Get database connection with WAL mode enabled."""
+    """Shared connection to the configured database (WAL mode), opened on first use."""
     config = get_config()
-    conn = sqlite3.connect(str(config.db_path))
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.row_factory = sqlite3.Row
-    return conn
+    with _db_lock:
+        conn = _connections.get(config.db_path)
+        if conn is None:
+            conn = sqlite3.connect(str(config.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            _connections[config.db_path] = conn
+        return conn
+
+
+@contextmanager
+def _transaction() -> Iterator[sqlite3.Connection]:
+    """Shared connection, serialized across threads; commits on success."""
+    with _db_lock:
+        conn = _get_connection()
+        with conn:
+            yield conn
+
+
+def close_database() -> None:
+    """Close the shared database connections."""
+    with _db_lock:
+        for conn in _connections.values():
+            conn.close()
+        _connections.clear()
 
 
 def init_database() -> None:
@@ -57,43 +137,131 @@ def init_database() -> None:
     config = get_config()
     config.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with _get_connection() as conn:
+    with _transaction() as conn:
         conn.executescript(SCHEMA)
-        conn.commit()
+        _backfill_rollups(conn)
 
     logger.info(f"Database initialized at {config.db_path}")
 
 
-def save_snapshot(snapshot: HealthSnapshot, details: Optional[dict] = None) -> None:
-    """Save a health snapshot to the database."""
-    with _get_connection() as conn:
+def _backfill_rollups(conn: sqlite3.Connection) -> None:
+    """Build rollups for snapshots saved before rollups existed."""
+    if conn.execute("SELECT 1 FROM snapshot_rollups LIMIT 1").fetchone():
+        return
+    if not conn.execute("SELECT 1 FROM snapshots LIMIT 1").fetchone():
+        return
+
+    status_rank = " ".join(
+        f"WHEN '{status.value}' THEN {rank}" for status, rank in STATUS_RANK.items()
+    )
+    sums = ", ".join(f"SUM(COALESCE({column}, 0))" for column in SNAPSHOT_COLUMNS)
+    for resolution, seconds in ROLLUP_RESOLUTIONS.items():
         conn.execute(
-            """
-            INSERT INTO snapshots
-            (timestamp, health_score, status, queue_pending, queue_in_progress,
-             queue_completed, agents_online, agents_stale, agents_total, stuck_tasks, details)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            f"""
+            INSERT INTO snapshot_rollups
+            SELECT ?, timestamp - timestamp % ?, COUNT(*), SUM(health_score),
+                   MIN(health_score), MAX(health_score),
+                   MAX(CASE status {status_rank} ELSE 0 END), {sums}
+            FROM snapshots
+            GROUP BY timestamp - timestamp % ?
             """,
-            (
-                int(snapshot.timestamp.timestamp()),
-                snapshot.health_score,
-                snapshot.status.value,
-                snapshot.queue_pending,
-                snapshot.queue_in_progress,
-                snapshot.queue_completed,
-                snapshot.agents_online,
-                snapshot.agents_stale,
-                snapshot.agents_total,
-                snapshot.stuck_tasks,
-                json.dumps(details) if details else None,
-            )
+            (resolution, seconds, seconds)
         )
-        conn.commit()
+    logger.info("Built snapshot rollups from existing snapshots")
+
+
+def save_snapshot(snapshot: HealthSnapshot, details: Optional[dict] = None) -> None:
+    """Save a health snapshot to the database."""
+    save_snapshots([(snapshot, details)])
+
+
+def save_snapshots(snapshots: Iterable[Tuple[HealthSnapshot, Optional[dict]]]) -> int:
+    """
+    Save health snapshots and update their rollups in one transaction.
+
+    Args:
+        snapshots: (snapshot, details) pairs
+
+    Returns:
+        Number of snapshots saved
+    """
+    rows = []
+    rollups = []
+    for snapshot, details in snapshots:
+        timestamp = int(snapshot.timestamp.timestamp())
+        counts = [getattr(snapshot, column) or 0 for column in SNAPSHOT_COLUMNS]
+        rows.append((
+            timestamp,
+            snapshot.health_score,
+            snapshot.status.value,
+            snapshot.queue_pending,
+            snapshot.queue_in_progress,
+            snapshot.queue_completed,
+            snapshot.agents_online,
+            snapshot.agents_stale,
+            snapshot.agents_total,
+            snapshot.stuck_tasks,
+            json.dumps(details) if details else None,
+        ))
+        for resolution, seconds in ROLLUP_RESOLUTIONS.items():
+            rollups.append((
+                resolution,
+                timestamp - timestamp % seconds,
+                snapshot.health_score,
+                snapshot.health_score,
+                snapshot.health_score,
+                STATUS_RANK[snapshot.status],
+                *counts,
+            ))
+    if not rows:
+        return 0
+
+    with _transaction() as conn:
+        conn.executemany(INSERT_SNAPSHOT, rows)
+        conn.executemany(UPSERT_ROLLUP, rollups)
+    return len(rows)
+
+
+class SnapshotWriter:
+    """
+    Buffers health snapshots and saves them in batches.
+
+    A batch is written once batch_size snapshots are buffered or the oldest
+    buffered snapshot is max_delay_seconds old; call flush() before exiting.
+    """
+
+    def __init__(self, batch_size: int = 10, max_delay_seconds: float = 60.0):
+        self.batch_size = max(1, batch_size)
+        self.max_delay_seconds = max_delay_seconds
+        self._pending: List[Tuple[HealthSnapshot, Optional[dict]]] = []
+        self._first_pending_at = 0.0
+
+    def add(self, snapshot: HealthSnapshot, details: Optional[dict] = None) -> None:
+        """Buffer a snapshot, writing the batch if it is due."""
+        if not self._pending:
+            self._first_pending_at = time.monotonic()
+        self._pending.append((snapshot, details))
+        if (len(self._pending) >= self.batch_size
+                or time.monotonic() - self._first_pending_at >= self.max_delay_seconds):
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered snapshots; returns how many were written."""
+        if not self._pending:
+            return 0
+        written = save_snapshots(self._pending)  # Kept buffered if this raises
+        self._pending = []
+        return written
+
+    @property
+    def pending(self) -> int:
+        """Number of snapshots not yet written."""
+        return len(self._pending)
 
 
 def save_metric(metric: Metric) -> None:
     """Save a metric to the database."""
-    with _get_connection() as conn:
+    with _transaction() as conn:
         conn.execute(
             """
             INSERT INTO metrics (timestamp, name, value, unit, tags)
@@ -107,14 +275,26 @@ def save_metric(metric: Metric) -> None:
                 json.dumps(metric.tags) if metric.tags else None,
             )
         )
-        conn.commit()
 
 
-def get_recent_snapshots(hours: int = 24) -> List[HealthSnapshot]:
-    """Get health snapshots from the last N hours."""
+def get_recent_snapshots(hours: int = 24, resolution: Optional[str] = None) -> List[HealthSnapshot]:
+    """
+    Get health snapshots from the last N hours, newest first.
+
+    Args:
+        hours: How far back to look
+        resolution: 'raw', or a rollup resolution ('1m', '1h', '1d') whose
+            snapshots carry bucket averages and the bucket's worst status;
+            None picks one from the span (raw up to a day, then 1m up to a
+            week, 1h up to 90 days, 1d beyond)
+    """
     cutoff = int((datetime.now() - timedelta(hours=hours)).timestamp())
+    if resolution is None:
+        resolution = _resolution_for(hours)
+    if resolution != 'raw':
+        return _get_rollup_snapshots(resolution, cutoff)
 
-    with _get_connection() as conn:
+    with _transaction() as conn:
         rows = conn.execute(
             """
             SELECT * FROM snapshots
@@ -141,12 +321,49 @@ def get_recent_snapshots(hours: int = 24) -> List[HealthSnapshot]:
     ]
 
 
+def _resolution_for(hours: int) -> str:
+    if hours <= 24:
+        return 'raw'
+    if hours <= 24 * 7:
+        return '1m'
+    if hours <= 24 * 90:
+        return '1h'
+    return '1d'
+
+
+def _get_rollup_snapshots(resolution: str, cutoff: int) -> List[HealthSnapshot]:
+    if resolution not in ROLLUP_RESOLUTIONS:
+        raise ValueError(f"Unknown resolution {resolution!r}, expected 'raw' or one of {list(ROLLUP_RESOLUTIONS)}")
+
+    # Include the bucket the cutoff falls in
+    bucket_start = cutoff - cutoff % ROLLUP_RESOLUTIONS[resolution]
+    with _transaction() as conn:
+        rows = conn.execute(
+            """
+            SELECT * FROM snapshot_rollups
+            WHERE resolution = ? AND bucket >= ?
+            ORDER BY bucket DESC
+            """,
+            (resolution, bucket_start)
+        ).fetchall()
+
+    return [
+        HealthSnapshot(
+            timestamp=datetime.fromtimestamp(row['bucket']),
+            health_score=round(row['health_score_sum'] / row['samples']),
+            status=RANKED_STATUS[row['status_worst']],
+            **{column: round(row[f'{column}_sum'] / row['samples']) for column in SNAPSHOT_COLUMNS},
+        )
+        for row in rows
+    ]
+
+
 def get_metrics_range(start: datetime, end: datetime, name: Optional[str] = None) -> List[Metric]:
     """Get metrics within a time range, optionally filtered by name."""
     start_ts = int(start.timestamp())
     end_ts = int(end.timestamp())
 
-    with _get_connection() as conn:
+    with _transaction() as conn:
         if name:
             rows = conn.execute(
                 """
@@ -180,7 +397,7 @@ def get_metrics_range(start: datetime, end: datetime, name: Optional[str] = None
 
 def get_latest_snapshot() -> Optional[HealthSnapshot]:
     """Get the most recent health snapshot."""
-    with _get_connection() as conn:
+    with _transaction() as conn:
         row = conn.execute(
             "SELECT * FROM snapshots ORDER BY timestamp DESC LIMIT 1"
         ).fetchone()
@@ -0,0 +1,413 @@
+"""Event journal reader for BB5 Health Monitor.
+
+Agents append events to a journal next to events.yaml (events.journal/,
+one JSON event per line in numbered segments, each with a sparse
+offset/timestamp index; see bin/lib/event_journal.py).
+This reader answers the monitor's questions without parsing the history:
+
+- tail(n): the last n events, read backwards from the end of the newest
+  segments
+- between(start, end): a time window, seeking into segments through their
+  sparse index
+- latest_by_task(): the newest event per task, kept current by refresh(),
+  which only reads what was appended since the previous call. The index is
+  saved with its (segment, offset) cursor in events.journal/, so a restarted
+  monitor only reads what was appended while it was down
+
+Without a journal (an older install that still rewrites events.yaml) the
+reader falls back to parsing events.yaml, once per change of the file.
+"""
+
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from event_journal import EventJournal, Segment
+
+from .models import Event
+from .utils import parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+TAIL_BLOCK_BYTES = 64 * 1024
+TASK_INDEX_FILE = "latest_by_task.json"
+TASK_INDEX_VERSION = 1
+
+# Task id of a compact JSON record, as EventJournal writes them
+TASK_ID_PATTERN = re.compile(rb'"task_id":"((?:[^"\\]|\\.)*)"')
+
+
+def parse_event_time(value: Any) -> Optional[datetime]:
+    """Parse an event timestamp; ISO 8601 fast path, parse_timestamp formats otherwise."""
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value))
+        if parsed.tzinfo is None:
+            return parsed
+    except ValueError:
+        pass
+    return parse_timestamp(str(value))
+
+
+def event_record(event: Event) -> Dict[str, Any]:
+    """Journal-style record of an Event (the inverse of event_from_dict)."""
+    return {
+        'timestamp': event.timestamp.isoformat(),
+        'type': event.event_type,
+        'task_id': event.task_id,
+        'agent': event.agent,
+        'message': event.message,
+        'data': event.data,
+    }
+
+
+def event_from_dict(item: Dict[str, Any]) -> Event:
+    """Build an Event from a journal record or events.yaml entry."""
+    return Event(
+        timestamp=parse_event_time(item.get('timestamp')) or datetime.now(),
+        event_type=item.get('type', 'unknown'),
+        task_id=item.get('task_id'),
+        agent=item.get('agent'),
+        message=item.get('message'),
+        data=item.get('data', {}),
+    )
+
+
+class EventReader:
+    """Reads recent events, time windows and per-task activity from the event log."""
+
+    def __init__(self, events_path: Path, persist_index: bool = True):
+        """
+        Initialize the reader.
+
+        Args:
+            events_path: events.yaml path; its journal is events.journal/ beside it
+            persist_index: Save the per-task index in the journal directory and
+                resume from it instead of re-reading the whole journal
+        """
+        self.events_path = Path(events_path)
+        self.journal = EventJournal.for_events_file(self.events_path)
+        self.journal_dir = self.journal.directory
+        self.index_path = self.journal_dir / TASK_INDEX_FILE
+        self.persist_index = persist_index
+
+        # Per-task latest event and how far the journal has been indexed
+        self._latest: Dict[str, Event] = {}
+        self._cursor: Optional[Tuple[int, int]] = None  # (segment number, byte offset)
+        self._cursor_path: Optional[Path] = None
+        self._index_loaded = False
+
+        # events.yaml fallback, parsed once per (mtime_ns, size)
+        self._yaml_key: Optional[Tuple[int, int]] = None
+        self._yaml_events: List[Dict[str, Any]] = []
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def tail(self, limit: int = 100) -> List[Event]:
+        """The last `limit` events, oldest first."""
+        if limit <= 0:
+            return []
+        segments = self.journal.segments()
+        if not segments:
+            return [event_from_dict(item) for item in self._read_yaml()[-limit:]]
+
+        lines: List[bytes] = []
+        for segment in reversed(segments):
+            lines = self._tail_lines(segment.path, limit - len(lines)) + lines
+            if len(lines) >= limit:
+                break
+        return self._events_from_lines(lines)
+
+    def between(self, start: datetime, end: Optional[datetime] = None) -> List[Event]:
+        """
+        Events with start <= timestamp <= end (end defaults to now), oldest first.
+
+        Only segments whose indexed time range can overlap the window are
+        opened, and each is read from the last index entry before `start`
+        up to the first index entry after `end`.
+        """
+        end = end or datetime.now()
+        segments = self.journal.segments()
+        if not segments:
+            return [
+                event for event in map(event_from_dict, self._read_yaml())
+                if start <= event.timestamp <= end
+            ]
+
+        indexes = [self._read_index(segment) for segment in segments]
+        events = []
+        for position, segment in enumerate(segments):
+            index = indexes[position]
+            if index and index[0][1] and index[0][1] > end:
+                break  # This and later segments start after the window
+            following = indexes[position + 1] if position + 1 < len(segments) else None
+            if following and following[0][1] and following[0][1] < start:
+                continue  # The next segment already starts before the window
+
+            # Concurrent writers append in roughly, not strictly, timestamp
+            # order, so read one stride past the first entry after `end`
+            first, stop, past_end = 0, None, 0
+            for offset, timestamp in index:
+                if timestamp is None:
+                    continue
+                if timestamp < start and not past_end:
+                    first = offset
+                elif timestamp > end:
+                    past_end += 1
+                    if past_end == 2:
+                        stop = offset
+                        break
+            for event in self._events_from_lines(self._read_lines(segment.path, first, stop)):
+                if start <= event.timestamp <= end:
+                    events.append(event)
+        return events
+
+    def refresh(self) -> int:
+        """
+        Index events appended since the last refresh.
+
+        Returns:
+            Number of new records read
+        """
+        segments = self.journal.segments()
+        if not segments:
+            return self._refresh_from_yaml()
+
+        if not self._index_loaded:
+            self._index_loaded = True
+            if self.persist_index and self._cursor is None:
+                self._load_task_index(segments)
+
+        read = 0
+        for segment in segments:
+            if self._cursor and segment.number < self._cursor[0]:
+                continue
+            offset = self._cursor[1] if self._cursor and segment.number == self._cursor[0] else 0
+            try:
+                with open(segment.path, 'rb') as f:
+                    f.seek(offset)
+                    data = f.read()
+            except OSError as e:
+                logger.warning(f"Cannot read {segment.path}: {e}")
+                break
+
+            complete = data.rfind(b"\n") + 1  # A line still being written waits
+            lines = data[:complete].splitlines()
+            read += len(lines)
+            self._index_lines(lines)
+            self._cursor = (segment.number, offset + complete)
+            self._cursor_path = segment.path
+
+        if read and self.persist_index:
+            self._save_task_index()
+        return read
+
+    def latest_by_task(self) -> Dict[str, Event]:
+        """Newest event per task id as of the last refresh() (do not modify)."""
+        return self._latest
+
+    # =========================================================================
+    # JOURNAL ACCESS
+    # =========================================================================
+
+    def _read_index(self, segment: Segment) -> List[Tuple[int, Optional[datetime]]]:
+        """(offset, timestamp) sparse index entries of a segment, by offset."""
+        return [
+            (entry.offset, parse_event_time(entry.timestamp))
+            for entry in self.journal.read_index(segment)
+        ]
+
+    @staticmethod
+    def _tail_lines(path: Path, limit: int) -> List[bytes]:
+        """Last `limit` complete lines of a file, read backwards in blocks."""
+        try:
+            with open(path, 'rb') as f:
+                end = f.seek(0, os.SEEK_END)
+                position = end
+                buffer = b""
+                while position > 0 and buffer.count(b"\n") <= limit:
+                    step = min(TAIL_BLOCK_BYTES, position)
+                    position -= step
+                    f.seek(position)
+                    buffer = f.read(step) + buffer
+        except OSError as e:
+            logger.warning(f"Cannot read {path}: {e}")
+            return []
+
+        lines = buffer.split(b"\n")[:-1]  # Drop the part after the last newline
+        if position > 0:
+            lines = lines[1:]  # First line may start before the buffer
+        return lines[-limit:]
+
+    @staticmethod
+    def _read_lines(path: Path, start: int, stop: Optional[int]) -> List[bytes]:
+        """Complete lines between two record offsets (stop None = end of file)."""
+        try:
+            with open(path, 'rb') as f:
+                f.seek(start)
+                data = f.read() if stop is None else f.read(max(0, stop - start))
+        except OSError as e:
+            logger.warning(f"Cannot read {path}: {e}")
+            return []
+        if stop is None:
+            data = data[:data.rfind(b"\n") + 1]
+        return data.splitlines()
+
+    @staticmethod
+    def _decode(line: bytes) -> Optional[Dict[str, Any]]:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            logger.warning("Skipping corrupt event record")
+            return None
+        return record if isinstance(record, dict) else None
+
+    def _events_from_lines(self, lines: List[bytes]) -> List[Event]:
+        events = []
+        for line in lines:
+            record = self._decode(line)
+            if record is None:
+                continue
+            try:
+                events.append(event_from_dict(record))
+            except Exception as e:
+                logger.warning(f"Error parsing event: {e}")
+        return events
+
+    def _index_lines(self, lines: List[bytes]) -> None:
+        """
+        Fold journal lines into the per-task index.
+
+        Lines are in append order, so only each task's last line in the
+        batch is decoded; lines whose task id the pattern cannot pick out
+        unambiguously (null ids, a "task_id" nested in data) are decoded
+        individually.
+        """
+        last: Dict[bytes, bytes] = {}
+        for line in lines:
+            if b'"task_id"' not in line:
+                continue
+            match = TASK_ID_PATTERN.search(line) if line.count(b'"task_id"') == 1 else None
+            if match:
+                last[match.group(1)] = line
+            else:
+                self._index_record(self._decode(line))
+        for line in last.values():
+            self._index_record(self._decode(line))
+
+    def _index_record(self, record: Optional[Dict[str, Any]]) -> None:
+        if not record or not record.get('task_id'):
+            return
+        try:
+            event = event_from_dict(record)
+        except Exception as e:
+            logger.warning(f"Error parsing event: {e}")
+            return
+        current = self._latest.get(event.task_id)
+        if current is None or event.timestamp > current.timestamp:
+            self._latest[event.task_id] = event
+
+    # =========================================================================
+    # PERSISTED TASK INDEX
+    # =========================================================================
+
+    def _load_task_index(self, segments: List[Segment]) -> None:
+        """
+        Resume from the saved index if its cursor still fits the journal.
+
+        The cursor's segment must still exist (same inode) and be at least
+        as long as the offset; otherwise the whole journal is re-read.
+        """
+        try:
+            with open(self.index_path, 'r') as f:
+                saved = json.load(f)
+            if saved.get('version') != TASK_INDEX_VERSION:
+                return
+            number, offset, inode = saved['cursor']
+            segment = next((s for s in segments if s.number == number), None)
+            if segment is None:
+                return
+            stat = segment.path.stat()
+            if stat.st_ino != inode or stat.st_size < offset:
+                return
+            latest = {task_id: event_from_dict(item) for task_id, item in saved['tasks'].items()}
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable task index {self.index_path}: {e}")
+            return
+
+        self._latest = latest
+        self._cursor = (number, offset)
+        self._cursor_path = segment.path
+
+    def _save_task_index(self) -> None:
+        """Atomically replace the saved index with the current one."""
+        try:
+            inode = self._cursor_path.stat().st_ino
+        except OSError:
+            return
+        payload = {
+            'version': TASK_INDEX_VERSION,
+            'cursor': [self._cursor[0], self._cursor[1], inode],
+            'tasks': {task_id: event_record(event) for task_id, event in self._latest.items()},
+        }
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(payload, f, default=str, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not save task index {self.index_path}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    # =========================================================================
+    # EVENTS.YAML FALLBACK
+    # =========================================================================
+
+    def _read_yaml(self) -> List[Dict[str, Any]]:
+        """Events in events.yaml, re-parsed only when the file changed."""
+        try:
+            stat = self.events_path.stat()
+        except OSError:
+            self._yaml_key, self._yaml_events = None, []
+            return []
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key != self._yaml_key:
+            try:
+                loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                with open(self.events_path, 'r') as f:
+                    data = yaml.load(f, Loader=loader) or {}
+            except Exception as e:
+                logger.error(f"Error reading {self.events_path}: {e}")
+                data = {}
+            if isinstance(data, dict):
+                data = data.get('events') or []
+            self._yaml_events = [item for item in data if isinstance(item, dict)] if isinstance(data, list) else []
+            self._yaml_key = key
+        return self._yaml_events
+
+    def _refresh_from_yaml(self) -> int:
+        key = self._yaml_key
+        items = self._read_yaml()
+        if self._yaml_key == key and self._latest:
+            return 0
+        self._latest = {}
+        for item in items:
+            self._index_record(item)
+        return len(items)
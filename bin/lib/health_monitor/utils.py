@@ -3,7 +3,7 @@
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 
 def get_bb5_root() -> Path:
@@ -34,6 +34,18 @@ def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
     return None
 
 
+def file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Stat signature (mtime_ns, size, inode) of a file, or None if it is missing.
+
+    Changes whenever a file is rewritten in place or replaced atomically.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
 def format_duration(seconds: int) -> str:
     """Format seconds as human-readable duration."""
     if seconds < 60:
@@ -28,6 +28,7 @@ PROJECT_MEMORY="$(get_project_path)"
 TASKS_DIR="$PROJECT_MEMORY/tasks/active"
 QUEUE_FILE="$(get_project_path)/.autonomous/agents/communications/queue.yaml"
 EVENTS_FILE="$PROJECT_MEMORY/.autonomous/agents/communications/events.yaml"
+LOG_EVENT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)/bb5-log-event"
 STORAGE_BACKEND="$PROJECT_MEMORY/.autonomous/lib/storage_backend.py"
 
 # Ensure communications directory exists
@@ -276,22 +277,16 @@ EOF
 
     success "Queue filled to depth $new_depth"
 
-    # Log event with file locking
+    # Log event to the event journal (mirrored into events.yaml)
     if eh_file_exists "$EVENTS_FILE" "event logging"; then
-        (
-            flock -x 200
-            cat >> "$EVENTS_FILE" << EOF
-
-- timestamp: "$timestamp"
-  type: queue_refilled
-  agent: planner
-  run_id: "$RUN_ID"
-  data:
-    previous_depth: $current_depth
-    new_depth: $new_depth
-    tasks_added: $added
-EOF
-        ) 200>"$PROJECT_MEMORY/.autonomous/agents/communications/.events.lock"
+        "$LOG_EVENT" --events-file "$EVENTS_FILE" \
+            timestamp="$timestamp" \
+            type=queue_refilled \
+            agent=planner \
+            run_id="$RUN_ID" \
+            data.previous_depth:="${current_depth:-null}" \
+            data.new_depth:="${new_depth:-null}" \
+            data.tasks_added:="${added:-null}"
     else
         warning "events.yaml not found - event not logged"
     fi
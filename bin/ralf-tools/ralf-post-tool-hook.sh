@@ -79,32 +79,18 @@ elif echo "$CHANGED_FILES" | grep -qE "\.(md|yaml|json)$"; then
     EVENT_TYPE="docs_modified"
 fi
 
-# Create event entry
+# Append to the event journal (mirrored into events.yaml)
 TIMESTAMP=$(date -u +"%Y-%m-%dT%H:%M:%S%z")
-EVENT_ENTRY=$(cat <<EOF
-
-- timestamp: "$TIMESTAMP"
-  task_id: "$TASK_ID"
-  type: $EVENT_TYPE
-  agent: $AGENT_TYPE
-  run_id: "$RUN_ID"
-  data:
-    files_modified:
-$(echo "$CHANGED_FILES" | sed 's/^/      - /')
-    file_count: $CHANGED_COUNT
-EOF
-)
-
-# Append to events.yaml with file locking to prevent corruption
-# Ensure the events file exists (create if missing)
-if ! eh_file_exists "$EVENTS_FILE" "event append"; then
-    eh_create_minimal_events "$EVENTS_FILE"
-fi
-
-(
-    flock -x 200 || exit 1
-    echo "$EVENT_ENTRY" >> "$EVENTS_FILE"
-) 200>"$COMMS_DIR/.events.lock"
+FILES_JSON=$(printf '%s\n' "$CHANGED_FILES" | python3 -c 'import json, sys; print(json.dumps(sys.stdin.read().splitlines()))')
+
+"$SCRIPT_DIR/../bb5-log-event" --events-file "$EVENTS_FILE" \
+    timestamp="$TIMESTAMP" \
+    task_id="$TASK_ID" \
+    type="$EVENT_TYPE" \
+    agent="$AGENT_TYPE" \
+    run_id="$RUN_ID" \
+    data.files_modified:="$FILES_JSON" \
+    data.file_count:="$CHANGED_COUNT"
 
 log "Detected $CHANGED_COUNT file change(s) - Event logged ($EVENT_TYPE)"
 
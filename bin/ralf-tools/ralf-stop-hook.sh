@@ -17,6 +17,7 @@ set -e
 
 # Hook knows where it lives
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+LOG_EVENT="$SCRIPT_DIR/../bb5-log-event"
 PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
 
 # Discover project memory
@@ -295,23 +296,18 @@ if [ "$ACTUAL_AGENT_TYPE" = "executor" ]; then
     if [ -n "$CURRENT_TASK" ]; then
         log "Found task claimed by this run: $CURRENT_TASK"
 
-        # Mark task as completed in events (with file locking)
+        # Mark task as completed in the event journal (mirrored into events.yaml)
         if ! eh_file_exists "$EVENTS_FILE" "event logging"; then
             log_warning "events.yaml not found - creating minimal events file"
             eh_create_minimal_events "$EVENTS_FILE"
         fi
 
-        (
-            flock -x 200 || exit 1
-            cat >> "$EVENTS_FILE" << EOF
-
-- timestamp: "$COMPLETION_TIME"
-  task_id: "$CURRENT_TASK"
-  type: completed
-  agent: executor
-  run_id: "$RUN_ID"
-EOF
-        ) 200>"$COMMUNICATIONS_DIR/.events.lock"
+        "$LOG_EVENT" --events-file "$EVENTS_FILE" \
+            timestamp="$COMPLETION_TIME" \
+            task_id="$CURRENT_TASK" \
+            type=completed \
+            agent=executor \
+            run_id="$RUN_ID"
         log_success "Task $CURRENT_TASK marked as completed in events"
 
         # Update queue.yaml - set task status to completed (with file locking)
@@ -38,6 +38,7 @@ COMMUNICATIONS_DIR="$(get_project_path)/.autonomous/agents/communications"
 HEARTBEAT_FILE="$COMMUNICATIONS_DIR/heartbeat.yaml"
 QUEUE_FILE="$COMMUNICATIONS_DIR/queue.yaml"
 EVENTS_FILE="$COMMUNICATIONS_DIR/events.yaml"
+LOG_EVENT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)/bb5-log-event"
 TASKS_FILE="$COMMUNICATIONS_DIR/tasks.yaml"
 
 # Ensure communications directory exists
@@ -134,19 +135,14 @@ claim_task() {
 
     TIMESTAMP=$(date -Iseconds)
 
-    # Write claim event to events.yaml with file locking
+    # Write claim event to the event journal (mirrored into events.yaml)
     if eh_file_exists "$EVENTS_FILE" "event logging"; then
-        (
-            flock -x 200
-            cat >> "$EVENTS_FILE" << EOF
-
-- timestamp: "$TIMESTAMP"
-  task_id: "$NEXT_TASK"
-  type: started
-  agent: executor
-  run_id: "$RUN_ID"
-EOF
-        ) 200>"$COMMUNICATIONS_DIR/.events.lock"
+        "$LOG_EVENT" --events-file "$EVENTS_FILE" \
+            timestamp="$TIMESTAMP" \
+            task_id="$NEXT_TASK" \
+            type=started \
+            agent=executor \
+            run_id="$RUN_ID"
         log_success "Claim event written to events.yaml"
     else
         eh_log_warning "events.yaml not found - claim event not logged"
@@ -274,19 +270,14 @@ report_idle() {
 
     TIMESTAMP=$(date -Iseconds)
 
-    # Write idle event to events.yaml with file locking
+    # Write idle event to the event journal (mirrored into events.yaml)
     if eh_file_exists "$EVENTS_FILE" "idle event logging"; then
-        (
-            flock -x 200
-            cat >> "$EVENTS_FILE" << EOF
-
-- timestamp: "$TIMESTAMP"
-  type: idle
-  agent: executor
-  run_id: "$RUN_ID"
-  reason: "queue.yaml has no next_task"
-EOF
-        ) 200>"$COMMUNICATIONS_DIR/.events.lock"
+        "$LOG_EVENT" --events-file "$EVENTS_FILE" \
+            timestamp="$TIMESTAMP" \
+            type=idle \
+            agent=executor \
+            run_id="$RUN_ID" \
+            reason="queue.yaml has no next_task"
         log_success "Idle event written to events.yaml"
     else
         eh_log_warning "events.yaml not found - idle event not logged"
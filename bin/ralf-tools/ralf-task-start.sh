@@ -22,6 +22,7 @@ fi
 COMMUNICATIONS_DIR="$PROJECT_ROOT/5-project-memory/blackbox5/.autonomous/agents/communications"
 QUEUE_FILE="$COMMUNICATIONS_DIR/queue.yaml"
 EVENTS_FILE="$COMMUNICATIONS_DIR/events.yaml"
+LOG_EVENT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)/bb5-log-event"
 HEARTBEAT_FILE="$COMMUNICATIONS_DIR/heartbeat.yaml"
 
 # Colors
@@ -85,19 +86,14 @@ if [ -f "$QUEUE_FILE" ]; then
     ) 200>"$COMMUNICATIONS_DIR/.queue.lock"
 fi
 
-# Log event (with file locking)
+# Log event to the event journal (mirrored into events.yaml)
 if [ -f "$EVENTS_FILE" ]; then
-    (
-        flock -x 200
-        cat >> "$EVENTS_FILE" << EOF
-
-- timestamp: "$TIMESTAMP"
-  task_id: "$TASK_ID"
-  type: in_progress
-  agent: executor
-  run_id: "$RUN_ID"
-EOF
-    ) 200>"$COMMUNICATIONS_DIR/.events.lock"
+    "$LOG_EVENT" --events-file "$EVENTS_FILE" \
+        timestamp="$TIMESTAMP" \
+        task_id="$TASK_ID" \
+        type=in_progress \
+        agent=executor \
+        run_id="$RUN_ID"
     success "Event logged to events.yaml"
 fi
 